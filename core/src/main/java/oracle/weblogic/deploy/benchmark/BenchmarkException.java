@@ -0,0 +1,79 @@
+/*
+ * Copyright (c) 2026, Oracle and/or its affiliates.
+ * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+ */
+package oracle.weblogic.deploy.benchmark;
+
+import oracle.weblogic.deploy.exception.BundleAwareException;
+import oracle.weblogic.deploy.exception.ExceptionHelper;
+
+/**
+ * The exception used by the benchmark tool components.
+ */
+public class BenchmarkException extends BundleAwareException {
+    private static final long serialVersionUID = 1L;
+
+    /**
+     * Constructs a default exception.
+     */
+    public BenchmarkException() {
+        // default constructor
+    }
+
+    /**
+     * Constructs a new exception with the specified message id.
+     *
+     * @param messageID the message ID
+     */
+    public BenchmarkException(String messageID) {
+        super(messageID);
+    }
+
+    /**
+     * Constructs a new exception with the specified message id and parameters.
+     *
+     * @param messageID the message ID
+     * @param params    the parameters to use to fill in the message tokens
+     */
+    public BenchmarkException(String messageID, Object... params) {
+        super(messageID, params);
+    }
+
+    /**
+     * Constructs a new exception with the specified message id and cause.
+     *
+     * @param messageID the message ID
+     * @param cause     the exception that triggered the creation of this exception
+     */
+    public BenchmarkException(String messageID, Throwable cause) {
+        super(messageID, cause);
+    }
+
+    /**
+     * Constructs a new exception with passed message id, cause, and parameters.
+     *
+     * @param messageID the message ID
+     * @param cause     the exception that triggered the creation of this exception
+     * @param params    the parameters to use to fill in the message tokens
+     */
+    public BenchmarkException(String messageID, Throwable cause, Object... params) {
+        super(messageID, cause, params);
+    }
+
+    /**
+     * Constructs a new exception with the specified cause.
+     *
+     * @param cause the exception that triggered the creation of this exception
+     */
+    public BenchmarkException(Throwable cause) {
+        super(cause);
+    }
+
+    /**
+     * {@inheritDoc}
+     */
+    @Override
+    public String getBundleName() {
+        return ExceptionHelper.getResourceBundleName();
+    }
+}
@@ -15,6 +15,7 @@ import oracle.weblogic.deploy.tool.archive_helper.add.AddCommand;
 import oracle.weblogic.deploy.tool.archive_helper.extract.ExtractCommand;
 import oracle.weblogic.deploy.tool.archive_helper.list.ListCommand;
 import oracle.weblogic.deploy.tool.archive_helper.remove.RemoveCommand;
+import oracle.weblogic.deploy.tool.archive_helper.sync.SyncCommand;
 import oracle.weblogic.deploy.tool.archive_helper.wktui.WKTUICommand;
 import oracle.weblogic.deploy.util.ExitCode;
 
@@ -35,6 +36,7 @@ import picocli.CommandLine.UnmatchedArgumentException;
         ExtractCommand.class,
         ListCommand.class,
         RemoveCommand.class,
+        SyncCommand.class,
         WKTUICommand.class
     },
     versionProvider = ArchiveHelperVersionProvider.class
@@ -0,0 +1,231 @@
+/*
+ * Copyright (c) 2026, Oracle and/or its affiliates.
+ * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+ */
+package oracle.weblogic.deploy.tool.archive_helper.sync;
+
+import java.io.File;
+import java.util.LinkedHashMap;
+import java.util.List;
+import java.util.Map;
+import java.util.concurrent.Callable;
+
+import oracle.weblogic.deploy.json.JavaJsonTranslator;
+import oracle.weblogic.deploy.json.JsonException;
+import oracle.weblogic.deploy.logging.PlatformLogger;
+import oracle.weblogic.deploy.logging.WLSDeployLogFactory;
+import oracle.weblogic.deploy.tool.archive_helper.ArchiveHelperException;
+import oracle.weblogic.deploy.tool.archive_helper.CommandResponse;
+import oracle.weblogic.deploy.tool.archive_helper.CommonOptions;
+import oracle.weblogic.deploy.util.ArchiveSynchronizer;
+import oracle.weblogic.deploy.util.ExitCode;
+import oracle.weblogic.deploy.util.FileUtils;
+import oracle.weblogic.deploy.util.StringUtils;
+import oracle.weblogic.deploy.util.WLSDeployArchive;
+import oracle.weblogic.deploy.util.WLSDeployArchiveIOException;
+
+import picocli.CommandLine.Command;
+import picocli.CommandLine.Option;
+
+import static oracle.weblogic.deploy.tool.ArchiveHelper.LOGGER_NAME;
+
+@Command(
+    name = "sync",
+    header = "Add, replace, and remove entries so that the archive file matches a directory or manifest file.",
+    description = "%nCommand-line options:",
+    footer = "%nNote: Files are compared using their size and CRC-32 checksum, and all changes are written " +
+        "to the archive file at once.%n"
+)
+public class SyncCommand extends CommonOptions implements Callable<CommandResponse> {
+    private static final String CLASS = SyncCommand.class.getName();
+    private static final PlatformLogger LOGGER = WLSDeployLogFactory.getLogger(LOGGER_NAME);
+
+    private static final String ZIP_SEP = "/";
+    private static final String ENTRIES = "entries";
+    private static final String ARCHIVE_PATH = "archivePath";
+    private static final String SOURCE_PATH = "sourcePath";
+
+    @Option(
+        names = { "-source_dir" },
+        paramLabel = "<source_dir>",
+        description = "File system path to a directory laid out like the archive file, such as a build output directory"
+    )
+    private String sourceDirectoryPath;
+
+    @Option(
+        names = { "-manifest_file" },
+        paramLabel = "<manifest_file>",
+        description = "File system path to a JSON file that lists the archive entries and their source paths"
+    )
+    private String manifestFilePath;
+
+    @Option(
+        names = { "-dry_run" },
+        description = "List the changes without writing the archive file"
+    )
+    private boolean dryRun;
+
+    @Option(
+        names = { "-no_remove" },
+        description = "Do not remove archive entries that are not in the source directory or manifest file"
+    )
+    private boolean noRemove;
+
+    @Override
+    public CommandResponse call() throws Exception {
+        final String METHOD = "call";
+        LOGGER.entering(CLASS, METHOD);
+
+        CommandResponse response;
+        try {
+            initializeOptions(false);
+
+            Map<String, File> desiredEntries = getDesiredEntries();
+            ArchiveSynchronizer synchronizer = new ArchiveSynchronizer(this.archive);
+            ArchiveSynchronizer.Plan plan = synchronizer.createPlan(desiredEntries, !this.noRemove);
+
+            response = new CommandResponse(ExitCode.OK);
+            if (this.dryRun) {
+                addEntryMessages(response, "WLSDPLY-30090", plan.getAdditions());
+                addEntryMessages(response, "WLSDPLY-30091", plan.getReplacements());
+                addEntryMessages(response, "WLSDPLY-30092", plan.getRemovals());
+                response.addMessage("WLSDPLY-30093", plan.getAdditions().size(), plan.getReplacements().size(),
+                    plan.getRemovals().size(), plan.getUnchangedCount(), this.archiveFilePath);
+            } else {
+                synchronizer.applyPlan(plan);
+                response.addMessage("WLSDPLY-30094", plan.getAdditions().size(), plan.getReplacements().size(),
+                    plan.getRemovals().size(), plan.getUnchangedCount(), this.archiveFilePath);
+            }
+        } catch (ArchiveHelperException ex) {
+            LOGGER.severe(ex.getLocalizedMessage(), ex);
+            response = new CommandResponse(ex.getExitCode(), ex.getLocalizedMessage());
+        } catch (WLSDeployArchiveIOException ex) {
+            LOGGER.severe("WLSDPLY-30095", ex, this.archiveFilePath, ex.getLocalizedMessage());
+            response = new CommandResponse(ExitCode.ERROR, "WLSDPLY-30095", this.archiveFilePath,
+                ex.getLocalizedMessage());
+        }
+
+        LOGGER.exiting(CLASS, METHOD, response);
+        return response;
+    }
+
+    private Map<String, File> getDesiredEntries() throws ArchiveHelperException {
+        final String METHOD = "getDesiredEntries";
+        LOGGER.entering(CLASS, METHOD);
+
+        if (StringUtils.isEmpty(this.sourceDirectoryPath) == StringUtils.isEmpty(this.manifestFilePath)) {
+            ArchiveHelperException ex = new ArchiveHelperException(ExitCode.USAGE_ERROR, "WLSDPLY-30082");
+            LOGGER.throwing(CLASS, METHOD, ex);
+            throw ex;
+        }
+
+        Map<String, File> desiredEntries;
+        if (!StringUtils.isEmpty(this.sourceDirectoryPath)) {
+            File sourceDirectory = FileUtils.getCanonicalFile(this.sourceDirectoryPath);
+            if (!sourceDirectory.isDirectory()) {
+                ArchiveHelperException ex = new ArchiveHelperException(ExitCode.ARG_VALIDATION_ERROR,
+                    "WLSDPLY-30083", sourceDirectory.getAbsolutePath());
+                LOGGER.throwing(CLASS, METHOD, ex);
+                throw ex;
+            }
+            desiredEntries = ArchiveSynchronizer.getDirectoryEntries("", sourceDirectory);
+        } else {
+            desiredEntries = getManifestEntries();
+        }
+
+        for (String entryName : desiredEntries.keySet()) {
+            if (!WLSDeployArchive.isPathIntoArchive(entryName)) {
+                ArchiveHelperException ex = new ArchiveHelperException(ExitCode.ARG_VALIDATION_ERROR,
+                    "WLSDPLY-30089", entryName);
+                LOGGER.throwing(CLASS, METHOD, ex);
+                throw ex;
+            }
+        }
+
+        LOGGER.exiting(CLASS, METHOD, desiredEntries.size());
+        return desiredEntries;
+    }
+
+    /**
+     * Get the desired entries from the manifest file.  Each manifest entry has an archive path, and a source path
+     * that is resolved relative to the manifest file.  A source directory is added below the archive path,
+     * a source file is added at the archive path, or below it if the archive path ends with a slash,
+     * and an archive path with no source path is added as an empty directory.
+     */
+    private Map<String, File> getManifestEntries() throws ArchiveHelperException {
+        final String METHOD = "getManifestEntries";
+        LOGGER.entering(CLASS, METHOD);
+
+        File manifestFile = FileUtils.getCanonicalFile(this.manifestFilePath);
+        if (!manifestFile.isFile()) {
+            ArchiveHelperException ex = new ArchiveHelperException(ExitCode.ARG_VALIDATION_ERROR, "WLSDPLY-30084",
+                manifestFile.getAbsolutePath());
+            LOGGER.throwing(CLASS, METHOD, ex);
+            throw ex;
+        }
+
+        Map<String, Object> manifest;
+        try {
+            manifest = new JavaJsonTranslator(manifestFile.getAbsolutePath(), true).parse();
+        } catch (JsonException je) {
+            ArchiveHelperException ex = new ArchiveHelperException(ExitCode.ARG_VALIDATION_ERROR, "WLSDPLY-30085", je,
+                manifestFile.getAbsolutePath(), je.getLocalizedMessage());
+            LOGGER.throwing(CLASS, METHOD, ex);
+            throw ex;
+        }
+
+        Object entriesObject = manifest.get(ENTRIES);
+        if (!(entriesObject instanceof List)) {
+            ArchiveHelperException ex = new ArchiveHelperException(ExitCode.ARG_VALIDATION_ERROR, "WLSDPLY-30086",
+                manifestFile.getAbsolutePath(), ENTRIES);
+            LOGGER.throwing(CLASS, METHOD, ex);
+            throw ex;
+        }
+
+        Map<String, File> desiredEntries = new LinkedHashMap<>();
+        for (Object entryObject : (List<?>) entriesObject) {
+            Object archivePathObject = entryObject instanceof Map ? ((Map<?, ?>) entryObject).get(ARCHIVE_PATH) : null;
+            if (!(archivePathObject instanceof String) || StringUtils.isEmpty((String) archivePathObject)) {
+                ArchiveHelperException ex = new ArchiveHelperException(ExitCode.ARG_VALIDATION_ERROR,
+                    "WLSDPLY-30087", manifestFile.getAbsolutePath(), ARCHIVE_PATH);
+                LOGGER.throwing(CLASS, METHOD, ex);
+                throw ex;
+            }
+            String archivePath = (String) archivePathObject;
+            Object sourcePathObject = ((Map<?, ?>) entryObject).get(SOURCE_PATH);
+
+            if (sourcePathObject == null) {
+                desiredEntries.put(archivePath.endsWith(ZIP_SEP) ? archivePath : archivePath + ZIP_SEP, null);
+                continue;
+            }
+
+            File sourceFile = new File(sourcePathObject.toString());
+            if (!sourceFile.isAbsolute()) {
+                sourceFile = new File(manifestFile.getParentFile(), sourcePathObject.toString());
+            }
+            sourceFile = FileUtils.getCanonicalFile(sourceFile);
+
+            if (sourceFile.isDirectory()) {
+                String directoryPath = archivePath.endsWith(ZIP_SEP) ? archivePath : archivePath + ZIP_SEP;
+                desiredEntries.putAll(ArchiveSynchronizer.getDirectoryEntries(directoryPath, sourceFile));
+            } else if (sourceFile.isFile()) {
+                String filePath = archivePath.endsWith(ZIP_SEP) ? archivePath + sourceFile.getName() : archivePath;
+                desiredEntries.put(filePath, sourceFile);
+            } else {
+                ArchiveHelperException ex = new ArchiveHelperException(ExitCode.ARG_VALIDATION_ERROR,
+                    "WLSDPLY-30088", manifestFile.getAbsolutePath(), archivePath, sourceFile.getAbsolutePath());
+                LOGGER.throwing(CLASS, METHOD, ex);
+                throw ex;
+            }
+        }
+
+        LOGGER.exiting(CLASS, METHOD, desiredEntries.size());
+        return desiredEntries;
+    }
+
+    private static void addEntryMessages(CommandResponse response, String messageKey, List<String> entryNames) {
+        for (String entryName : entryNames) {
+            response.addMessage(messageKey, entryName);
+        }
+    }
+}
@@ -0,0 +1,27 @@
+/*
+ * Copyright (c) 2026, Oracle and/or its affiliates.
+ * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+ */
+package oracle.weblogic.deploy.util;
+
+import java.io.IOException;
+import java.io.InputStream;
+
+/**
+ * Rewrites the content of a file while it is added to the archive, so the file is read once and written once.
+ */
+public interface ArchiveEntryTransformer {
+
+    /**
+     * Transform the content of a file that is being added to the archive.
+     * If the returned stream does not read from the content stream, the transformer must close the content stream.
+     *
+     * @param entryName the path of the file relative to the item being added, using forward slashes,
+     *                  or the file name of the archive entry, after any rename, if the item is a single file
+     * @param content   the content of the file
+     * @return the transformed content, the content stream if this transformer does not apply to the file,
+     *         or null if the file should not be added to the archive
+     * @throws IOException if an error occurs reading the content
+     */
+    InputStream transform(String entryName, InputStream content) throws IOException;
+}
@@ -0,0 +1,306 @@
+/*
+ * Copyright (c) 2026, Oracle and/or its affiliates.
+ * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+ */
+package oracle.weblogic.deploy.util;
+
+import java.io.File;
+import java.io.FileInputStream;
+import java.io.FileOutputStream;
+import java.io.IOException;
+import java.io.InputStream;
+import java.util.ArrayList;
+import java.util.Enumeration;
+import java.util.LinkedHashSet;
+import java.util.List;
+import java.util.Set;
+import java.util.concurrent.Callable;
+import java.util.concurrent.ExecutionException;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Executors;
+import java.util.concurrent.Future;
+import java.util.zip.CRC32;
+import java.util.zip.ZipEntry;
+import java.util.zip.ZipFile;
+
+import oracle.weblogic.deploy.logging.PlatformLogger;
+import oracle.weblogic.deploy.logging.WLSDeployLogFactory;
+
+/**
+ * Extracts the entries under an archive directory to the file system.  Entries are streamed from the zip file
+ * one at a time, so only the entries that are being written have an open input stream.  Files are written
+ * concurrently using a bounded thread pool, and a file is skipped if the existing target file has the same size
+ * and CRC-32 checksum as the archive entry.
+ */
+public class ArchiveExtractor {
+    private static final String CLASS = ArchiveExtractor.class.getName();
+    private static final PlatformLogger LOGGER = WLSDeployLogFactory.getLogger("wlsdeploy.archive");
+
+    private static final String ZIP_SEP = "/";
+    private static final String SEP = File.separator;
+    private static final int READ_BUFFER_SIZE = 4096;
+
+    private final File archiveFile;
+    private final int threadCount;
+
+    /**
+     * The constructor.
+     *
+     * @param archiveFile the archive file to read
+     * @param threadCount the maximum number of files to write at the same time
+     */
+    public ArchiveExtractor(File archiveFile, int threadCount) {
+        this.archiveFile = archiveFile;
+        this.threadCount = Math.max(threadCount, 1);
+    }
+
+    /**
+     * Extract the entries under an archive directory, optionally writing them to a different directory name.
+     * A regular file that is found where a directory is needed is removed.
+     *
+     * @param fromDirectoryName the archive directory to extract, without a trailing slash
+     * @param toDirectoryName   the directory below extractToLocation to which to write the entries
+     * @param extractToLocation the base directory to which to write the entries
+     * @return the counts of files written, skipped, and removed
+     * @throws WLSDeployArchiveIOException if the directory is not in the archive, or an error occurs reading the
+     *                                     archive or writing the files
+     */
+    public Result extractDirectory(String fromDirectoryName, String toDirectoryName, File extractToLocation)
+        throws WLSDeployArchiveIOException {
+        final String METHOD = "extractDirectory";
+        LOGGER.entering(CLASS, METHOD, fromDirectoryName, toDirectoryName, extractToLocation);
+
+        String dirName = fromDirectoryName.endsWith(ZIP_SEP) ? fromDirectoryName : fromDirectoryName + ZIP_SEP;
+        Result result = new Result();
+        try (ZipFile zip = new ZipFile(archiveFile, ZipFile.OPEN_READ)) {
+            Set<File> directories = new LinkedHashSet<>();
+            List<ZipEntry> fileEntries = new ArrayList<>();
+            List<File> targetFiles = new ArrayList<>();
+
+            Enumeration<? extends ZipEntry> entries = zip.entries();
+            while (entries.hasMoreElements()) {
+                ZipEntry entry = entries.nextElement();
+                String entryName = entry.getName();
+                if (!entryName.startsWith(dirName)) {
+                    continue;
+                }
+
+                String targetFileName = entryName.replace(fromDirectoryName + ZIP_SEP, toDirectoryName + SEP);
+                File targetFile = getTargetFile(extractToLocation, targetFileName);
+                if (entryName.endsWith(ZIP_SEP)) {
+                    directories.add(targetFile);
+                } else {
+                    directories.add(targetFile.getParentFile());
+                    fileEntries.add(entry);
+                    targetFiles.add(targetFile);
+                }
+            }
+
+            if (directories.isEmpty()) {
+                WLSDeployArchiveIOException ex =
+                    new WLSDeployArchiveIOException("WLSDPLY-01416", getArchiveFileName(), dirName);
+                LOGGER.throwing(CLASS, METHOD, ex);
+                throw ex;
+            }
+
+            // directories are created before any file is written, so the file writes are independent
+            for (File directory : directories) {
+                createDirectory(directory, result);
+            }
+            writeFiles(zip, fileEntries, targetFiles, result);
+        } catch (IOException ioe) {
+            WLSDeployArchiveIOException wdaioe = new WLSDeployArchiveIOException("WLSDPLY-01503", ioe,
+                getArchiveFileName(), ioe.getLocalizedMessage());
+            LOGGER.throwing(CLASS, METHOD, wdaioe);
+            throw wdaioe;
+        }
+
+        LOGGER.fine("WLSDPLY-01484", dirName, extractToLocation, result.getWrittenCount(), result.getSkippedCount(),
+            result.getRemovedCount());
+        LOGGER.exiting(CLASS, METHOD, result);
+        return result;
+    }
+
+    ///////////////////////////////////////////////////////////////////////////
+    // Private Helper methods                                                //
+    ///////////////////////////////////////////////////////////////////////////
+
+    private String getArchiveFileName() {
+        return archiveFile.getAbsolutePath();
+    }
+
+    private File getTargetFile(File extractLocation, String targetFileName) throws WLSDeployArchiveIOException {
+        String canonicalExtractLocation = FileUtils.getCanonicalPath(extractLocation);
+        File targetFile = new File(extractLocation, targetFileName);
+        String canonicalTargetFile = FileUtils.getCanonicalPath(targetFile);
+
+        if (!canonicalTargetFile.startsWith(canonicalExtractLocation)) {
+            throw new WLSDeployArchiveIOException("WLSDPLY-01431", getArchiveFileName(), targetFileName,
+                canonicalTargetFile, canonicalExtractLocation);
+        }
+        return targetFile;
+    }
+
+    private void createDirectory(File directory, Result result) throws WLSDeployArchiveIOException {
+        final String METHOD = "createDirectory";
+
+        if (directory.isFile()) {
+            if (!directory.delete()) {
+                WLSDeployArchiveIOException ex = new WLSDeployArchiveIOException("WLSDPLY-01414",
+                    getArchiveFileName(), directory.getAbsolutePath());
+                LOGGER.throwing(CLASS, METHOD, ex);
+                throw ex;
+            }
+            LOGGER.fine("WLSDPLY-01485", getArchiveFileName(), directory.getAbsolutePath());
+            result.removedCount++;
+        }
+
+        if (!directory.exists() && !directory.mkdirs()) {
+            WLSDeployArchiveIOException ex = new WLSDeployArchiveIOException("WLSDPLY-01414", getArchiveFileName(),
+                directory.getAbsolutePath());
+            LOGGER.throwing(CLASS, METHOD, ex);
+            throw ex;
+        }
+    }
+
+    private void writeFiles(final ZipFile zip, List<ZipEntry> fileEntries, List<File> targetFiles, Result result)
+        throws WLSDeployArchiveIOException {
+        final String METHOD = "writeFiles";
+
+        int poolSize = Math.min(threadCount, fileEntries.size());
+        if (poolSize <= 1) {
+            for (int i = 0; i < fileEntries.size(); i++) {
+                File targetFile = targetFiles.get(i);
+                try {
+                    result.addFile(writeFile(zip, fileEntries.get(i), targetFile));
+                } catch (IOException ioe) {
+                    throw getWriteException(targetFile, ioe, METHOD);
+                }
+            }
+            return;
+        }
+
+        ExecutorService executor = Executors.newFixedThreadPool(poolSize);
+        try {
+            List<Future<Boolean>> futures = new ArrayList<>();
+            for (int i = 0; i < fileEntries.size(); i++) {
+                final ZipEntry entry = fileEntries.get(i);
+                final File targetFile = targetFiles.get(i);
+                futures.add(executor.submit(new Callable<Boolean>() {
+                    @Override
+                    public Boolean call() throws IOException {
+                        return writeFile(zip, entry, targetFile);
+                    }
+                }));
+            }
+
+            for (int i = 0; i < futures.size(); i++) {
+                try {
+                    result.addFile(futures.get(i).get());
+                } catch (ExecutionException ee) {
+                    Throwable cause = ee.getCause();
+                    IOException ioe = cause instanceof IOException ? (IOException) cause : new IOException(cause);
+                    throw getWriteException(targetFiles.get(i), ioe, METHOD);
+                } catch (InterruptedException ie) {
+                    Thread.currentThread().interrupt();
+                    IOException ioe = new IOException(ie);
+                    throw getWriteException(targetFiles.get(i), ioe, METHOD);
+                }
+            }
+        } finally {
+            // stops any remaining writes if a write failed
+            executor.shutdownNow();
+        }
+    }
+
+    /**
+     * Write the zip entry to the target file, unless the target file already matches the entry.
+     *
+     * @return true if the file was written, false if it was skipped
+     */
+    private static boolean writeFile(ZipFile zip, ZipEntry entry, File targetFile) throws IOException {
+        if (isMatchingFile(entry, targetFile)) {
+            return false;
+        }
+
+        // overwrite any existing file
+        try (InputStream inputStream = zip.getInputStream(entry);
+             FileOutputStream outputStream = new FileOutputStream(targetFile, false)) {
+            byte[] readBuffer = new byte[READ_BUFFER_SIZE];
+            int bytesRead;
+            while ((bytesRead = inputStream.read(readBuffer)) >= 0) {
+                outputStream.write(readBuffer, 0, bytesRead);
+            }
+        }
+        return true;
+    }
+
+    private static boolean isMatchingFile(ZipEntry entry, File targetFile) throws IOException {
+        if (!targetFile.isFile() || entry.getCrc() == -1 || targetFile.length() != entry.getSize()) {
+            return false;
+        }
+
+        CRC32 crc = new CRC32();
+        try (InputStream inputStream = new FileInputStream(targetFile)) {
+            byte[] readBuffer = new byte[READ_BUFFER_SIZE];
+            int bytesRead;
+            while ((bytesRead = inputStream.read(readBuffer)) >= 0) {
+                crc.update(readBuffer, 0, bytesRead);
+            }
+        }
+        return crc.getValue() == entry.getCrc();
+    }
+
+    private WLSDeployArchiveIOException getWriteException(File targetFile, IOException ioe, String method) {
+        WLSDeployArchiveIOException wdaioe = new WLSDeployArchiveIOException("WLSDPLY-01415", ioe,
+            getArchiveFileName(), targetFile.getAbsolutePath(), ioe.getLocalizedMessage());
+        LOGGER.throwing(CLASS, method, wdaioe);
+        return wdaioe;
+    }
+
+    /**
+     * The counts of files written, skipped because the target file already matched the archive entry,
+     * and removed because they were found where a directory was needed.
+     */
+    public static class Result {
+        private int writtenCount;
+        private int skippedCount;
+        private int removedCount;
+
+        public int getWrittenCount() {
+            return writtenCount;
+        }
+
+        public int getSkippedCount() {
+            return skippedCount;
+        }
+
+        public int getRemovedCount() {
+            return removedCount;
+        }
+
+        /**
+         * Add the counts from another result to this result.
+         *
+         * @param other the other result
+         */
+        public void add(Result other) {
+            writtenCount += other.writtenCount;
+            skippedCount += other.skippedCount;
+            removedCount += other.removedCount;
+        }
+
+        private void addFile(boolean written) {
+            if (written) {
+                writtenCount++;
+            } else {
+                skippedCount++;
+            }
+        }
+
+        @Override
+        public String toString() {
+            return "written=" + writtenCount + ", skipped=" + skippedCount + ", removed=" + removedCount;
+        }
+    }
+}
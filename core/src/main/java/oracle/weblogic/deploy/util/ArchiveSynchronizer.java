@@ -0,0 +1,222 @@
+/*
+ * Copyright (c) 2026, Oracle and/or its affiliates.
+ * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+ */
+package oracle.weblogic.deploy.util;
+
+import java.io.File;
+import java.io.FileInputStream;
+import java.io.IOException;
+import java.io.InputStream;
+import java.util.ArrayList;
+import java.util.Collections;
+import java.util.LinkedHashMap;
+import java.util.List;
+import java.util.Map;
+import java.util.zip.CRC32;
+import java.util.zip.ZipEntry;
+
+import oracle.weblogic.deploy.logging.PlatformLogger;
+import oracle.weblogic.deploy.logging.WLSDeployLogFactory;
+
+/**
+ * Brings the contents of an archive file in line with a set of desired entries.  The desired entries are compared
+ * with the archive entries using the size and CRC-32 checksum of each file, and the resulting additions, replacements,
+ * and removals are applied to the archive file in a single rewrite.
+ */
+public class ArchiveSynchronizer {
+    private static final String CLASS = ArchiveSynchronizer.class.getName();
+    private static final PlatformLogger LOGGER = WLSDeployLogFactory.getLogger("wlsdeploy.archive");
+
+    private static final String ZIP_SEP = "/";
+    private static final int READ_BUFFER_SIZE = 4096;
+
+    private final WLSDeployArchive archive;
+
+    /**
+     * The constructor.
+     *
+     * @param archive the archive file to synchronize
+     */
+    public ArchiveSynchronizer(WLSDeployArchive archive) {
+        this.archive = archive;
+    }
+
+    /**
+     * Get the desired entries for the contents of a directory.  Each file is added below the archive path using its
+     * path relative to the directory.  Empty directories are added as directory entries.
+     *
+     * @param archivePath the archive path for the directory, either empty or ending with a slash
+     * @param directory   the directory
+     * @return the files keyed by entry name, with a null file for a directory entry
+     */
+    public static Map<String, File> getDirectoryEntries(String archivePath, File directory) {
+        Map<String, File> entries = new LinkedHashMap<>();
+        addDirectoryEntries(entries, archivePath, directory);
+        return entries;
+    }
+
+    /**
+     * Compare the desired entries with the archive file.
+     * A directory entry in the archive file is kept if it is a desired entry, or if a desired entry is below it.
+     *
+     * @param desiredEntries the files keyed by entry name, with a null file for a directory entry
+     * @param removeEntries  whether to remove archive entries that are not desired
+     * @return the changes needed to bring the archive file in line with the desired entries
+     * @throws WLSDeployArchiveIOException if an error occurs reading the archive file or a desired file
+     */
+    public Plan createPlan(Map<String, File> desiredEntries, boolean removeEntries)
+        throws WLSDeployArchiveIOException {
+        final String METHOD = "createPlan";
+        LOGGER.entering(CLASS, METHOD, desiredEntries, removeEntries);
+
+        Map<String, ZipEntry> archiveEntries = archive.getZipFile().getZipEntryDetails();
+        Plan plan = new Plan(desiredEntries);
+        for (Map.Entry<String, File> desiredEntry : desiredEntries.entrySet()) {
+            String entryName = desiredEntry.getKey();
+            ZipEntry archiveEntry = archiveEntries.get(entryName);
+            if (archiveEntry == null) {
+                plan.additions.add(entryName);
+            } else if (entryName.endsWith(ZIP_SEP) || isMatchingFile(archiveEntry, desiredEntry.getValue())) {
+                plan.unchangedCount++;
+            } else {
+                plan.replacements.add(entryName);
+            }
+        }
+
+        if (removeEntries) {
+            for (String entryName : archiveEntries.keySet()) {
+                if (!desiredEntries.containsKey(entryName) && !isParentDirectory(entryName, desiredEntries)) {
+                    plan.removals.add(entryName);
+                }
+            }
+        }
+
+        LOGGER.fine("WLSDPLY-01487", archive.getArchiveFileName(), plan.additions.size(), plan.replacements.size(),
+            plan.removals.size(), plan.unchangedCount);
+        LOGGER.exiting(CLASS, METHOD, plan);
+        return plan;
+    }
+
+    /**
+     * Apply the changes in the plan to the archive file in a single rewrite.
+     * The archive file is not rewritten if the plan has no changes.
+     *
+     * @param plan the plan from createPlan()
+     * @throws WLSDeployArchiveIOException if an error occurs reading or writing the archive file
+     */
+    public void applyPlan(Plan plan) throws WLSDeployArchiveIOException {
+        final String METHOD = "applyPlan";
+        LOGGER.entering(CLASS, METHOD, plan);
+
+        if (plan.hasChanges()) {
+            Map<String, File> newEntries = new LinkedHashMap<>();
+            for (String entryName : plan.getReplacements()) {
+                newEntries.put(entryName, plan.sources.get(entryName));
+            }
+            for (String entryName : plan.getAdditions()) {
+                newEntries.put(entryName, plan.sources.get(entryName));
+            }
+            archive.getZipFile().updateZipEntries(plan.getRemovals(), newEntries);
+        }
+        LOGGER.exiting(CLASS, METHOD);
+    }
+
+    ///////////////////////////////////////////////////////////////////////////
+    // Private Helper methods                                                //
+    ///////////////////////////////////////////////////////////////////////////
+
+    private static void addDirectoryEntries(Map<String, File> entries, String archivePath, File directory) {
+        File[] files = directory.listFiles();
+        if (files == null || files.length == 0) {
+            if (!archivePath.isEmpty()) {
+                entries.put(archivePath, null);
+            }
+            return;
+        }
+
+        for (File file : files) {
+            if (file.isDirectory()) {
+                addDirectoryEntries(entries, archivePath + file.getName() + ZIP_SEP, file);
+            } else {
+                entries.put(archivePath + file.getName(), file);
+            }
+        }
+    }
+
+    private static boolean isParentDirectory(String entryName, Map<String, File> desiredEntries) {
+        if (entryName.endsWith(ZIP_SEP)) {
+            for (String desiredName : desiredEntries.keySet()) {
+                if (desiredName.startsWith(entryName)) {
+                    return true;
+                }
+            }
+        }
+        return false;
+    }
+
+    private boolean isMatchingFile(ZipEntry archiveEntry, File file) throws WLSDeployArchiveIOException {
+        final String METHOD = "isMatchingFile";
+
+        // the CRC-32 is only computed if the sizes match
+        if (archiveEntry.getCrc() == -1 || file.length() != archiveEntry.getSize()) {
+            return false;
+        }
+
+        CRC32 crc = new CRC32();
+        try (InputStream inputStream = new FileInputStream(file)) {
+            byte[] readBuffer = new byte[READ_BUFFER_SIZE];
+            int bytesRead;
+            while ((bytesRead = inputStream.read(readBuffer)) >= 0) {
+                crc.update(readBuffer, 0, bytesRead);
+            }
+        } catch (IOException ioe) {
+            WLSDeployArchiveIOException ex = new WLSDeployArchiveIOException("WLSDPLY-01488", ioe,
+                file.getAbsolutePath(), archiveEntry.getName(), archive.getArchiveFileName(), ioe.getLocalizedMessage());
+            LOGGER.throwing(CLASS, METHOD, ex);
+            throw ex;
+        }
+        return crc.getValue() == archiveEntry.getCrc();
+    }
+
+    /**
+     * The changes needed to bring an archive file in line with the desired entries.
+     */
+    public static class Plan {
+        private final Map<String, File> sources;
+        private final List<String> additions = new ArrayList<>();
+        private final List<String> replacements = new ArrayList<>();
+        private final List<String> removals = new ArrayList<>();
+        private int unchangedCount;
+
+        private Plan(Map<String, File> sources) {
+            this.sources = sources;
+        }
+
+        public List<String> getAdditions() {
+            return Collections.unmodifiableList(additions);
+        }
+
+        public List<String> getReplacements() {
+            return Collections.unmodifiableList(replacements);
+        }
+
+        public List<String> getRemovals() {
+            return Collections.unmodifiableList(removals);
+        }
+
+        public int getUnchangedCount() {
+            return unchangedCount;
+        }
+
+        public boolean hasChanges() {
+            return !additions.isEmpty() || !replacements.isEmpty() || !removals.isEmpty();
+        }
+
+        @Override
+        public String toString() {
+            return "additions=" + additions.size() + ", replacements=" + replacements.size() + ", removals=" +
+                removals.size() + ", unchanged=" + unchangedCount;
+        }
+    }
+}
@@ -1,19 +1,16 @@
 /*
- * Copyright (c) 2017, 2022, Oracle and/or its affiliates.
+ * Copyright (c) 2017, 2026, Oracle and/or its affiliates.
  * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
  */
 package oracle.weblogic.deploy.util;
 
 import java.io.IOException;
 import java.io.ObjectInputStream;
-import java.util.ArrayList;
-import java.util.Collection;
 import java.util.Iterator;
 import java.util.LinkedHashMap;
-import java.util.LinkedHashSet;
-import java.util.List;
 import java.util.Map;
-import java.util.Set;
+import java.util.concurrent.ConcurrentMap;
+import java.util.concurrent.atomic.AtomicInteger;
 
 import oracle.weblogic.deploy.exception.ExceptionHelper;
 import oracle.weblogic.deploy.logging.PlatformLogger;
@@ -31,13 +28,22 @@ import org.python.core.ThreadState;
 
 /**
  * A basic implementation of a Python dictionary that preserves order.
+ * <p>
+ * The entries are kept in a single ordered store. Copies of a dictionary share its store until
+ * one of them is changed, so shallow copies, and deep copies of dictionaries that only have
+ * immutable values, do not copy any entries. With Jython 2.2.1, the entries are also kept in the
+ * PyDictionary table, and copies do not share stores.
  */
 public final class PyOrderedDict extends PyDictionary implements Iterable<PyObject> {
     private static final long serialVersionUID = 1L;
 
     private static final PlatformLogger LOGGER = WLSDeployLogFactory.getLogger("wlsdeploy.util");
 
-    private final LinkedHashMap<PyObject, PyObject> linkedHashMap;
+    // Jython 2.7 uses getMap() for the PyDictionary operations that are not overridden here,
+    // so the ordered store can replace the PyDictionary table. Jython 2.2.1 uses its table directly.
+    private static final boolean MIRROR_TABLE = !hasBackingMapAccessor();
+
+    private Store store;
 
     private final transient CommentMap commentMap = new CommentMap();
 
@@ -46,7 +52,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     public PyOrderedDict() {
         super(PyType.fromClass(PyOrderedDict.class));
-        this.linkedHashMap = new LinkedHashMap<>();
+        this.store = new Store();
     }
 
     /**
@@ -56,8 +62,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     public PyOrderedDict(PyOrderedDict other) {
         this();
-        super.update(other);
-        update(other);
+        copyFrom(other);
     }
 
     /**
@@ -105,8 +110,8 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
             return -2;
         } else {
             other = (PyOrderedDict) obOther;
-            int an = this.linkedHashMap.size();
-            int bn = other.linkedHashMap.size();
+            int an = this.store.size();
+            int bn = other.store.size();
             if (an < bn) {
                 return -1;
             } else if (an > bn) {
@@ -120,7 +125,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
         akeys.sort();
         bkeys.sort();
 
-        for (int i = 0; i < other.linkedHashMap.size(); i++) {
+        for (int i = 0; i < other.store.size(); i++) {
             PyObject akey = akeys.pyget(i);
             PyObject bkey = bkeys.pyget(i);
             int c = akey._cmp(bkey);
@@ -163,6 +168,9 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      * types encountered will log an error and return the original object without
      * copying.  Support for new types can be added in the switch statement in
      * the internal doDeepCopy() method.
+     * <p>
+     * If all the values of this dictionary are immutable, the new dictionary shares the entries
+     * of this dictionary until either of them is changed.
      *
      * @param memo the memo dictionary that keeps track of the new versions of the original objects
      * @return a new deepcopy of this PyOrderedDictionary
@@ -186,7 +194,12 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
         // referenced from one of it's attributes.
         memoDict.__setitem__(new PyString(Py.idstr(this)), newPyOrderedDict);
 
-        for (Map.Entry<PyObject, PyObject> entry : linkedHashMap.entrySet()) {
+        if (!MIRROR_TABLE && hasOnlyImmutableValues()) {
+            newPyOrderedDict.shareStore(this);
+            return newPyOrderedDict;
+        }
+
+        for (Map.Entry<PyObject, PyObject> entry : store.entrySet()) {
             PyObject newKey = doDeepCopy(entry.getKey(), memo);
             PyObject newValue = doDeepCopy(entry.getValue(), memo);
             newPyOrderedDict.__setitem__(newKey, newValue);
@@ -199,13 +212,13 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public void __delitem__(PyObject key) {
-        synchronized (this.linkedHashMap){
-            PyObject ret = this.linkedHashMap.remove(key);
-            if (ret == null) {
-                throw Py.KeyError(key.toString());
-            }
+        if (!this.store.containsKey(key)) {
+            throw Py.KeyError(key.toString());
+        }
+        getWritableStore().remove(key);
+        if (MIRROR_TABLE) {
+            super.__delitem__(key);
         }
-        super.__delitem__(key);
     }
 
     /**
@@ -219,24 +232,15 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
 
         PyObject result = Py.One;
         PyOrderedDict other = (PyOrderedDict)obOther;
-        int an = this.linkedHashMap.size();
-        int bn = other.linkedHashMap.size();
+        int an = this.store.size();
+        int bn = other.store.size();
         if (an != bn) {
             result = Py.Zero;
-        } else {
-            PyList akeys = keys();
-            for (int i = 0; i < an; i++) {
-                PyObject akey = akeys.pyget(i);
-                PyObject bvalue = other.__finditem__(akey);
-                if (bvalue == null) {
+        } else if (this.store != other.store) {
+            for (Map.Entry<PyObject, PyObject> entry : this.store.entrySet()) {
+                PyObject bvalue = other.__finditem__(entry.getKey());
+                if (bvalue == null || !entry.getValue()._eq(bvalue).__nonzero__()) {
                     result = Py.Zero;
-                } else {
-                    PyObject avalue = __finditem__(akey);
-                    if (!avalue._eq(bvalue).__nonzero__()) {
-                        result = Py.Zero;
-                    }
-                }
-                if (result == Py.Zero) {
                     break;
                 }
             }
@@ -252,12 +256,29 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
         return this.get(key);
     }
 
+    /**
+     * {@inheritDoc}
+     */
+    @Override
+    public PyObject __getitem__(PyObject key) {
+        if (MIRROR_TABLE) {
+            return super.__getitem__(key);
+        }
+
+        // Jython 2.7 would use getMap(), which prepares the store to be changed
+        PyObject result = this.store.get(key);
+        if (result == null) {
+            throw Py.KeyError(key.toString());
+        }
+        return result;
+    }
+
     /**
      * {@inheritDoc}
      */
     @Override
     public PyObject __iter__(){
-        return new PyOrderedDictIter(this, this.linkedHashMap.keySet(), PyOrderedDictIter.KEYS);
+        return new PyOrderedDictIter(this.store, PyOrderedDictIter.KEYS);
     }
 
     /**
@@ -265,7 +286,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public int __len__() {
-        return this.linkedHashMap.size();
+        return this.store.size();
     }
 
     /**
@@ -273,7 +294,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public boolean __nonzero__() {
-        return this.linkedHashMap.size() != 0;
+        return !this.store.isEmpty();
     }
 
     /**
@@ -281,13 +302,11 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public void __setitem__(PyObject key, PyObject value) {
-        synchronized (this.linkedHashMap) {
-            this.linkedHashMap.put(key, value);
+        getWritableStore().put(key, value);
+        if (MIRROR_TABLE) {
+            // do not access protected field directly.
+            super.__setitem__(key, value);
         }
-        // do not access protected field directly.
-        // 2.7 version does not have table variable.
-        // Neither version has synchronization on the table.
-        super.__setitem__(key, value);
     }
 
     /**
@@ -295,17 +314,28 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public void clear() {
-        this.linkedHashMap.clear();
-        super.clear();
+        Store current = this.store;
+        synchronized (current) {
+            if (current.isShared()) {
+                current.release();
+                this.store = new Store();
+            } else {
+                current.clear();
+            }
+        }
+        if (MIRROR_TABLE) {
+            super.clear();
+        }
     }
 
     /**
      * {@inheritDoc}
+     * The new dictionary shares the entries of this dictionary until either of them is changed.
      */
     @Override
     public PyOrderedDict copy() {
         PyOrderedDict newPyOrderedDict = new PyOrderedDict();
-        newPyOrderedDict.doUpdate(this);
+        newPyOrderedDict.copyFrom(this);
         return newPyOrderedDict;
     }
 
@@ -324,9 +354,10 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
     public PyObject get(PyObject key, PyObject defaultObject) {
         // Cannot use getOrDefault() as this is a Java 8 method and
         // the project is attempting to be compatible with Java 7...
-        PyObject result = defaultObject;
-        if (linkedHashMap.containsKey(key)) {
-            result = linkedHashMap.get(key);
+        // The store never has null values, so a single lookup is enough.
+        PyObject result = this.store.get(key);
+        if (result == null) {
+            result = defaultObject;
         }
         return result;
     }
@@ -336,7 +367,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public boolean has_key(PyObject key) {
-        return this.linkedHashMap.containsKey(key);
+        return this.store.containsKey(key);
     }
 
     /**
@@ -344,12 +375,12 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public PyList items() {
-        Set<Map.Entry<PyObject, PyObject>> entries = this.linkedHashMap.entrySet();
-        List<PyObject> l = new ArrayList<>(entries.size());
-        for (Map.Entry<PyObject, PyObject> entry: entries) {
-            l.add(new PyTuple(new PyObject[] { entry.getKey(), entry.getValue() }));
+        PyObject[] items = new PyObject[this.store.size()];
+        int i = 0;
+        for (Map.Entry<PyObject, PyObject> entry: this.store.entrySet()) {
+            items[i++] = new PyTuple(new PyObject[] { entry.getKey(), entry.getValue() });
         }
-        return new PyList(l.toArray(new PyObject[0]));
+        return new PyList(items);
     }
 
     /**
@@ -357,7 +388,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public Iterator<PyObject> iterator(){
-        return new PyOrderedDictIter(this, this.linkedHashMap.keySet(), PyOrderedDictIter.ITEMS);
+        return new PyOrderedDictIter(this.store, PyOrderedDictIter.ITEMS);
     }
 
     /**
@@ -365,7 +396,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public PyObject iterkeys() {
-        return new PyOrderedDictIter(this, this.linkedHashMap.keySet(), PyOrderedDictIter.KEYS);
+        return new PyOrderedDictIter(this.store, PyOrderedDictIter.KEYS);
     }
 
     /**
@@ -373,7 +404,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public PyObject itervalues() {
-        return new PyOrderedDictIter(this, this.linkedHashMap.keySet(), PyOrderedDictIter.VALUES);
+        return new PyOrderedDictIter(this.store, PyOrderedDictIter.VALUES);
     }
 
     /**
@@ -381,7 +412,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public PyObject iteritems() {
-        return new PyOrderedDictIter(this, this.linkedHashMap.keySet(), PyOrderedDictIter.ITEMS);
+        return new PyOrderedDictIter(this.store, PyOrderedDictIter.ITEMS);
     }
 
     /**
@@ -389,10 +420,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public PyList keys() {
-        Set<PyObject> keys = this.linkedHashMap.keySet();
-        List<PyObject> v = new ArrayList<>(keys.size());
-        v.addAll(keys);
-        return new PyList(v.toArray(new PyObject[0]));
+        return new PyList(this.store.keySet().toArray(new PyObject[this.store.size()]));
     }
 
     /**
@@ -411,7 +439,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
         if (!this.__contains__(key)) {
             return defaultValue;
         }
-        PyObject val = this.get(key);
+        PyObject val = this.store.get(key);
         this.__delitem__(key);
         return val;
     }
@@ -426,9 +454,8 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
             return "{...}";
         }
 
-        Set<Map.Entry<PyObject, PyObject>> entries = this.linkedHashMap.entrySet();
         StringBuilder buf = new StringBuilder("{");
-        for (Map.Entry<PyObject, PyObject> entry: entries) {
+        for (Map.Entry<PyObject, PyObject> entry: this.store.entrySet()) {
             buf.append((entry.getKey()).__repr__());
             buf.append(": ");
             buf.append((entry.getValue()).__repr__());
@@ -473,10 +500,19 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      * @return an ordered list of values
      */
     public PyList getValues() {
-        Collection<PyObject> values = this.linkedHashMap.values();
-        List<PyObject> v = new ArrayList<>(values.size());
-        v.addAll(values);
-        return new PyList(v.toArray(new PyObject[0]));
+        return new PyList(this.store.values().toArray(new PyObject[this.store.size()]));
+    }
+
+    /**
+     * Return the ordered store of this dictionary.
+     * Jython 2.7 uses this method for the PyDictionary operations that are not overridden by this class.
+     * The caller may change the store, so it is no longer shared with any copies of this dictionary.
+     * Jython 2.2.1 does not have this method, and does not call it.
+     *
+     * @return the ordered store
+     */
+    public ConcurrentMap<PyObject, PyObject> getMap() {
+        return getWritableStore();
     }
 
     public CommentMap getCommentMap() {
@@ -501,7 +537,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
             result = super.equals(other);
             if (result) {
                 PyOrderedDict otherDict = (PyOrderedDict) other;
-                result = this.linkedHashMap.equals(otherDict.linkedHashMap) &&
+                result = this.store.equals(otherDict.store) &&
                     this.commentMap.equals(otherDict.commentMap);
             }
         }
@@ -513,11 +549,83 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
      */
     @Override
     public int hashCode() {
-        return super.hashCode() >> 8 + this.linkedHashMap.hashCode() >> 4 + this.commentMap.hashCode();
+        return super.hashCode() >> 8 + this.store.hashCode() >> 4 + this.commentMap.hashCode();
     }
 
     // private methods
 
+    private static boolean hasBackingMapAccessor() {
+        try {
+            PyDictionary.class.getMethod("getMap");
+            return true;
+        } catch (NoSuchMethodException e) {
+            return false;
+        }
+    }
+
+    /**
+     * Return the store of this dictionary, first making a private copy of it if it is shared.
+     * The copy is made while holding the store's lock, and the store is released after it is copied,
+     * so a dictionary in another thread that shares the store does not change it during the copy.
+     */
+    private Store getWritableStore() {
+        Store current = this.store;
+        synchronized (current) {
+            if (current.isShared()) {
+                Store copy = new Store(current);
+                current.release();
+                this.store = copy;
+            }
+        }
+        return this.store;
+    }
+
+    /**
+     * Add all the entries of the other dictionary to this empty dictionary.
+     * If the table is not mirrored, this dictionary shares the other dictionary's store.
+     */
+    private void copyFrom(PyOrderedDict other) {
+        if (MIRROR_TABLE) {
+            doUpdate(other);
+        } else {
+            shareStore(other);
+        }
+    }
+
+    private void shareStore(PyOrderedDict other) {
+        Store otherStore = other.store;
+        synchronized (otherStore) {
+            this.store = otherStore.share();
+        }
+    }
+
+    private boolean hasOnlyImmutableValues() {
+        for (PyObject value : this.store.values()) {
+            if (!isImmutable(value)) {
+                return false;
+            }
+        }
+        return true;
+    }
+
+    private static boolean isImmutable(PyObject value) {
+        switch(value.getType().fastGetName()) {
+            case "bool":
+            case "float":
+            case "int":
+            case "long":
+            case "NoneType":
+            case "str":
+            case "unicode":
+            case "PyRealBoolean":
+            case "oracle.weblogic.deploy.util.PyRealBoolean":
+                return true;
+
+            default:
+                return false;
+        }
+    }
+
     private static PyObject dictFromKeys(PyType type, PyObject keys, PyObject value) {
         if (value == null) {
             value = Py.None;
@@ -531,12 +639,18 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
     }
 
     private void doUpdate(PyDictionary od) {
-        PyList pylist = od.items();
+        if (od instanceof PyOrderedDict) {
+            PyOrderedDict other = (PyOrderedDict) od;
+            for (Map.Entry<PyObject, PyObject> entry : other.store.entrySet()) {
+                this.__setitem__(entry.getKey(), entry.getValue());
+            }
+            return;
+        }
 
+        PyList pylist = od.items();
         for (int i = 0; i < pylist.size(); i++) {
             PyTuple tuple = (PyTuple) pylist.get(i);
             this.__setitem__(Py.java2py(tuple.get(0)), Py.java2py(tuple.get(1)));
-            super.__setitem__(Py.java2py(tuple.get(0)), Py.java2py(tuple.get(1)));
         }
     }
 
@@ -548,23 +662,15 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
     }
 
     private static PyObject doDeepCopy(PyObject orig, PyObject memo) {
+        if (isImmutable(orig)) {
+            return orig;
+        }
+
         PyObject result;
         PyType origType = orig.getType();
 
         String typeName = origType.fastGetName();
         switch(typeName) {
-            case "bool":
-            case "float":
-            case "int":
-            case "long":
-            case "NoneType":
-            case "str":
-            case "unicode":
-            case "PyRealBoolean":
-            case "oracle.weblogic.deploy.util.PyRealBoolean":
-                result = orig;
-                break;
-
             case "list":
                 result = deepCopyList(orig, memo);
                 break;
@@ -617,8 +723,92 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
         return newDict;
     }
 
+    /**
+     * The ordered store for the entries of one or more PyOrderedDict objects.
+     * A store that is shared is not changed, each dictionary makes its own copy before changing it.
+     * The shared count is changed, and a shared store is copied, while holding the store's lock,
+     * so dictionaries in different threads can share a store.
+     * This class implements ConcurrentMap to match the return type of PyDictionary.getMap() in Jython 2.7,
+     * but the map operations are not thread-safe, and it is used as an ordered map.
+     */
+    static final class Store extends LinkedHashMap<PyObject, PyObject> implements ConcurrentMap<PyObject, PyObject> {
+        private static final long serialVersionUID = 1L;
+
+        // the number of dictionaries using this store, in addition to the first one
+        private final AtomicInteger sharedCount = new AtomicInteger();
+
+        private Store() {
+            super();
+        }
+
+        private Store(Map<PyObject, PyObject> other) {
+            super(other);
+        }
+
+        private boolean isShared() {
+            return this.sharedCount.get() > 0;
+        }
+
+        private Store share() {
+            this.sharedCount.incrementAndGet();
+            return this;
+        }
+
+        private void release() {
+            this.sharedCount.decrementAndGet();
+        }
+
+        /**
+         * {@inheritDoc}
+         */
+        @Override
+        public PyObject putIfAbsent(PyObject key, PyObject value) {
+            PyObject result = get(key);
+            if (result == null) {
+                put(key, value);
+            }
+            return result;
+        }
+
+        /**
+         * {@inheritDoc}
+         */
+        @Override
+        public boolean remove(Object key, Object value) {
+            if (containsKey(key) && get(key).equals(value)) {
+                remove(key);
+                return true;
+            }
+            return false;
+        }
+
+        /**
+         * {@inheritDoc}
+         */
+        @Override
+        public boolean replace(PyObject key, PyObject oldValue, PyObject newValue) {
+            if (containsKey(key) && get(key).equals(oldValue)) {
+                put(key, newValue);
+                return true;
+            }
+            return false;
+        }
+
+        /**
+         * {@inheritDoc}
+         */
+        @Override
+        public PyObject replace(PyObject key, PyObject value) {
+            if (containsKey(key)) {
+                return put(key, value);
+            }
+            return null;
+        }
+    }
+
     /**
      * Iterator class for PyOrderedDict class.
+     * The iterator reads the entries of the store directly, without copying them.
      */
     static final class PyOrderedDictIter extends PyIterator implements Iterator<PyObject> {
         private static final long serialVersionUID = 1L;
@@ -627,16 +817,14 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
         private static final int VALUES = 1;
         private static final int ITEMS = 2;
 
-        private final PyObject orderedDict;
-        private final Set<PyObject> dictKeys;
+        private final Map<PyObject, PyObject> entries;
         private final int type;
-        private transient Iterator<PyObject> iter;
+        private transient Iterator<Map.Entry<PyObject, PyObject>> iter;
 
-        private PyOrderedDictIter(PyObject orderedDict, Set<PyObject> dictKeys, int type) {
-            this.orderedDict = orderedDict;
-            this.dictKeys = new LinkedHashSet<>(dictKeys);
+        private PyOrderedDictIter(Map<PyObject, PyObject> entries, int type) {
+            this.entries = entries;
             this.type = type;
-            this.iter = dictKeys.iterator();
+            this.iter = entries.entrySet().iterator();
         }
 
         /**
@@ -662,18 +850,18 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
         public PyObject next() {
             PyObject result = null;
             if (hasNext()) {
-                PyObject key = this.iter.next();
+                Map.Entry<PyObject, PyObject> entry = this.iter.next();
                 switch (type) {
                     case VALUES:
-                        result = orderedDict.__finditem__(key);
+                        result = entry.getValue();
                         break;
 
                     case ITEMS:
-                        result = new PyTuple(new PyObject[] { key, orderedDict.__finditem__(key) });
+                        result = new PyTuple(new PyObject[] { entry.getKey(), entry.getValue() });
                         break;
 
                     default: // KEYS
-                        result = key;
+                        result = entry.getKey();
                         break;
                 }
             }
@@ -683,7 +871,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
         @SuppressWarnings("unused")
         private void readObject(ObjectInputStream in) throws IOException, ClassNotFoundException {
             in.defaultReadObject();
-            iter = dictKeys.iterator();
+            iter = entries.entrySet().iterator();
         }
 
         /**
@@ -705,8 +893,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
                 result = super.equals(other);
                 if (result) {
                     PyOrderedDictIter otherIter = (PyOrderedDictIter) other;
-                    result = this.orderedDict.equals(otherIter.orderedDict) &&
-                        this.dictKeys.equals(otherIter.dictKeys) &&
+                    result = this.entries.equals(otherIter.entries) &&
                         this.type == otherIter.type &&
                         this.iter.equals(otherIter.iter);
                 }
@@ -716,8 +903,7 @@ public final class PyOrderedDict extends PyDictionary implements Iterable<PyObje
 
         @Override
         public int hashCode() {
-            return super.hashCode() >> 16 + this.orderedDict.hashCode() >> 12 +
-                this.dictKeys.hashCode() >> 8 + this.iter.hashCode() >> 4 +
+            return super.hashCode() >> 16 + this.entries.hashCode() >> 8 + this.iter.hashCode() >> 4 +
                 Integer.valueOf(this.type).hashCode();
         }
     }
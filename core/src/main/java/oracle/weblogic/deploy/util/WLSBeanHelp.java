@@ -1,5 +1,5 @@
 /*
- * Copyright (c) 2022, 2024, Oracle and/or its affiliates.
+ * Copyright (c) 2022, 2026, Oracle and/or its affiliates.
  * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
  */
 package oracle.weblogic.deploy.util;
@@ -11,6 +11,7 @@ import java.beans.PropertyDescriptor;
 import java.lang.reflect.Method;
 import java.util.ArrayList;
 import java.util.HashMap;
+import java.util.List;
 
 /**
  * Helper for getting attribute descriptions from a WL mbean.
@@ -62,6 +63,50 @@ public class WLSBeanHelp {
     return get(beanName, null, width, null);
   }
 
+  // gets description of given bean or property as plain text, without wrapping
+  //   - returns "" if not found
+  //   - if propName is null, gets description of bean,
+  //     else gets description of prop
+  //   - does not include the prop limits, see the getLegal* methods
+  public static String getDescription(String beanName, String propName) {
+    String ds;
+
+    if (propName == null)
+      ds = getFeatureDescription(getBeanDescriptor(beanName));
+    else
+      ds = getFeatureDescription(getPropertyDescriptor(beanName, propName));
+
+    if (ds.length() == 0)
+      return "";
+
+    return prettyHTML(ds, Integer.MAX_VALUE).trim();
+  }
+
+  // gets the legal values for given bean prop
+  //   - returns an empty list if not found or not restricted
+  public static List<String> getLegalValues(String beanName, String propName) {
+    PropertyDescriptor pd = getPropertyDescriptor(beanName, propName);
+    if (pd == null) return new ArrayList<>();
+
+    Object lval = pd.getValue(PD_ATT_LEGALVALUES);
+    if (lval == null) return new ArrayList<>();
+
+    ArrayList<String> ret = new ArrayList<>();
+    for (String val : legalValues(lval))
+      ret.add(val.trim());
+    return ret;
+  }
+
+  // gets the legal minimum for given bean prop, or null if not found
+  public static String getLegalMin(String beanName, String propName) {
+    return getPropertyValue(beanName, propName, PD_ATT_LEGALMIN);
+  }
+
+  // gets the legal maximum for given bean prop, or null if not found
+  public static String getLegalMax(String beanName, String propName) {
+    return getPropertyValue(beanName, propName, PD_ATT_LEGALMAX);
+  }
+
   // convert basic javadoc HTML to plain text
   // (package visible to enable unit testing)
   static String prettyHTML(String html, int margin) {
@@ -107,6 +152,16 @@ public class WLSBeanHelp {
     return ret.toString();
   }
 
+  // gets a property descriptor attribute value as a string, or null if not found
+  private static String getPropertyValue(String beanName, String propName, String attributeName) {
+    PropertyDescriptor pd = getPropertyDescriptor(beanName, propName);
+    if (pd == null) return null;
+
+    Object value = pd.getValue(attributeName);
+    if (value == null) return null;
+    return value.toString();
+  }
+
   // can return null if not found
   private static PropertyDescriptor getPropertyDescriptor(String beanName, String propName) {
     try {
@@ -12,6 +12,7 @@ import java.nio.file.Files;
 import java.security.NoSuchAlgorithmException;
 import java.util.ArrayList;
 import java.util.Arrays;
+import java.util.Collections;
 import java.util.HashSet;
 import java.util.List;
 import java.util.ListIterator;
@@ -251,9 +252,15 @@ public class WLSDeployArchive {
     private static final int HTTP_CREATED = 201;
     private static final Pattern ARCHIVE_SUBDIR_PATTERN = Pattern.compile("^wlsdeploy/(\\w*)/.*$");
 
+    /**
+     * The default maximum number of files that are written at the same time when extracting a directory.
+     */
+    public static final int DEFAULT_EXTRACTION_THREADS = 4;
+
     private static final PlatformLogger LOGGER = WLSDeployLogFactory.getLogger("wlsdeploy.archive");
 
     private WLSDeployZipFile zipFile;
+    private int extractionThreads = DEFAULT_EXTRACTION_THREADS;
 
     /**
      * Constructor for a JCSLifecycleArchive, which hides the details of the bundle generated by export domain.
@@ -673,6 +680,24 @@ public class WLSDeployArchive {
         return getZipFile().getFileName();
     }
 
+    /**
+     * Get the maximum number of files that are written at the same time when extracting a directory.
+     *
+     * @return the maximum number of extraction threads
+     */
+    public int getExtractionThreads() {
+        return extractionThreads;
+    }
+
+    /**
+     * Set the maximum number of files that are written at the same time when extracting a directory.
+     *
+     * @param extractionThreads the maximum number of extraction threads, values less than 1 are treated as 1
+     */
+    public void setExtractionThreads(int extractionThreads) {
+        this.extractionThreads = Math.max(extractionThreads, 1);
+    }
+
     /**
      * Get the list of entries in the archive file.
      *
@@ -1055,16 +1080,19 @@ public class WLSDeployArchive {
         validateExistingDirectory(domainHome, "domainHome", getArchiveFileName(), METHOD);
 
         List<String> entries = getZipFile().listZipEntries();
+        ArchiveExtractor.Result result = new ArchiveExtractor.Result();
 
         if(zipListContainsPath(entries, WLSDPLY_ARCHIVE_BINARY_DIR + ZIP_SEP)) {
-            extractDirectoryFromZip(WLSDPLY_ARCHIVE_BINARY_DIR + ZIP_SEP, domainHome);
+            result.add(extractDirectoryFromZip(WLSDPLY_ARCHIVE_BINARY_DIR + ZIP_SEP, domainHome));
         }
 
         if(zipListContainsPath(entries, WLSDPLY_ARCHIVE_CONFIG_DIR_PREFIX)) {
-            extractDirectoryFromZip(WLSDPLY_ARCHIVE_CONFIG_DIR_PREFIX, domainHome);
+            result.add(extractDirectoryFromZip(WLSDPLY_ARCHIVE_CONFIG_DIR_PREFIX, domainHome));
         }
 
-        LOGGER.exiting(CLASS, METHOD);
+        LOGGER.info("WLSDPLY-01486", getArchiveFileName(), domainHome, result.getWrittenCount(),
+            result.getSkippedCount(), result.getRemovedCount());
+        LOGGER.exiting(CLASS, METHOD, result);
     }
 
     /**
@@ -1151,14 +1179,35 @@ public class WLSDeployArchive {
     }
 
     public String addItem(ArchiveEntryType archiveType, String sourcePath) throws WLSDeployArchiveIOException {
+        return addItem(archiveType, sourcePath, Collections.<ArchiveEntryTransformer>emptyList());
+    }
+
+    /**
+     * Add a file or directory to the archive, passing the content of each file through the transformers,
+     * in order, as it is written to the archive.
+     *
+     * @param archiveType  the type of the entry
+     * @param sourcePath   the file or directory to add
+     * @param transformers the transformers to apply to the content of each file
+     * @return the new name of the entry in the archive, or null if a transformer excluded a single file
+     * @throws WLSDeployArchiveIOException if an error occurs reading the file or writing the archive
+     * @throws IllegalArgumentException    if the file or directory does not exist
+     */
+    public String addItem(ArchiveEntryType archiveType, String sourcePath, List<ArchiveEntryTransformer> transformers)
+        throws WLSDeployArchiveIOException {
         final String METHOD = "addItem";
-        LOGGER.entering(CLASS, METHOD, archiveType, sourcePath);
+        LOGGER.entering(CLASS, METHOD, archiveType, sourcePath, transformers);
 
         File filePath = FileUtils.getCanonicalFile(sourcePath);
         validateExistingFile(filePath, "path", getArchiveFileName(), METHOD, true);
 
         String pathPrefix = getPathForType(archiveType);
-        String newName = addItemToZip(pathPrefix, filePath);
+        String newName;
+        if (transformers.isEmpty()) {
+            newName = addItemToZip(pathPrefix, filePath);
+        } else {
+            newName = addTransformedItemToZip(pathPrefix, filePath, transformers);
+        }
 
         LOGGER.exiting(CLASS, METHOD, newName);
         return newName;
@@ -1185,6 +1234,66 @@ public class WLSDeployArchive {
         return newName;
     }
 
+    /**
+     * Add a file or directory to the archive at the specified archive path, replacing any existing entries
+     * at that path. This is used to place files at the archive paths that discoverDomain -remote
+     * wrote into the model, so the entry is never renamed.
+     *
+     * @param archivePath the path of the entry in the archive (e.g., wlsdeploy/applications/foo.ear)
+     * @param sourcePath  the file or directory to add
+     * @return the name of the entry in the archive
+     * @throws WLSDeployArchiveIOException if an error occurs reading the file or writing the archive
+     * @throws IllegalArgumentException    if the archive path is empty or the file or directory does not exist
+     */
+    public String addItemAtPath(String archivePath, String sourcePath) throws WLSDeployArchiveIOException {
+        final String METHOD = "addItemAtPath";
+        LOGGER.entering(CLASS, METHOD, archivePath, sourcePath);
+
+        validateNonEmptyString(archivePath, "archivePath", METHOD);
+        File filePath = FileUtils.getCanonicalFile(sourcePath);
+        validateExistingFile(filePath, "sourcePath", getArchiveFileName(), METHOD, true);
+
+        String newName = archivePath;
+        if (newName.endsWith(ZIP_SEP)) {
+            newName = newName.substring(0, newName.length() - 1);
+        }
+
+        if (filePath.isDirectory()) {
+            newName += ZIP_SEP;
+            getZipFile().removeZipEntries(newName);
+            newName = getZipFile().addDirectoryZipEntries(newName, filePath);
+        } else {
+            getZipFile().removeZipEntry(newName);
+            newName = addSingleFileToZip(filePath, newName, METHOD);
+        }
+
+        LOGGER.exiting(CLASS, METHOD, newName);
+        return newName;
+    }
+
+    /**
+     * Add an empty directory to the archive at the specified archive path, if it is not already present.
+     *
+     * @param archivePath the path of the directory in the archive (e.g., wlsdeploy/stores/fs1/)
+     * @return the name of the directory entry in the archive
+     * @throws WLSDeployArchiveIOException if an error occurs writing the archive
+     * @throws IllegalArgumentException    if the archive path is empty
+     */
+    public String addEmptyDirectoryAtPath(String archivePath) throws WLSDeployArchiveIOException {
+        final String METHOD = "addEmptyDirectoryAtPath";
+        LOGGER.entering(CLASS, METHOD, archivePath);
+
+        validateNonEmptyString(archivePath, "archivePath", METHOD);
+        String newName = archivePath;
+        if (!newName.endsWith(ZIP_SEP)) {
+            newName += ZIP_SEP;
+        }
+        getZipFile().addZipDirectoryEntry(newName);
+
+        LOGGER.exiting(CLASS, METHOD, newName);
+        return newName;
+    }
+
     /**
      * Extracts the named file or directory from the archive into the specified directory,
      * preserving any archive directory structure.
@@ -6112,6 +6221,46 @@ public class WLSDeployArchive {
         return newName;
     }
 
+    protected String addTransformedItemToZip(String zipPathPrefix, File itemToAdd,
+        List<ArchiveEntryTransformer> transformers) throws WLSDeployArchiveIOException {
+        final String METHOD = "addTransformedItemToZip";
+
+        LOGGER.entering(CLASS, METHOD, zipPathPrefix, itemToAdd.getAbsolutePath(), transformers);
+        String newName = getArchiveName(zipPathPrefix, itemToAdd.getName(), true);
+        if (itemToAdd.isDirectory()) {
+            if (!newName.endsWith(ZIP_SEP)) {
+                newName += ZIP_SEP;
+            }
+            LOGGER.finer("WLSDPLY-01408", newName, itemToAdd);
+            newName = getZipFile().addDirectoryZipEntries(newName, itemToAdd, transformers);
+            LOGGER.finer("WLSDPLY-01409", newName, itemToAdd);
+        } else {
+            // the transformers get the name of the entry as it will be stored, after any rename
+            newName = getZipFile().getUniqueEntryName(newName);
+            String entryFileName = newName.substring(newName.lastIndexOf(ZIP_SEP) + 1);
+            FileInputStream inputStream = getFileInputStream(itemToAdd, newName, getArchiveFileName(), METHOD);
+            InputStream content =
+                WLSDeployZipFile.transformEntry(transformers, entryFileName, inputStream, itemToAdd);
+            if (content == null) {
+                newName = null;
+            } else {
+                try {
+                    LOGGER.finer("WLSDPLY-01418", newName, itemToAdd);
+                    newName = getZipFile().addZipEntry(newName, content, false);
+                    LOGGER.finer("WLSDPLY-01419", newName, itemToAdd);
+                } finally {
+                    try {
+                        content.close();
+                    } catch (IOException ignore) {
+                        LOGGER.warning("WLSDPLY-01420", ignore, itemToAdd.getPath(), ignore.getLocalizedMessage());
+                    }
+                }
+            }
+        }
+        LOGGER.exiting(CLASS, METHOD, newName);
+        return newName;
+    }
+
     protected static String getURLArchiveName(String zipPathPrefix, URL url, boolean useFileNameInEntryPath) {
         String newName = zipPathPrefix;
         String urlFileName = new File(url.getPath()).getName();
@@ -6398,72 +6547,25 @@ public class WLSDeployArchive {
         return newName;
     }
 
-    protected void extractDirectoryFromZip(String directoryName, File extractToLocation)
+    protected ArchiveExtractor.Result extractDirectoryFromZip(String directoryName, File extractToLocation)
         throws WLSDeployArchiveIOException {
-        extractDirectoryFromZip(directoryName, directoryName, extractToLocation);
+        return extractDirectoryFromZip(directoryName, directoryName, extractToLocation);
     }
 
-    protected void extractDirectoryFromZip(String fromDirectoryName, String toDirectoryName, File extractToLocation)
-        throws WLSDeployArchiveIOException {
+    protected ArchiveExtractor.Result extractDirectoryFromZip(String fromDirectoryName, String toDirectoryName,
+        File extractToLocation) throws WLSDeployArchiveIOException {
         final String METHOD = "extractDirectoryFromZip";
 
         LOGGER.entering(CLASS, METHOD, fromDirectoryName, toDirectoryName, extractToLocation.getAbsolutePath());
-        String dirName = fromDirectoryName;
-        if (!dirName.endsWith(ZIP_SEP)) {
-            dirName += ZIP_SEP;
-        }
-        Map<String, InputStream> zipEntries = getZipFile().getZipEntries(dirName);
-        FileOutputStream outputStream;
-        File targetFile = null;
-        try {
-            if (zipEntries != null && !zipEntries.isEmpty()) {
-                for (Map.Entry<String, InputStream> zipEntry : zipEntries.entrySet()) {
-                    String entryName = zipEntry.getKey();
-                    String targetFileName = entryName.replace(fromDirectoryName + ZIP_SEP, toDirectoryName + SEP);
-                    checkForZipSlip(extractToLocation, targetFileName);
-                    targetFile = new File(extractToLocation, targetFileName);
-                    File targetDirectory;
-                    if (entryName.endsWith(ZIP_SEP)) {
-                        targetDirectory = targetFile;
-                    } else {
-                        targetDirectory = targetFile.getParentFile();
-                    }
 
-                    if (!targetDirectory.exists() && !targetDirectory.mkdirs()) {
-                        WLSDeployArchiveIOException wdaioe =
-                            new WLSDeployArchiveIOException("WLSDPLY-01414", getArchiveFileName(),
-                                targetDirectory.getAbsolutePath());
-                        LOGGER.throwing(CLASS, METHOD, wdaioe);
-                        throw wdaioe;
-                    }
+        // the extractor reads the archive file directly, so release any streams left open by an earlier call
+        getZipFile().close();
+        ArchiveExtractor extractor = new ArchiveExtractor(new File(getArchiveFileName()), getExtractionThreads());
+        ArchiveExtractor.Result result = extractor.extractDirectory(fromDirectoryName, toDirectoryName,
+            extractToLocation);
 
-                    // no need to copy a directory entry
-                    //
-                    if (!entryName.endsWith(ZIP_SEP)) {
-                        InputStream inputStream = zipEntry.getValue();
-                        // overwrite any existing file
-                        outputStream = new FileOutputStream(targetFile, false);
-                        copyFile(inputStream, outputStream);
-                        outputStream.close();
-                    }
-                }
-            } else {
-                WLSDeployArchiveIOException ex =
-                    new WLSDeployArchiveIOException("WLSDPLY-01416", getArchiveFileName(), dirName);
-                LOGGER.throwing(CLASS, METHOD, ex);
-                throw ex;
-            }
-        } catch (IOException ioe) {
-            WLSDeployArchiveIOException wdaioe =
-                new WLSDeployArchiveIOException("WLSDPLY-01415", ioe, getArchiveFileName(),
-                    targetFile.getAbsolutePath(), ioe.getLocalizedMessage());
-            LOGGER.throwing(CLASS, METHOD, wdaioe);
-            throw wdaioe;
-        } finally {
-            closeMapInputStreams(zipEntries);
-            getZipFile().close();
-        }
-        LOGGER.exiting(CLASS, METHOD);
+        LOGGER.exiting(CLASS, METHOD, result);
+        return result;
     }
 
     protected void extractFileFromZip(String itemToExtract, File extractToLocation) throws WLSDeployArchiveIOException {
@@ -1,5 +1,5 @@
 /*
- * Copyright (c) 2017, 2019, Oracle Corporation and/or its affiliates.  All rights reserved.
+ * Copyright (c) 2017, 2026, Oracle Corporation and/or its affiliates.  All rights reserved.
  * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
  */
 package oracle.weblogic.deploy.util;
@@ -12,6 +12,8 @@ import java.io.InputStream;
 import java.nio.file.Files;
 import java.nio.file.Path;
 import java.util.ArrayList;
+import java.util.Collection;
+import java.util.Collections;
 import java.util.Enumeration;
 import java.util.Iterator;
 import java.util.LinkedHashMap;
@@ -353,6 +355,29 @@ public class WLSDeployZipFile {
         return newEntryName;
     }
 
+    /**
+     * Get the name that addZipEntry() would use to store a new file entry, renamed to prevent conflicts.
+     *
+     * @param entryName the name of the entry to add
+     * @return the entry name, or the next unique entry name if the entry name is already used
+     * @throws WLSDeployArchiveIOException if an IOException occurred while reading the zip file
+     */
+    public String getUniqueEntryName(String entryName) throws WLSDeployArchiveIOException {
+        final String METHOD = "getUniqueEntryName";
+
+        LOGGER.entering(CLASS, METHOD, entryName);
+        closeOpenZipFile();
+
+        String newEntryName = entryName;
+        if (isRenameNecessary(newEntryName)) {
+            LOGGER.finer("WLSDPLY-01507", entryName);
+            newEntryName = getNextUniqueEntryName(entryName);
+            LOGGER.finer("WLSDPLY-01508", entryName, newEntryName);
+        }
+        LOGGER.exiting(CLASS, METHOD, newEntryName);
+        return newEntryName;
+    }
+
     /**
      * Adds the provided entry to the zip if the zip does not have an entry with the same name.
      *
@@ -463,9 +488,26 @@ public class WLSDeployZipFile {
      * @throws IllegalArgumentException if the file provided is not a valid directory
      */
     public String addDirectoryZipEntries(String entryName, File directory) throws WLSDeployArchiveIOException {
+        return addDirectoryZipEntries(entryName, directory, Collections.<ArchiveEntryTransformer>emptyList());
+    }
+
+    /**
+     * Add the provided directory entry and all of its contents to the zip file, renaming the directory
+     * entry name to prevent conflicts. The content of each file is passed through the transformers,
+     * in order, as it is written to the zip file.
+     *
+     * @param entryName    the name of the directory entry to add
+     * @param directory    the directory to add including all of its content, recursively
+     * @param transformers the transformers to apply to the content of each file
+     * @return the entry name used to store the directory or null if the add failed
+     * @throws WLSDeployArchiveIOException if an IOException occurred while adding the entry
+     * @throws IllegalArgumentException if the file provided is not a valid directory
+     */
+    public String addDirectoryZipEntries(String entryName, File directory, List<ArchiveEntryTransformer> transformers)
+        throws WLSDeployArchiveIOException {
         final String METHOD = "addDirectoryZipEntries";
 
-        LOGGER.entering(CLASS, METHOD, entryName, directory);
+        LOGGER.entering(CLASS, METHOD, entryName, directory, transformers);
         closeOpenZipFile();
 
         if (!directory.exists()) {
@@ -500,7 +542,7 @@ public class WLSDeployZipFile {
         LinkedHashMap<String, ZipEntry> existingEntries = getZipFileEntries(getFile());
         LinkedHashMap<String, InputStream> newEntries = new LinkedHashMap<>();
         try {
-            addDirectoryToUnsavedMap(newEntries, directory, rootEntryName);
+            addDirectoryToUnsavedMap(newEntries, directory, rootEntryName, "", transformers);
             saveChangesToZip(existingEntries, newEntries);
         } finally {
             cleanupUnsavedEntries(newEntries);
@@ -539,6 +581,87 @@ public class WLSDeployZipFile {
         LOGGER.exiting(CLASS, METHOD);
     }
 
+    /**
+     * Removes entries and adds or replaces entries from files in a single rewrite of the zip file.
+     * Each file is opened only while its entry is written.
+     *
+     * @param removeKeys the names of the entries to remove
+     * @param newEntries the files to add or replace, keyed by entry name, with a null file for a directory entry
+     * @throws WLSDeployArchiveIOException if an error occurs while reading or writing the zip file
+     */
+    public void updateZipEntries(Collection<String> removeKeys, Map<String, File> newEntries)
+        throws WLSDeployArchiveIOException {
+        final String METHOD = "updateZipEntries";
+
+        LOGGER.entering(CLASS, METHOD, removeKeys, newEntries);
+        closeOpenZipFile();
+
+        LinkedHashMap<String, ZipEntry> savedEntries = getZipFileEntries(getFile());
+        for (String removeKey : removeKeys) {
+            savedEntries.remove(removeKey);
+        }
+        for (String newKey : newEntries.keySet()) {
+            savedEntries.remove(newKey);
+        }
+
+        File newOutputFile = getNewOutputFile();
+        try (ZipOutputStream zos = new ZipOutputStream(new FileOutputStream(newOutputFile, false))) {
+            if (!savedEntries.isEmpty()) {
+                try (ZipFile zipper = new ZipFile(getFile(), ZIP_FILE_OPEN_MODE)) {
+                    for (Map.Entry<String, ZipEntry> savedEntry : savedEntries.entrySet()) {
+                        String savedKey = savedEntry.getKey();
+                        ZipEntry ze = savedEntry.getValue();
+                        sanitizeZipEntry(ze);
+                        zos.putNextEntry(ze);
+                        if (!savedKey.endsWith(ZIP_SEP)) {
+                            try (InputStream inputStream = zipper.getInputStream(ze)) {
+                                readWriteBytes(savedKey, inputStream, zos);
+                            }
+                        }
+                        zos.closeEntry();
+                        LOGGER.finer("WLSDPLY-01519", savedKey, getFileName(), newOutputFile.getAbsolutePath());
+                    }
+                }
+            }
+
+            for (Map.Entry<String, File> newEntry : newEntries.entrySet()) {
+                String newKey = newEntry.getKey();
+                zos.putNextEntry(new ZipEntry(newKey));
+                if (!newKey.endsWith(ZIP_SEP)) {
+                    try (InputStream inputStream = new FileInputStream(newEntry.getValue())) {
+                        readWriteBytes(newKey, inputStream, zos);
+                    }
+                }
+                zos.closeEntry();
+                LOGGER.finer("WLSDPLY-01520", newKey, getFileName(), newOutputFile.getAbsolutePath());
+            }
+            zos.finish();
+        } catch (IOException ioe) {
+            WLSDeployArchiveIOException wdaioe = new WLSDeployArchiveIOException("WLSDPLY-01522",
+                ioe, getFileName(), ioe.getLocalizedMessage());
+            LOGGER.throwing(CLASS, METHOD, wdaioe);
+            throw wdaioe;
+        }
+
+        if (isNewFile()) {
+            setNewFile(false);
+        } else {
+            swapFiles(getFile(), newOutputFile);
+        }
+        LOGGER.exiting(CLASS, METHOD);
+    }
+
+    /**
+     * Get the saved entries of the zip file, including the size and CRC-32 of each entry.
+     *
+     * @return the zip entries keyed by entry name
+     * @throws WLSDeployArchiveIOException if an error occurs while reading the zip file
+     */
+    Map<String, ZipEntry> getZipEntryDetails() throws WLSDeployArchiveIOException {
+        closeOpenZipFile();
+        return getZipFileEntries(getFile());
+    }
+
     /**
      * Closes the open zip file from the last call, if any, which in turn closes all open input streams into the zip.
      */
@@ -1112,8 +1235,9 @@ public class WLSDeployZipFile {
         return Integer.parseInt(numberStr);
     }
 
-    private void addDirectoryToUnsavedMap(Map<String, InputStream> unsavedChanges,
-        File directory, String directoryEntryName) throws WLSDeployArchiveIOException {
+    private void addDirectoryToUnsavedMap(Map<String, InputStream> unsavedChanges, File directory,
+        String directoryEntryName, String relativeDirectoryName, List<ArchiveEntryTransformer> transformers)
+        throws WLSDeployArchiveIOException {
         final String METHOD = "addDirectoryToUnsavedMap";
 
         LOGGER.entering(CLASS, METHOD, directory.getAbsolutePath(), directoryEntryName);
@@ -1121,9 +1245,11 @@ public class WLSDeployZipFile {
         if (dirEntries != null) {
             for (File dirEntry : dirEntries) {
                 String newEntryName = directoryEntryName + dirEntry.getName();
+                String relativeName = relativeDirectoryName + dirEntry.getName();
                 if (dirEntry.isDirectory()) {
                     newEntryName += ZIP_SEP;
-                    addDirectoryToUnsavedMap(unsavedChanges, dirEntry, newEntryName);
+                    addDirectoryToUnsavedMap(unsavedChanges, dirEntry, newEntryName, relativeName + ZIP_SEP,
+                        transformers);
                 } else {
                     FileInputStream inputStream;
                     try {
@@ -1135,13 +1261,64 @@ public class WLSDeployZipFile {
                         LOGGER.throwing(CLASS, METHOD, wdaioe);
                         throw wdaioe;
                     }
-                    unsavedChanges.put(newEntryName, inputStream);
+                    InputStream content = transformEntry(transformers, relativeName, inputStream, dirEntry);
+                    if (content != null) {
+                        unsavedChanges.put(newEntryName, content);
+                    }
                 }
             }
         }
         LOGGER.exiting(CLASS, METHOD);
     }
 
+    /**
+     * Pass the content of a file through the transformers, in order.
+     *
+     * @param transformers the transformers to apply
+     * @param entryName    the name passed to the transformers
+     * @param content      the content of the file
+     * @param file         the file, used for logging
+     * @return the transformed content, or null if a transformer excluded the file
+     * @throws WLSDeployArchiveIOException if a transformer failed to read the content
+     */
+    static InputStream transformEntry(List<ArchiveEntryTransformer> transformers, String entryName,
+        InputStream content, File file) throws WLSDeployArchiveIOException {
+        final String METHOD = "transformEntry";
+
+        InputStream result = content;
+        boolean transformed = false;
+        try {
+            for (ArchiveEntryTransformer transformer : transformers) {
+                InputStream next = transformer.transform(entryName, result);
+                if (next == null) {
+                    LOGGER.finer("WLSDPLY-01544", file.getAbsolutePath(), transformer);
+                    return null;
+                }
+                result = next;
+            }
+            transformed = true;
+        } catch (IOException ioe) {
+            WLSDeployArchiveIOException ex = new WLSDeployArchiveIOException("WLSDPLY-01545", ioe,
+                file.getAbsolutePath(), ioe.getLocalizedMessage());
+            LOGGER.throwing(CLASS, METHOD, ex);
+            throw ex;
+        } finally {
+            // also closes the content if a transformer failed with a runtime exception
+            if (!transformed) {
+                closeQuietly(result, file);
+            }
+        }
+        return result;
+    }
+
+    private static void closeQuietly(InputStream stream, File file) {
+        try {
+            stream.close();
+        } catch (IOException ignore) {
+            LOGGER.warning("WLSDPLY-01541", ignore, file.getAbsolutePath(), ignore.getLocalizedMessage());
+        }
+    }
+
     private static void cleanupUnsavedEntries(Map<String, InputStream> unsavedEntries) {
         if (unsavedEntries != null && !unsavedEntries.isEmpty()) {
             for (Map.Entry<String, InputStream> entry : unsavedEntries.entrySet()) {
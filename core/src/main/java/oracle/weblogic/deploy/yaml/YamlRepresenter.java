@@ -1,21 +1,31 @@
 /*
- * Copyright (c) 2022, Oracle and/or its affiliates.
+ * Copyright (c) 2022, 2026, Oracle and/or its affiliates.
  * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
  */
 package oracle.weblogic.deploy.yaml;
 
 import oracle.weblogic.deploy.util.CommentMap;
 import oracle.weblogic.deploy.util.OrderedMap;
+import oracle.weblogic.deploy.util.PyOrderedDict;
+import oracle.weblogic.deploy.util.PyRealBoolean;
+import org.python.core.Py;
+import org.python.core.PyDictionary;
+import org.python.core.PyList;
+import org.python.core.PyObject;
+import org.python.core.PyString;
 import org.yaml.snakeyaml.DumperOptions;
 import org.yaml.snakeyaml.comments.CommentLine;
 import org.yaml.snakeyaml.comments.CommentType;
+import org.yaml.snakeyaml.error.YAMLException;
 import org.yaml.snakeyaml.nodes.MappingNode;
 import org.yaml.snakeyaml.nodes.Node;
 import org.yaml.snakeyaml.nodes.NodeTuple;
 import org.yaml.snakeyaml.nodes.ScalarNode;
 import org.yaml.snakeyaml.nodes.Tag;
+import org.yaml.snakeyaml.representer.Represent;
 import org.yaml.snakeyaml.representer.Representer;
 
+import java.math.BigInteger;
 import java.util.ArrayList;
 import java.util.List;
 import java.util.Map;
@@ -24,11 +34,17 @@ import static oracle.weblogic.deploy.util.CommentMap.BLANK_LINE_KEY;
 
 /**
  * Attach comments from mappings to the associated elements.
+ * Python dictionaries and lists are represented directly, one level at a time,
+ * so the model does not need to be copied into Java collections before it is written.
  */
 public class YamlRepresenter extends Representer {
 
   public YamlRepresenter(DumperOptions dumperOptions) {
     super(dumperOptions);
+    Represent representPyDictionary = new RepresentPyDictionary();
+    this.representers.put(PyDictionary.class, representPyDictionary);
+    this.representers.put(PyOrderedDict.class, representPyDictionary);
+    this.representers.put(PyList.class, new RepresentPyList());
   }
 
   @Override
@@ -59,4 +75,74 @@ public class YamlRepresenter extends Representer {
 
     return node;
   }
+
+  /**
+   * Convert a Python scalar to the Java type used for its YAML representation.
+   * Python dictionaries and lists are returned unchanged, to be represented when they are reached.
+   *
+   * @param value the Python value
+   * @return the Java value
+   * @throws YAMLException if the value is not a supported Python type
+   */
+  static Object toJavaValue(PyObject value) {
+    if (value == null || value == Py.None) {
+      return null;
+    } else if (value instanceof PyDictionary || value instanceof PyList) {
+      return value;
+    } else if (value instanceof PyRealBoolean) {
+      return ((PyRealBoolean) value).getValue();
+    } else if (value instanceof PyString) {
+      // includes unicode values
+      return value.toString();
+    }
+
+    // bool, int, long and float values
+    Object javaValue = value.__tojava__(Object.class);
+    if (javaValue instanceof Boolean || javaValue instanceof Integer || javaValue instanceof Long
+        || javaValue instanceof BigInteger || javaValue instanceof Double) {
+      return javaValue;
+    }
+
+    YamlException yex = new YamlException("WLSDPLY-18201", value.getType());
+    throw new YAMLException(yex.getLocalizedMessage(), yex);
+  }
+
+  /**
+   * Represent a Python dictionary as an ordered map of its keys and values.
+   * The comments from an ordered dictionary are included.
+   */
+  private class RepresentPyDictionary implements Represent {
+    @Override
+    public Node representData(Object data) {
+      PyDictionary dictionary = (PyDictionary) data;
+      OrderedMap map = new OrderedMap();
+      if (dictionary instanceof PyOrderedDict) {
+        map.setCommentMap(((PyOrderedDict) dictionary).getCommentMap());
+      }
+
+      PyList items = dictionary.items();
+      int size = items.__len__();
+      for (int i = 0; i < size; i++) {
+        PyObject item = items.__getitem__(i);
+        map.put(item.__getitem__(0).toString(), toJavaValue(item.__getitem__(1)));
+      }
+      return YamlRepresenter.this.representData(map);
+    }
+  }
+
+  /**
+   * Represent a Python list as a list of its values.
+   */
+  private class RepresentPyList implements Represent {
+    @Override
+    public Node representData(Object data) {
+      PyList pyList = (PyList) data;
+      int size = pyList.__len__();
+      List<Object> list = new ArrayList<>(size);
+      for (int i = 0; i < size; i++) {
+        list.add(toJavaValue(pyList.__getitem__(i)));
+      }
+      return YamlRepresenter.this.representData(list);
+    }
+  }
 }
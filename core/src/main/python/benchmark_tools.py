@@ -0,0 +1,149 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+The main module for the WebLogic Deploy tool to benchmark the other tools using generated models.
+"""
+import os
+import sys
+
+from oracle.weblogic.deploy.benchmark import BenchmarkException
+from oracle.weblogic.deploy.json import JsonException
+from oracle.weblogic.deploy.util import CLAException
+
+sys.path.insert(0, os.path.dirname(os.path.realpath(sys.argv[0])))
+
+# imports from local packages start here
+from wlsdeploy.aliases.aliases import Aliases
+from wlsdeploy.aliases.wlst_modes import WlstModes
+from wlsdeploy.exception import exception_helper
+from wlsdeploy.exception.exception_types import ExceptionType
+from wlsdeploy.json.json_translator import JsonToPython
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.tool.benchmark import benchmark_report
+from wlsdeploy.tool.benchmark.benchmark_configuration import BenchmarkConfiguration
+from wlsdeploy.tool.benchmark.benchmark_runner import BenchmarkRunner
+from wlsdeploy.tool.benchmark.model_generator import SyntheticModelGenerator
+from wlsdeploy.tool.util import model_context_helper
+from wlsdeploy.util import tool_main
+from wlsdeploy.util.cla_utils import CommandLineArgUtil
+from wlsdeploy.util.cla_utils import TOOL_TYPE_DEFAULT
+from wlsdeploy.util.exit_code import ExitCode
+
+_program_name = 'benchmarkTools'
+
+_class_name = 'benchmark_tools'
+__logger = PlatformLogger('wlsdeploy.benchmark')
+
+__required_arguments = [
+    CommandLineArgUtil.ORACLE_HOME_SWITCH,
+    CommandLineArgUtil.OUTPUT_DIR_SWITCH
+]
+
+__optional_arguments = [
+    CommandLineArgUtil.BENCHMARK_FILE_SWITCH,
+    CommandLineArgUtil.BASELINE_FILE_SWITCH,
+    CommandLineArgUtil.DOMAIN_TYPE_SWITCH
+]
+
+
+def __process_args(args, is_encryption_supported):
+    """
+    Process the command-line arguments.
+    :param args: the command-line arguments list
+    :param is_encryption_supported: whether WDT encryption is supported by the JVM
+    :raises CLAException: if an error occurs while validating and processing the command-line arguments
+    """
+    cla_util = CommandLineArgUtil(_program_name, __required_arguments, __optional_arguments)
+    argument_map = cla_util.process_args(args, TOOL_TYPE_DEFAULT)
+    return model_context_helper.create_context(_program_name, argument_map)
+
+
+def __load_configuration(model_context):
+    """
+    Load the benchmark configuration from the benchmark file, or use the default configuration.
+    :param model_context: the model context
+    :return: the BenchmarkConfiguration
+    :raises CLAException: if the benchmark file cannot be parsed, or has invalid values
+    """
+    _method_name = '__load_configuration'
+
+    benchmark_file = model_context.get_benchmark_file()
+    if benchmark_file is None:
+        return BenchmarkConfiguration()
+
+    try:
+        config_dict = JsonToPython(benchmark_file).parse()
+    except JsonException, ex:
+        cla_ex = exception_helper.create_cla_exception(ExitCode.ARG_VALIDATION_ERROR, 'WLSDPLY-00918',
+                                                       benchmark_file, ex.getLocalizedMessage(), error=ex)
+        __logger.throwing(cla_ex, class_name=_class_name, method_name=_method_name)
+        raise cla_ex
+    return BenchmarkConfiguration(config_dict)
+
+
+def __check_baseline(model_context, configuration, report):
+    """
+    Compare the report with the baseline report, if one was specified.
+    :return: ExitCode.ERROR if any phase has regressed, otherwise ExitCode.OK
+    """
+    _method_name = '__check_baseline'
+
+    baseline_file = model_context.get_baseline_file()
+    if baseline_file is None:
+        return ExitCode.OK
+
+    baseline_report = benchmark_report.read_report(baseline_file)
+    threshold = configuration.get_regression_threshold_percent()
+    regressions = benchmark_report.find_regressions(report, baseline_report, threshold)
+    for regression in regressions:
+        __logger.severe('WLSDPLY-33033', regression.phase, regression.mean_millis, regression.baseline_mean_millis,
+                        regression.percent_change, threshold, class_name=_class_name, method_name=_method_name)
+
+    if regressions:
+        return ExitCode.ERROR
+
+    __logger.info('WLSDPLY-33035', baseline_file, threshold, class_name=_class_name, method_name=_method_name)
+    return ExitCode.OK
+
+
+def main(model_context):
+    """
+    The main entry point for the benchmarkTools tool.
+    :param model_context: the model context object
+    :return: exit code
+    """
+    _method_name = 'main'
+    __logger.entering(class_name=_class_name, method_name=_method_name)
+
+    _exit_code = ExitCode.OK
+    try:
+        configuration = __load_configuration(model_context)
+        aliases = Aliases(model_context=model_context, wlst_mode=WlstModes.OFFLINE,
+                          exception_type=ExceptionType.BENCHMARK)
+
+        generator = SyntheticModelGenerator(configuration, aliases, model_context.get_output_dir())
+        generated_files = generator.generate()
+
+        results = BenchmarkRunner(model_context, configuration, generated_files).run()
+
+        report = benchmark_report.create_report(model_context, configuration, results)
+        report_file = os.path.join(model_context.get_output_dir(), benchmark_report.REPORT_FILE_NAME)
+        benchmark_report.write_report(report, report_file)
+
+        _exit_code = __check_baseline(model_context, configuration, report)
+    except CLAException, ex:
+        _exit_code = ex.getExitCode()
+        __logger.severe('WLSDPLY-20008', _program_name, ex.getLocalizedMessage(), error=ex,
+                        class_name=_class_name, method_name=_method_name)
+    except BenchmarkException, ex:
+        _exit_code = ExitCode.ERROR
+        __logger.severe('WLSDPLY-33037', _program_name, ex.getLocalizedMessage(), error=ex,
+                        class_name=_class_name, method_name=_method_name)
+
+    __logger.exiting(class_name=_class_name, method_name=_method_name, result=_exit_code)
+    return _exit_code
+
+
+if __name__ == '__main__' or __name__ == 'main':
+    tool_main.run_tool(main, __process_args, sys.argv, _program_name, _class_name, __logger)
@@ -0,0 +1,110 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+The main module for the WebLogic Deploy tool to collect the archive entries listed in the artifact collection plan
+that is written by discoverDomain in remote mode.
+"""
+import os
+import sys
+
+from oracle.weblogic.deploy.util import CLAException
+
+sys.path.insert(0, os.path.dirname(os.path.realpath(sys.argv[0])))
+
+# imports from local packages start here
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.tool.discover import artifact_collector
+from wlsdeploy.tool.discover import collection_plan
+from wlsdeploy.tool.discover.artifact_collector import ArtifactCollector
+from wlsdeploy.tool.util import model_context_helper
+from wlsdeploy.util import path_helper
+from wlsdeploy.util import tool_main
+from wlsdeploy.util.cla_utils import CommandLineArgUtil
+from wlsdeploy.util.cla_utils import TOOL_TYPE_DEFAULT
+from wlsdeploy.util.exit_code import ExitCode
+
+_program_name = 'collectArtifacts'
+
+_class_name = 'collect_artifacts'
+__logger = PlatformLogger('wlsdeploy.discover')
+
+__required_arguments = [
+    CommandLineArgUtil.ORACLE_HOME_SWITCH,
+    CommandLineArgUtil.ARCHIVE_FILE_SWITCH,
+    CommandLineArgUtil.COLLECTION_PLAN_FILE_SWITCH
+]
+
+__optional_arguments = [
+    CommandLineArgUtil.OUTPUT_DIR_SWITCH,
+    CommandLineArgUtil.SSH_HOST_SWITCH,
+    CommandLineArgUtil.SSH_PORT_SWITCH,
+    CommandLineArgUtil.SSH_USER_SWITCH,
+    CommandLineArgUtil.SSH_PASS_SWITCH,
+    CommandLineArgUtil.SSH_PASS_ENV_SWITCH,
+    CommandLineArgUtil.SSH_PASS_FILE_SWITCH,
+    CommandLineArgUtil.SSH_PASS_PROMPT_SWITCH,
+    CommandLineArgUtil.SSH_PRIVATE_KEY_SWITCH,
+    CommandLineArgUtil.SSH_PRIVATE_KEY_PASSPHRASE_SWITCH,
+    CommandLineArgUtil.SSH_PRIVATE_KEY_PASSPHRASE_ENV_SWITCH,
+    CommandLineArgUtil.SSH_PRIVATE_KEY_PASSPHRASE_FILE_SWITCH,
+    CommandLineArgUtil.SSH_PRIVATE_KEY_PASSPHRASE_PROMPT_SWITCH,
+]
+
+
+def __process_args(args, is_encryption_supported):
+    """
+    Process the command-line arguments.
+    :param args: the command-line arguments list
+    :param is_encryption_supported: whether WDT encryption is supported by the JVM
+    :raises CLAException: if an error occurs while validating and processing the command-line arguments
+    """
+    cla_util = CommandLineArgUtil(_program_name, __required_arguments, __optional_arguments)
+    argument_map = cla_util.process_args(args, TOOL_TYPE_DEFAULT)
+    model_context = model_context_helper.create_context(_program_name, argument_map)
+
+    ssh_context = model_context.get_ssh_context()
+    if ssh_context is not None:
+        path_helper.get_path_helper().set_remote_path_module(ssh_context.is_remote_system_running_windows())
+    return model_context
+
+
+def main(model_context):
+    """
+    The main entry point for the collectArtifacts tool.
+    :param model_context: the model context object
+    :return: exit code
+    """
+    _method_name = 'main'
+    __logger.entering(class_name=_class_name, method_name=_method_name)
+
+    _exit_code = ExitCode.OK
+    try:
+        plan_file = model_context.get_collection_plan_file()
+        plan = collection_plan.read_plan(plan_file)
+
+        archive_file_name = model_context.get_archive_file_name()
+        results = ArtifactCollector(model_context, plan).collect(archive_file_name)
+
+        results_dir = model_context.get_output_dir()
+        if results_dir is None:
+            results_dir = os.path.dirname(plan_file)
+        summary = artifact_collector.create_results(results, archive_file_name)
+        artifact_collector.write_results(summary, os.path.join(results_dir, artifact_collector.RESULTS_FILE_NAME))
+
+        missing_count = summary[artifact_collector.MISSING_COUNT]
+        failed_count = summary[artifact_collector.FAILED_COUNT]
+        __logger.info('WLSDPLY-33520', len(results) - missing_count - failed_count, len(results), missing_count,
+                      failed_count, class_name=_class_name, method_name=_method_name)
+        _exit_code = artifact_collector.get_exit_code(results)
+    except CLAException, ex:
+        _exit_code = ex.getExitCode()
+        __logger.severe('WLSDPLY-20008', _program_name, ex.getLocalizedMessage(), error=ex,
+                        class_name=_class_name, method_name=_method_name)
+
+    __logger.exiting(class_name=_class_name, method_name=_method_name, result=_exit_code)
+    return _exit_code
+
+
+if __name__ == '__main__' or __name__ == 'main':
+    tool_main.run_tool(main, __process_args, sys.argv, _program_name, _class_name, __logger)
@@ -1,5 +1,5 @@
 """
-Copyright (c) 2017, 2025, Oracle and/or its affiliates.
+Copyright (c) 2017, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 
 The entry point for the deployApps tool.
@@ -8,6 +8,8 @@ import exceptions
 import os
 import sys
 
+from java.lang import Exception as JException
+from java.lang import System
 from oracle.weblogic.deploy.deploy import DeployException
 from oracle.weblogic.deploy.exception import BundleAwareException
 
@@ -15,10 +17,14 @@ sys.path.insert(0, os.path.dirname(os.path.realpath(sys.argv[0])))
 
 # imports from local packages start here
 from wlsdeploy.aliases.aliases import Aliases
+from wlsdeploy.aliases.model_constants import APP_DEPLOYMENTS
+from wlsdeploy.aliases.model_constants import RESOURCES
 from wlsdeploy.aliases.wlst_modes import WlstModes
 from wlsdeploy.exception.exception_types import ExceptionType
 from wlsdeploy.logging.platform_logger import PlatformLogger
 from wlsdeploy.tool.deploy import deployer_utils
+from wlsdeploy.tool.deploy import online_change_plan
+from wlsdeploy.tool.deploy import rolling_restart
 from wlsdeploy.tool.deploy.model_deployer import ModelDeployer
 from wlsdeploy.tool.util import model_context_helper
 from wlsdeploy.tool.util import wlst_helper
@@ -117,7 +123,7 @@ def __deploy(model, model_context, aliases):
     model_deployer = ModelDeployer(model, model_context, aliases, wlst_mode=__wlst_mode)
 
     if __wlst_mode == WlstModes.ONLINE:
-        ret_code = __deploy_online(model_deployer, model_context)
+        ret_code = __deploy_online(model_deployer, model, model_context, aliases)
     else:
         model_deployer.extract_early_archive_files()
         ret_code = __deploy_offline(model_deployer, model_context)
@@ -127,11 +133,13 @@ def __deploy(model, model_context, aliases):
     return ret_code
 
 
-def __deploy_online(model_deployer, model_context):
+def __deploy_online(model_deployer, model, model_context, aliases):
     """
     Online deployment orchestration
     :param model_deployer: ModelDeployer object
+    :param model: the model
     :param model_context: the model context
+    :param aliases: the aliases object
     :raises: DeployException: if an error occurs
     """
     _method_name = '__deploy_online'
@@ -154,16 +162,24 @@ def __deploy_online(model_deployer, model_context):
                                                  __wlst_helper.get_domain_name_online())
 
     model_deployer.extract_early_archive_files()
+
+    # the plan only reads the live configuration, so it is computed before the edit lock is held
+    change_plan = online_change_plan.create_plan_if_enabled(model, model_context, aliases,
+                                                            [RESOURCES, APP_DEPLOYMENTS])
+
     deployer_utils.ensure_no_uncommitted_changes_or_edit_sessions(skip_edit_session_check)
     __wlst_helper.edit()
     __logger.fine("WLSDPLY-09019", edit_lock_acquire_timeout, edit_lock_release_timeout, edit_lock_exclusive)
     __wlst_helper.start_edit(acquire_timeout=edit_lock_acquire_timeout, release_timeout=edit_lock_release_timeout,
                              exclusive=edit_lock_exclusive)
+    edit_start_time = System.currentTimeMillis()
     if model_context.is_discard_current_edit():
         deployer_utils.discard_current_edit()
+    edit_plan = online_change_plan.get_plan_for_edit_session(change_plan)
 
     __logger.info("WLSDPLY-09007", admin_url, method_name=_method_name, class_name=_class_name)
 
+    model_deployer.set_change_plan(edit_plan)
     try:
         model_deployer.deploy_plugins()
         model_deployer.deploy_resources()
@@ -174,9 +190,12 @@ def __deploy_online(model_deployer, model_context):
         raise ex
 
     exit_code = deployer_utils.online_check_save_activate(model_context)
+    online_change_plan.record_execution_time(change_plan, model_context,
+                                             System.currentTimeMillis() - edit_start_time)
 
     if exit_code != ExitCode.CANCEL_CHANGES_IF_RESTART:
         model_deployer.deploy_applications()
+        exit_code = rolling_restart.restart_if_enabled(model_context, aliases, exit_code)
 
     try:
         __wlst_helper.disconnect()
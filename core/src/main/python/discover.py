@@ -40,6 +40,7 @@ from wlsdeploy.exception import exception_helper
 from wlsdeploy.exception.exception_types import ExceptionType
 from wlsdeploy.json import json_translator
 from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.tool.discover import collection_plan
 from wlsdeploy.tool.discover import discoverer
 from wlsdeploy.tool.discover.deployments_discoverer import DeploymentsDiscoverer
 from wlsdeploy.tool.discover.domain_info_discoverer import DomainInfoDiscoverer
@@ -489,6 +490,7 @@ def __discover(model_context, aliases, credential_injector, helper, extra_tokens
         OpssWalletDiscoverer(model_context, model.get_model_domain_info(), base_location, wlst_mode=__wlst_mode,
                              aliases=aliases, credential_injector=credential_injector).discover()
         __discover_multi_tenant(model, model_context, base_location, aliases, credential_injector)
+        discoverer.log_archive_content_summary()
     except AliasException, ae:
         wls_version = model_context.get_effective_wls_version()
         wlst_mode = WlstModes.from_value(__wlst_mode)
@@ -1052,6 +1054,30 @@ def __generate_remote_report_json(model_context):
                          class_name=_class_name, method_name=_method_name)
 
 
+def __write_collection_plan(model_context):
+    """
+    Write the artifact collection plan for the archive entries that could not be collected in remote mode.
+    The plan is written to the output directory, if specified, or to the directory of the model file.
+    :param model_context: the model context
+    """
+    _method_name = '__write_collection_plan'
+
+    if not model_context.is_remote() or len(discoverer.remote_dict) == 0:
+        return
+
+    plan_dir = model_context.get_output_dir()
+    if plan_dir is None:
+        plan_dir = path_helper.get_path_helper().get_local_parent_directory(model_context.get_model_file())
+    plan_file = os.path.join(plan_dir, collection_plan.PLAN_FILE_NAME)
+
+    plan = collection_plan.create_plan(discoverer.remote_dict, model_context.get_domain_home())
+    try:
+        collection_plan.write_plan(plan, plan_file)
+    except JsonException, ex:
+        __logger.warning('WLSDPLY-33501', plan_file, ex.getLocalizedMessage(),
+                         class_name=_class_name, method_name=_method_name)
+
+
 def main(model_context):
     """
     The main entry point for the discoverDomain tool.
@@ -1100,6 +1126,7 @@ def main(model_context):
             model = __check_and_customize_model(model, model_context, aliases, credential_injector, extra_tokens)
 
             __generate_remote_report_json(model_context)
+            __write_collection_plan(model_context)
         except DiscoverException, ex:
             __logger.severe('WLSDPLY-06011', _program_name, model_context.get_domain_name(),
                             model_context.get_domain_home(), ex.getLocalizedMessage(),
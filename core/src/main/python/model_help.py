@@ -1,5 +1,5 @@
 """
-Copyright (c) 2020, 2024, Oracle and/or its affiliates.
+Copyright (c) 2020, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v1.0 as shown at https://oss.oracle.com/licenses/upl.
 
 The entry point for the modelHelp tool.
@@ -32,6 +32,7 @@ __optional_arguments = [
     CommandLineArgUtil.ATTRIBUTES_ONLY_SWITCH,
     CommandLineArgUtil.FOLDERS_ONLY_SWITCH,
     CommandLineArgUtil.RECURSIVE_SWITCH,
+    CommandLineArgUtil.SEARCH_SWITCH,
     CommandLineArgUtil.TARGET_SWITCH,
     CommandLineArgUtil.TARGET_MODE_SWITCH
 ]
@@ -39,7 +40,8 @@ __optional_arguments = [
 __output_types = [
     CommandLineArgUtil.ATTRIBUTES_ONLY_SWITCH,
     CommandLineArgUtil.FOLDERS_ONLY_SWITCH,
-    CommandLineArgUtil.RECURSIVE_SWITCH
+    CommandLineArgUtil.RECURSIVE_SWITCH,
+    CommandLineArgUtil.SEARCH_SWITCH
 ]
 
 
@@ -98,6 +100,14 @@ def print_help(model_path, model_context):
     elif model_context.get_folders_only_control_option():
         control_option = ControlOptions.FOLDERS_ONLY
 
+    search_text = model_context.get_search_text()
+    if search_text:
+        # the aliases are loaded only if the model help index needs to be built
+        printer = ModelHelpPrinter(model_context, None, __logger)
+        printer.print_search_results(search_text)
+        __logger.exiting(class_name=_class_name, method_name=_method_name)
+        return ExitCode.OK
+
     aliases = Aliases(model_context, wlst_mode=model_context.get_target_wlst_mode())
 
     if model_path:
@@ -0,0 +1,112 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+The main module for the WebLogic Deploy tool to run a tool for several domains, listed in a manifest file.
+"""
+import os
+import sys
+
+from oracle.weblogic.deploy.json import JsonException
+from oracle.weblogic.deploy.util import CLAException
+from oracle.weblogic.deploy.util import TranslateException
+from oracle.weblogic.deploy.yaml import YamlException
+
+sys.path.insert(0, os.path.dirname(os.path.realpath(sys.argv[0])))
+
+# imports from local packages start here
+from wlsdeploy.exception import exception_helper
+from wlsdeploy.json.json_translator import JsonToPython
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.tool.multidomain import domain_runner
+from wlsdeploy.tool.multidomain.domain_manifest import DomainManifest
+from wlsdeploy.tool.multidomain.domain_runner import MultiDomainRunner
+from wlsdeploy.tool.util import model_context_helper
+from wlsdeploy.util import tool_main
+from wlsdeploy.util.cla_utils import CommandLineArgUtil
+from wlsdeploy.util.cla_utils import TOOL_TYPE_DEFAULT
+from wlsdeploy.util.exit_code import ExitCode
+
+_program_name = 'multiDomainRunner'
+
+_class_name = 'multi_domain_runner'
+__logger = PlatformLogger('wlsdeploy.multidomain')
+
+__required_arguments = [
+    CommandLineArgUtil.ORACLE_HOME_SWITCH,
+    CommandLineArgUtil.OUTPUT_DIR_SWITCH,
+    CommandLineArgUtil.MANIFEST_FILE_SWITCH
+]
+
+__optional_arguments = [
+]
+
+
+def __process_args(args, is_encryption_supported):
+    """
+    Process the command-line arguments.
+    :param args: the command-line arguments list
+    :param is_encryption_supported: whether WDT encryption is supported by the JVM
+    :raises CLAException: if an error occurs while validating and processing the command-line arguments
+    """
+    cla_util = CommandLineArgUtil(_program_name, __required_arguments, __optional_arguments)
+    argument_map = cla_util.process_args(args, TOOL_TYPE_DEFAULT)
+    return model_context_helper.create_context(_program_name, argument_map)
+
+
+def __load_manifest(model_context):
+    """
+    Load the domains from the manifest file.
+    :param model_context: the model context
+    :return: the DomainManifest
+    :raises CLAException: if the manifest file cannot be parsed, or has invalid values
+    """
+    _method_name = '__load_manifest'
+
+    manifest_file = model_context.get_manifest_file()
+    try:
+        manifest_dict = JsonToPython(manifest_file).parse()
+    except JsonException, ex:
+        cla_ex = exception_helper.create_cla_exception(ExitCode.ARG_VALIDATION_ERROR, 'WLSDPLY-00920',
+                                                       manifest_file, ex.getLocalizedMessage(), error=ex)
+        __logger.throwing(cla_ex, class_name=_class_name, method_name=_method_name)
+        raise cla_ex
+    return DomainManifest(manifest_dict, os.path.dirname(manifest_file))
+
+
+def main(model_context):
+    """
+    The main entry point for the multiDomainRunner tool.
+    :param model_context: the model context object
+    :return: exit code
+    """
+    _method_name = 'main'
+    __logger.entering(class_name=_class_name, method_name=_method_name)
+
+    _exit_code = ExitCode.OK
+    try:
+        manifest = __load_manifest(model_context)
+        results = MultiDomainRunner(model_context, manifest).run()
+
+        summary = domain_runner.create_summary(results)
+        summary_file = os.path.join(model_context.get_output_dir(), domain_runner.SUMMARY_FILE_NAME)
+        domain_runner.write_summary(summary, summary_file)
+
+        __logger.info('WLSDPLY-33417', len(results) - summary[domain_runner.FAILED_COUNT], len(results),
+                      class_name=_class_name, method_name=_method_name)
+        _exit_code = domain_runner.get_exit_code(results)
+    except CLAException, ex:
+        _exit_code = ex.getExitCode()
+        __logger.severe('WLSDPLY-20008', _program_name, ex.getLocalizedMessage(), error=ex,
+                        class_name=_class_name, method_name=_method_name)
+    except (TranslateException, YamlException), ex:
+        _exit_code = ExitCode.ERROR
+        __logger.severe('WLSDPLY-33418', _program_name, ex.getLocalizedMessage(), error=ex,
+                        class_name=_class_name, method_name=_method_name)
+
+    __logger.exiting(class_name=_class_name, method_name=_method_name, result=_exit_code)
+    return _exit_code
+
+
+if __name__ == '__main__' or __name__ == 'main':
+    tool_main.run_tool(main, __process_args, sys.argv, _program_name, _class_name, __logger)
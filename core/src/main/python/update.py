@@ -1,5 +1,5 @@
 """
-Copyright (c) 2017, 2025, Oracle and/or its affiliates.
+Copyright (c) 2017, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 
 The entry point for the updateDomain tool.
@@ -9,6 +9,7 @@ import os
 import sys
 
 from java.lang import Exception as JException
+from java.lang import System
 from oracle.weblogic.deploy.deploy import DeployException
 from oracle.weblogic.deploy.exception import BundleAwareException
 from oracle.weblogic.deploy.validate import ValidateException
@@ -17,10 +18,15 @@ sys.path.insert(0, os.path.dirname(os.path.realpath(sys.argv[0])))
 
 # imports from local packages start here
 from wlsdeploy.aliases.aliases import Aliases
+from wlsdeploy.aliases.model_constants import APP_DEPLOYMENTS
+from wlsdeploy.aliases.model_constants import RESOURCES
+from wlsdeploy.aliases.model_constants import TOPOLOGY
 from wlsdeploy.aliases.wlst_modes import WlstModes
 from wlsdeploy.exception.exception_types import ExceptionType
 from wlsdeploy.logging.platform_logger import PlatformLogger
 from wlsdeploy.tool.deploy import deployer_utils
+from wlsdeploy.tool.deploy import online_change_plan
+from wlsdeploy.tool.deploy import rolling_restart
 from wlsdeploy.tool.deploy.model_deployer import ModelDeployer
 from wlsdeploy.tool.deploy.topology_updater import TopologyUpdater
 from wlsdeploy.tool.util import model_context_helper
@@ -168,13 +174,20 @@ def __update_online(model_deployer, model, model_context, aliases):
                                                      __wlst_helper.get_domain_name_online())
 
         model_deployer.extract_early_archive_files()
+
+        # the plan only reads the live configuration, so it is computed before the edit lock is held
+        change_plan = online_change_plan.create_plan_if_enabled(model, model_context, aliases,
+                                                                [TOPOLOGY, RESOURCES, APP_DEPLOYMENTS])
+
         deployer_utils.ensure_no_uncommitted_changes_or_edit_sessions(skip_edit_session_check)
         __wlst_helper.edit()
         __logger.fine("WLSDPLY-09019", edit_lock_acquire_timeout, edit_lock_release_timeout, edit_lock_exclusive)
         __wlst_helper.start_edit(acquire_timeout=edit_lock_acquire_timeout, release_timeout=edit_lock_release_timeout,
                                  exclusive=edit_lock_exclusive)
+        edit_start_time = System.currentTimeMillis()
         if model_context.is_discard_current_edit():
             deployer_utils.discard_current_edit()
+        edit_plan = online_change_plan.get_plan_for_edit_session(change_plan)
     except ValidateException, ve:
         raise ve
     except BundleAwareException, ex:
@@ -183,6 +196,8 @@ def __update_online(model_deployer, model, model_context, aliases):
     __logger.info("WLSDPLY-09007", admin_url, method_name=_method_name, class_name=_class_name)
 
     topology_updater = TopologyUpdater(model, model_context, aliases, wlst_mode=WlstModes.ONLINE)
+    topology_updater.set_change_plan(edit_plan)
+    model_deployer.set_change_plan(edit_plan)
     try:
         topology_updater.update_certificate_management_enabled()
 
@@ -205,11 +220,14 @@ def __update_online(model_deployer, model, model_context, aliases):
         raise ex
 
     exit_code = deployer_utils.online_check_save_activate(model_context)
+    online_change_plan.record_execution_time(change_plan, model_context,
+                                             System.currentTimeMillis() - edit_start_time)
     # if user requested cancel changes if restart required stops
 
     if exit_code != ExitCode.CANCEL_CHANGES_IF_RESTART:
         is_restart_required = exit_code == ExitCode.RESTART_REQUIRED
         model_deployer.deploy_applications(is_restart_required=is_restart_required)
+        exit_code = rolling_restart.restart_if_enabled(model_context, aliases, exit_code)
 
     try:
         __wlst_helper.disconnect()
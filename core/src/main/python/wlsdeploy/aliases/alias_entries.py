@@ -594,7 +594,7 @@ class AliasEntries(object):
 
         result = None
 
-        if len(location.get_model_folders()) == 0:
+        if location.is_empty():
             # There are no model folders in the location, so
             # just return %DOMAIN% for the name token
             return self.__domain_name_token
@@ -679,9 +679,8 @@ class AliasEntries(object):
 
         if mbean_name.startswith('%') and mbean_name.endswith('%'):
             token_name = mbean_name[1:-1]
-            name_tokens = location.get_name_tokens()
-            if token_name in name_tokens:
-                mbean_name = name_tokens[token_name]
+            if location.has_name_token(token_name):
+                mbean_name = location.get_name_for_token(token_name)
             else:
                 ex = exception_helper.create_alias_exception('WLSDPLY-08105', location.get_folder_path(), token_name)
                 _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
@@ -849,7 +848,7 @@ class AliasEntries(object):
 
         valid_version_range = None
         valid_mode = None
-        if len(location.get_model_folders()) == 0 and model_folder_name in self.get_model_domain_subfolder_names():
+        if location.is_empty() and model_folder_name in self.get_model_domain_subfolder_names():
             sub_location = LocationContext(location).append_location(model_folder_name)
             folder_dict = self.__get_dictionary_for_location(sub_location, False)
             if folder_dict is None:
@@ -1007,9 +1006,9 @@ class AliasEntries(object):
         :param location: the location to be checked
         :return: True if the location is valid, false otherwise
         """
-        if len(location.get_model_folders()) > 0:
-            parent_location = LocationContext(location)
-            folder = parent_location.pop_location()
+        if not location.is_empty():
+            parent_location = location.get_parent_location()
+            folder = location.get_current_model_folder()
             code, _, _ = self.is_valid_model_folder_name_for_location(parent_location, folder)
             if code != ValidationCodes.VALID:
                 return False
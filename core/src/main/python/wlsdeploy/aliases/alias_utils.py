@@ -1,5 +1,5 @@
 """
-Copyright (c) 2017, 2025, Oracle and/or its affiliates.
+Copyright (c) 2017, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 import copy
@@ -436,17 +436,15 @@ def replace_tokens_in_path(location, path):
     _method_name = 'replace_tokens_in_path'
     _logger.entering(str_helper.to_string(location), path, class_name=_class_name, method_name=_method_name)
 
-    name_tokens = location.get_name_tokens()
     new_path = path
-    if name_tokens:
-        for key, value in name_tokens.iteritems():
-            if isinstance(value, (str, unicode)):
-                if '/' in value and _wlst_mode == WlstModes.OFFLINE:
-                    value = '(%s)' % value
-                new_path = new_path.replace('%s%s%s' % ('%', key, '%'), value)
-            else:
-                _logger.finer('WLSDPLY-08028', key, value, str_helper.to_string(location),
-                              class_name=_class_name, method_name=_method_name)
+    for key, value in location.iter_name_tokens():
+        if isinstance(value, (str, unicode)):
+            if '/' in value and _wlst_mode == WlstModes.OFFLINE:
+                value = '(%s)' % value
+            new_path = new_path.replace('%s%s%s' % ('%', key, '%'), value)
+        else:
+            _logger.finer('WLSDPLY-08028', key, value, str_helper.to_string(location),
+                          class_name=_class_name, method_name=_method_name)
 
     missing_name_token = get_missing_name_tokens(new_path)
 
@@ -471,9 +469,8 @@ def get_token_value(location, value):
     result = value
     if value is not None and value.startswith('%') and value.endswith('%'):
         token_name = value[1:-1]
-        name_tokens = location.get_name_tokens()
-        if token_name in name_tokens:
-            result = name_tokens[token_name]
+        if location.has_name_token(token_name):
+            result = location.get_name_for_token(token_name)
         else:
             ex = exception_helper.create_alias_exception('WLSDPLY-7015', token_name)
             _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
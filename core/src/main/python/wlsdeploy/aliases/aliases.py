@@ -1,5 +1,5 @@
 """
-Copyright (c) 2017, 2025, Oracle and/or its affiliates.
+Copyright (c) 2017, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 import array
@@ -39,6 +39,7 @@ from wlsdeploy.aliases.alias_constants import PRODUCTION_DEFAULT
 from wlsdeploy.aliases.alias_constants import PROPERTIES
 from wlsdeploy.aliases.alias_constants import RESTART_REQUIRED
 from wlsdeploy.aliases.alias_constants import RO
+from wlsdeploy.aliases.alias_constants import RW
 from wlsdeploy.aliases.alias_constants import SECRET_KEY
 from wlsdeploy.aliases.alias_constants import SECRET_PASSWORD_KEY
 from wlsdeploy.aliases.alias_constants import SECRET_SUFFIX
@@ -1369,6 +1370,27 @@ class Aliases(object):
 
         return wlst_type
 
+    def get_model_attribute_access(self, location, model_attribute_name):
+        """
+        Get the access for the model attribute name at the specified location.
+        :param location: the location
+        :param model_attribute_name: the model attribute name
+        :return: the access value, RW if the alias entry does not specify one, or None if the attribute is not found
+        """
+        _method_name = 'get_model_attribute_access'
+        access = None
+        try:
+            attribute_info = self._alias_entries.get_alias_attribute_entry_by_model_name(location, model_attribute_name)
+            if attribute_info is not None:
+                access = RW
+                if ACCESS in attribute_info:
+                    access = attribute_info[ACCESS]
+        except AliasException, ae:
+            self._raise_exception(ae, _method_name, 'WLSDPLY-19015', model_attribute_name, location.get_folder_path(),
+                                  ae.getLocalizedMessage())
+
+        return access
+
     def get_model_attribute_default_value(self, location, model_attribute_name):
         """
         Get the default value for the specified attribute
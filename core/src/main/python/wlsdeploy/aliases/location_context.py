@@ -1,13 +1,50 @@
 """
-Copyright (c) 2017, 2022, Oracle Corporation and/or its affiliates.  All rights reserved.
+Copyright (c) 2017, 2026, Oracle Corporation and/or its affiliates.  All rights reserved.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 from wlsdeploy.util import unicode_helper as str_helper
 
 
+class _FolderPath(object):
+    """
+    An immutable model folder path, such as /Server/SSL, that is shared by all the locations with the same folders.
+    Child paths are interned in their parent path, so each distinct path is created once, and locations derived
+    from each other share the parent-prefix structure. The folder list and folder path string are computed once,
+    when the path is created.
+    """
+    def __init__(self, parent, folder):
+        self.parent = parent
+        self.folder = folder
+        self.children = {}
+        if parent is None:
+            self.folders = ()
+            self.path = '/'
+        else:
+            self.folders = parent.folders + (folder,)
+            self.path = '/' + '/'.join(self.folders)
+
+    def get_child(self, folder):
+        child = self.children.get(folder)
+        if child is None:
+            child = self.children.setdefault(folder, _FolderPath(self, folder))
+        return child
+
+    def get_descendant(self, folders):
+        result = self
+        for folder in folders:
+            result = result.get_child(folder)
+        return result
+
+
+_ROOT_PATH = _FolderPath(None, None)
+
+
 class LocationContext(object):
     """
     Class that serves as the navigation context during model processing.
+    The model folders are stored as a shared, immutable folder path, so copying a location,
+    or deriving a parent or child location, does not copy the folder list. The name tokens are
+    copied only when a location that shares them is changed.
     """
     def __init__(self, another_location=None):
         """
@@ -19,11 +56,18 @@ class LocationContext(object):
         :param another_location: list of folder names that are part of the model
         """
         if another_location is None:
-            self._model_folders = list()
+            self._folder_path = _ROOT_PATH
             self._name_tokens = dict()
+            self._name_tokens_shared = False
+        elif isinstance(another_location, LocationContext):
+            self._folder_path = another_location._folder_path
+            self._name_tokens = another_location._name_tokens
+            self._name_tokens_shared = True
+            another_location._name_tokens_shared = True
         else:
-            self._model_folders = another_location.get_model_folders()
+            self._folder_path = _ROOT_PATH.get_descendant(another_location.get_model_folders())
             self._name_tokens = another_location.get_name_tokens()
+            self._name_tokens_shared = False
 
     def append_location(self, *args, **kwargs):
         """
@@ -33,11 +77,12 @@ class LocationContext(object):
         :return: self, for method chaining
         """
         if len(args) != 0:
-            self._model_folders.extend(args)
+            self._folder_path = self._folder_path.get_descendant(args)
 
         if len(kwargs) != 0:
+            name_tokens = self._get_writable_name_tokens()
             for key in kwargs:
-                self._name_tokens[key] = kwargs[key]
+                name_tokens[key] = kwargs[key]
         return self
 
     def pop_location(self, index=None):
@@ -46,12 +91,38 @@ class LocationContext(object):
         :param index: integer Index of list item to pop
         :return: The ``model_folder`` of list item at ``index``
         """
-        if index is None:
-            retval = self._model_folders.pop()
+        if index is None or index == -1 or index == len(self._folder_path.folders) - 1:
+            if self._folder_path.parent is None:
+                raise IndexError('pop from empty list')
+            retval = self._folder_path.folder
+            self._folder_path = self._folder_path.parent
         else:
-            retval = self._model_folders.pop(index)
+            model_folders = list(self._folder_path.folders)
+            retval = model_folders.pop(index)
+            self._folder_path = _ROOT_PATH.get_descendant(model_folders)
         return retval
 
+    def get_parent_location(self):
+        """
+        Get a new location for the parent folder of this location, with the same name tokens.
+        :return: the parent location, or None if this location is empty
+        """
+        if self._folder_path.parent is None:
+            return None
+        result = LocationContext(self)
+        result._folder_path = self._folder_path.parent
+        return result
+
+    def get_child_location(self, folder):
+        """
+        Get a new location for a child folder of this location, with the same name tokens.
+        :param folder: the name of the child folder
+        :return: the child location
+        """
+        result = LocationContext(self)
+        result._folder_path = self._folder_path.get_child(folder)
+        return result
+
     def add_name_token(self, token, value):
         """
         Adds a token-value pair to the location context
@@ -59,7 +130,7 @@ class LocationContext(object):
         :param value: string Value to use for NV pair
         :return: self, for method chaining
         """
-        self._name_tokens[token] = value
+        self._get_writable_name_tokens()[token] = value
         return self
 
     def remove_name_token(self, token):
@@ -69,7 +140,7 @@ class LocationContext(object):
         :return: self, for method chaining
         """
         if token in self._name_tokens:
-            del self._name_tokens[token]
+            del self._get_writable_name_tokens()[token]
         return self
 
     def get_name_for_token(self, token_name):
@@ -78,10 +149,23 @@ class LocationContext(object):
         :param token_name: token associated with the name value
         :return: name value or None if the token is not currently in the context
         """
-        name_value = None
-        if token_name in self._name_tokens:
-            name_value = self._name_tokens[token_name]
-        return name_value
+        return self._name_tokens.get(token_name)
+
+    def has_name_token(self, token_name):
+        """
+        Determine if the location has a value for the provided token.
+        :param token_name: the token name
+        :return: True if the token is in the context, False otherwise
+        """
+        return token_name in self._name_tokens
+
+    def iter_name_tokens(self):
+        """
+        Iterate over the token-value pairs of the location context, without copying them.
+        The location should not be changed during the iteration.
+        :return: an iterator of (token, value) tuples
+        """
+        return self._name_tokens.iteritems()
 
     def get_model_folders(self):
         """
@@ -89,9 +173,9 @@ class LocationContext(object):
 
         NOTE: This method is not part of the public API.
 
-        :return: new Python list built from ``self._model_folders``
+        :return: new Python list of the model folders
         """
-        return list(self._model_folders)
+        return list(self._folder_path.folders)
 
     def get_current_model_folder(self):
         """
@@ -100,9 +184,8 @@ class LocationContext(object):
         :return: return the current model folder name
         """
         model_folder = "Domain"
-        model_folder_list = self.get_model_folders()
-        if model_folder_list:
-            model_folder = model_folder_list[-1]
+        if self._folder_path.parent is not None:
+            model_folder = self._folder_path.folder
         return model_folder
 
     def get_parent_folder_path(self):
@@ -111,14 +194,8 @@ class LocationContext(object):
         :return: return the parent folder path
         """
         result = None
-        model_folder_list = self.get_model_folders()
-        if model_folder_list:
-            result = ''
-            if len(model_folder_list) > 1:
-                for folder in model_folder_list[-2]:
-                    result += '/' + folder
-            if len(result) == 0:
-                result = '/'
+        if self._folder_path.parent is not None:
+            result = self._folder_path.parent.path
         return result
 
     def get_name_tokens(self):
@@ -133,25 +210,21 @@ class LocationContext(object):
 
     def get_folder_path(self):
         """
-        Get the string that represents the model path specified by the model folders in this location
+        Get the string that represents the model path specified by the model folders in this location.
+        The string is the same object for every location with the same folders, and can be used as a lookup key.
         :return: the string that represents the model path
         """
-        result = ''
-        for folder in self._model_folders:
-            result += '/' + folder
-        if len(result) == 0:
-            result = '/'
-        return result
+        return self._folder_path.path
 
     def is_empty(self):
         """
         Is the location empty?
         :return: True if there are no folders, False otherwise
         """
-        return len(self._model_folders) == 0
+        return self._folder_path.parent is None
 
     def __str__(self):
-        location_model_folders = 'model_folders = %s' % (str_helper.to_string(self._model_folders))
+        location_model_folders = 'model_folders = %s' % (str_helper.to_string(self.get_model_folders()))
         tmp = ''
         for key, value in self._name_tokens.iteritems():
             tmp += "'%s': '%s'," % (key, value)
@@ -161,7 +234,7 @@ class LocationContext(object):
         return '%s, %s' % (location_model_folders, location_name_tokens)
 
     def __unicode__(self):
-        location_model_folders = u'model_folders = %s' % (str_helper.to_string(self._model_folders))
+        location_model_folders = u'model_folders = %s' % (str_helper.to_string(self.get_model_folders()))
         tmp = u''
         for key in self._name_tokens.keys():
             value = self._name_tokens[key]
@@ -172,4 +245,13 @@ class LocationContext(object):
         return u'%s, %s' % (location_model_folders, location_name_tokens)
 
     def __len__(self):
-        return len(self._model_folders)
+        return len(self._folder_path.folders)
+
+    def _get_writable_name_tokens(self):
+        """
+        Get the name tokens dictionary to be changed, copying it first if it is shared with another location.
+        """
+        if self._name_tokens_shared:
+            self._name_tokens = dict(self._name_tokens)
+            self._name_tokens_shared = False
+        return self._name_tokens
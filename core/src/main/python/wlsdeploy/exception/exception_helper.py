@@ -1,5 +1,5 @@
 """
-Copyright (c) 2017, 2024, Oracle and/or its affiliates.
+Copyright (c) 2017, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 import sys
@@ -8,6 +8,7 @@ import traceback
 from java.lang import Throwable as JThrowable
 
 import oracle.weblogic.deploy.aliases.AliasException as AliasException
+import oracle.weblogic.deploy.benchmark.BenchmarkException as BenchmarkException
 import oracle.weblogic.deploy.compare.CompareException as CompareException
 import oracle.weblogic.deploy.create.CreateException as CreateException
 import oracle.weblogic.deploy.deploy.DeployException as DeployException
@@ -37,6 +38,7 @@ from wlsdeploy.util.exit_code import ExitCode
 
 _EXCEPTION_TYPE_MAP = {
     ExceptionType.ALIAS:                 'create_alias_exception',
+    ExceptionType.BENCHMARK:             'create_benchmark_exception',
     ExceptionType.CLA:                   '_create_cla_type_exception',
     ExceptionType.COMPARE:               'create_compare_exception',
     ExceptionType.CREATE:                'create_create_exception',
@@ -55,6 +57,8 @@ _EXCEPTION_TYPE_MAP = {
 }
 
 _PROGRAM_NAME_TO_EXCEPTION_TYPE_MAP = {
+    'benchmarkTools':        ExceptionType.BENCHMARK,
+    'collectArtifacts':      ExceptionType.DISCOVER,
     'compareModel':          ExceptionType.COMPARE,
     'createDomain':          ExceptionType.CREATE,
     'deployApps':            ExceptionType.DEPLOY,
@@ -63,6 +67,7 @@ _PROGRAM_NAME_TO_EXCEPTION_TYPE_MAP = {
     'extractDomainResource': ExceptionType.DEPLOY,
     'injectVariables':       ExceptionType.TRANSLATE,
     'modelHelp':             ExceptionType.CLA,
+    'multiDomainRunner':     ExceptionType.CLA,
     'prepareModel':          ExceptionType.PREPARE,
     'updateDomain':          ExceptionType.DEPLOY,
     'validateModel':         ExceptionType.VALIDATE,
@@ -233,6 +238,35 @@ def create_alias_exception(key, *args, **kwargs):
     return ex
 
 
+def create_benchmark_exception(key, *args, **kwargs):
+    """
+    Create a BenchmarkException from a message id, list of message parameters and Throwable error.
+    :param key: key to the message in resource bundler or the message itself
+    :param args: list of parameters for the parameters or empty if none needed for the message
+    :param kwargs: contains Throwable or instance if present
+    :return: BenchmarkException encapsulating the exception information
+    """
+    arg_list, error = _return_exception_params(*args, **kwargs)
+    arg_len = len(arg_list)
+    if error is not None:
+        if arg_len > 0:
+            # Jython 2.7.1 in 14.1.1 is broken when it comes to binding varargs
+            # Java methods.  Calling the BenchmarkException(key, error, arg_list) is
+            # binding to the BenchmarkException(String key, Object... params) constructor
+            # instead of BenchmarkException(String key, Throwable cause, Object...params).
+            #
+            ex = BenchmarkException(key, arg_list)
+            ex.initCause(error)
+        else:
+            ex = BenchmarkException(key, error)
+    else:
+        if arg_len > 0:
+            ex = BenchmarkException(key, arg_list)
+        else:
+            ex = BenchmarkException(key)
+    return ex
+
+
 def create_validate_exception(key, *args, **kwargs):
     """
     Create a ValidateException from a message id, list of message parameters and Throwable error.
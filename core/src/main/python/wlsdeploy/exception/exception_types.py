@@ -1,11 +1,12 @@
 """
-Copyright (c) 2017, 2024, Oracle and/or its affiliates.
+Copyright (c) 2017, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 from wlsdeploy.util.enum import Enum
 
 ExceptionType = Enum([
     'ALIAS',
+    'BENCHMARK',
     'CLA',
     'COMPARE',
     'CREATE',
@@ -1,5 +1,5 @@
 """
-Copyright (c) 2017, 2022, Oracle and/or its affiliates.
+Copyright (c) 2017, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 
 This model provider translation classes that convert between JSON and Python Dictionaries.
@@ -126,7 +126,8 @@ class PythonToJson(object):
         writer = None
         try:
             fos = JFileOutputStream(json_file, False)
-            writer = JPrintWriter(fos, True)
+            # the writer is buffered and flushed when it is closed, instead of on each line
+            writer = JPrintWriter(fos, False)
             self._write_dictionary_to_json_file(self._dictionary, writer)
 
         except JFileNotFoundException, fnfe:
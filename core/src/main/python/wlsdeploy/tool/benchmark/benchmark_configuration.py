@@ -0,0 +1,169 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+Configuration for the benchmark tool, read from an optional benchmark definition file.
+"""
+from wlsdeploy.exception import exception_helper
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.util import dictionary_utils
+from wlsdeploy.util.exit_code import ExitCode
+
+# the sizes of the generated model
+CLUSTER_COUNT = 'cluster_count'
+SERVERS_PER_CLUSTER = 'servers_per_cluster'
+JDBC_RESOURCE_COUNT = 'jdbc_resource_count'
+JMS_RESOURCE_COUNT = 'jms_resource_count'
+QUEUES_PER_JMS_RESOURCE = 'queues_per_jms_resource'
+APPLICATION_COUNT = 'application_count'
+APPLICATION_SIZE_KB = 'application_size_kb'
+
+# how the benchmark is run
+ITERATIONS = 'iterations'
+PHASES = 'phases'
+REGRESSION_THRESHOLD_PERCENT = 'regression_threshold_percent'
+
+# phase names
+LOAD_MODEL_PHASE = 'loadModel'
+VALIDATE_MODEL_PHASE = 'validateModel'
+PREPARE_MODEL_PHASE = 'prepareModel'
+COMPARE_MODEL_PHASE = 'compareModel'
+CREATE_DOMAIN_PHASE = 'createDomain'
+DISCOVER_DOMAIN_PHASE = 'discoverDomain'
+
+# phases that run in the benchmark JVM, so memory usage can be measured
+IN_PROCESS_PHASES = [
+    LOAD_MODEL_PHASE,
+    VALIDATE_MODEL_PHASE,
+    PREPARE_MODEL_PHASE,
+    COMPARE_MODEL_PHASE
+]
+
+# phases that run the installed tool scripts, and require WebLogic Server to create a domain
+TOOL_PHASES = [
+    CREATE_DOMAIN_PHASE,
+    DISCOVER_DOMAIN_PHASE
+]
+
+ALL_PHASES = IN_PROCESS_PHASES + TOOL_PHASES
+
+_DEFAULTS = {
+    CLUSTER_COUNT: 2,
+    SERVERS_PER_CLUSTER: 4,
+    JDBC_RESOURCE_COUNT: 10,
+    JMS_RESOURCE_COUNT: 4,
+    QUEUES_PER_JMS_RESOURCE: 10,
+    APPLICATION_COUNT: 4,
+    APPLICATION_SIZE_KB: 512,
+    ITERATIONS: 3,
+    PHASES: IN_PROCESS_PHASES,
+    REGRESSION_THRESHOLD_PERCENT: 10
+}
+
+_INTEGER_KEYS = [
+    CLUSTER_COUNT,
+    SERVERS_PER_CLUSTER,
+    JDBC_RESOURCE_COUNT,
+    JMS_RESOURCE_COUNT,
+    QUEUES_PER_JMS_RESOURCE,
+    APPLICATION_COUNT,
+    APPLICATION_SIZE_KB,
+    ITERATIONS,
+    REGRESSION_THRESHOLD_PERCENT
+]
+
+_class_name = 'BenchmarkConfiguration'
+_logger = PlatformLogger('wlsdeploy.benchmark')
+
+
+class BenchmarkConfiguration(object):
+    """
+    Provides access to the benchmark settings, with defaults for values that are not specified.
+    """
+
+    def __init__(self, config_dict=None):
+        """
+        Create a configuration from the contents of a benchmark file.
+        :param config_dict: the dictionary parsed from the benchmark file, or None for defaults
+        :raises CLAException: if a value in the dictionary is not valid
+        """
+        self._config_dict = {}
+        if config_dict is not None:
+            self._config_dict = config_dict
+        self._validate()
+
+    def get_cluster_count(self):
+        return self._get_value(CLUSTER_COUNT)
+
+    def get_servers_per_cluster(self):
+        return self._get_value(SERVERS_PER_CLUSTER)
+
+    def get_jdbc_resource_count(self):
+        return self._get_value(JDBC_RESOURCE_COUNT)
+
+    def get_jms_resource_count(self):
+        return self._get_value(JMS_RESOURCE_COUNT)
+
+    def get_queues_per_jms_resource(self):
+        return self._get_value(QUEUES_PER_JMS_RESOURCE)
+
+    def get_application_count(self):
+        return self._get_value(APPLICATION_COUNT)
+
+    def get_application_size_kb(self):
+        return self._get_value(APPLICATION_SIZE_KB)
+
+    def get_iterations(self):
+        return self._get_value(ITERATIONS)
+
+    def get_phases(self):
+        """
+        Get the names of the phases to be run, in order.
+        :return: a list of phase names
+        """
+        return list(self._get_value(PHASES))
+
+    def get_regression_threshold_percent(self):
+        return self._get_value(REGRESSION_THRESHOLD_PERCENT)
+
+    def get_model_sizes(self):
+        """
+        Get the settings that determine the size of the generated model, for the report.
+        :return: a dictionary of size keys and values
+        """
+        result = {}
+        for key in [CLUSTER_COUNT, SERVERS_PER_CLUSTER, JDBC_RESOURCE_COUNT, JMS_RESOURCE_COUNT,
+                    QUEUES_PER_JMS_RESOURCE, APPLICATION_COUNT, APPLICATION_SIZE_KB]:
+            result[key] = self._get_value(key)
+        return result
+
+    def _get_value(self, key):
+        value = dictionary_utils.get_element(self._config_dict, key)
+        if value is None:
+            value = _DEFAULTS[key]
+        return value
+
+    def _validate(self):
+        _method_name = '_validate'
+
+        for key in self._config_dict:
+            if key not in _DEFAULTS:
+                ex = exception_helper.create_cla_exception(ExitCode.ARG_VALIDATION_ERROR, 'WLSDPLY-33000', key,
+                                                           ', '.join(_DEFAULTS.keys()))
+                _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+                raise ex
+
+        for key in _INTEGER_KEYS:
+            value = self._get_value(key)
+            if not isinstance(value, (int, long)) or value < 0:
+                ex = exception_helper.create_cla_exception(ExitCode.ARG_VALIDATION_ERROR, 'WLSDPLY-33001', key,
+                                                           value)
+                _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+                raise ex
+
+        for phase in self.get_phases():
+            if phase not in ALL_PHASES:
+                ex = exception_helper.create_cla_exception(ExitCode.ARG_VALIDATION_ERROR, 'WLSDPLY-33002', phase,
+                                                           ', '.join(ALL_PHASES))
+                _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+                raise ex
@@ -0,0 +1,172 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+Creates benchmark reports, and compares them with a baseline report to find regressions.
+"""
+import time
+
+from oracle.weblogic.deploy.json import JsonException
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+from oracle.weblogic.deploy.util import WebLogicDeployToolingVersion
+
+from wlsdeploy.exception import exception_helper
+from wlsdeploy.json.json_translator import JsonToPython
+from wlsdeploy.json.json_translator import PythonToJson
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.util import dictionary_utils
+
+REPORT_FILE_NAME = 'benchmark-report.json'
+
+# report keys
+WDT_VERSION = 'wdt_version'
+WLS_VERSION = 'wls_version'
+DOMAIN_TYPE = 'domain_type'
+TIMESTAMP = 'timestamp'
+ITERATIONS = 'iterations'
+MODEL_SIZES = 'model_sizes'
+PHASES = 'phases'
+ELAPSED_MILLIS = 'elapsed_millis'
+MIN_MILLIS = 'min_millis'
+MEAN_MILLIS = 'mean_millis'
+MAX_MILLIS = 'max_millis'
+PEAK_HEAP_BYTES = 'peak_heap_bytes'
+
+_class_name = 'benchmark_report'
+_logger = PlatformLogger('wlsdeploy.benchmark')
+
+
+class Regression(object):
+    """
+    A phase whose mean elapsed time exceeded the baseline by more than the threshold.
+    """
+    def __init__(self, phase, mean_millis, baseline_mean_millis, percent_change):
+        self.phase = phase
+        self.mean_millis = mean_millis
+        self.baseline_mean_millis = baseline_mean_millis
+        self.percent_change = percent_change
+
+
+def create_report(model_context, configuration, results):
+    """
+    Create a report dictionary from the benchmark results.
+    :param model_context: the model context for the benchmark tool
+    :param configuration: the BenchmarkConfiguration that was run
+    :param results: a dictionary of phase names to lists of PhaseResult objects
+    :return: the report dictionary
+    """
+    report = OrderedDict()
+    report[WDT_VERSION] = WebLogicDeployToolingVersion.getVersion()
+    report[WLS_VERSION] = model_context.get_effective_wls_version()
+    report[DOMAIN_TYPE] = model_context.get_domain_type()
+    report[TIMESTAMP] = time.strftime('%Y-%m-%dT%H:%M:%S')
+    report[ITERATIONS] = configuration.get_iterations()
+
+    model_sizes = OrderedDict()
+    sizes = configuration.get_model_sizes()
+    for key in sorted(sizes.keys()):
+        model_sizes[key] = sizes[key]
+    report[MODEL_SIZES] = model_sizes
+
+    phases = OrderedDict()
+    for phase in configuration.get_phases():
+        phase_results = dictionary_utils.get_element(results, phase)
+        if phase_results:
+            phases[phase] = _summarize_phase(phase_results)
+    report[PHASES] = phases
+    return report
+
+
+def write_report(report, report_file):
+    """
+    Write the report dictionary to a JSON file.
+    :param report: the report dictionary
+    :param report_file: the file to be written
+    :raises BenchmarkException: if the file cannot be written
+    """
+    _method_name = 'write_report'
+
+    try:
+        PythonToJson(report).write_to_json_file(report_file)
+    except JsonException, e:
+        ex = exception_helper.create_benchmark_exception('WLSDPLY-33031', report_file, e.getLocalizedMessage(),
+                                                         error=e)
+        _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+        raise ex
+    _logger.info('WLSDPLY-33030', report_file, class_name=_class_name, method_name=_method_name)
+
+
+def read_report(report_file):
+    """
+    Read a previously written report from a JSON file.
+    :param report_file: the file to be read
+    :return: the report dictionary
+    :raises BenchmarkException: if the file cannot be read
+    """
+    _method_name = 'read_report'
+
+    try:
+        return JsonToPython(report_file).parse()
+    except JsonException, e:
+        ex = exception_helper.create_benchmark_exception('WLSDPLY-33032', report_file, e.getLocalizedMessage(),
+                                                         error=e)
+        _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+        raise ex
+
+
+def find_regressions(report, baseline_report, threshold_percent):
+    """
+    Compare the mean elapsed time of each phase with the same phase in the baseline report.
+    Phases that are not in the baseline report are skipped.
+    :param report: the report dictionary for the current run
+    :param baseline_report: the baseline report dictionary
+    :param threshold_percent: the allowed increase over the baseline, as a percentage
+    :return: a list of Regression objects, one for each phase that exceeded the threshold
+    """
+    _method_name = 'find_regressions'
+
+    model_sizes = dict(dictionary_utils.get_dictionary_element(report, MODEL_SIZES))
+    baseline_model_sizes = dict(dictionary_utils.get_dictionary_element(baseline_report, MODEL_SIZES))
+    if model_sizes != baseline_model_sizes:
+        _logger.warning('WLSDPLY-33036', class_name=_class_name, method_name=_method_name)
+
+    regressions = []
+    baseline_phases = dictionary_utils.get_dictionary_element(baseline_report, PHASES)
+    phases = dictionary_utils.get_dictionary_element(report, PHASES)
+    for phase, summary in phases.iteritems():
+        baseline_summary = dictionary_utils.get_element(baseline_phases, phase)
+        if baseline_summary is None:
+            _logger.info('WLSDPLY-33034', phase, class_name=_class_name, method_name=_method_name)
+            continue
+
+        mean_millis = summary[MEAN_MILLIS]
+        baseline_mean_millis = dictionary_utils.get_element(baseline_summary, MEAN_MILLIS)
+        if not baseline_mean_millis:
+            continue
+
+        percent_change = (float(mean_millis) - baseline_mean_millis) * 100 / baseline_mean_millis
+        if percent_change > threshold_percent:
+            regressions.append(Regression(phase, mean_millis, baseline_mean_millis, round(percent_change, 1)))
+    return regressions
+
+
+def _summarize_phase(phase_results):
+    """
+    Summarize the results of all iterations of a phase.
+    Peak heap usage is the highest value from any iteration, and is omitted if it was not measured.
+    """
+    elapsed = []
+    peak_heap_bytes = None
+    for phase_result in phase_results:
+        elapsed.append(phase_result.elapsed_millis)
+        if phase_result.peak_heap_bytes is not None:
+            peak_heap_bytes = max(peak_heap_bytes, phase_result.peak_heap_bytes)
+
+    summary = OrderedDict()
+    summary[ELAPSED_MILLIS] = elapsed
+    summary[MIN_MILLIS] = min(elapsed)
+    summary[MEAN_MILLIS] = round(float(sum(elapsed)) / len(elapsed), 1)
+    summary[MAX_MILLIS] = max(elapsed)
+    if peak_heap_bytes is not None:
+        summary[PEAK_HEAP_BYTES] = peak_heap_bytes
+    return summary
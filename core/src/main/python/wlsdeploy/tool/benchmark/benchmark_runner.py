@@ -0,0 +1,277 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+Runs the benchmark phases against the generated model, recording elapsed time and memory usage.
+"""
+import os
+import sets
+
+from java.io import File as JFile
+from java.lang import ProcessBuilder
+from java.lang import System as JSystem
+from java.lang.management import ManagementFactory
+from java.lang.management import MemoryType
+
+from oracle.weblogic.deploy.benchmark import BenchmarkException
+from oracle.weblogic.deploy.exception import BundleAwareException
+from oracle.weblogic.deploy.util import FileUtils
+
+from wlsdeploy.aliases.aliases import Aliases
+from wlsdeploy.aliases.wlst_modes import WlstModes
+from wlsdeploy.exception import exception_helper
+from wlsdeploy.exception.exception_types import ExceptionType
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.tool.benchmark import benchmark_configuration
+from wlsdeploy.tool.compare.model_comparer import ModelComparer
+from wlsdeploy.tool.prepare.model_preparer import ModelPreparer
+from wlsdeploy.tool.util import model_context_helper
+from wlsdeploy.tool.validate.validator import Validator
+from wlsdeploy.util import cla_helper
+from wlsdeploy.util import env_helper
+from wlsdeploy.util import validate_configuration
+from wlsdeploy.util import variables
+from wlsdeploy.util.cla_utils import CommandLineArgUtil
+from wlsdeploy.util.model_translator import FileToPython
+
+_DOMAIN_DIR_NAME = 'benchmark_domain'
+_DISCOVER_MODEL_FILE_NAME = 'discovered-model.yaml'
+_DISCOVER_ARCHIVE_FILE_NAME = 'discovered-archive.zip'
+_PREPARE_DIR_NAME = 'prepared'
+_TOOL_LOG_SUFFIX = '-output.log'
+
+_class_name = 'BenchmarkRunner'
+_logger = PlatformLogger('wlsdeploy.benchmark')
+
+
+class PhaseResult(object):
+    """
+    The measurements from one iteration of a benchmark phase.
+    """
+    def __init__(self, elapsed_millis, peak_heap_bytes):
+        """
+        :param elapsed_millis: the elapsed time of the phase, in milliseconds
+        :param peak_heap_bytes: the peak heap usage during the phase, or None if it was not measured
+        """
+        self.elapsed_millis = elapsed_millis
+        self.peak_heap_bytes = peak_heap_bytes
+
+
+class BenchmarkRunner(object):
+    """
+    Runs each configured phase for the configured number of iterations.
+    Phases in IN_PROCESS_PHASES call the tool classes directly, so heap usage can be measured.
+    Phases in TOOL_PHASES run the installed tool scripts in a separate process, and only elapsed time is measured.
+    """
+    def __init__(self, model_context, configuration, generated_files):
+        """
+        :param model_context: the model context for the benchmark tool
+        :param configuration: the BenchmarkConfiguration to be run
+        :param generated_files: the GeneratedFiles from the model generator
+        """
+        self._model_context = model_context
+        self._configuration = configuration
+        self._files = generated_files
+        self._output_dir = model_context.get_output_dir()
+        self._domain_home = os.path.join(self._output_dir, _DOMAIN_DIR_NAME)
+
+        self._phase_methods = {
+            benchmark_configuration.LOAD_MODEL_PHASE: self._run_load_model,
+            benchmark_configuration.VALIDATE_MODEL_PHASE: self._run_validate_model,
+            benchmark_configuration.PREPARE_MODEL_PHASE: self._run_prepare_model,
+            benchmark_configuration.COMPARE_MODEL_PHASE: self._run_compare_model,
+            benchmark_configuration.CREATE_DOMAIN_PHASE: self._run_create_domain,
+            benchmark_configuration.DISCOVER_DOMAIN_PHASE: self._run_discover_domain
+        }
+
+    def run(self):
+        """
+        Run the configured phases.
+        :return: a dictionary of phase names to lists of PhaseResult objects, one for each iteration
+        :raises BenchmarkException: if a phase fails
+        """
+        _method_name = 'run'
+        _logger.entering(class_name=_class_name, method_name=_method_name)
+
+        results = {}
+        iterations = self._configuration.get_iterations()
+        for phase in self._configuration.get_phases():
+            phase_method = self._phase_methods[phase]
+            measure_heap = phase in benchmark_configuration.IN_PROCESS_PHASES
+            phase_results = []
+            for iteration in range(1, iterations + 1):
+                _logger.info('WLSDPLY-33020', phase, iteration, iterations,
+                             class_name=_class_name, method_name=_method_name)
+                phase_result = self._run_phase(phase, phase_method, measure_heap)
+                _logger.info('WLSDPLY-33021', phase, iteration, phase_result.elapsed_millis,
+                             class_name=_class_name, method_name=_method_name)
+                phase_results.append(phase_result)
+            results[phase] = phase_results
+
+        _logger.exiting(class_name=_class_name, method_name=_method_name)
+        return results
+
+    def _run_phase(self, phase, phase_method, measure_heap):
+        """
+        Run a single iteration of the phase, and measure it.
+        Garbage collection is requested before each in-process phase,
+        so the peak heap usage reflects the phase and not earlier iterations.
+        """
+        _method_name = '_run_phase'
+
+        heap_pools = []
+        if measure_heap:
+            JSystem.gc()
+            heap_pools = _get_heap_pools()
+            for pool in heap_pools:
+                pool.resetPeakUsage()
+
+        start = JSystem.nanoTime()
+        try:
+            phase_method()
+        except BenchmarkException, ex:
+            raise ex
+        except BundleAwareException, ex:
+            # exceptions from the tools are reported as a failure of the phase
+            bex = exception_helper.create_benchmark_exception('WLSDPLY-33025', phase, ex.getLocalizedMessage(),
+                                                              error=ex)
+            _logger.throwing(bex, class_name=_class_name, method_name=_method_name)
+            raise bex
+        elapsed_millis = (JSystem.nanoTime() - start) / 1000000L
+
+        peak_heap_bytes = None
+        if measure_heap:
+            peak_heap_bytes = 0L
+            for pool in heap_pools:
+                peak_heap_bytes += pool.getPeakUsage().getUsed()
+
+        return PhaseResult(elapsed_millis, peak_heap_bytes)
+
+    def _run_load_model(self):
+        FileToPython(self._files.model_file, True).parse()
+
+    def _run_validate_model(self):
+        _method_name = '_run_validate_model'
+
+        model_context = self._create_phase_context('validateModel', self._files.model_file)
+        aliases = Aliases(model_context=model_context, wlst_mode=WlstModes.OFFLINE,
+                          exception_type=ExceptionType.VALIDATE)
+        validator = Validator(model_context, aliases)
+        variable_map = validator.load_variables(self._files.variable_file)
+        model_dictionary = cla_helper.merge_model_files(self._files.model_file, variable_map)
+        return_code = validator.validate_in_standalone_mode(model_dictionary, variable_map,
+                                                            self._files.archive_file)
+        if return_code == Validator.ReturnCode.STOP:
+            ex = exception_helper.create_benchmark_exception('WLSDPLY-33026', self._files.model_file)
+            _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+            raise ex
+
+    def _run_prepare_model(self):
+        prepare_dir = os.path.join(self._output_dir, _PREPARE_DIR_NAME)
+        FileUtils.deleteDirectory(JFile(prepare_dir))
+        os.makedirs(prepare_dir)
+
+        arg_map = {
+            CommandLineArgUtil.OUTPUT_DIR_SWITCH: prepare_dir,
+            CommandLineArgUtil.TARGET_SWITCH: 'wko'
+        }
+        model_context = self._create_phase_context('prepareModel', self._files.model_file, arg_map)
+        ModelPreparer(self._files.model_file, model_context, prepare_dir).prepare_models()
+
+    def _run_compare_model(self):
+        model_context = self._create_phase_context('compareModel', self._files.model_file)
+        model_context.set_validation_method(validate_configuration.LAX_METHOD)
+        aliases = Aliases(model_context=model_context, wlst_mode=WlstModes.OFFLINE,
+                          exception_type=ExceptionType.COMPARE)
+
+        variable_map = variables.load_variables(self._files.variable_file)
+        current_dict = cla_helper.merge_model_files(self._files.model_file, variable_map)
+        variables.substitute(current_dict, variable_map, model_context)
+        past_dict = cla_helper.merge_model_files(self._files.variant_model_file, variable_map)
+        variables.substitute(past_dict, variable_map, model_context)
+
+        ModelComparer(current_dict, past_dict, aliases, sets.Set()).compare_models()
+
+    def _run_create_domain(self):
+        FileUtils.deleteDirectory(JFile(self._domain_home))
+        self._run_tool_script(benchmark_configuration.CREATE_DOMAIN_PHASE, [
+            CommandLineArgUtil.DOMAIN_HOME_SWITCH, self._domain_home,
+            CommandLineArgUtil.DOMAIN_TYPE_SWITCH, self._model_context.get_domain_type(),
+            CommandLineArgUtil.MODEL_FILE_SWITCH, self._files.model_file,
+            CommandLineArgUtil.VARIABLE_FILE_SWITCH, self._files.variable_file,
+            CommandLineArgUtil.ARCHIVE_FILE_SWITCH, self._files.archive_file
+        ])
+
+    def _run_discover_domain(self):
+        _method_name = '_run_discover_domain'
+
+        if not os.path.isdir(self._domain_home):
+            ex = exception_helper.create_benchmark_exception('WLSDPLY-33024', self._domain_home,
+                                                             benchmark_configuration.CREATE_DOMAIN_PHASE)
+            _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+            raise ex
+
+        self._run_tool_script(benchmark_configuration.DISCOVER_DOMAIN_PHASE, [
+            CommandLineArgUtil.DOMAIN_HOME_SWITCH, self._domain_home,
+            CommandLineArgUtil.DOMAIN_TYPE_SWITCH, self._model_context.get_domain_type(),
+            CommandLineArgUtil.MODEL_FILE_SWITCH, os.path.join(self._output_dir, _DISCOVER_MODEL_FILE_NAME),
+            CommandLineArgUtil.ARCHIVE_FILE_SWITCH, os.path.join(self._output_dir, _DISCOVER_ARCHIVE_FILE_NAME)
+        ])
+
+    def _create_phase_context(self, program_name, model_file, extra_args=None):
+        """
+        Create a model context for an in-process phase, as the corresponding tool would.
+        """
+        arg_map = {
+            CommandLineArgUtil.ORACLE_HOME_SWITCH: self._model_context.get_oracle_home(),
+            CommandLineArgUtil.DOMAIN_TYPE_SWITCH: self._model_context.get_domain_type(),
+            CommandLineArgUtil.MODEL_FILE_SWITCH: model_file,
+            CommandLineArgUtil.VARIABLE_FILE_SWITCH: self._files.variable_file,
+            CommandLineArgUtil.ARCHIVE_FILE_SWITCH: self._files.archive_file
+        }
+        if extra_args:
+            arg_map.update(extra_args)
+        return model_context_helper.create_context(program_name, arg_map)
+
+    def _run_tool_script(self, tool_name, arguments):
+        """
+        Run the installed script for the tool, with its output written to a log file in the output directory.
+        :raises BenchmarkException: if the script is not found, or returns a non-zero exit code
+        """
+        _method_name = '_run_tool_script'
+
+        script_extension = '.sh'
+        if JSystem.getProperty('os.name').startswith('Windows'):
+            script_extension = '.cmd'
+
+        wlsdeploy_home = env_helper.getenv('WLSDEPLOY_HOME', '')
+        script = os.path.join(wlsdeploy_home, 'bin', tool_name + script_extension)
+        if not os.path.isfile(script):
+            ex = exception_helper.create_benchmark_exception('WLSDPLY-33022', script)
+            _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+            raise ex
+
+        command = [script, CommandLineArgUtil.ORACLE_HOME_SWITCH, self._model_context.get_oracle_home()]
+        command.extend(arguments)
+
+        log_file = os.path.join(self._output_dir, tool_name + _TOOL_LOG_SUFFIX)
+        process_builder = ProcessBuilder(command)
+        process_builder.redirectErrorStream(True)
+        process_builder.redirectOutput(JFile(log_file))
+        exit_code = process_builder.start().waitFor()
+        if exit_code != 0:
+            ex = exception_helper.create_benchmark_exception('WLSDPLY-33023', tool_name, exit_code, log_file)
+            _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+            raise ex
+
+
+def _get_heap_pools():
+    """
+    Get the heap memory pools for this JVM.
+    The sum of their peak usage values is used as the peak heap usage for a phase.
+    """
+    result = []
+    for pool in ManagementFactory.getMemoryPoolMXBeans():
+        if pool.getType() == MemoryType.HEAP:
+            result.append(pool)
+    return result
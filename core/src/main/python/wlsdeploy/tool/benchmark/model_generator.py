@@ -0,0 +1,371 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+Generates synthetic models, variable files and archives for the benchmark tool.
+"""
+import os
+
+from java.io import BufferedOutputStream
+from java.io import File as JFile
+from java.io import FileOutputStream
+from java.lang import String
+from java.util import Random
+from java.util.zip import ZipEntry
+from java.util.zip import ZipOutputStream
+
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+from oracle.weblogic.deploy.util import WLSDeployArchive
+from oracle.weblogic.deploy.util import WLSDeployArchiveIOException
+
+from wlsdeploy.aliases.location_context import LocationContext
+from wlsdeploy.aliases.model_constants import ADMIN_PASSWORD
+from wlsdeploy.aliases.model_constants import ADMIN_USERNAME
+from wlsdeploy.aliases.model_constants import APP_DEPLOYMENTS
+from wlsdeploy.aliases.model_constants import APPLICATION
+from wlsdeploy.aliases.model_constants import CLUSTER
+from wlsdeploy.aliases.model_constants import CONNECTION_FACTORY
+from wlsdeploy.aliases.model_constants import DOMAIN_INFO
+from wlsdeploy.aliases.model_constants import DOMAIN_NAME
+from wlsdeploy.aliases.model_constants import FILE_STORE
+from wlsdeploy.aliases.model_constants import JDBC_DATASOURCE_PARAMS
+from wlsdeploy.aliases.model_constants import JDBC_DRIVER_PARAMS
+from wlsdeploy.aliases.model_constants import JDBC_DRIVER_PARAMS_PROPERTIES
+from wlsdeploy.aliases.model_constants import JDBC_RESOURCE
+from wlsdeploy.aliases.model_constants import JDBC_SYSTEM_RESOURCE
+from wlsdeploy.aliases.model_constants import JMS_RESOURCE
+from wlsdeploy.aliases.model_constants import JMS_SERVER
+from wlsdeploy.aliases.model_constants import JMS_SYSTEM_RESOURCE
+from wlsdeploy.aliases.model_constants import JNDI_NAME
+from wlsdeploy.aliases.model_constants import LISTEN_PORT
+from wlsdeploy.aliases.model_constants import MODULE_TYPE
+from wlsdeploy.aliases.model_constants import PASSWORD_ENCRYPTED
+from wlsdeploy.aliases.model_constants import PERSISTENT_STORE
+from wlsdeploy.aliases.model_constants import QUEUE
+from wlsdeploy.aliases.model_constants import RESOURCES
+from wlsdeploy.aliases.model_constants import SERVER
+from wlsdeploy.aliases.model_constants import SOURCE_PATH
+from wlsdeploy.aliases.model_constants import TARGET
+from wlsdeploy.aliases.model_constants import TOPOLOGY
+from wlsdeploy.aliases.validation_codes import ValidationCodes
+from wlsdeploy.exception import exception_helper
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.util import variables
+from wlsdeploy.yaml.yaml_translator import PythonToYaml
+
+MODEL_FILE_NAME = 'benchmark-model.yaml'
+VARIANT_MODEL_FILE_NAME = 'benchmark-variant-model.yaml'
+VARIABLE_FILE_NAME = 'benchmark-variables.properties'
+ARCHIVE_FILE_NAME = 'benchmark-archive.zip'
+
+_ADMIN_USER_VARIABLE = 'admin.username'
+_ADMIN_PASSWORD_VARIABLE = 'admin.password'
+_JDBC_PASSWORD_VARIABLE = 'jdbc.password'
+_BASE_LISTEN_PORT = 9001
+
+_class_name = 'SyntheticModelGenerator'
+_logger = PlatformLogger('wlsdeploy.benchmark')
+
+
+class GeneratedFiles(object):
+    """
+    The locations of the files created by the model generator.
+    """
+    def __init__(self, model_file, variant_model_file, variable_file, archive_file):
+        self.model_file = model_file
+        self.variant_model_file = variant_model_file
+        self.variable_file = variable_file
+        self.archive_file = archive_file
+
+
+class SyntheticModelGenerator(object):
+    """
+    Generates a model of the size specified by the benchmark configuration.
+    Folders and attributes are checked against the aliases for the target WLS version,
+    so the model is valid for the version being benchmarked.
+    """
+    def __init__(self, configuration, aliases, output_dir):
+        """
+        :param configuration: the BenchmarkConfiguration with the model sizes
+        :param aliases: the aliases for the WLS version and WLST mode being benchmarked
+        :param output_dir: the directory where generated files are written
+        """
+        self._configuration = configuration
+        self._aliases = aliases
+        self._output_dir = output_dir
+
+    def generate(self):
+        """
+        Generate the model, a variant of the model for comparison, a variable file, and an archive.
+        :return: a GeneratedFiles object with the file locations
+        :raises BenchmarkException: if the files cannot be written
+        """
+        _method_name = 'generate'
+        _logger.entering(class_name=_class_name, method_name=_method_name)
+
+        model_file = os.path.join(self._output_dir, MODEL_FILE_NAME)
+        variant_model_file = os.path.join(self._output_dir, VARIANT_MODEL_FILE_NAME)
+        variable_file = os.path.join(self._output_dir, VARIABLE_FILE_NAME)
+        archive_file = os.path.join(self._output_dir, ARCHIVE_FILE_NAME)
+
+        application_paths = self._create_archive(archive_file)
+
+        model = self._create_model(application_paths, False)
+        PythonToYaml(model).write_to_yaml_file(model_file)
+
+        variant_model = self._create_model(application_paths, True)
+        PythonToYaml(variant_model).write_to_yaml_file(variant_model_file)
+
+        variable_map = OrderedDict()
+        variable_map[_ADMIN_USER_VARIABLE] = 'weblogic'
+        variable_map[_ADMIN_PASSWORD_VARIABLE] = 'Welcome1'
+        variable_map[_JDBC_PASSWORD_VARIABLE] = 'Welcome1'
+        variables.write_variables('benchmarkTools', variable_map, variable_file)
+
+        _logger.info('WLSDPLY-33010', model_file, variable_file, archive_file,
+                     class_name=_class_name, method_name=_method_name)
+        result = GeneratedFiles(model_file, variant_model_file, variable_file, archive_file)
+        _logger.exiting(class_name=_class_name, method_name=_method_name)
+        return result
+
+    def _create_model(self, application_paths, is_variant):
+        """
+        Create the model dictionary.
+        The variant model changes some attributes and removes some elements,
+        so the comparison has differences to report.
+        """
+        model = OrderedDict()
+
+        domain_info = OrderedDict()
+        domain_info[ADMIN_USERNAME] = '@@PROP:%s@@' % _ADMIN_USER_VARIABLE
+        domain_info[ADMIN_PASSWORD] = '@@PROP:%s@@' % _ADMIN_PASSWORD_VARIABLE
+        model[DOMAIN_INFO] = domain_info
+
+        model[TOPOLOGY] = self._create_topology(is_variant)
+        model[RESOURCES] = self._create_resources(is_variant)
+        model[APP_DEPLOYMENTS] = self._create_deployments(application_paths, is_variant)
+        return model
+
+    def _create_topology(self, is_variant):
+        topology = OrderedDict()
+        topology[DOMAIN_NAME] = 'benchmark_domain'
+
+        clusters = OrderedDict()
+        servers = OrderedDict()
+        port = _BASE_LISTEN_PORT
+        cluster_location = LocationContext().append_location(CLUSTER)
+        server_location = LocationContext().append_location(SERVER)
+
+        for cluster_index in range(1, self._configuration.get_cluster_count() + 1):
+            cluster_name = 'cluster%s' % cluster_index
+            clusters[cluster_name] = OrderedDict()
+
+            for server_index in range(1, self._configuration.get_servers_per_cluster() + 1):
+                server_name = '%s-ms%s' % (cluster_name, server_index)
+                server = OrderedDict()
+                self._add_attribute(server, server_location, CLUSTER, cluster_name)
+                if is_variant and server_index == 1:
+                    self._add_attribute(server, server_location, LISTEN_PORT, port + 10000)
+                else:
+                    self._add_attribute(server, server_location, LISTEN_PORT, port)
+                self._add_attribute(server, server_location, 'ListenAddress', '')
+                servers[server_name] = server
+                port += 1
+
+        self._add_folder(topology, cluster_location, clusters)
+        self._add_folder(topology, server_location, servers)
+        return topology
+
+    def _create_resources(self, is_variant):
+        resources = OrderedDict()
+        target = self._get_default_target()
+
+        jdbc_location = LocationContext().append_location(JDBC_SYSTEM_RESOURCE)
+        jdbc_resource_location = LocationContext(jdbc_location).append_location(JDBC_RESOURCE)
+        params_location = LocationContext(jdbc_resource_location).append_location(JDBC_DATASOURCE_PARAMS)
+        driver_location = LocationContext(jdbc_resource_location).append_location(JDBC_DRIVER_PARAMS)
+        properties_location = LocationContext(driver_location).append_location(JDBC_DRIVER_PARAMS_PROPERTIES)
+
+        data_sources = OrderedDict()
+        for index in range(1, self._configuration.get_jdbc_resource_count() + 1):
+            data_source = OrderedDict()
+            self._add_attribute(data_source, jdbc_location, TARGET, target)
+
+            params = OrderedDict()
+            self._add_attribute(params, params_location, JNDI_NAME, 'jdbc/benchmark%s' % index)
+
+            driver = OrderedDict()
+            database = 'benchmark%s' % index
+            if is_variant and index == 1:
+                database = 'changed%s' % index
+            self._add_attribute(driver, driver_location, 'URL', 'jdbc:oracle:thin:@//dbhost:1521/%s' % database)
+            self._add_attribute(driver, driver_location, 'DriverName', 'oracle.jdbc.OracleDriver')
+            self._add_attribute(driver, driver_location, PASSWORD_ENCRYPTED, '@@PROP:%s@@' % _JDBC_PASSWORD_VARIABLE)
+
+            user_property = OrderedDict()
+            user_property['Value'] = 'benchmark'
+            properties = OrderedDict()
+            properties['user'] = user_property
+            self._add_folder(driver, properties_location, properties)
+
+            jdbc_resource = OrderedDict()
+            self._add_folder(jdbc_resource, params_location, params)
+            self._add_folder(jdbc_resource, driver_location, driver)
+            self._add_folder(data_source, jdbc_resource_location, jdbc_resource)
+            data_sources['Benchmark-DS-%s' % index] = data_source
+
+        self._add_folder(resources, jdbc_location, data_sources)
+
+        store_location = LocationContext().append_location(FILE_STORE)
+        jms_server_location = LocationContext().append_location(JMS_SERVER)
+        jms_system_location = LocationContext().append_location(JMS_SYSTEM_RESOURCE)
+        jms_resource_location = LocationContext(jms_system_location).append_location(JMS_RESOURCE)
+        queue_location = LocationContext(jms_resource_location).append_location(QUEUE)
+        factory_location = LocationContext(jms_resource_location).append_location(CONNECTION_FACTORY)
+
+        stores = OrderedDict()
+        jms_servers = OrderedDict()
+        jms_modules = OrderedDict()
+        jms_count = self._configuration.get_jms_resource_count()
+        for index in range(1, jms_count + 1):
+            store_name = 'BenchmarkStore%s' % index
+            store = OrderedDict()
+            self._add_attribute(store, store_location, TARGET, target)
+            stores[store_name] = store
+
+            jms_server = OrderedDict()
+            self._add_attribute(jms_server, jms_server_location, PERSISTENT_STORE, store_name)
+            self._add_attribute(jms_server, jms_server_location, TARGET, target)
+            jms_servers['BenchmarkJMSServer%s' % index] = jms_server
+
+            queue_count = self._configuration.get_queues_per_jms_resource()
+            if is_variant and index == jms_count:
+                queue_count = max(0, queue_count - 1)
+
+            queues = OrderedDict()
+            for queue_index in range(1, queue_count + 1):
+                queue = OrderedDict()
+                self._add_attribute(queue, queue_location, JNDI_NAME, 'jms/benchmark%s/queue%s' % (index, queue_index))
+                queues['BenchmarkQueue%s' % queue_index] = queue
+
+            factory = OrderedDict()
+            self._add_attribute(factory, factory_location, JNDI_NAME, 'jms/benchmark%s/factory' % index)
+            factories = OrderedDict()
+            factories['BenchmarkFactory'] = factory
+
+            jms_resource = OrderedDict()
+            self._add_folder(jms_resource, queue_location, queues)
+            self._add_folder(jms_resource, factory_location, factories)
+
+            jms_module = OrderedDict()
+            self._add_attribute(jms_module, jms_system_location, TARGET, target)
+            self._add_folder(jms_module, jms_resource_location, jms_resource)
+            jms_modules['BenchmarkJmsModule%s' % index] = jms_module
+
+        self._add_folder(resources, store_location, stores)
+        self._add_folder(resources, jms_server_location, jms_servers)
+        self._add_folder(resources, jms_system_location, jms_modules)
+        return resources
+
+    def _create_deployments(self, application_paths, is_variant):
+        deployments = OrderedDict()
+        application_location = LocationContext().append_location(APPLICATION)
+        target = self._get_default_target()
+
+        applications = OrderedDict()
+        count = len(application_paths)
+        for index in range(count):
+            if is_variant and index == count - 1:
+                continue
+            application_path = application_paths[index]
+            application = OrderedDict()
+            self._add_attribute(application, application_location, SOURCE_PATH, application_path)
+            self._add_attribute(application, application_location, MODULE_TYPE, 'war')
+            self._add_attribute(application, application_location, TARGET, target)
+            name = os.path.splitext(os.path.basename(application_path))[0]
+            applications[name] = application
+
+        self._add_folder(deployments, application_location, applications)
+        return deployments
+
+    def _create_archive(self, archive_file):
+        """
+        Create the archive file with generated applications.
+        :return: a list of application paths in the archive
+        :raises BenchmarkException: if the archive cannot be written
+        """
+        _method_name = '_create_archive'
+
+        if os.path.exists(archive_file):
+            os.remove(archive_file)
+
+        application_paths = []
+        archive = WLSDeployArchive(archive_file)
+        try:
+            for index in range(1, self._configuration.get_application_count() + 1):
+                war_file = os.path.join(self._output_dir, 'benchmark-app%s.war' % index)
+                self._create_war_file(war_file, index)
+                application_paths.append(archive.addApplication(war_file))
+                os.remove(war_file)
+        except WLSDeployArchiveIOException, e:
+            ex = exception_helper.create_benchmark_exception('WLSDPLY-33011', archive_file, e.getLocalizedMessage(),
+                                                             error=e)
+            _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+            raise ex
+        finally:
+            archive.close()
+        return application_paths
+
+    def _create_war_file(self, war_file, index):
+        """
+        Write a web application with a padding entry of the configured size.
+        The padding uses seeded random bytes, so it does not compress, and the content is repeatable.
+        """
+        output_stream = ZipOutputStream(BufferedOutputStream(FileOutputStream(JFile(war_file))))
+        try:
+            output_stream.putNextEntry(ZipEntry('WEB-INF/web.xml'))
+            web_xml = '<?xml version="1.0" encoding="UTF-8"?>\n' \
+                      '<web-app xmlns="http://xmlns.jcp.org/xml/ns/javaee" version="3.1">\n' \
+                      '  <display-name>benchmark-app%s</display-name>\n' \
+                      '</web-app>\n' % index
+            output_stream.write(String(web_xml).getBytes('UTF-8'))
+            output_stream.closeEntry()
+
+            output_stream.putNextEntry(ZipEntry('WEB-INF/lib/padding.bin'))
+            random = Random(index)
+            buffer = String(' ' * 1024).getBytes('UTF-8')
+            for block in range(self._configuration.get_application_size_kb()):
+                random.nextBytes(buffer)
+                output_stream.write(buffer)
+            output_stream.closeEntry()
+        finally:
+            output_stream.close()
+
+    def _get_default_target(self):
+        """
+        Resources and applications are targeted to the first cluster, or the admin server if there are no clusters.
+        """
+        if self._configuration.get_cluster_count() > 0:
+            return 'cluster1'
+        return 'AdminServer'
+
+    def _add_attribute(self, folder_dict, location, attribute_name, value):
+        """
+        Add the attribute to the folder if it is valid for the WLS version of the aliases.
+        """
+        code, _message = self._aliases.is_valid_model_attribute_name(location, attribute_name)
+        if code == ValidationCodes.VALID:
+            folder_dict[attribute_name] = value
+
+    def _add_folder(self, parent_dict, location, folder_dict):
+        """
+        Add the folder to the parent if it is not empty, and valid for the WLS version of the aliases.
+        """
+        if not folder_dict:
+            return
+        folder_name = location.get_current_model_folder()
+        parent_location = LocationContext(location)
+        parent_location.pop_location()
+        code, _message = self._aliases.is_valid_model_folder_name(parent_location, folder_name)
+        if code == ValidationCodes.VALID:
+            parent_dict[folder_name] = folder_dict
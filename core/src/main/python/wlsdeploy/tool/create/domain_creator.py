@@ -1,5 +1,5 @@
 """
-Copyright (c) 2017, 2025, Oracle and/or its affiliates.
+Copyright (c) 2017, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 import os
@@ -60,6 +60,7 @@ from wlsdeploy.aliases.model_constants import XML_REGISTRY
 from wlsdeploy.aliases.validation_codes import ValidationCodes
 from wlsdeploy.exception import exception_helper
 from wlsdeploy.exception.exception_types import ExceptionType
+from wlsdeploy.tool.create import domain_snapshot
 from wlsdeploy.tool.create import opss_helper
 from wlsdeploy.tool.create.creator import Creator
 from wlsdeploy.tool.create.domain_typedef import POST_CREATE_DOMAIN_LIFECYCLE_HOOK
@@ -103,6 +104,7 @@ class DomainCreator(Creator):
                                                                  ExceptionType.CREATE, self.logger)
 
         self._domain_typedef = self.model_context.get_domain_typedef()
+        self._snapshot_cache = domain_snapshot.get_snapshot_cache(self.__program_name)
         self._topology = self.model.get_model_topology()
         self._domain_info = self.model.get_model_domain_info()
 
@@ -244,9 +246,16 @@ class DomainCreator(Creator):
         self.logger.info('WLSDPLY-12203', domain_type, class_name=self.__class_name, method_name=_method_name)
 
         if self.wls_helper.is_select_template_supported():
-            self.__create_base_domain_with_select_template(self._domain_home)
-            self.__extend_domain_with_select_template(self._domain_home)
+            snapshot_file = self.__find_domain_snapshot()
+            if snapshot_file is None:
+                self.__create_base_domain_with_select_template(self._domain_home)
+            else:
+                self.wlst_helper.read_template(snapshot_file)
+            self.__extend_domain_with_select_template(self._domain_home, snapshot_file)
         else:
+            if self._snapshot_cache is not None:
+                self._snapshot_cache.set_unsupported(self.wls_helper.wl_version)
+                self._snapshot_cache.write_report()
             self.__create_base_domain(self._domain_home)
             self.__extend_domain(self._domain_home)
 
@@ -407,10 +416,11 @@ class DomainCreator(Creator):
 
         self.logger.exiting(class_name=self.__class_name, method_name=_method_name)
 
-    def __extend_domain_with_select_template(self, domain_home):
+    def __extend_domain_with_select_template(self, domain_home, snapshot_file=None):
         """
         Create and extend the domain, as needed, for WebLogic Server versions 12.2.1 and above.
         :param domain_home: the domain home directory
+        :param snapshot_file: the domain snapshot that was read instead of selecting the templates, or None
         :raises: CreateException: if an error occurs
         """
         _method_name = '__extend_domain_with_select_template'
@@ -420,18 +430,20 @@ class DomainCreator(Creator):
         extension_templates = self._domain_typedef.get_extension_templates()
         custom_templates = self._domain_typedef.get_custom_extension_templates()
 
-        for extension_template in extension_templates:
-            self.logger.info('WLSDPLY-12211', extension_template,
-                             class_name=self.__class_name, method_name=_method_name)
-            self.wlst_helper.select_template(extension_template)
+        if snapshot_file is None:
+            for extension_template in extension_templates:
+                self.logger.info('WLSDPLY-12211', extension_template,
+                                 class_name=self.__class_name, method_name=_method_name)
+                self.wlst_helper.select_template(extension_template)
 
-        for custom_template in custom_templates:
-            self.logger.info('WLSDPLY-12245', custom_template,
-                             class_name=self.__class_name, method_name=_method_name)
-            self.wlst_helper.select_custom_template(custom_template)
+            for custom_template in custom_templates:
+                self.logger.info('WLSDPLY-12245', custom_template,
+                                 class_name=self.__class_name, method_name=_method_name)
+                self.wlst_helper.select_custom_template(custom_template)
 
-        self.logger.info('WLSDPLY-12212', class_name=self.__class_name, method_name=_method_name)
-        self.wlst_helper.load_templates()
+            self.logger.info('WLSDPLY-12212', class_name=self.__class_name, method_name=_method_name)
+            self.wlst_helper.load_templates()
+            self.__store_domain_snapshot()
 
         self.__set_core_domain_params()
         self.__set_app_dir()
@@ -488,6 +500,40 @@ class DomainCreator(Creator):
 
         self.logger.exiting(class_name=self.__class_name, method_name=_method_name)
 
+    def __find_domain_snapshot(self):
+        """
+        Find a valid snapshot of the domain type templates, if the snapshot cache is enabled.
+        :return: the snapshot template file, or None if there is no valid snapshot
+        """
+        if self._snapshot_cache is None:
+            return None
+
+        templates = [(domain_snapshot.BASE_TEMPLATE, self._domain_typedef.get_base_template())]
+        for extension_template in self._domain_typedef.get_extension_templates():
+            templates.append((domain_snapshot.EXTENSION_TEMPLATE, extension_template))
+        for custom_template in self._domain_typedef.get_custom_extension_templates():
+            templates.append((domain_snapshot.CUSTOM_TEMPLATE, custom_template))
+
+        topology_profile = self._domain_typedef.get_topology_profile()
+        if topology_profile not in TopologyProfile:
+            topology_profile = None
+
+        inputs = domain_snapshot.compute_inputs(self.wls_helper.wl_version, self.model_context.get_domain_type(),
+                                                topology_profile, self.model_context.get_oracle_home(), templates)
+        snapshot_file = self._snapshot_cache.lookup(inputs)
+        if snapshot_file is not None:
+            self._snapshot_cache.write_report()
+        return snapshot_file
+
+    def __store_domain_snapshot(self):
+        """
+        Store a snapshot of the loaded templates, if the snapshot cache is enabled.
+        This is called before any model content is applied.
+        """
+        if self._snapshot_cache is not None:
+            self._snapshot_cache.store(self.wlst_helper.write_template)
+            self._snapshot_cache.write_report()
+
     def __apply_base_domain_config(self, topology_folder_list, fmw_ds_names, delete=True):
         """
         Apply the base domain configuration from the model topology section.
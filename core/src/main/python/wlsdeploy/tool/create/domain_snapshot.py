@@ -0,0 +1,488 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+An opt-in cache of domain snapshots, used by createDomain to skip selecting and loading the domain type templates.
+A snapshot is a domain template written by WLST after the templates are loaded, before any model content is applied.
+The cache is enabled by setting the WLSDEPLOY_DOMAIN_SNAPSHOT_DIR environment variable to the cache directory.
+"""
+import os
+import shutil
+
+from java.io import File
+from java.io import IOException
+from java.lang import System
+from java.util.zip import ZipFile
+from javax.xml.parsers import DocumentBuilderFactory
+from javax.xml.parsers import ParserConfigurationException
+from org.xml.sax import SAXException
+
+from oracle.weblogic.deploy.create import CreateException
+from oracle.weblogic.deploy.json import JsonException
+from oracle.weblogic.deploy.logging import WLSDeployLoggingConfig
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+
+from wlsdeploy.exception import exception_helper
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.util import dictionary_utils
+from wlsdeploy.util import env_helper
+from wlsdeploy.util import hash_utils
+from wlsdeploy.util import unicode_helper as str_helper
+
+SNAPSHOT_DIR_ENV_VARIABLE = 'WLSDEPLOY_DOMAIN_SNAPSHOT_DIR'
+SNAPSHOT_FILE_NAME = 'snapshot.jar'
+MANIFEST_FILE_NAME = 'manifest.json'
+REPORT_FILE_SUFFIX = '-snapshot.json'
+
+# the Oracle Home file that records the installed components, included in the key when it exists
+INSTALL_REGISTRY_PATH = os.path.join('inventory', 'registry.xml')
+
+# the template catalog directory under each Oracle Home component, such as wlserver and oracle_common,
+# and the entry in each template jar that declares the name used to select the template
+TEMPLATE_CATALOG_PATH = os.path.join('common', 'templates', 'wls')
+TEMPLATE_INFO_ENTRY = 'template-info.xml'
+TEMPLATE_NAME_ATTRIBUTE = 'name'
+
+# template kinds, in the order they are applied
+BASE_TEMPLATE = 'base'
+EXTENSION_TEMPLATE = 'extension'
+CUSTOM_TEMPLATE = 'custom'
+
+# key input and manifest keys
+WLS_VERSION = 'wlsVersion'
+DOMAIN_TYPE = 'domainType'
+TOPOLOGY_PROFILE = 'topologyProfile'
+ORACLE_HOME = 'oracleHome'
+INSTALL_REGISTRY_HASH = 'installRegistrySha256'
+TEMPLATES = 'templates'
+KIND = 'kind'
+TEMPLATE = 'template'
+FILES = 'files'
+SHA256 = 'sha256'
+KEY = 'key'
+INPUTS = 'inputs'
+SNAPSHOT_HASH = 'snapshotSha256'
+
+# report keys
+PROGRAM = 'program'
+STATUS = 'status'
+REASON = 'reason'
+CACHE_DIRECTORY = 'cacheDirectory'
+SNAPSHOT_FILE = 'snapshotFile'
+
+# report status values
+HIT = 'hit'
+MISS = 'miss'
+STORED = 'stored'
+STORE_FAILED = 'storeFailed'
+UNSUPPORTED = 'unsupported'
+
+_class_name = 'domain_snapshot'
+_logger = PlatformLogger('wlsdeploy.create')
+
+
+def get_snapshot_cache(program_name):
+    """
+    Get the snapshot cache for the tool, if it is enabled.
+    :param program_name: the name of the tool
+    :return: the DomainSnapshotCache, or None if the cache directory is not set
+    """
+    _method_name = 'get_snapshot_cache'
+
+    cache_directory = env_helper.getenv(SNAPSHOT_DIR_ENV_VARIABLE)
+    if not cache_directory:
+        return None
+
+    cache_directory = os.path.abspath(cache_directory)
+    _logger.info('WLSDPLY-33200', cache_directory, class_name=_class_name, method_name=_method_name)
+    return DomainSnapshotCache(cache_directory, program_name)
+
+
+def compute_inputs(wl_version, domain_type, topology_profile, oracle_home, templates):
+    """
+    Compute the inputs that identify a domain snapshot.
+    Templates that are files are identified by the SHA-256 hash of their content.
+    Templates that are selected by name are resolved to the jar files in the Oracle Home template catalog,
+    and are identified by the SHA-256 hash of those files. A template that cannot be resolved has no hash,
+    and the snapshot cache will not be used.
+    :param wl_version: the WebLogic Server version
+    :param domain_type: the domain type name
+    :param topology_profile: the topology profile, or None
+    :param oracle_home: the Oracle Home directory
+    :param templates: a list of (kind, template) tuples, in the order the templates are applied
+    :return: an ordered dictionary of the inputs
+    """
+    inputs = OrderedDict()
+    inputs[WLS_VERSION] = wl_version
+    inputs[DOMAIN_TYPE] = domain_type
+    inputs[TOPOLOGY_PROFILE] = topology_profile
+    inputs[ORACLE_HOME] = oracle_home
+
+    registry_hash = None
+    if oracle_home is not None:
+        registry_file = os.path.join(oracle_home, INSTALL_REGISTRY_PATH)
+        if os.path.isfile(registry_file):
+            registry_hash = hash_utils.hash_file(registry_file)
+    inputs[INSTALL_REGISTRY_HASH] = registry_hash
+
+    catalog = None
+    template_list = []
+    for kind, template in templates:
+        if os.path.isfile(template):
+            template_files = [template]
+        elif kind != CUSTOM_TEMPLATE and not _is_path(template):
+            if catalog is None:
+                catalog = get_template_catalog(oracle_home)
+            template_files = dictionary_utils.get_element(catalog, template, [])
+        else:
+            template_files = []
+
+        template_entry = OrderedDict()
+        template_entry[KIND] = kind
+        template_entry[TEMPLATE] = template
+        template_entry[FILES] = template_files
+        template_entry[SHA256] = _hash_template_files(template_files)
+        template_list.append(template_entry)
+    inputs[TEMPLATES] = template_list
+    return inputs
+
+
+def get_unresolved_templates(inputs):
+    """
+    Get the templates in the inputs that could not be resolved to a file.
+    :param inputs: the snapshot inputs
+    :return: a list of the unresolved template names or paths
+    """
+    unresolved = []
+    for template_entry in dictionary_utils.get_element(inputs, TEMPLATES, []):
+        if dictionary_utils.get_element(template_entry, SHA256) is None:
+            unresolved.append(dictionary_utils.get_element(template_entry, TEMPLATE))
+    return unresolved
+
+
+def get_template_catalog(oracle_home):
+    """
+    Get the template jar files in the Oracle Home template catalog, by the name used to select each template.
+    Each component directory of the Oracle Home may have a catalog directory with template jar files,
+    and each template jar declares its name in the template information entry.
+    :param oracle_home: the Oracle Home directory
+    :return: a dictionary of template names to sorted lists of the jar files that declare the name
+    """
+    _method_name = 'get_template_catalog'
+
+    catalog = dict()
+    if oracle_home is None or not os.path.isdir(oracle_home):
+        return catalog
+
+    for component in sorted(os.listdir(oracle_home)):
+        catalog_dir = os.path.join(oracle_home, component, TEMPLATE_CATALOG_PATH)
+        if not os.path.isdir(catalog_dir):
+            continue
+        for file_name in sorted(os.listdir(catalog_dir)):
+            template_file = os.path.join(catalog_dir, file_name)
+            if not file_name.endswith('.jar') or not os.path.isfile(template_file):
+                continue
+            template_name = _get_template_name(template_file)
+            if template_name is not None:
+                _logger.finer('WLSDPLY-33216', template_name, template_file,
+                              class_name=_class_name, method_name=_method_name)
+                if template_name not in catalog:
+                    catalog[template_name] = []
+                catalog[template_name].append(template_file)
+    return catalog
+
+
+def compute_key(inputs):
+    """
+    Compute the cache key for the snapshot inputs.
+    :param inputs: the inputs from compute_inputs(), or read from a manifest file
+    :return: the hexadecimal SHA-256 hash of the canonical form of the inputs
+    """
+    return hash_utils.hash_text(get_canonical_form(inputs))
+
+
+def get_canonical_form(inputs):
+    """
+    Get the canonical text form of the snapshot inputs, with one name=value line for each value.
+    The form is the same for inputs that were computed and inputs that were read from a manifest file.
+    :param inputs: the snapshot inputs
+    :return: the canonical text
+    """
+    lines = []
+    for name in [WLS_VERSION, DOMAIN_TYPE, TOPOLOGY_PROFILE, ORACLE_HOME, INSTALL_REGISTRY_HASH]:
+        lines.append('%s=%s' % (name, _canonical_value(dictionary_utils.get_element(inputs, name))))
+
+    templates = dictionary_utils.get_element(inputs, TEMPLATES, [])
+    for index in range(len(templates)):
+        template_entry = templates[index]
+        for name in [KIND, TEMPLATE, FILES, SHA256]:
+            value = _canonical_value(dictionary_utils.get_element(template_entry, name))
+            lines.append('%s.%d.%s=%s' % (TEMPLATES, index, name, value))
+    return '\n'.join(lines)
+
+
+class DomainSnapshotCache(object):
+    """
+    A directory of domain snapshots, each in a subdirectory named for its key.
+    Each subdirectory contains the snapshot template file, and a manifest file with the key inputs and the
+    snapshot hash. A snapshot is used only if the manifest matches the current inputs exactly, and the
+    snapshot file matches the manifest hash. The result of the lookup and store is recorded for the report file.
+    """
+    def __init__(self, cache_directory, program_name):
+        self._cache_directory = cache_directory
+        self._program_name = program_name
+        self._key = None
+        self._inputs = None
+
+        self._report = OrderedDict()
+        self._report[PROGRAM] = program_name
+        self._report[STATUS] = None
+        self._report[REASON] = None
+        self._report[CACHE_DIRECTORY] = cache_directory
+        self._report[SNAPSHOT_FILE] = None
+        self._report[KEY] = None
+        self._report[INPUTS] = None
+
+    def get_cache_directory(self):
+        return self._cache_directory
+
+    def get_report(self):
+        """
+        :return: the ordered dictionary of report values
+        """
+        return self._report
+
+    def lookup(self, inputs):
+        """
+        Find a valid snapshot for the inputs.
+        :param inputs: the snapshot inputs from compute_inputs()
+        :return: the path of the snapshot file, or None if there is no valid snapshot
+        """
+        _method_name = 'lookup'
+
+        self._inputs = inputs
+        self._key = compute_key(inputs)
+        self._report[KEY] = self._key
+        self._report[INPUTS] = inputs
+
+        # a template without a hash could change without changing the key, so the cache is not used
+        unresolved = get_unresolved_templates(inputs)
+        if len(unresolved) > 0:
+            self._key = None
+            reason = exception_helper.get_message('WLSDPLY-33218', ', '.join(unresolved))
+            self._set_status(MISS, reason)
+            _logger.info('WLSDPLY-33219', reason, class_name=_class_name, method_name=_method_name)
+            return None
+
+        snapshot_directory = self._get_snapshot_directory(self._key)
+        snapshot_file = os.path.join(snapshot_directory, SNAPSHOT_FILE_NAME)
+        if not os.path.isdir(snapshot_directory):
+            self._set_status(MISS, exception_helper.get_message('WLSDPLY-33209'))
+            _logger.info('WLSDPLY-33202', self._key, class_name=_class_name, method_name=_method_name)
+            return None
+
+        reason = self.verify(snapshot_directory, self._key, inputs)
+        if reason is not None:
+            self._set_status(MISS, reason)
+            _logger.warning('WLSDPLY-33203', snapshot_directory, reason,
+                            class_name=_class_name, method_name=_method_name)
+            return None
+
+        self._set_status(HIT, None)
+        self._report[SNAPSHOT_FILE] = snapshot_file
+        _logger.info('WLSDPLY-33201', snapshot_file, self._key, class_name=_class_name, method_name=_method_name)
+        return snapshot_file
+
+    def verify(self, snapshot_directory, key, inputs):
+        """
+        Verify that the snapshot in the directory was stored for the key and inputs, and has not changed.
+        :param snapshot_directory: the snapshot directory
+        :param key: the expected key
+        :param inputs: the expected inputs
+        :return: None if the snapshot is valid, otherwise the reason it is not valid
+        """
+        manifest_file = os.path.join(snapshot_directory, MANIFEST_FILE_NAME)
+        snapshot_file = os.path.join(snapshot_directory, SNAPSHOT_FILE_NAME)
+        if not os.path.isfile(manifest_file) or not os.path.isfile(snapshot_file):
+            return exception_helper.get_message('WLSDPLY-33210', snapshot_directory)
+
+        try:
+            from wlsdeploy.json.json_translator import JsonToPython
+            manifest = JsonToPython(manifest_file).parse()
+        except JsonException, ex:
+            return exception_helper.get_message('WLSDPLY-33211', manifest_file, ex.getLocalizedMessage())
+
+        manifest_inputs = dictionary_utils.get_dictionary_element(manifest, INPUTS)
+        if dictionary_utils.get_element(manifest, KEY) != key or \
+                get_canonical_form(manifest_inputs) != get_canonical_form(inputs):
+            return exception_helper.get_message('WLSDPLY-33212', manifest_file)
+
+        expected_hash = dictionary_utils.get_element(manifest, SNAPSHOT_HASH)
+        try:
+            snapshot_hash = hash_utils.hash_file(snapshot_file)
+        except IOException, ex:
+            return exception_helper.get_message('WLSDPLY-33215', snapshot_file, ex.getLocalizedMessage())
+        if snapshot_hash != expected_hash:
+            return exception_helper.get_message('WLSDPLY-33213', snapshot_file, snapshot_hash, expected_hash)
+        return None
+
+    def store(self, write_snapshot):
+        """
+        Store a snapshot for the inputs of the previous lookup.
+        The snapshot is written to a temporary directory, and moved into place only if it is complete.
+        If another process has stored the same snapshot first, that snapshot is kept.
+        A failure to store the snapshot is logged, and does not stop domain creation.
+        :param write_snapshot: a function that writes the snapshot template to the path argument
+        """
+        _method_name = 'store'
+
+        if self._key is None:
+            return
+
+        snapshot_directory = self._get_snapshot_directory(self._key)
+        temp_directory = '%s.%s.tmp' % (snapshot_directory, str_helper.to_string(System.nanoTime()))
+        snapshot_file = os.path.join(temp_directory, SNAPSHOT_FILE_NAME)
+        try:
+            try:
+                os.makedirs(temp_directory)
+                write_snapshot(snapshot_file)
+
+                manifest = OrderedDict()
+                manifest[KEY] = self._key
+                manifest[SNAPSHOT_HASH] = hash_utils.hash_file(snapshot_file)
+                manifest[INPUTS] = self._inputs
+                from wlsdeploy.json.json_translator import PythonToJson
+                PythonToJson(manifest).write_to_json_file(os.path.join(temp_directory, MANIFEST_FILE_NAME))
+
+                # replace a snapshot that failed verification
+                if os.path.isdir(snapshot_directory):
+                    shutil.rmtree(snapshot_directory)
+                os.rename(temp_directory, snapshot_directory)
+            except (CreateException, JsonException, IOException), ex:
+                self._store_failed(ex.getLocalizedMessage())
+                return
+            except (IOError, OSError), ex:
+                self._store_failed(str_helper.to_string(ex))
+                return
+        finally:
+            if os.path.isdir(temp_directory):
+                shutil.rmtree(temp_directory, True)
+
+        self._set_status(STORED, None)
+        self._report[SNAPSHOT_FILE] = os.path.join(snapshot_directory, SNAPSHOT_FILE_NAME)
+        _logger.info('WLSDPLY-33204', self._report[SNAPSHOT_FILE], self._key,
+                     class_name=_class_name, method_name=_method_name)
+
+    def set_unsupported(self, wl_version):
+        """
+        Record that snapshots cannot be used with this WebLogic Server version.
+        :param wl_version: the WebLogic Server version
+        """
+        _method_name = 'set_unsupported'
+
+        reason = exception_helper.get_message('WLSDPLY-33205', wl_version)
+        self._set_status(UNSUPPORTED, reason)
+        _logger.info('WLSDPLY-33206', self._cache_directory, reason, class_name=_class_name, method_name=_method_name)
+
+    def write_report(self):
+        """
+        Write the report file to the log directory.
+        """
+        _method_name = 'write_report'
+
+        report_file = get_report_file(self._program_name)
+        try:
+            from wlsdeploy.json.json_translator import PythonToJson
+            PythonToJson(self._report).write_to_json_file(report_file)
+            _logger.info('WLSDPLY-33207', report_file, self._report[STATUS],
+                         class_name=_class_name, method_name=_method_name)
+        except JsonException, ex:
+            _logger.warning('WLSDPLY-33208', report_file, ex.getLocalizedMessage(), error=ex,
+                            class_name=_class_name, method_name=_method_name)
+
+    def _get_snapshot_directory(self, key):
+        return os.path.join(self._cache_directory, key)
+
+    def _set_status(self, status, reason):
+        self._report[STATUS] = status
+        self._report[REASON] = reason
+
+    def _store_failed(self, reason):
+        _method_name = 'store'
+
+        self._set_status(STORE_FAILED, reason)
+        _logger.warning('WLSDPLY-33214', self._key, reason, class_name=_class_name, method_name=_method_name)
+
+
+def get_report_file(program_name):
+    """
+    Get the snapshot report file for the tool, in the log directory.
+    :param program_name: the name of the tool
+    :return: the path of the report file
+    """
+    log_directory = WLSDeployLoggingConfig.getLoggingDirectory().getPath()
+    return os.path.join(log_directory, program_name + REPORT_FILE_SUFFIX)
+
+
+def _canonical_value(value):
+    if value is None:
+        return ''
+    if isinstance(value, list):
+        return ','.join(map(str_helper.to_string, value))
+    return str_helper.to_string(value)
+
+
+def _is_path(template):
+    return os.path.isabs(template) or template.endswith('.jar')
+
+
+def _hash_template_files(template_files):
+    """
+    Get the hash of the template files. A template selected by name may be declared by more than one jar,
+    so the hash covers every jar file that declares the name.
+    :param template_files: the list of template files
+    :return: the hexadecimal SHA-256 hash, or None if there are no files
+    """
+    if len(template_files) == 0:
+        return None
+    if len(template_files) == 1:
+        return hash_utils.hash_file(template_files[0])
+
+    lines = []
+    for template_file in template_files:
+        lines.append('%s=%s' % (template_file, hash_utils.hash_file(template_file)))
+    return hash_utils.hash_text('\n'.join(lines))
+
+
+def _get_template_name(template_file):
+    """
+    Get the template name declared in the template information entry of the jar file.
+    :param template_file: the template jar file
+    :return: the template name, or None if the jar does not declare a name or cannot be read
+    """
+    _method_name = '_get_template_name'
+
+    zip_file = None
+    try:
+        try:
+            zip_file = ZipFile(File(template_file))
+            zip_entry = zip_file.getEntry(TEMPLATE_INFO_ENTRY)
+            if zip_entry is None:
+                return None
+
+            input_stream = zip_file.getInputStream(zip_entry)
+            try:
+                document = DocumentBuilderFactory.newInstance().newDocumentBuilder().parse(input_stream)
+            finally:
+                input_stream.close()
+            template_name = document.getDocumentElement().getAttribute(TEMPLATE_NAME_ATTRIBUTE)
+            if template_name:
+                return template_name
+            return None
+        except (IOException, ParserConfigurationException, SAXException), ex:
+            _logger.fine('WLSDPLY-33217', template_file, ex.getLocalizedMessage(),
+                         class_name=_class_name, method_name=_method_name)
+            return None
+    finally:
+        if zip_file is not None:
+            zip_file.close()
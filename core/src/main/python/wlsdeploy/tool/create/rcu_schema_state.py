@@ -0,0 +1,138 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+Detects the state of the RCU schemas for a prefix, using the database schema version registry.
+"""
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+
+# schema states
+PRESENT = 'present'
+MISSING = 'missing'
+STALE = 'stale'
+
+VALID_STATUS = 'VALID'
+
+_REGISTRY_QUERY = 'SELECT COMP_ID, OWNER, VERSION, STATUS FROM SCHEMA_VERSION_REGISTRY WHERE MRC_NAME = ?'
+
+
+def inspect_schemas(connection, rcu_prefix, rcu_schemas, wls_version):
+    """
+    Query the schema version registry for the schemas with the RCU prefix.
+    The connection is not closed.
+    :param connection: an open JDBC connection to the RCU database
+    :param rcu_prefix: the RCU prefix
+    :param rcu_schemas: the names of the schemas required by the domain type, such as STB
+    :param wls_version: the WebLogic Server version of the Oracle Home
+    :return: the RcuSchemaState
+    :raises SQLException: if the registry query fails
+    """
+    registry_rows = []
+    statement = connection.prepareStatement(_REGISTRY_QUERY)
+    try:
+        statement.setString(1, rcu_prefix.upper())
+        result_set = statement.executeQuery()
+        try:
+            while result_set.next():
+                registry_rows.append((result_set.getString(1), result_set.getString(2),
+                                      result_set.getString(3), result_set.getString(4)))
+        finally:
+            result_set.close()
+    finally:
+        statement.close()
+
+    return RcuSchemaState(rcu_prefix, rcu_schemas, wls_version, registry_rows)
+
+
+class RcuSchemaState(object):
+    """
+    The state of each required schema for an RCU prefix.
+    A schema is present if the registry has a valid entry for the same release as the Oracle Home,
+    stale if the registry entry is for another release or is not valid, and missing otherwise.
+    """
+    def __init__(self, rcu_prefix, rcu_schemas, wls_version, registry_rows):
+        """
+        :param rcu_prefix: the RCU prefix
+        :param rcu_schemas: the names of the schemas required by the domain type
+        :param wls_version: the WebLogic Server version of the Oracle Home
+        :param registry_rows: tuples of (component ID, owner, version, status) from the registry
+        """
+        self._rcu_prefix = rcu_prefix
+        self._expected_release = get_release(wls_version)
+
+        registry = {}
+        for comp_id, owner, version, status in registry_rows:
+            if comp_id is not None:
+                registry[comp_id.upper()] = (version, status)
+
+        # schema name -> state, in the order required by the domain type
+        self._states = OrderedDict()
+        # schema name -> version found in the registry
+        self._versions = {}
+        for schema in rcu_schemas:
+            registry_entry = registry.get(schema.upper())
+            if registry_entry is None:
+                self._states[schema] = MISSING
+                continue
+
+            version, status = registry_entry
+            self._versions[schema] = version
+            if status is not None and status.upper() == VALID_STATUS and \
+                    get_release(version) == self._expected_release:
+                self._states[schema] = PRESENT
+            else:
+                self._states[schema] = STALE
+
+    def get_rcu_prefix(self):
+        return self._rcu_prefix
+
+    def get_expected_release(self):
+        return self._expected_release
+
+    def get_schema_names(self):
+        return self._states.keys()
+
+    def get_state(self, schema):
+        return self._states.get(schema)
+
+    def get_version(self, schema):
+        """
+        :return: the version of the schema in the registry, or None if it is missing
+        """
+        return self._versions.get(schema)
+
+    def get_schemas(self, state):
+        """
+        Get the names of the schemas with the specified state.
+        :param state: the state, such as MISSING
+        :return: a list of schema names, in the order required by the domain type
+        """
+        result = []
+        for schema in self._states:
+            if self._states[schema] == state:
+                result.append(schema)
+        return result
+
+    def get_missing_schemas(self):
+        return self.get_schemas(MISSING)
+
+    def has_stale_schemas(self):
+        return len(self.get_schemas(STALE)) > 0
+
+    def is_complete(self):
+        """
+        :return: True if every required schema is present, False otherwise
+        """
+        return len(self.get_schemas(PRESENT)) == len(self._states)
+
+
+def get_release(version):
+    """
+    Get the release of a WebLogic Server or schema version, such as 12.2.1 for 12.2.1.4.0.
+    Schemas from the same release may have different patch versions, such as 12.2.1.3.0 for STB in 12.2.1.4.0.
+    :param version: the version string, or None
+    :return: the first three version components, or None
+    """
+    if version is None:
+        return None
+    return '.'.join(version.split('.')[:3])
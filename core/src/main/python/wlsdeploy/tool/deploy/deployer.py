@@ -62,6 +62,7 @@ class Deployer(object):
         self.attribute_setter = AttributeSetter(model_context, self.aliases, ExceptionType.DEPLOY, wlst_mode=wlst_mode)
         self.topology_helper = TopologyHelper(self.aliases, ExceptionType.DEPLOY, self.logger)
         self.path_helper = path_helper.get_path_helper()
+        self.change_plan = None
 
         self.archive_helper = None
         archive_file_name = self.model_context.get_archive_file_name()
@@ -77,6 +78,12 @@ class Deployer(object):
                 self.logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
                 raise ex
 
+    def set_change_plan(self, change_plan):
+        """
+        Set the online change plan used to skip unchanged folders and attributes.
+        :param change_plan: the OnlineChangePlan, or None to process the complete model
+        """
+        self.change_plan = change_plan
 
     def _add_named_elements(self, type_name, model_nodes, location, delete_now=True):
         """
@@ -109,12 +116,15 @@ class Deployer(object):
                 continue
 
             is_add = name not in existing_names
-            log_helper.log_updating_named_folder(type_name, name, parent_type, parent_name, is_add, self._class_name,
-                                                 _method_name)
-
             if token is not None:
                 location.add_name_token(token, name)
 
+            if not is_add and self._is_unchanged_folder(location):
+                continue
+
+            log_helper.log_updating_named_folder(type_name, name, parent_type, parent_name, is_add, self._class_name,
+                                                 _method_name)
+
             child_nodes = dictionary_utils.get_dictionary_element(model_nodes, name)
             self._create_and_cd(location, existing_names, child_nodes)
             self._set_attributes_and_add_subfolders(location, child_nodes, delete_now=delete_now)
@@ -167,6 +177,9 @@ class Deployer(object):
 
         mbean_name = deployer_utils.get_mbean_name(location, existing_subfolder_names, self.aliases)
         is_add = mbean_name not in existing_subfolder_names
+        if not is_add and self._is_unchanged_folder(location):
+            return
+
         log_helper.log_updating_folder(type_name, parent_type, parent_name, is_add, self._class_name, _method_name)
 
         deployer_utils.create_and_cd(location, existing_subfolder_names, self.aliases)
@@ -204,6 +217,9 @@ class Deployer(object):
         for key in model_nodes:
             key_excluded = (excludes is not None) and (key in excludes)
             if key in attribute_names and not key_excluded:
+                if self._is_unchanged_attribute(location, key):
+                    continue
+
                 value = model_nodes[key]
                 if key in uses_path_tokens_attribute_names:
                     value = deployer_utils.extract_from_uri(self.model_context, value)
@@ -227,6 +243,46 @@ class Deployer(object):
                         self.logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
                         raise ex
 
+    def _is_unchanged_folder(self, location):
+        """
+        Determine if the online change plan found no changes for the folder at the specified location.
+        :param location: the location of the folder, with its name token set
+        :return: True if the folder and its contents can be skipped
+        """
+        _method_name = '_is_unchanged_folder'
+        if self.change_plan is None:
+            return False
+
+        model_path = self.aliases.get_model_folder_path(location)
+        if self.change_plan.is_unchanged_folder(model_path):
+            self.change_plan.skipped_folder_count += 1
+            self.logger.fine('WLSDPLY-09041', model_path, class_name=self._class_name, method_name=_method_name)
+            return True
+        return False
+
+    def _is_unchanged_attribute(self, location, key):
+        """
+        Determine if the online change plan found that the attribute matches the live value.
+        :param location: the location of the attribute
+        :param key: the model attribute name
+        :return: True if the attribute does not need to be set
+        """
+        if self.change_plan is None:
+            return False
+
+        if self.change_plan.is_unchanged_attribute(self.aliases.get_model_folder_path(location), key):
+            self.change_plan.skipped_attribute_count += 1
+            return True
+        return False
+
+    def _require_full_update(self, location):
+        """
+        Require the folder at the specified location to be processed without using the online change plan.
+        :param location: the location of the folder
+        """
+        if self.change_plan is not None:
+            self.change_plan.require_update(self.aliases.get_model_folder_path(location))
+
     def _skip_setting_attribute(self, key, value, wlst_merge_value, restart_attribute_names):
         """
         For the case where a change to an attribute will require restart, verify that the new value is different
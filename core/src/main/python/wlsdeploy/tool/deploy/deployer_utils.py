@@ -1,5 +1,5 @@
 """
-Copyright (c) 2017, 2025, Oracle and/or its affiliates.
+Copyright (c) 2017, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 import os
@@ -7,8 +7,6 @@ import os
 from sets import Set
 
 from java.io import IOException
-from java.io import PrintStream
-from java.lang import System
 from java.net import URI
 from java.net import URISyntaxException
 from java.security import NoSuchAlgorithmException
@@ -56,8 +54,8 @@ from wlsdeploy.exception.exception_types import ExceptionType
 from wlsdeploy.logging import platform_logger
 from wlsdeploy.tool.deploy.applications_offline_deployer import OfflineApplicationsDeployer
 from wlsdeploy.tool.deploy.applications_online_deployer import OnlineApplicationsDeployer
+from wlsdeploy.tool.deploy import restart_inventory
 from wlsdeploy.tool.util import results_file
-from wlsdeploy.tool.util.string_output_stream import StringOutputStream
 from wlsdeploy.tool.util.wlst_helper import WlstHelper
 from wlsdeploy.util import dictionary_utils
 from wlsdeploy.util import model_helper
@@ -571,47 +569,9 @@ def list_non_dynamic_changes(unactivated_changes, non_dynamic_changes_string, mo
 def get_list_of_restarts():
     """
     Return the restart checklist from the online domain instance. Log each instance of the restart checklist
-    :return: String buffer of restart information
-    """
-    _method_name = 'get_list_of_restarts'
-    restart_list = []
-    _wlst_helper.cd('/')
-    cmo = _wlst_helper.get_cmo()
-    for server in _wlst_helper.get_server_runtimes():
-        resources = server.getPendingRestartSystemResources()
-        is_restart = server.isRestartRequired()
-        if len(resources) > 0 or is_restart:
-            server_name = server.getName()
-            cluster = server.getClusterRuntime()
-            cluster_name = ''
-            if cluster is not None:
-                cluster_name = cluster.getName()
-            prt_cluster = cluster_name
-            if cluster_name == '':
-                prt_cluster = 'standalone'
-            for resource in resources:
-                line = list()
-                line.append(cluster_name)
-                line.append(server_name)
-                line.append(resource)
-                value = cmo.lookupSystemResource(resource)
-                res_type = ''
-                if value is not None:
-                    res_type = value.getType()
-                line.append(res_type)
-                restart_list.append(line)
-                _logger.warning('WLSDPLY-09207', resource, res_type, server_name, prt_cluster,
-                                class_name=_class_name, method_name=_method_name)
-            if is_restart:
-                line = list()
-                line.append(cluster_name)
-                line.append(server_name)
-                line.append('')
-                line.append('')
-                restart_list.append(line)
-                _logger.warning('WLSDPLY-09206', server_name, prt_cluster,
-                                class_name=_class_name, method_name=_method_name)
-    return restart_list
+    :return: a list of [cluster name, server name, resource name, resource type] lists
+    """
+    return restart_inventory.RestartInventory().collect()
 
 
 def online_check_save_activate(model_context):
@@ -624,19 +584,14 @@ def online_check_save_activate(model_context):
     exit_code = 0
 
     try:
-        # First we enable the stdout again and then redirect the stdoout to a string output stream
-        # call isRestartRequired to get the output, capture the string and then silence wlst output again
-
-        _wlst_helper.enable_stdout()
-        sostream = StringOutputStream()
-        System.setOut(PrintStream(sostream))
-        restart_required = _wlst_helper.is_restart_required()
-        is_restartreq_output = sostream.get_string()
-        _wlst_helper.silence()
-
-        # get unactivated changes before cancel or save
+        # get unactivated changes before cancel or save, and use them to determine if restart is required,
+        # rather than capturing the console output of isRestartRequired
         config_manager = _wlst_helper.get_config_manager()
         unactivated_changes = config_manager.getUnactivatedChanges()
+        restart_required = restart_inventory.is_restart_required(unactivated_changes)
+        has_affected_bean = model_context.get_weblogic_helper().is_weblogic_version_or_above('12.2.1')
+        non_dynamic_changes = restart_inventory.get_non_dynamic_changes(unactivated_changes, has_affected_bean)
+        is_restartreq_output = restart_inventory.get_non_dynamic_changes_text(non_dynamic_changes)
 
         if model_context.is_cancel_changes_if_restart_required() and restart_required:
             _wlst_helper.cancel_edit()
@@ -1,5 +1,5 @@
 """
-Copyright (c) 2017, 2025, Oracle and/or its affiliates.
+Copyright (c) 2017, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 import os
@@ -31,6 +31,16 @@ class ModelDeployer(Deployer):
         self.applications_deployer = \
             deployer_utils.get_applications_deployer(model, model_context, aliases, wlst_mode=wlst_mode)
 
+    # Override
+    def set_change_plan(self, change_plan):
+        """
+        Pass the online change plan to the resources deployer.
+        Applications are always processed without the plan.
+        :param change_plan: the OnlineChangePlan, or None to process the complete model
+        """
+        Deployer.set_change_plan(self, change_plan)
+        self.resources_deployer.set_change_plan(change_plan)
+
     def deploy_resources(self):
         """
         Deploy the resources in specific order.
@@ -0,0 +1,586 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+Predict the changes that an online update or deployment will make, before the edit lock is acquired.
+The live configuration is read from the serverConfig tree, and each model folder and attribute is compared
+with it to produce an ordered list of creates, sets, deletes, and targeting changes.
+
+If the live configuration has not changed when the edit session starts, the plan is passed to the updaters
+and deployers, and existing folders and attributes that the plan found unchanged are not processed in the
+edit session.  Security providers, server group targeting, and applications are always processed in full,
+and any folder that could not be compared is processed in full.
+"""
+import os
+
+from array import array
+
+from java.lang import Class
+from java.lang import Exception as JException
+from java.lang import System
+
+from oracle.weblogic.deploy.aliases import AliasException
+from oracle.weblogic.deploy.json import JsonException
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+
+from wlsdeploy.aliases.location_context import LocationContext
+from wlsdeploy.aliases.model_constants import TARGET
+from wlsdeploy.aliases.model_constants import TARGETS
+from wlsdeploy.exception import exception_helper
+from wlsdeploy.exception.exception_types import ExceptionType
+from wlsdeploy.json.json_translator import PythonToJson
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.tool.deploy import deployer_utils
+from wlsdeploy.tool.util.wlst_helper import WlstHelper
+from wlsdeploy.util import dictionary_utils
+from wlsdeploy.util import model_helper
+import wlsdeploy.util.unicode_helper as str_helper
+
+PLAN_FILE_NAME = 'online_change_plan.json'
+
+CREATE = 'create'
+DELETE = 'delete'
+SET = 'set'
+TARGET_CHANGE = 'target'
+
+_class_name = 'OnlineChangePlanner'
+_logger = PlatformLogger('wlsdeploy.deploy')
+
+_MASKED_VALUE = '********'
+_TARGET_ATTRIBUTES = [TARGET, TARGETS]
+
+_object_name_class = Class.forName('javax.management.ObjectName')
+_list_interface = Class.forName('java.util.List')
+
+
+class OnlineChangePlanner(object):
+    """
+    Read the live configuration and compute the changes for the specified model sections.
+    Only WLST read operations are used, so the planner can run before the edit session is started.
+    """
+    def __init__(self, model, aliases, section_names):
+        """
+        :param model: the model
+        :param aliases: the aliases object, in online mode
+        :param section_names: the names of the model sections to plan, in processing order
+        """
+        self._model = model
+        self._aliases = aliases
+        self._section_names = section_names
+        self._wlst_helper = WlstHelper(ExceptionType.DEPLOY)
+
+    def create_plan(self):
+        """
+        Compare the model with the live configuration, and return the plan of changes.
+        The current WLST directory is restored when planning is complete.
+        :return: the OnlineChangePlan
+        """
+        _method_name = 'create_plan'
+        _logger.entering(self._section_names, class_name=_class_name, method_name=_method_name)
+
+        start_time = System.currentTimeMillis()
+        plan = OnlineChangePlan()
+        # read before the comparison, so an activation during planning is detected
+        plan.activation_marker = _get_activation_marker(self._wlst_helper)
+        model_dict = self._model.get_model()
+        current_dir = self._wlst_helper.get_pwd()
+        try:
+            for section_name in self._section_names:
+                section_nodes = dictionary_utils.get_dictionary_element(model_dict, section_name)
+                if not section_nodes:
+                    continue
+
+                attribute_location = self._aliases.get_model_section_attribute_location(section_name)
+                if attribute_location is not None:
+                    self._plan_attributes(plan, attribute_location, section_nodes, True)
+                    plan.add_compared_path(self._get_path(attribute_location))
+
+                folder_names = self._aliases.get_model_section_top_level_folder_names(section_name)
+                for key in section_nodes:
+                    if key in folder_names:
+                        self._plan_folder(plan, LocationContext(), key, section_nodes[key], True)
+        finally:
+            self._wlst_helper.cd(current_dir)
+
+        plan.planning_millis = System.currentTimeMillis() - start_time
+        _logger.exiting(class_name=_class_name, method_name=_method_name, result=plan)
+        return plan
+
+    def _plan_folder(self, plan, parent_location, folder_name, folder_nodes, parent_exists):
+        """
+        Add the changes for a model folder and its contents to the plan.
+        :param plan: the plan to be updated
+        :param parent_location: the location of the parent folder
+        :param folder_name: the model name of the folder
+        :param folder_nodes: the model nodes of the folder
+        :param parent_exists: True if the parent MBean exists in the live configuration
+        """
+        _method_name = '_plan_folder'
+
+        if not folder_nodes:
+            return
+
+        location = LocationContext(parent_location).append_location(folder_name)
+        try:
+            self._plan_folder_location(plan, location, folder_nodes, parent_exists)
+        except (AliasException, exception_helper.get_exception_class(ExceptionType.DEPLOY)), ex:
+            _logger.fine('WLSDPLY-09034', folder_name, location.get_folder_path(), ex.getLocalizedMessage(),
+                         class_name=_class_name, method_name=_method_name)
+            self._require_folder_update(plan, location)
+
+    def _require_folder_update(self, plan, location):
+        """
+        Require the edit session to process a folder that could not be compared, including all of its contents.
+        If the folder path cannot be determined, the plan is not used in the edit session.
+        """
+        _method_name = '_require_folder_update'
+        try:
+            plan.require_update(self._get_path(location))
+        except (AliasException, exception_helper.get_exception_class(ExceptionType.DEPLOY)), ex:
+            _logger.fine('WLSDPLY-09039', location.get_folder_path(), ex.getLocalizedMessage(),
+                         class_name=_class_name, method_name=_method_name)
+            plan.complete = False
+
+    def _plan_folder_location(self, plan, location, folder_nodes, parent_exists):
+        if not self._aliases.is_model_location_valid(location):
+            return
+
+        flattened_folder_info = self._aliases.get_wlst_flattened_folder_info(location)
+        if flattened_folder_info is not None:
+            location.add_name_token(flattened_folder_info.get_path_token(), flattened_folder_info.get_mbean_name())
+
+        existing_names = []
+        if parent_exists:
+            existing_names = self._get_existing_names(location)
+
+        if self._aliases.supports_multiple_mbean_instances(location):
+            token = self._aliases.get_name_token(location)
+            delete_names = []
+            for name in folder_nodes:
+                if model_helper.is_delete_name(name):
+                    delete_names.append(model_helper.get_delete_item_name(name))
+
+            for name in folder_nodes:
+                if model_helper.is_delete_name(name):
+                    delete_name = model_helper.get_delete_item_name(name)
+                    if delete_name in existing_names:
+                        plan.add_change(DELETE, self._get_path(location, delete_name))
+                    continue
+
+                name_location = LocationContext(location)
+                if token is not None:
+                    name_location.add_name_token(token, name)
+
+                # an element that is deleted and added again is created in the edit session
+                exists = name in existing_names and name not in delete_names
+                if not exists:
+                    plan.add_change(CREATE, self._get_path(name_location))
+                child_nodes = dictionary_utils.get_dictionary_element(folder_nodes, name)
+                self._plan_attributes_and_subfolders(plan, name_location, child_nodes, exists)
+        else:
+            mbean_name = deployer_utils.get_mbean_name(location, existing_names, self._aliases)
+            exists = mbean_name in existing_names
+            if not exists:
+                plan.add_change(CREATE, self._get_path(location))
+            self._plan_attributes_and_subfolders(plan, location, folder_nodes, exists)
+
+    def _plan_attributes_and_subfolders(self, plan, location, model_nodes, exists):
+        self._plan_attributes(plan, location, model_nodes, exists)
+
+        subfolder_names = self._aliases.get_model_subfolder_names(location)
+        for key in model_nodes:
+            if key in subfolder_names:
+                self._plan_folder(plan, location, key, model_nodes[key], exists)
+
+        # only existing folders are compared, new folders are always processed
+        if exists:
+            plan.add_compared_path(self._get_path(location))
+
+    def _plan_attributes(self, plan, location, model_nodes, exists):
+        """
+        Add a set or targeting change for each model attribute that differs from the live value.
+        Attributes of MBeans that will be created are always set.
+        Password values cannot be compared, so they are always set.
+        Attributes that use path tokens may require archive extraction, so they are always set.
+        """
+        _method_name = '_plan_attributes'
+
+        attribute_names = self._aliases.get_model_attribute_names(location)
+        restart_attribute_names = self._aliases.get_model_restart_required_attribute_names(location)
+        path_token_attribute_names = self._aliases.get_model_uses_path_tokens_attribute_names(location)
+        attributes_path = None
+        if exists:
+            attributes_path = self._aliases.get_wlst_attributes_path(location)
+
+        for key in model_nodes:
+            if key not in attribute_names:
+                continue
+
+            if key in path_token_attribute_names:
+                plan.require_update(self._get_path(location), key)
+
+            value = model_nodes[key]
+            is_password = self._aliases.is_model_password_attribute(location, key)
+            current_value = None
+            if exists and not is_password:
+                current_value = self._get_current_value(location, attributes_path, key)
+                if _is_same_value(value, current_value):
+                    continue
+
+            action = SET
+            if key in _TARGET_ATTRIBUTES:
+                action = TARGET_CHANGE
+
+            if is_password:
+                value = _MASKED_VALUE
+                current_value = None
+
+            # changes to new MBeans do not require a restart
+            non_dynamic = exists and key in restart_attribute_names
+            plan.add_change(action, self._get_path(location), key, value, current_value, non_dynamic)
+            _logger.finer('WLSDPLY-09023', action, key, self._get_path(location), non_dynamic,
+                          class_name=_class_name, method_name=_method_name)
+
+    def _get_current_value(self, location, attributes_path, key):
+        """
+        Get the live value of an attribute, converted to its model form.
+        :return: the model value, or None if the value could not be read
+        """
+        _method_name = '_get_current_value'
+        try:
+            wlst_name = self._aliases.get_wlst_attribute_name(location, key)
+            if wlst_name is None:
+                return None
+
+            self._wlst_helper.cd(attributes_path)
+            wlst_value = _get_names_if_mbean_list(self._wlst_helper.get(wlst_name))
+            model_name, model_value = \
+                self._aliases.get_model_attribute_name_and_value(location, wlst_name, wlst_value,
+                                                                 ignore_default_match=True)
+            return model_value
+        except (AliasException, exception_helper.get_exception_class(ExceptionType.DEPLOY)), ex:
+            _logger.fine('WLSDPLY-09024', key, self._get_path(location), ex.getLocalizedMessage(),
+                         class_name=_class_name, method_name=_method_name)
+            return None
+
+    def _get_existing_names(self, location):
+        list_path = self._aliases.get_wlst_list_path(location)
+        return self._wlst_helper.get_existing_object_list(list_path)
+
+    def _get_path(self, location, name=None):
+        path = self._aliases.get_model_folder_path(location)
+        if name is not None:
+            path = path + '/' + name
+        return path
+
+
+class OnlineChangePlan(object):
+    """
+    The ordered changes for an online update or deployment, and the time taken by each phase.
+    The plan also records which existing folders were compared, so the edit session can skip
+    the folders and attributes that have no changes.
+    """
+    def __init__(self):
+        self.changes = []
+        self.planning_millis = 0
+        self.execution_millis = None
+        self.activation_marker = None
+        self.complete = True
+        self.applied = False
+        self.skipped_folder_count = 0
+        self.skipped_attribute_count = 0
+        self._compared_paths = set()
+        self._changed_paths = set()
+        self._changed_attributes = set()
+        self._full_update_paths = set()
+
+    def add_change(self, action, path, attribute=None, value=None, current_value=None, non_dynamic=False):
+        self._add_changed_path(path, attribute)
+        change = OrderedDict()
+        change['action'] = action
+        change['path'] = path
+        if attribute is not None:
+            change['attribute'] = attribute
+            change['value'] = _get_plan_value(value)
+            change['currentValue'] = _get_plan_value(current_value)
+            change['nonDynamic'] = non_dynamic
+        self.changes.append(change)
+
+    def add_compared_path(self, path):
+        """
+        Record that the folder at the specified model path exists and was compared with the model.
+        :param path: the model folder path
+        """
+        self._compared_paths.add(path)
+
+    def require_update(self, path, attribute=None):
+        """
+        Require the edit session to process a folder or attribute, without adding a change to the plan.
+        If no attribute is specified, the folder and all of its contents are processed.
+        :param path: the model folder path
+        :param attribute: the model attribute name, or None for the complete folder
+        """
+        self._add_changed_path(path, attribute)
+        if attribute is None:
+            self._full_update_paths.add(path)
+
+    def is_unchanged_folder(self, path):
+        """
+        Determine if the edit session can skip the folder at the specified model path.
+        :param path: the model folder path
+        :return: True if the folder exists, and neither it nor any of its contents have changes
+        """
+        if path not in self._compared_paths or path in self._changed_paths:
+            return False
+        for full_update_path in self._full_update_paths:
+            if path.startswith(_get_folder_prefix(full_update_path)):
+                return False
+        return True
+
+    def is_unchanged_attribute(self, path, attribute):
+        """
+        Determine if the edit session can skip setting an attribute.
+        :param path: the model folder path
+        :param attribute: the model attribute name
+        :return: True if the attribute was compared and matches the live value
+        """
+        if path not in self._compared_paths or (path, attribute) in self._changed_attributes:
+            return False
+        for full_update_path in self._full_update_paths:
+            if path == full_update_path or path.startswith(_get_folder_prefix(full_update_path)):
+                return False
+        return True
+
+    def _add_changed_path(self, path, attribute):
+        if attribute is not None:
+            self._changed_attributes.add((path, attribute))
+
+        # a change in a folder requires each of its parent folders to be processed
+        while path:
+            if path.endswith(':'):
+                path = path + '/'
+            self._changed_paths.add(path)
+            if path.endswith(':/'):
+                break
+            path = path[:path.rfind('/')]
+
+    def get_change_count(self, action=None):
+        count = 0
+        for change in self.changes:
+            if action is None or change['action'] == action:
+                count += 1
+        return count
+
+    def get_non_dynamic_changes(self):
+        result = []
+        for change in self.changes:
+            if change.get('nonDynamic'):
+                result.append(change)
+        return result
+
+    def to_dictionary(self):
+        result = OrderedDict()
+        timing = OrderedDict()
+        timing['planningMillis'] = self.planning_millis
+        if self.execution_millis is not None:
+            timing['executionMillis'] = self.execution_millis
+        result['timing'] = timing
+        result['appliedToEditSession'] = self.applied
+        if self.applied:
+            result['skippedFolderCount'] = self.skipped_folder_count
+            result['skippedAttributeCount'] = self.skipped_attribute_count
+        result['nonDynamicChangeCount'] = len(self.get_non_dynamic_changes())
+        result['changes'] = self.changes
+        return result
+
+    def __str__(self):
+        return 'changes=%s, nonDynamic=%s' % (len(self.changes), len(self.get_non_dynamic_changes()))
+
+
+def create_plan_if_enabled(model, model_context, aliases, section_names):
+    """
+    Create and log the online change plan, if it is enabled by the tool configuration.
+    If an output directory was specified, the plan is written to a file in that directory.
+    This must be called after connecting, and before the edit session is started.
+    :param model: the model
+    :param model_context: the model context
+    :param aliases: the aliases object, in online mode
+    :param section_names: the names of the model sections to plan, in processing order
+    :return: the OnlineChangePlan, or None if planning is not enabled
+    :raises DeployException: if the plan file cannot be written
+    """
+    _method_name = 'create_plan_if_enabled'
+
+    if not model_context.get_model_config().is_online_change_plan():
+        return None
+
+    plan = OnlineChangePlanner(model, aliases, section_names).create_plan()
+    _logger.info('WLSDPLY-09021', len(plan.changes), plan.get_change_count(CREATE), plan.get_change_count(SET),
+                 plan.get_change_count(DELETE), plan.get_change_count(TARGET_CHANGE),
+                 len(plan.get_non_dynamic_changes()), plan.planning_millis,
+                 class_name=_class_name, method_name=_method_name)
+    for change in plan.get_non_dynamic_changes():
+        _logger.info('WLSDPLY-09022', change['attribute'], change['path'],
+                     class_name=_class_name, method_name=_method_name)
+
+    write_plan(plan, model_context)
+    return plan
+
+
+def get_plan_for_edit_session(plan):
+    """
+    Return the plan if it can be used to skip unchanged folders and attributes in the edit session.
+    The plan is not used if an activation was in progress or has completed since planning started,
+    or if the edit session already has unactivated changes.
+    This must be called after the edit session is started, and after any current edit is discarded.
+    :param plan: the OnlineChangePlan, or None if planning is not enabled
+    :return: the plan, or None if the complete model should be processed
+    """
+    _method_name = 'get_plan_for_edit_session'
+
+    if plan is None:
+        return None
+
+    if not plan.complete:
+        _logger.info('WLSDPLY-09037', class_name=_class_name, method_name=_method_name)
+        return None
+
+    wlst_helper = WlstHelper(ExceptionType.DEPLOY)
+    activation_marker = _get_activation_marker(wlst_helper)
+    if plan.activation_marker is None or activation_marker != plan.activation_marker:
+        _logger.info('WLSDPLY-09036', class_name=_class_name, method_name=_method_name)
+        return None
+
+    try:
+        unactivated_changes = wlst_helper.get_config_manager().getUnactivatedChanges()
+    except (exception_helper.get_exception_class(ExceptionType.DEPLOY), JException), ex:
+        _logger.fine('WLSDPLY-09040', ex.getLocalizedMessage(), class_name=_class_name, method_name=_method_name)
+        return None
+
+    if unactivated_changes is None or len(unactivated_changes) > 0:
+        _logger.info('WLSDPLY-09038', class_name=_class_name, method_name=_method_name)
+        return None
+
+    plan.applied = True
+    _logger.info('WLSDPLY-09035', class_name=_class_name, method_name=_method_name)
+    return plan
+
+
+def record_execution_time(plan, model_context, execution_millis):
+    """
+    Record the time that the edit lock was held for the plan, and rewrite the plan file.
+    :param plan: the OnlineChangePlan, or None if planning is not enabled
+    :param model_context: the model context
+    :param execution_millis: the time from the start of the edit session until it was saved or canceled
+    :raises DeployException: if the plan file cannot be written
+    """
+    _method_name = 'record_execution_time'
+
+    if plan is None:
+        return
+
+    plan.execution_millis = execution_millis
+    _logger.info('WLSDPLY-09025', plan.planning_millis, execution_millis, plan.skipped_folder_count,
+                 plan.skipped_attribute_count, class_name=_class_name, method_name=_method_name)
+    write_plan(plan, model_context)
+
+
+def write_plan(plan, model_context):
+    """
+    Write the plan to the output directory, if an output directory was specified.
+    :param plan: the OnlineChangePlan
+    :param model_context: used to determine the output directory
+    :raises DeployException: if the file cannot be written
+    """
+    _method_name = 'write_plan'
+
+    output_dir = model_context.get_output_dir()
+    if output_dir:
+        plan_file = os.path.join(output_dir, PLAN_FILE_NAME)
+        try:
+            PythonToJson(plan.to_dictionary()).write_to_json_file(plan_file)
+        except JsonException, ex:
+            de = exception_helper.create_deploy_exception('WLSDPLY-09026', plan_file, ex.getLocalizedMessage(),
+                                                          error=ex)
+            _logger.throwing(de, class_name=_class_name, method_name=_method_name)
+            raise de
+
+
+def _get_activation_marker(wlst_helper):
+    """
+    Get a value that changes when a configuration activation completes.
+    :return: the marker, or None if an activation is in progress or the activation tasks cannot be read
+    """
+    _method_name = '_get_activation_marker'
+    try:
+        config_manager = wlst_helper.get_config_manager()
+        if len(wlst_helper.get_active_activation_tasks(config_manager)) > 0:
+            return None
+
+        latest_start_time = 0
+        completed_count = 0
+        for task in config_manager.getCompletedActivationTasks():
+            completed_count += 1
+            latest_start_time = max(latest_start_time, task.getStartTime())
+        return '%s:%s' % (completed_count, latest_start_time)
+    except (exception_helper.get_exception_class(ExceptionType.DEPLOY), JException), ex:
+        _logger.fine('WLSDPLY-09040', ex.getLocalizedMessage(), class_name=_class_name, method_name=_method_name)
+        return None
+
+
+def _get_folder_prefix(path):
+    if path.endswith('/'):
+        return path
+    return path + '/'
+
+
+def _is_same_value(model_value, current_value):
+    """
+    Determine if a model value matches the live value, ignoring differences in list form and boolean case.
+    """
+    if current_value is None:
+        return False
+    return _get_comparable_value(model_value) == _get_comparable_value(current_value)
+
+
+def _get_comparable_value(value):
+    if isinstance(value, (list, tuple, array)) or _list_interface.isInstance(value):
+        items = []
+        for item in value:
+            items.append(str_helper.to_string(item).strip())
+        return ','.join(items)
+
+    text = str_helper.to_string(value).strip()
+    if text.lower() in ['true', 'false']:
+        return text.lower()
+    if ',' in text:
+        items = []
+        for item in text.split(','):
+            items.append(item.strip())
+        return ','.join(items)
+    return text
+
+
+def _get_plan_value(value):
+    if value is None:
+        return None
+    if isinstance(value, (list, tuple, array)) or _list_interface.isInstance(value):
+        return _get_comparable_value(value)
+    if isinstance(value, (bool, int, long, float)):
+        return value
+    return str_helper.to_string(value)
+
+
+def _get_names_if_mbean_list(wlst_value):
+    """
+    Convert a list of MBeans or object names to a list of names, as the deployers do before merging.
+    """
+    if isinstance(wlst_value, (list, array)) or _list_interface.isInstance(wlst_value):
+        if len(wlst_value) > 0:
+            first_item = wlst_value[0]
+            mbean_interface = Class.forName('weblogic.management.configuration.ConfigurationMBean')
+            if mbean_interface.isInstance(first_item):
+                return [mbean.getName() for mbean in wlst_value]
+            if _object_name_class.isInstance(first_item):
+                return [object_name.getKeyProperty('Name') for object_name in wlst_value]
+    return wlst_value
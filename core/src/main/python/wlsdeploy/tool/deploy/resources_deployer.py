@@ -41,6 +41,7 @@ class ResourcesDeployer(Deployer):
 
         self._add_resources(location)
 
+        # multi-tenant objects are always processed without the online change plan
         multi_tenant_deployer = \
             MultiTenantResourcesDeployer(self.model, self.model_context, self.aliases, self.wlst_mode)
         multi_tenant_deployer.add_multi_tenant_objects(location)
@@ -62,9 +63,11 @@ class ResourcesDeployer(Deployer):
         :param location: the location to deploy elements
         """
         data_source_deployer = DatasourceDeployer(self.model, self.model_context, self.aliases, self.wlst_mode)
+        data_source_deployer.set_change_plan(self.change_plan)
         data_source_deployer.add_data_sources(self._resources, location)
 
         common_deployer = CommonResourcesDeployer(self.model, self.model_context, self.aliases, self.wlst_mode)
+        common_deployer.set_change_plan(self.change_plan)
         common_deployer.add_self_tuning(self._resources, location)
 
         self._add_startup_classes(location)
@@ -87,6 +90,7 @@ class ResourcesDeployer(Deployer):
         self._add_named_elements(NO_SQL_SYSTEM_RESOURCE, no_sql_system_resources, location)
 
         jms_deployer = JmsResourcesDeployer(self.model, self.model_context, self.aliases, wlst_mode=self.wlst_mode)
+        jms_deployer.set_change_plan(self.change_plan)
         jms_deployer.add_jms_system_resources(self._resources, location)
 
         common_deployer.add_jms_bridge_destinations(self._resources, location)
@@ -94,9 +98,11 @@ class ResourcesDeployer(Deployer):
         common_deployer.add_mail_sessions(self._resources, location)
 
         wldf_deployer = WldfResourcesDeployer(self.model, self.model_context, self.aliases, self.wlst_mode)
+        wldf_deployer.set_change_plan(self.change_plan)
         wldf_deployer.add_wldf_modules(self._resources, location)
 
         coherence_deployer = CoherenceResourcesDeployer(self.model, self.model_context, self.aliases, self.wlst_mode)
+        coherence_deployer.set_change_plan(self.change_plan)
         coherence_deployer.add_coherence_cluster_system_resources(self._resources, location)
 
         common_deployer.add_webapp_container(self._resources, location)
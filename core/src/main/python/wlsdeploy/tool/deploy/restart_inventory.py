@@ -0,0 +1,187 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+Collect the servers and system resources that require a restart, using the domain runtime MBean server directly.
+The server runtimes are found with one query, and the attributes of each server runtime are read with one
+getAttributes call. These calls run on a bounded number of threads, so there are about N / 8 sequential round trips
+for N running servers with the default thread count, instead of several WLST navigation calls for each server.
+The types of all system resources are read with one call to the domain configuration.
+The non-dynamic changes are read from the unactivated changes of the configuration manager,
+instead of capturing the console output of the WLST isRestartRequired command.
+"""
+from javax.management import ObjectName
+
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+
+from wlsdeploy.exception.exception_types import ExceptionType
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.tool.util.wlst_helper import WlstHelper
+from wlsdeploy.util import parallel_utils
+
+_class_name = 'restart_inventory'
+_logger = PlatformLogger('wlsdeploy.deploy.utils')
+
+_SERVER_RUNTIME_QUERY = 'com.bea:Type=ServerRuntime,*'
+_DOMAIN_RUNTIME_SERVICE_NAME = 'com.bea:Name=DomainRuntimeService,' \
+                               'Type=weblogic.management.mbeanservers.domainruntime.DomainRuntimeServiceMBean'
+
+_NAME = 'Name'
+_RESTART_REQUIRED = 'RestartRequired'
+_PENDING_RESTART_SYSTEM_RESOURCES = 'PendingRestartSystemResources'
+_CLUSTER_RUNTIME = 'ClusterRuntime'
+_SERVER_ATTRIBUTES = [_NAME, _RESTART_REQUIRED, _PENDING_RESTART_SYSTEM_RESOURCES, _CLUSTER_RUNTIME]
+
+_MAX_THREADS = 8
+
+_RESTART_REQUIRED_TEXT = 'Server re-start is REQUIRED for the set of changes in progress.'
+_NON_DYNAMIC_HEADER_TEXT = 'The following non-dynamic attribute(s) have been changed on MBeans\n' \
+                           'that require server re-start:'
+
+
+class RestartInventory(object):
+    """
+    Read the pending restart information for every running server, with one getAttributes call for each server
+    and up to max_threads of those calls running at the same time.
+    """
+    def __init__(self, max_threads=_MAX_THREADS):
+        """
+        :param max_threads: the maximum number of server runtimes to read at the same time
+        """
+        self._max_threads = max_threads
+        self._wlst_helper = WlstHelper(ExceptionType.DEPLOY)
+
+    def collect(self):
+        """
+        Get the restart list for the domain.
+        The current WLST tree is restored when the list is complete.
+        :return: a list of [cluster name, server name, resource name, resource type] lists.
+            The resource name and type are empty if the entry is for a server restart.
+        """
+        _method_name = 'collect'
+        _logger.entering(class_name=_class_name, method_name=_method_name)
+
+        current_tree = self._wlst_helper.current_tree()
+        self._wlst_helper.domain_runtime()
+        try:
+            connection = self._wlst_helper.get_mbean_server_connection()
+            server_names = list(connection.queryNames(ObjectName(_SERVER_RUNTIME_QUERY), None))
+            server_names.sort(key=lambda object_name: object_name.getKeyProperty(_NAME))
+
+            def _read_server(server_object_name):
+                return _get_attribute_map(connection.getAttributes(server_object_name, _SERVER_ATTRIBUTES))
+
+            servers = parallel_utils.run_parallel(_read_server, server_names, self._max_threads)
+
+            resource_types = None
+            restart_list = []
+            for server in servers:
+                resources = server.get(_PENDING_RESTART_SYSTEM_RESOURCES) or []
+                is_restart = server.get(_RESTART_REQUIRED)
+                if len(resources) == 0 and not is_restart:
+                    continue
+
+                if len(resources) > 0 and resource_types is None:
+                    resource_types = _get_resource_types(connection)
+
+                restart_list.extend(_get_server_restarts(server, resources, is_restart, resource_types))
+        finally:
+            current_tree()
+
+        _logger.exiting(class_name=_class_name, method_name=_method_name, result=len(restart_list))
+        return restart_list
+
+
+def is_restart_required(unactivated_changes):
+    """
+    Determine if any of the unactivated changes require a restart.
+    :param unactivated_changes: the Change objects from the configuration manager
+    :return: True if a restart is required
+    """
+    for change in unactivated_changes:
+        if change.isRestartRequired():
+            return True
+    return False
+
+
+def get_non_dynamic_changes(unactivated_changes, has_affected_bean=False):
+    """
+    Get the attributes that require a restart for each changed MBean, from the unactivated changes.
+    If the changes have an affected bean, the derived changes to affected beans are not included.
+    :param unactivated_changes: the Change objects from the configuration manager
+    :param has_affected_bean: True if the Change objects have getAffectedBean(), for WebLogic 12.2.1 and later
+    :return: an ordered dictionary of MBean names to lists of attribute names
+    """
+    result = OrderedDict()
+    for change in unactivated_changes:
+        if change.isRestartRequired() and (not has_affected_bean or not change.getAffectedBean()):
+            bean_name = str(change.getBean())
+            if bean_name not in result:
+                result[bean_name] = []
+            attribute_name = change.getAttributeName()
+            if attribute_name not in result[bean_name]:
+                result[bean_name].append(attribute_name)
+    return result
+
+
+def get_non_dynamic_changes_text(non_dynamic_changes):
+    """
+    Format the non-dynamic changes in the same layout as the WLST isRestartRequired command.
+    :param non_dynamic_changes: the dictionary from get_non_dynamic_changes()
+    :return: the text, or an empty string if there are no non-dynamic changes
+    """
+    if not non_dynamic_changes:
+        return ''
+
+    lines = ['', _RESTART_REQUIRED_TEXT, '', _NON_DYNAMIC_HEADER_TEXT]
+    for bean_name, attribute_names in non_dynamic_changes.iteritems():
+        lines.append('MBean Changed : ' + bean_name)
+        lines.append('Attributes changed : ' + ', '.join(attribute_names))
+        lines.append('')
+    return '\n'.join(lines)
+
+
+def _get_server_restarts(server, resources, is_restart, resource_types):
+    _method_name = '_get_server_restarts'
+
+    server_name = server.get(_NAME)
+    cluster_name = ''
+    cluster = server.get(_CLUSTER_RUNTIME)
+    if cluster is not None:
+        cluster_name = cluster.getKeyProperty(_NAME)
+    prt_cluster = cluster_name
+    if cluster_name == '':
+        prt_cluster = 'standalone'
+
+    restart_list = []
+    for resource in resources:
+        res_type = ''
+        if resource_types is not None and resource in resource_types:
+            res_type = resource_types[resource]
+        restart_list.append([cluster_name, server_name, resource, res_type])
+        _logger.warning('WLSDPLY-09207', resource, res_type, server_name, prt_cluster,
+                        class_name=_class_name, method_name=_method_name)
+    if is_restart:
+        restart_list.append([cluster_name, server_name, '', ''])
+        _logger.warning('WLSDPLY-09206', server_name, prt_cluster, class_name=_class_name, method_name=_method_name)
+    return restart_list
+
+
+def _get_resource_types(connection):
+    """
+    Get the type of each system resource from the object names in the domain configuration.
+    :param connection: the domain runtime MBean server connection
+    :return: a dictionary of system resource names to types
+    """
+    domain_name = connection.getAttribute(ObjectName(_DOMAIN_RUNTIME_SERVICE_NAME), 'DomainConfiguration')
+    resource_types = {}
+    for resource_name in connection.getAttribute(domain_name, 'SystemResources') or []:
+        resource_types[resource_name.getKeyProperty(_NAME)] = resource_name.getKeyProperty('Type')
+    return resource_types
+
+
+def _get_attribute_map(attribute_list):
+    result = {}
+    for attribute in attribute_list.asList():
+        result[attribute.getName()] = attribute.getValue()
+    return result
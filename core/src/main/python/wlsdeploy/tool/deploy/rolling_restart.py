@@ -0,0 +1,256 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+Restart the servers that require a restart after an online update or deployment has been activated.
+Servers in different clusters, and stand-alone servers, are restarted in parallel.
+Members of the same cluster are restarted one at a time, and a member is not shut down
+if the number of running members would drop below the configured minimum.
+"""
+import exceptions
+import time
+
+from java.lang import Exception as JException
+from java.lang import System
+
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+
+from wlsdeploy.exception.exception_types import ExceptionType
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.tool.deploy import deployer_utils
+from wlsdeploy.tool.util import results_file
+from wlsdeploy.tool.util.wlst_helper import WlstHelper
+from wlsdeploy.util import parallel_utils
+from wlsdeploy.util.exit_code import ExitCode
+
+RESTARTED = 'restarted'
+FAILED = 'failed'
+SKIPPED = 'skipped'
+
+RUNNING_STATE = 'RUNNING'
+SHUTDOWN_STATE = 'SHUTDOWN'
+
+_class_name = 'rolling_restart'
+_logger = PlatformLogger('wlsdeploy.deploy')
+
+_POLL_INTERVAL_SECONDS = 5
+
+
+def restart_if_enabled(model_context, aliases, exit_code):
+    """
+    Restart the servers that require a restart, if rolling restart is enabled by the tool configuration.
+    The results for each server are added to the results file.
+    :param model_context: the model context
+    :param aliases: the aliases object, used to find the cluster for each server
+    :param exit_code: the exit code after activation
+    :return: the OK exit code if every server that required a restart was restarted, otherwise the exit code
+    """
+    _method_name = 'restart_if_enabled'
+
+    model_config = model_context.get_model_config()
+    if exit_code != ExitCode.RESTART_REQUIRED or not model_config.is_online_rolling_restart():
+        return exit_code
+
+    restarter = RollingRestart(model_config.get_online_rolling_restart_min_members(),
+                               model_config.get_online_rolling_restart_timeout(),
+                               model_config.get_online_rolling_restart_threads())
+    report = restarter.restart_servers(deployer_utils.get_list_of_restarts(), aliases)
+    for entry in report:
+        results_file.add_rolling_restart_entry(entry)
+
+    for entry in report:
+        if entry[results_file.STATUS_KEY] != RESTARTED:
+            _logger.warning('WLSDPLY-09027', class_name=_class_name, method_name=_method_name)
+            return exit_code
+    return ExitCode.OK
+
+
+class RollingRestart(object):
+    """
+    Restart servers using their ServerLifeCycleRuntime MBeans, which can be used from several threads.
+    """
+    def __init__(self, min_running_members, timeout_millis, max_threads):
+        """
+        :param min_running_members: the minimum number of running members in a cluster during the restart
+        :param timeout_millis: the maximum time to wait for a server to shut down, and to reach the RUNNING state
+        :param max_threads: the maximum number of clusters and stand-alone servers to restart at the same time
+        """
+        self._min_running_members = min_running_members
+        self._timeout_millis = timeout_millis
+        self._max_threads = max_threads
+        self._wlst_helper = WlstHelper(ExceptionType.DEPLOY)
+
+    def restart_servers(self, restart_list, aliases):
+        """
+        Restart each server in the restart list.
+        The administration server is not restarted, since the tool is connected to it.
+        :param restart_list: the list from deployer_utils.get_list_of_restarts()
+        :param aliases: the aliases object, used to find the cluster for each server
+        :return: the restart report, a list of dictionaries with one entry for each server
+        """
+        _method_name = 'restart_servers'
+        _logger.entering(len(restart_list), class_name=_class_name, method_name=_method_name)
+
+        domain_runtime_service = self._wlst_helper.get_domain_runtime_service()
+        domain = domain_runtime_service.getDomainConfiguration()
+        domain_runtime = domain_runtime_service.getDomainRuntime()
+        admin_server_name = domain.getAdminServerName()
+
+        server_names = []
+        for entry in restart_list:
+            server_name = entry[1]
+            if server_name and server_name not in server_names:
+                server_names.append(server_name)
+
+        cluster_members = OrderedDict()
+        for server in domain.getServers():
+            cluster_name = _get_name(deployer_utils.get_cluster_for_server(server.getName(), aliases))
+            if cluster_name:
+                if cluster_name not in cluster_members:
+                    cluster_members[cluster_name] = []
+                cluster_members[cluster_name].append(server.getName())
+
+        report = []
+        groups = OrderedDict()
+        for server_name in server_names:
+            if server_name == admin_server_name:
+                _logger.warning('WLSDPLY-09028', server_name, class_name=_class_name, method_name=_method_name)
+                report.append(_create_entry(server_name, None, SKIPPED, 0, 'administration server'))
+                continue
+
+            cluster_name = _get_cluster_name(server_name, cluster_members)
+            group_key = cluster_name
+            if group_key is None:
+                # each stand-alone server is restarted independently
+                group_key = '/' + server_name
+            if group_key not in groups:
+                groups[group_key] = _RestartGroup(cluster_name, cluster_members.get(cluster_name, []))
+            groups[group_key].server_names.append(server_name)
+
+        def _restart_group(group):
+            return self._restart_group(domain_runtime, group)
+
+        for group_report in parallel_utils.run_parallel(_restart_group, groups.values(), self._max_threads):
+            report.extend(group_report)
+
+        _logger.exiting(class_name=_class_name, method_name=_method_name, result=len(report))
+        return report
+
+    def _restart_group(self, domain_runtime, group):
+        """
+        Restart the servers in a cluster one at a time, or a single stand-alone server.
+        :param domain_runtime: the DomainRuntimeMBean
+        :param group: the _RestartGroup
+        :return: the restart report entries for the group
+        """
+        report = []
+        for server_name in group.server_names:
+            start_time = System.currentTimeMillis()
+            try:
+                status, message = self._restart_server(domain_runtime, group, server_name)
+            except (exceptions.Exception, JException), ex:
+                _logger.severe('WLSDPLY-09033', server_name, str(ex), error=ex,
+                               class_name=_class_name, method_name='_restart_group')
+                status, message = FAILED, str(ex)
+            report.append(_create_entry(server_name, group.cluster_name, status,
+                                        System.currentTimeMillis() - start_time, message))
+        return report
+
+    def _restart_server(self, domain_runtime, group, server_name):
+        """
+        Shut down and start the server, waiting for each state change.
+        :return: the status and a message for the restart report
+        """
+        _method_name = '_restart_server'
+
+        lifecycle = domain_runtime.lookupServerLifeCycleRuntime(server_name)
+        if lifecycle is None:
+            return FAILED, 'no life cycle runtime'
+
+        if group.cluster_name is not None:
+            running_count = _get_running_count(domain_runtime, group.member_names)
+            if running_count - 1 < self._min_running_members:
+                _logger.warning('WLSDPLY-09029', server_name, group.cluster_name, running_count,
+                                self._min_running_members, class_name=_class_name, method_name=_method_name)
+                return SKIPPED, 'minimum running members'
+
+        _logger.info('WLSDPLY-09030', server_name, group.cluster_name, class_name=_class_name,
+                     method_name=_method_name)
+        timeout_seconds = int(self._timeout_millis / 1000)
+        lifecycle.shutdown(timeout_seconds, False)
+        if not self._wait_for_state(lifecycle, SHUTDOWN_STATE):
+            _logger.severe('WLSDPLY-09031', server_name, SHUTDOWN_STATE, self._timeout_millis,
+                           class_name=_class_name, method_name=_method_name)
+            return FAILED, 'shutdown timed out'
+
+        lifecycle.start()
+        if not self._wait_for_state(lifecycle, RUNNING_STATE):
+            _logger.severe('WLSDPLY-09031', server_name, RUNNING_STATE, self._timeout_millis,
+                           class_name=_class_name, method_name=_method_name)
+            return FAILED, 'start timed out'
+
+        _logger.info('WLSDPLY-09032', server_name, class_name=_class_name, method_name=_method_name)
+        return RESTARTED, None
+
+    def _wait_for_state(self, lifecycle, state):
+        """
+        Wait for the server to reach the state, until the timeout expires.
+        :return: True if the server reached the state
+        """
+        end_time = System.currentTimeMillis() + self._timeout_millis
+        while lifecycle.getState() != state:
+            if System.currentTimeMillis() >= end_time:
+                return False
+            time.sleep(_POLL_INTERVAL_SECONDS)
+        return True
+
+
+class _RestartGroup(object):
+    """
+    The servers to be restarted one at a time, and the members of their cluster.
+    """
+    def __init__(self, cluster_name, member_names):
+        self.cluster_name = cluster_name
+        self.member_names = member_names
+        self.server_names = []
+
+
+def _create_entry(server_name, cluster_name, status, duration_millis, message):
+    entry = OrderedDict()
+    entry[results_file.SERVER_KEY] = server_name
+    if cluster_name:
+        entry[results_file.CLUSTER_KEY] = cluster_name
+    entry[results_file.STATUS_KEY] = status
+    entry[results_file.DURATION_MILLIS_KEY] = duration_millis
+    if message:
+        entry[results_file.TEXT_KEY] = message
+    return entry
+
+
+def _get_cluster_name(server_name, cluster_members):
+    for cluster_name, member_names in cluster_members.iteritems():
+        if server_name in member_names:
+            return cluster_name
+    return None
+
+
+def _get_running_count(domain_runtime, member_names):
+    count = 0
+    for member_name in member_names:
+        lifecycle = domain_runtime.lookupServerLifeCycleRuntime(member_name)
+        if lifecycle is not None and lifecycle.getState() == RUNNING_STATE:
+            count += 1
+    return count
+
+
+def _get_name(value):
+    """
+    Get the name from a WLST reference value, which may be an MBean, an ObjectName, or a name.
+    """
+    if value is None:
+        return None
+    if hasattr(value, 'getKeyProperty'):
+        return value.getKeyProperty('Name')
+    if hasattr(value, 'getName'):
+        return value.getName()
+    return str(value)
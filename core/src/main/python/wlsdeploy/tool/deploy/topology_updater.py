@@ -1,5 +1,5 @@
 """
-Copyright (c) 2017, 2025, Oracle and/or its affiliates.
+Copyright (c) 2017, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 from wlsdeploy.aliases.location_context import LocationContext
@@ -57,7 +57,7 @@ class TopologyUpdater(Deployer):
     def set_attributes(self, location, model_nodes, excludes=None):
         model_type, model_name = self.aliases.get_model_type_and_name(location)
         if model_type == CLUSTER:
-            if FRONTEND_HOST in model_nodes:
+            if FRONTEND_HOST in model_nodes and not self._is_unchanged_attribute(location, FRONTEND_HOST):
                 model_value = model_nodes[FRONTEND_HOST]
                 self.attribute_setter.set_attribute(location, FRONTEND_HOST, model_value, None)
         Deployer.set_attributes(self, location, model_nodes, excludes)
@@ -229,8 +229,21 @@ class TopologyUpdater(Deployer):
                 self.target_helper.target_server_groups(server_assigns)
             if len(dynamic_assigns) > 0:
                 self.target_helper.target_dynamic_server_groups(dynamic_assigns)
+            if len(server_assigns) > 0 or len(dynamic_assigns) > 0:
+                self._require_server_group_updates()
         elif self._domain_typedef.has_jrf_with_database_store():
             self.target_helper.target_jrf_groups_to_clusters_servers()
+            self._require_server_group_updates()
+
+    def _require_server_group_updates(self):
+        """
+        Server group targeting may change servers and clusters in the edit session,
+        so the second pass must process them without the online change plan.
+        """
+        for folder_name in [CLUSTER, SERVER, SERVER_TEMPLATE, MIGRATABLE_TARGET]:
+            location = LocationContext().append_location(folder_name)
+            if self.aliases.is_model_location_valid(location):
+                self._require_full_update(location)
 
     def _process_section(self, folder_dict, folder_list, key, location, delete_now=True):
         if key in folder_dict:
@@ -0,0 +1,183 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+import os
+
+from java.io import File
+from java.lang import System
+
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.util import hash_utils
+
+_class_name = 'ArchiveContentCache'
+_logger = PlatformLogger('wlsdeploy.discover')
+
+
+class ArchiveContentCache(object):
+    """
+    Maintain a map of content hashes to archive paths, so that each unique file or directory is only
+    added to the archive once for each archive entry type.
+    The model references for byte-identical content resolve to the archive path of the first copy.
+    The archive entries are not changed in any other way, so archives can be read by earlier tool versions.
+    """
+    def __init__(self, model_context):
+        """
+        :param model_context: used to get tool configuration
+        """
+        self._enabled = model_context.get_model_config().is_archive_deduplication()
+        self._source_path_cache = {}  # (entry type, source path) to archive path
+        self._content_cache = {}      # (entry type, extension, content hash) to archive path
+
+        self._added_count = 0
+        self._added_bytes = 0
+        self._add_millis = 0
+        self._hash_millis = 0
+        self._reused_count = 0
+        self._reused_bytes = 0
+
+    def find_or_add(self, entry_type_name, source_path, add_function):
+        """
+        Find the archive path for content that matches the source path, adding the content if needed.
+        :param entry_type_name: the name of the archive entry type, such as APPLICATION
+        :param source_path: the absolute path of the source file or directory
+        :param add_function: a function with no arguments that adds the source path to the archive,
+            and returns the archive path
+        :return: the archive path to use in the model
+        :raises: the exceptions raised by add_function
+        """
+        _method_name = 'find_or_add'
+
+        if not self._enabled:
+            return add_function()
+
+        path_key = (entry_type_name, os.path.abspath(source_path))
+        archive_path = self._source_path_cache.get(path_key)
+        if archive_path is not None:
+            self._record_reuse(source_path, archive_path, get_content_size(source_path))
+            return archive_path
+
+        start_time = System.currentTimeMillis()
+        content_hash, content_size = hash_content(source_path)
+        self._hash_millis += System.currentTimeMillis() - start_time
+
+        content_key = (entry_type_name, _get_extension(source_path), content_hash)
+        archive_path = self._content_cache.get(content_key)
+        if archive_path is not None:
+            self._record_reuse(source_path, archive_path, content_size)
+        else:
+            start_time = System.currentTimeMillis()
+            archive_path = add_function()
+            self._add_millis += System.currentTimeMillis() - start_time
+            self._added_count += 1
+            self._added_bytes += content_size
+            self._content_cache[content_key] = archive_path
+            _logger.finer('WLSDPLY-07210', source_path, content_hash, archive_path,
+                          class_name=_class_name, method_name=_method_name)
+
+        self._source_path_cache[path_key] = archive_path
+        return archive_path
+
+    def get_reused_count(self):
+        return self._reused_count
+
+    def get_reused_bytes(self):
+        return self._reused_bytes
+
+    def get_estimated_saved_millis(self):
+        """
+        Estimate the time saved by not adding reused content, using the average rate of the content that was added,
+        less the time spent computing content hashes.
+        :return: the estimated number of milliseconds saved, which may be negative
+        """
+        saved_millis = 0
+        if self._added_bytes > 0:
+            saved_millis = long(self._reused_bytes * self._add_millis / self._added_bytes)
+        return saved_millis - self._hash_millis
+
+    def log_summary(self):
+        """
+        Log the number of reused archive entries, and the archive size and time they saved.
+        """
+        _method_name = 'log_summary'
+        if self._reused_count > 0:
+            _logger.info('WLSDPLY-07212', self._reused_count, self._added_count, self._reused_bytes,
+                         self.get_estimated_saved_millis(), self._hash_millis,
+                         class_name=_class_name, method_name=_method_name)
+
+    def _record_reuse(self, source_path, archive_path, content_size):
+        _method_name = '_record_reuse'
+        self._reused_count += 1
+        self._reused_bytes += content_size
+        _logger.info('WLSDPLY-07211', source_path, archive_path, class_name=_class_name, method_name=_method_name)
+
+
+def hash_content(source_path):
+    """
+    Compute the SHA-256 hash and the size of a file or a directory tree.
+    The hash of a directory includes the relative path and content hash of each file and subdirectory,
+    so directories with the same structure and file content have the same hash.
+    :param source_path: the path of the file or directory
+    :return: a tuple with the hexadecimal hash and the total size of the files in bytes
+    """
+    if not os.path.isdir(source_path):
+        return 'file:' + hash_utils.hash_file(source_path), File(source_path).length()
+
+    digest = hash_utils.create_digest()
+    total_size = 0
+    for relative_path, file_path in _get_tree_entries(source_path):
+        hash_utils.update_digest(digest, relative_path)
+        if file_path is None:
+            hash_utils.update_digest(digest, '/\n')
+        else:
+            file_hash = hash_utils.hash_file(file_path)
+            hash_utils.update_digest(digest, ':' + file_hash + '\n')
+            total_size += File(file_path).length()
+    return 'directory:' + hash_utils.to_hex(digest.digest()), total_size
+
+
+def get_content_size(source_path):
+    """
+    Get the total size in bytes of a file, or of the files in a directory tree.
+    :param source_path: the path of the file or directory
+    :return: the size in bytes
+    """
+    if not os.path.isdir(source_path):
+        return File(source_path).length()
+
+    total_size = 0
+    for relative_path, file_path in _get_tree_entries(source_path):
+        if file_path is not None:
+            total_size += File(file_path).length()
+    return total_size
+
+
+def _get_tree_entries(directory):
+    """
+    Get the entries of a directory tree, in a consistent order.
+    :param directory: the top directory
+    :return: a list of tuples (relative path, file path), with a file path of None for directories
+    """
+    entries = []
+    for dir_path, dir_names, file_names in os.walk(directory):
+        dir_names.sort()
+        relative_dir = os.path.relpath(dir_path, directory).replace(os.sep, '/')
+        for dir_name in dir_names:
+            entries.append((_join_relative(relative_dir, dir_name), None))
+        for file_name in sorted(file_names):
+            entries.append((_join_relative(relative_dir, file_name), os.path.join(dir_path, file_name)))
+    entries.sort()
+    return entries
+
+
+def _join_relative(relative_dir, name):
+    if relative_dir == '.':
+        return name
+    return relative_dir + '/' + name
+
+
+def _get_extension(source_path):
+    """
+    Content with different extensions is stored separately, since the extension can determine the module type.
+    """
+    return os.path.splitext(os.path.basename(os.path.abspath(source_path)))[1].lower()
@@ -0,0 +1,107 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+Transformers that rewrite the content of discovered files while they are added to the archive.
+Each transformer is passed to WLSDeployArchive.addItem, so the file is read once and written once.
+"""
+from java.io import BufferedReader
+from java.io import ByteArrayInputStream
+from java.io import InputStreamReader
+from java.lang import String
+from java.lang import StringBuilder
+from java.util.regex import Matcher
+from java.util.regex import Pattern
+
+from oracle.weblogic.deploy.util import ArchiveEntryTransformer
+
+from wlsdeploy.logging.platform_logger import PlatformLogger
+
+_class_name = 'archive_transformers'
+_logger = PlatformLogger('wlsdeploy.discover')
+
+_USER_NAME_PATTERN = Pattern.compile('<name>(\\s?)user(\\s?)</name>')
+_VALUE_PATTERN = Pattern.compile('<value>(.+?)</value>')
+_PASSWORD_PATTERN = Pattern.compile('<password-encrypted>(.+?)</password-encrypted>')
+_URL_PATTERN = Pattern.compile('<url>(\\s*)(.+?)(\\s*)</url>')
+_ONS_PASSWORD_PATTERN = Pattern.compile('<ons-wallet-password-encrypted>(.+?)</ons-wallet-password-encrypted>')
+
+
+class JdbcCredentialTransformer(ArchiveEntryTransformer):
+    """
+    Replace the user name, password, URL, and ONS wallet password in a standalone JDBC module
+    with tokens, or with the fixed password token.
+    """
+    def __init__(self, replacement_function):
+        """
+        :param replacement_function: a function with the arguments (file name, token suffix, element name,
+            properties=None, username=''), that returns the replacement XML element
+        """
+        self._replacement_function = replacement_function
+
+    def transform(self, entry_name, content):
+        """
+        Replace the credentials in the JDBC module XML.
+        :param entry_name: the name of the JDBC module file
+        :param content: the input stream with the JDBC module XML, which is closed by this method
+        :return: an input stream with the updated JDBC module XML
+        """
+        _method_name = 'transform'
+        _logger.entering(entry_name, class_name=_class_name, method_name=_method_name)
+
+        if not entry_name.lower().endswith('.xml'):
+            return content
+
+        text = _read_text(content)
+        replace = self._replacement_function
+
+        matcher = _USER_NAME_PATTERN.matcher(text)
+        if matcher.find():
+            matcher = _VALUE_PATTERN.matcher(text[matcher.end():])
+            if matcher.find():
+                username = matcher.group(1)
+                user_matcher = Pattern.compile(Pattern.quote(matcher.group())).matcher(text)
+                text = user_matcher.replaceFirst(_quote(replace(entry_name, '-user:username', 'value',
+                                                                username=username)))
+
+        matcher = _PASSWORD_PATTERN.matcher(text)
+        text = matcher.replaceFirst(_quote(replace(entry_name, '-user:password', 'password-encrypted')))
+
+        matcher = _URL_PATTERN.matcher(text)
+        if matcher.find():
+            text = matcher.replaceFirst(_quote(replace(entry_name, '-url', 'url', properties=matcher.group(2))))
+
+        matcher = _ONS_PASSWORD_PATTERN.matcher(text)
+        text = matcher.replaceFirst(_quote(replace(entry_name, '-ons-pass-encrypt:password',
+                                                   'ons-wallet-password-encrypted')))
+
+        _logger.exiting(class_name=_class_name, method_name=_method_name)
+        return ByteArrayInputStream(String(text).getBytes())
+
+    def toString(self):
+        return 'JdbcCredentialTransformer'
+
+
+def _read_text(content):
+    """
+    Read the lines of the input stream, using the platform encoding, and close the stream.
+    :param content: the input stream
+    :return: the text, with each line ending in a newline
+    """
+    reader = BufferedReader(InputStreamReader(content))
+    try:
+        builder = StringBuilder()
+        line = reader.readLine()
+        while line is not None:
+            builder.append(line).append('\n')
+            line = reader.readLine()
+        return builder.toString()
+    finally:
+        reader.close()
+
+
+def _quote(replacement):
+    """
+    Prevent group references in the replacement text.
+    """
+    return Matcher.quoteReplacement(replacement)
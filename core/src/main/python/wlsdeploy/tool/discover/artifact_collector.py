@@ -0,0 +1,396 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+Collects the files and directories listed in an artifact collection plan, and adds them to the archive file.
+The entries are read from the local file system, or downloaded from the domain host using SSH.
+The entries are transferred in parallel, and then added to the archive one at a time, in plan order,
+since the archive file is not safe for concurrent updates.
+"""
+import exceptions
+import fnmatch
+import glob
+import os
+import time
+
+from java.io import IOException
+from java.lang import Exception as JException
+from java.lang import IllegalArgumentException
+from oracle.weblogic.deploy.json import JsonException
+from oracle.weblogic.deploy.util import FileUtils
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+from oracle.weblogic.deploy.util import WLSDeployArchive
+from oracle.weblogic.deploy.util import WLSDeployArchiveIOException
+
+from wlsdeploy.exception import exception_helper
+from wlsdeploy.json.json_translator import PythonToJson
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.tool.discover import archive_content_cache
+from wlsdeploy.tool.discover import collection_plan
+from wlsdeploy.util import dictionary_utils
+from wlsdeploy.util import hash_utils
+from wlsdeploy.util import parallel_utils
+from wlsdeploy.util import path_helper
+from wlsdeploy.util.exit_code import ExitCode
+
+RESULTS_FILE_NAME = 'archive-collection-results.json'
+
+# results keys
+TIMESTAMP = 'timestamp'
+ARCHIVE_FILE = 'archiveFile'
+ENTRY_COUNT = 'entryCount'
+MISSING_COUNT = 'missingCount'
+FAILED_COUNT = 'failedCount'
+ENTRIES = 'entries'
+STATUS = 'status'
+MESSAGE = 'message'
+FILES = 'files'
+SIZE = 'size'
+SHA256 = 'sha256'
+
+# entry status values
+COLLECTED_STATUS = 'collected'
+CREATED_STATUS = 'created'
+MISSING_STATUS = 'missing'
+FAILED_STATUS = 'failed'
+
+_STAGING_DIR_PREFIX = 'wdt-collect'
+
+_class_name = 'ArtifactCollector'
+_logger = PlatformLogger('wlsdeploy.discover')
+
+
+class CollectedFile(object):
+    """
+    A file or directory that was read for a plan entry, and the archive path where it is added.
+    """
+    def __init__(self, source_path, local_path, archive_path):
+        """
+        :param source_path: the path of the file or directory on the domain host
+        :param local_path: the local path of the file or directory, which is a staged copy for SSH
+        :param archive_path: the archive path for the file or directory
+        """
+        self.source_path = source_path
+        self.local_path = local_path
+        self.archive_path = archive_path
+        self.size = None
+        self.checksum = None
+
+
+class EntryResult(object):
+    """
+    The result of collecting one plan entry.
+    """
+    def __init__(self, entry):
+        """
+        :param entry: the plan entry dictionary
+        """
+        self.entry = entry
+        self.status = None
+        self.message = None
+        self.files = []
+
+    def set_status(self, status, message=None):
+        self.status = status
+        self.message = message
+
+
+class ArtifactCollector(object):
+    """
+    Collects the entries of a collection plan into an archive file.
+    """
+
+    def __init__(self, model_context, plan):
+        """
+        :param model_context: the model context, with the SSH context if the entries are downloaded
+        :param plan: the validated plan dictionary
+        """
+        self._model_context = model_context
+        self._plan = plan
+        self._ssh_context = model_context.get_ssh_context()
+        self._path_helper = path_helper.get_path_helper()
+        self._staging_dir = None
+
+    def collect(self, archive_file_name):
+        """
+        Collect the plan entries, and add them to the archive file.
+        Entries that cannot be collected are recorded in the results, and the other entries are still collected.
+        :param archive_file_name: the archive file, which is created if it does not exist
+        :return: a list of EntryResult objects, in plan order
+        :raises CLAException: if the staging directory or the archive file cannot be opened
+        """
+        _method_name = 'collect'
+        _logger.entering(archive_file_name, class_name=_class_name, method_name=_method_name)
+
+        entries = self._plan[collection_plan.ENTRIES]
+        max_threads = self._model_context.get_model_config().get_archive_collection_threads()
+        source_host = 'localhost'
+        if self._ssh_context is not None:
+            source_host = self._model_context.get_ssh_host()
+            self._staging_dir = _create_staging_dir()
+        _logger.info('WLSDPLY-33510', len(entries), source_host, archive_file_name,
+                     class_name=_class_name, method_name=_method_name)
+
+        try:
+            indexed_entries = [(index, entries[index]) for index in range(len(entries))]
+            results = parallel_utils.run_parallel(self._stage_entry, indexed_entries, max_threads)
+            self._add_to_archive(archive_file_name, results)
+        finally:
+            if self._staging_dir is not None:
+                FileUtils.deleteDirectory(self._staging_dir)
+
+        _logger.exiting(class_name=_class_name, method_name=_method_name, result=len(results))
+        return results
+
+    def _stage_entry(self, indexed_entry):
+        """
+        Find and transfer the files for a plan entry, and verify their size and checksum.
+        Failures are logged and returned in the result, so the other entries are not affected.
+        :param indexed_entry: a tuple with the entry index and the plan entry
+        :return: the EntryResult
+        """
+        _method_name = '_stage_entry'
+
+        index, entry = indexed_entry
+        result = EntryResult(entry)
+        kind = entry[collection_plan.KIND]
+        source_path = dictionary_utils.get_element(entry, collection_plan.SOURCE_PATH)
+        archive_path = entry[collection_plan.ARCHIVE_PATH]
+        if kind == collection_plan.EMPTY_DIRECTORY_KIND:
+            return result
+
+        source_path = self._resolve_source_path(source_path)
+        try:
+            if kind == collection_plan.PATTERN_KIND:
+                collected_files = [CollectedFile(match, None, archive_path + _get_name(match))
+                                   for match in self._find_matches(source_path)]
+            elif self._exists(source_path):
+                collected_files = [CollectedFile(source_path, None, archive_path)]
+            else:
+                collected_files = []
+
+            if len(collected_files) == 0:
+                _logger.warning('WLSDPLY-33511', source_path, entry[collection_plan.TYPE], archive_path,
+                                class_name=_class_name, method_name=_method_name)
+                result.set_status(MISSING_STATUS)
+                return result
+
+            for collected_file in collected_files:
+                self._stage_file(collected_file, str(index))
+                result.files.append(collected_file)
+
+            expected_size = dictionary_utils.get_element(entry, collection_plan.EXPECTED_SIZE)
+            if kind == collection_plan.PATH_KIND and expected_size is not None \
+                    and collected_files[0].size != expected_size:
+                _logger.warning('WLSDPLY-33513', source_path, collected_files[0].size, expected_size,
+                                class_name=_class_name, method_name=_method_name)
+        except (exceptions.Exception, JException), ex:
+            _logger.severe('WLSDPLY-33512', source_path, archive_path, str(ex), error=ex,
+                           class_name=_class_name, method_name=_method_name)
+            result.set_status(FAILED_STATUS, str(ex))
+        return result
+
+    def _resolve_source_path(self, source_path):
+        """
+        Resolve a relative source path against the domain home of the plan, using the path format of the domain host.
+        :param source_path: the source path from the plan entry
+        :return: the absolute source path, or the source path if it cannot be resolved
+        """
+        domain_home = dictionary_utils.get_element(self._plan, collection_plan.DOMAIN_HOME)
+        if domain_home and self._path_helper.is_relative_path(source_path):
+            return self._path_helper.join(domain_home, source_path)
+        return source_path
+
+    def _find_matches(self, source_pattern):
+        """
+        Find the files and directories that match the file name pattern of the source path.
+        :param source_pattern: the source path with a file name pattern
+        :return: a sorted list of matching paths
+        """
+        if self._ssh_context is None:
+            matches = glob.glob(source_pattern)
+        else:
+            directory, pattern = _split_remote_path(source_pattern)
+            if not self._ssh_context.does_directory_exist(directory):
+                return []
+            matches = self._ssh_context.get_directory_contents(directory, False, fnmatch.translate(pattern))
+            matches = [match.rstrip('/\\') for match in matches]
+        matches.sort()
+        return matches
+
+    def _exists(self, source_path):
+        if self._ssh_context is None:
+            return os.path.exists(source_path)
+
+        directory, name = _split_remote_path(source_path)
+        if not self._ssh_context.does_directory_exist(directory):
+            return False
+        names = [_get_name(path) for path in self._ssh_context.get_directory_contents(directory, False)]
+        return name in names
+
+    def _stage_file(self, collected_file, staging_subdir):
+        """
+        Set the local path, size, and checksum of the collected file.
+        For SSH, the file is downloaded to the staging directory, and the checksum of a downloaded file
+        must match the checksum of the remote file.
+        :param collected_file: the CollectedFile to be updated
+        :param staging_subdir: the subdirectory of the staging directory for the plan entry
+        :raises: the SSH exception type if the download fails, or the checksums do not match
+        """
+        _method_name = '_stage_file'
+
+        if self._ssh_context is None:
+            collected_file.local_path = collected_file.source_path
+        else:
+            collected_file.local_path = self._path_helper.download_file_from_remote_server(
+                self._model_context, collected_file.source_path, self._staging_dir.getAbsolutePath(), staging_subdir)
+
+        collected_file.size = archive_content_cache.get_content_size(collected_file.local_path)
+        if os.path.isdir(collected_file.local_path):
+            return
+
+        collected_file.checksum = hash_utils.hash_file(collected_file.local_path)
+        if self._ssh_context is not None:
+            remote_checksum = self._ssh_context.get_file_checksum(collected_file.source_path)
+            if remote_checksum != collected_file.checksum:
+                ex = exception_helper.create_ssh_exception('WLSDPLY-33514', collected_file.source_path,
+                                                           collected_file.checksum, remote_checksum)
+                _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+                raise ex
+
+    def _add_to_archive(self, archive_file_name, results):
+        """
+        Add the staged files and the empty directories to the archive, in plan order.
+        :param archive_file_name: the archive file name
+        :param results: the list of EntryResult objects
+        :raises CLAException: if the archive file cannot be opened
+        """
+        _method_name = '_add_to_archive'
+
+        try:
+            archive_file = WLSDeployArchive(archive_file_name)
+        except IllegalArgumentException, ex:
+            cla_ex = exception_helper.create_cla_exception(ExitCode.ERROR, 'WLSDPLY-33516', archive_file_name,
+                                                           ex.getLocalizedMessage(), error=ex)
+            _logger.throwing(cla_ex, class_name=_class_name, method_name=_method_name)
+            raise cla_ex
+
+        try:
+            for result in results:
+                if result.status is not None:
+                    continue
+
+                archive_path = result.entry[collection_plan.ARCHIVE_PATH]
+                try:
+                    if result.entry[collection_plan.KIND] == collection_plan.EMPTY_DIRECTORY_KIND:
+                        archive_file.addEmptyDirectoryAtPath(archive_path)
+                        result.set_status(CREATED_STATUS)
+                    else:
+                        for collected_file in result.files:
+                            archive_file.addItemAtPath(collected_file.archive_path, collected_file.local_path)
+                            _logger.info('WLSDPLY-33515', collected_file.source_path, collected_file.archive_path,
+                                         class_name=_class_name, method_name=_method_name)
+                        result.set_status(COLLECTED_STATUS)
+                except (IllegalArgumentException, WLSDeployArchiveIOException), ex:
+                    source_path = dictionary_utils.get_element(result.entry, collection_plan.SOURCE_PATH)
+                    _logger.severe('WLSDPLY-33512', source_path, archive_path, ex.getLocalizedMessage(), error=ex,
+                                   class_name=_class_name, method_name=_method_name)
+                    result.set_status(FAILED_STATUS, ex.getLocalizedMessage())
+        finally:
+            archive_file.close()
+
+
+def get_exit_code(results):
+    """
+    Get the exit code of the collector from the entry results.
+    :param results: the list of EntryResult objects
+    :return: ExitCode.ERROR if any entry failed, ExitCode.WARNING if any entry was missing, otherwise ExitCode.OK
+    """
+    statuses = [result.status for result in results]
+    if FAILED_STATUS in statuses:
+        return ExitCode.ERROR
+    if MISSING_STATUS in statuses:
+        return ExitCode.WARNING
+    return ExitCode.OK
+
+
+def create_results(results, archive_file_name):
+    """
+    Create a results dictionary from the entry results.
+    :param results: the list of EntryResult objects
+    :param archive_file_name: the archive file name
+    :return: the results dictionary
+    """
+    entries = []
+    for result in results:
+        files = []
+        for collected_file in result.files:
+            file_dict = OrderedDict()
+            file_dict[collection_plan.SOURCE_PATH] = collected_file.source_path
+            file_dict[collection_plan.ARCHIVE_PATH] = collected_file.archive_path
+            file_dict[SIZE] = collected_file.size
+            file_dict[SHA256] = collected_file.checksum
+            files.append(file_dict)
+
+        entry = OrderedDict()
+        entry[collection_plan.SOURCE_PATH] = dictionary_utils.get_element(result.entry, collection_plan.SOURCE_PATH)
+        entry[collection_plan.ARCHIVE_PATH] = result.entry[collection_plan.ARCHIVE_PATH]
+        entry[collection_plan.TYPE] = dictionary_utils.get_element(result.entry, collection_plan.TYPE)
+        entry[STATUS] = result.status
+        entry[MESSAGE] = result.message
+        entry[FILES] = files
+        entries.append(entry)
+
+    statuses = [result.status for result in results]
+    summary = OrderedDict()
+    summary[TIMESTAMP] = time.strftime('%Y-%m-%dT%H:%M:%S')
+    summary[ARCHIVE_FILE] = archive_file_name
+    summary[ENTRY_COUNT] = len(results)
+    summary[MISSING_COUNT] = statuses.count(MISSING_STATUS)
+    summary[FAILED_COUNT] = statuses.count(FAILED_STATUS)
+    summary[ENTRIES] = entries
+    return summary
+
+
+def write_results(summary, results_file):
+    """
+    Write the results to a JSON file.
+    :param summary: the results dictionary
+    :param results_file: the file to be written
+    :raises CLAException: if the file cannot be written
+    """
+    _method_name = 'write_results'
+
+    try:
+        PythonToJson(summary).write_to_json_file(results_file)
+    except JsonException, ex:
+        cla_ex = exception_helper.create_cla_exception(ExitCode.ERROR, 'WLSDPLY-33518', results_file,
+                                                       ex.getLocalizedMessage(), error=ex)
+        _logger.throwing(cla_ex, class_name=_class_name, method_name=_method_name)
+        raise cla_ex
+    _logger.info('WLSDPLY-33517', results_file, class_name=_class_name, method_name=_method_name)
+
+
+def _create_staging_dir():
+    _method_name = '_create_staging_dir'
+
+    try:
+        return FileUtils.createTempDirectory(_STAGING_DIR_PREFIX)
+    except IOException, ex:
+        cla_ex = exception_helper.create_cla_exception(ExitCode.ERROR, 'WLSDPLY-33519', ex.getLocalizedMessage(),
+                                                       error=ex)
+        _logger.throwing(cla_ex, class_name=_class_name, method_name=_method_name)
+        raise cla_ex
+
+
+def _get_name(path):
+    return path.replace('\\', '/').rstrip('/').split('/')[-1]
+
+
+def _split_remote_path(path):
+    """
+    Split a remote path into its directory and name, for either path separator.
+    """
+    normalized = path.replace('\\', '/')
+    index = normalized.rfind('/')
+    return path[:index + 1], path[index + 1:]
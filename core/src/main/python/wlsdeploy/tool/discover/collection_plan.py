@@ -0,0 +1,158 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+The artifact collection plan written by discoverDomain in remote mode.
+The plan lists each file and directory that must be added to the archive for the discovered model,
+with its path on the domain host, its archive path, and its archive entry type.
+The collectArtifacts tool reads the plan and adds the entries to the archive file.
+"""
+import os
+
+from oracle.weblogic.deploy.json import JsonException
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+
+from wlsdeploy.exception import exception_helper
+from wlsdeploy.json.json_translator import JsonToPython
+from wlsdeploy.json.json_translator import PythonToJson
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.tool.discover import archive_content_cache
+from wlsdeploy.tool.discover import discoverer
+from wlsdeploy.util import dictionary_utils
+from wlsdeploy.util.exit_code import ExitCode
+
+PLAN_FILE_NAME = 'archive-collection-plan.json'
+
+# plan keys
+DOMAIN_HOME = 'domainHome'
+ENTRIES = 'entries'
+SOURCE_PATH = 'sourcePath'
+ARCHIVE_PATH = 'archivePath'
+TYPE = 'type'
+KIND = 'kind'
+EXPECTED_SIZE = 'expectedSize'
+
+# entry kinds
+PATH_KIND = 'path'
+PATTERN_KIND = 'pattern'
+EMPTY_DIRECTORY_KIND = 'emptyDirectory'
+
+ALL_KINDS = [PATH_KIND, PATTERN_KIND, EMPTY_DIRECTORY_KIND]
+
+# archive entry types that are created as empty directories, instead of collected from the domain host
+_EMPTY_DIRECTORY_TYPES = ['FILE_STORE', 'COHERENCE_PERSISTENCE_DIR']
+
+_PATTERN_CHARACTERS = '*?['
+
+_class_name = 'collection_plan'
+_logger = PlatformLogger('wlsdeploy.discover')
+
+
+def create_plan(remote_map, domain_home):
+    """
+    Create a collection plan from the archive entries recorded by the discoverers in remote mode.
+    Pattern entries, such as the domain libraries, have a source path with a file name pattern,
+    and an archive path that is the archive directory for the matching files, ending with a slash.
+    The expected size is only set if the source path can be read from this machine.
+    :param remote_map: the remote map from the discoverer module, keyed by source path
+    :param domain_home: the domain home on the domain host
+    :return: the plan dictionary
+    """
+    entries = []
+    for source_path in remote_map:
+        archive_map = remote_map[source_path]
+        entry_type = archive_map[discoverer.REMOTE_TYPE]
+        archive_path = archive_map[discoverer.REMOTE_ARCHIVE_PATH]
+        expected_size = None
+
+        if entry_type in _EMPTY_DIRECTORY_TYPES:
+            kind = EMPTY_DIRECTORY_KIND
+            source_path = None
+        elif is_pattern(source_path):
+            kind = PATTERN_KIND
+            archive_path = archive_path.rstrip('*')
+        else:
+            kind = PATH_KIND
+            if os.path.exists(source_path):
+                expected_size = archive_content_cache.get_content_size(source_path)
+
+        entry = OrderedDict()
+        entry[SOURCE_PATH] = source_path
+        entry[ARCHIVE_PATH] = archive_path
+        entry[TYPE] = entry_type
+        entry[KIND] = kind
+        entry[EXPECTED_SIZE] = expected_size
+        entries.append(entry)
+
+    plan = OrderedDict()
+    plan[DOMAIN_HOME] = domain_home
+    plan[ENTRIES] = entries
+    return plan
+
+
+def is_pattern(source_path):
+    """
+    Determine if the file name of the source path is a pattern.
+    :param source_path: the source path
+    :return: True if the last element of the path contains pattern characters
+    """
+    name = source_path.replace('\\', '/').split('/')[-1]
+    for character in _PATTERN_CHARACTERS:
+        if character in name:
+            return True
+    return False
+
+
+def write_plan(plan, plan_file):
+    """
+    Write the collection plan to a JSON file.
+    :param plan: the plan dictionary
+    :param plan_file: the file to be written
+    :raises JsonException: if the file cannot be written
+    """
+    _method_name = 'write_plan'
+
+    PythonToJson(plan).write_to_json_file(plan_file)
+    _logger.info('WLSDPLY-33500', len(plan[ENTRIES]), plan_file, class_name=_class_name, method_name=_method_name)
+
+
+def read_plan(plan_file):
+    """
+    Read and validate a collection plan file.
+    :param plan_file: the plan file
+    :return: the plan dictionary
+    :raises CLAException: if the file cannot be parsed, or has invalid entries
+    """
+    _method_name = 'read_plan'
+
+    try:
+        plan = JsonToPython(plan_file).parse()
+    except JsonException, ex:
+        cla_ex = exception_helper.create_cla_exception(ExitCode.ARG_VALIDATION_ERROR, 'WLSDPLY-00921',
+                                                       plan_file, ex.getLocalizedMessage(), error=ex)
+        _logger.throwing(cla_ex, class_name=_class_name, method_name=_method_name)
+        raise cla_ex
+
+    entries = dictionary_utils.get_element(plan, ENTRIES)
+    if not isinstance(entries, list):
+        _raise_plan_error('WLSDPLY-33502', plan_file, ENTRIES)
+
+    for entry in entries:
+        if not isinstance(entry, dict) or not dictionary_utils.get_element(entry, ARCHIVE_PATH):
+            _raise_plan_error('WLSDPLY-33502', plan_file, ARCHIVE_PATH)
+
+        kind = dictionary_utils.get_element(entry, KIND)
+        if kind not in ALL_KINDS:
+            _raise_plan_error('WLSDPLY-33503', entry[ARCHIVE_PATH], kind, ', '.join(ALL_KINDS))
+
+        if kind != EMPTY_DIRECTORY_KIND and not dictionary_utils.get_element(entry, SOURCE_PATH):
+            _raise_plan_error('WLSDPLY-33504', entry[ARCHIVE_PATH], SOURCE_PATH)
+    return plan
+
+
+def _raise_plan_error(key, *args):
+    _method_name = '_raise_plan_error'
+
+    ex = exception_helper.create_cla_exception(ExitCode.ARG_VALIDATION_ERROR, key, *args)
+    _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+    raise ex
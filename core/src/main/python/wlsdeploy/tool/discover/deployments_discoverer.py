@@ -1,19 +1,12 @@
 """
-Copyright (c) 2017, 2025, Oracle and/or its affiliates.
+Copyright (c) 2017, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 import os
 
-from java.io import BufferedReader
-from java.io import BufferedWriter
-from java.io import FileReader
-from java.io import FileWriter
 from java.lang import IllegalArgumentException
-from java.lang import StringBuilder
-from java.util.regex import Pattern
 
 from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
-from oracle.weblogic.deploy.util import FileUtils
 from oracle.weblogic.deploy.util import StringUtils
 from oracle.weblogic.deploy.util import WLSDeployArchiveIOException
 from oracle.weblogic.deploy.util import WLSDeployArchive
@@ -34,6 +27,7 @@ from wlsdeploy.exception import exception_helper
 from wlsdeploy.exception.exception_types import ExceptionType
 from wlsdeploy.logging.platform_logger import PlatformLogger
 from wlsdeploy.tool.discover import discoverer
+from wlsdeploy.tool.discover.archive_transformers import JdbcCredentialTransformer
 from wlsdeploy.tool.discover.discoverer import Discoverer
 from wlsdeploy.tool.util import structured_apps_helper
 from wlsdeploy.util import dictionary_utils
@@ -183,13 +177,20 @@ class DeploymentsDiscoverer(Discoverer):
                                 file_name_path = self.download_deployment_from_remote_server(
                                     file_name_path, self.download_temporary_dir, download_file_type)
 
-                            new_source_name = archive_file.addItem(archive_entry_type, file_name_path)
-
+                            module_type = None
                             if deployment_type == APPLICATION:
                                 module_type = dictionary_utils.get_dictionary_element(
                                     deployment_dict, model_constants.MODULE_TYPE)
-                                if module_type == 'jdbc':
-                                    self._jdbc_password_fix(new_source_name)
+
+                            if module_type == 'jdbc':
+                                # the archive entry has credential tokens for this deployment
+                                transformers = [JdbcCredentialTransformer(self._get_pass_replacement)]
+                                new_source_name = archive_file.addItem(archive_entry_type, file_name_path,
+                                                                       transformers)
+                            else:
+                                new_source_name = self._add_content_to_archive(
+                                    archive_entry_type, file_name_path,
+                                    lambda: archive_file.addItem(archive_entry_type, file_name_path))
 
                         except IllegalArgumentException, iae:
                             self._disconnect_target(deployment_type, deployment_name, deployment_dict, file_name_path,
@@ -407,63 +408,6 @@ class DeploymentsDiscoverer(Discoverer):
         _logger.exiting(class_name=_class_name, method_name=_method_name, result=new_value)
         return new_value
 
-    def _jdbc_password_fix(self, source_name):
-        """
-        This will look for password and userid in the jdbc standalone xml and
-        replace with either fix password token or a token in the xml and variable file.
-        It extracts the jdbc xml from the archive and then replaces it with the updated file.
-        :param source_name: Name of the path and file for the standalone xml file
-        """
-        _method_name = '_jdbc_password_fix'
-        _logger.entering(source_name, class_name=_class_name, method_name=_method_name)
-        archive_file = self._model_context.get_archive_file()
-        tmp_dir = FileUtils.getTmpDir();
-        temp_file = FileUtils.createTempDirectory(tmp_dir, 'jdbc-xml')
-        jdbc_file = archive_file.extractFile(source_name, temp_file)
-        jdbc_out = FileUtils.createTempDirectory(tmp_dir, 'jdbc-out')
-        jdbc_out = archive_file.extractFile(source_name, jdbc_out)
-        bis = BufferedReader(FileReader(jdbc_file))
-        bos = BufferedWriter(FileWriter(jdbc_out))
-        cache = StringBuilder()
-        while bis.ready():
-            cache.append(bis.readLine()).append("\n")
-        bis.close()
-        pattern = Pattern.compile("<name>(\s?)user(\s?)</name>")
-        matcher = pattern.matcher(cache.toString())
-        end = -1
-        if matcher.find():
-            end = matcher.end()
-        result = cache.toString()
-        if end >= 0:
-            pattern = Pattern.compile("<value>(.+?)</value>")
-            matcher = pattern.matcher(result[end:])
-            matcher.find()
-            username = matcher.group()
-            username = username[len('<value>'):len(username) - len('</value>')]
-            pattern = Pattern.compile(matcher.group())
-            matcher = pattern.matcher(cache.toString())
-            result = matcher.replaceFirst(self._get_pass_replacement(jdbc_file, '-user:username',
-                                                                     'value', username=username))
-
-        pattern = Pattern.compile('<password-encrypted>(.+?)</password-encrypted>')
-        matcher = pattern.matcher(result)
-        result = matcher.replaceFirst(self._get_pass_replacement(jdbc_file, '-user:password', 'password-encrypted'))
-
-        pattern = Pattern.compile('<url>(\s*)(.+?)(\s*)</url>')
-        matcher = pattern.matcher(result)
-        matcher.find()
-        result = matcher.replaceFirst(self._get_pass_replacement(jdbc_file, '-url', 'url',
-                                                                 properties=matcher.group(2)))
-
-        pattern = Pattern.compile('<ons-wallet-password-encrypted>(.+?)</ons-wallet-password-encrypted>')
-        matcher = pattern.matcher(result)
-        result = matcher.replaceFirst(self._get_pass_replacement(jdbc_file, '-ons-pass-encrypt:password',
-                                                                 'ons-wallet-password-encrypted'))
-        bos.write(result)
-        bos.close()
-        archive_file.replaceApplication(source_name, jdbc_out)
-        _logger.exiting(class_name=_class_name, method_name=_method_name)
-
     def _get_pass_replacement(self, jdbc_file, name, type, properties=None, username=''):
         if self._credential_injector is not None:
             token = self.path_helper.get_local_filename_no_ext_from_path(jdbc_file)
@@ -1,5 +1,5 @@
 """
-Copyright (c) 2017, 2025, Oracle and/or its affiliates.
+Copyright (c) 2017, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 import array
@@ -25,6 +25,7 @@ from wlsdeploy.exception import exception_helper
 from wlsdeploy.exception.exception_types import ExceptionType
 from wlsdeploy.logging.platform_logger import PlatformLogger
 from wlsdeploy.tool.deploy import deployer_utils
+from wlsdeploy.tool.discover.archive_content_cache import ArchiveContentCache
 from wlsdeploy.tool.discover.custom_folder_helper import CustomFolderHelper
 from wlsdeploy.tool.discover.wallet_cache import WalletCache
 from wlsdeploy.tool.encrypt import encryption_utils
@@ -47,6 +48,7 @@ REMOTE_ARCHIVE_PATH = 'ArchivePath'
 
 # static instances shared by subclasses
 _ssh_download_dir = None
+_archive_content_cache = None
 _wallet_cache = None
 
 class Discoverer(object):
@@ -64,6 +66,7 @@ class Discoverer(object):
         """
         _method_name = '__init__'
         global _ssh_download_dir
+        global _archive_content_cache
         global _wallet_cache
 
         self._model_context = model_context
@@ -88,7 +91,8 @@ class Discoverer(object):
         self._local_tmp_directory = None
 
         # lazy load this once for all Discoverer instances
-        _wallet_cache = _wallet_cache or WalletCache(model_context)
+        _archive_content_cache = _archive_content_cache or ArchiveContentCache(model_context)
+        _wallet_cache = _wallet_cache or WalletCache(model_context, _archive_content_cache)
 
         if model_context.is_ssh():
             if _ssh_download_dir is None:
@@ -122,6 +126,16 @@ class Discoverer(object):
         else:
             _logger.todo('WLSDPLY-06041', file_type, local_name, archive_name)
 
+    def _add_content_to_archive(self, archive_entry_type, source_path, add_function):
+        """
+        Add the source file or directory to the archive, unless identical content of the same type was already added.
+        :param archive_entry_type: the archive entry type, such as ArchiveEntryType.APPLICATION
+        :param source_path: the absolute path of the source file or directory
+        :param add_function: a function with no arguments that adds the source path, and returns the archive path
+        :return: the archive path to use in the model
+        """
+        return _archive_content_cache.find_or_add(archive_entry_type.name(), source_path, add_function)
+
     def discover_domain_named_mbeans(self, model_top_folder_name, model_folder):
         model_folder_name, folder_result = self._get_named_resources(model_top_folder_name)
         add_to_model_if_not_empty(model_folder, model_folder_name, folder_result)
@@ -1256,6 +1270,14 @@ def _is_containment(mbean_attribute_info):
     return mbean_attribute_info.getDescriptor().getFieldValue('com.bea.relationship') == 'containment'
 
 
+def log_archive_content_summary():
+    """
+    Log the archive size and time saved by adding identical archive content only once.
+    """
+    if _archive_content_cache is not None:
+        _archive_content_cache.log_summary()
+
+
 def get_discover_logger_name():
     """
     Return the common logger used for all discover logging.
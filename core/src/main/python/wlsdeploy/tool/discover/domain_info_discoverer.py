@@ -1,5 +1,5 @@
 """
-Copyright (c) 2017, 2024, Oracle and/or its affiliates.
+Copyright (c) 2017, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 import glob
@@ -169,8 +169,9 @@ class DomainInfoDiscoverer(Discoverer):
         file_list = []
         if not self._model_context.is_skip_archive():
             if self._model_context.is_remote():
-                self.add_to_remote_map("$DOMAIN_HOME/lib/*", "<remote domain home lib>/*",
-                               WLSDeployArchive.ArchiveEntryType.DOMAIN_LIB.name())
+                remote_lib_pattern = self.path_helper.join(self._model_context.get_domain_home(), 'lib', '*.jar')
+                self.add_to_remote_map(remote_lib_pattern, '%s/*' % WLSDeployArchive.ARCHIVE_DOMLIB_TARGET_DIR,
+                                       WLSDeployArchive.ArchiveEntryType.DOMAIN_LIB.name())
             elif self._model_context.is_ssh():
                 # execute remote command to find the domain libs
                 results = self._model_context.get_ssh_context().get_directory_contents(self.path_helper.remote_join(
@@ -225,7 +226,9 @@ class DomainInfoDiscoverer(Discoverer):
 
                 if self._model_context.is_remote():
                     # Tell user we won't be able to find them
-                    self.add_to_remote_map("setUserOverrides*.*", "<remote domain home bin>/setUserOverrides*.*",
+                    remote_bin_pattern = self.path_helper.join(self._model_context.get_domain_home(), 'bin',
+                                                               'setUserOverrides*.*')
+                    self.add_to_remote_map(remote_bin_pattern, '%s/*' % WLSDeployArchive.ARCHIVE_DOM_BIN_TARGET_DIR,
                                            WLSDeployArchive.ArchiveEntryType.DOMAIN_BIN.name())
                     file_list = None
                 elif self._model_context.is_ssh():
@@ -867,7 +867,9 @@ class TopologyDiscoverer(Discoverer):
                         file_name_path = self.download_deployment_from_remote_server(file_name_path,
                                                                                       self.download_temporary_dir,
                                                                                       "classPathLibraries")
-                    new_source_name = archive_file.addClasspathLibrary(file_name_path)
+                    new_source_name = self._add_content_to_archive(
+                        WLSDeployArchive.ArchiveEntryType.CLASSPATH_LIB, file_name_path,
+                        lambda: archive_file.addClasspathLibrary(file_name_path))
                 except IllegalArgumentException, iae:
                     _logger.warning('WLSDPLY-06620', server_name, file_name_path, iae.getLocalizedMessage(),
                                     class_name=_class_name, method_name=_method_name, error=iae)
@@ -1,5 +1,5 @@
 """
-Copyright (c) 2025, Oracle and/or its affiliates.
+Copyright (c) 2025, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 import os.path
@@ -17,6 +17,7 @@ class WalletCache(object):
     """
     Maintain a map of wallet directories to associated data.
     This helps to ensure that a wallet directory is only added to the archive once.
+    Wallet directories with identical content in different locations share a single archive path.
     Cache entry key is absolute source directory, entry value is this structure:
     {
         'wallet_name' : wallet_name,  # set to new value when a new entry is created
@@ -24,11 +25,13 @@ class WalletCache(object):
         'added_to_archive': add_to_archive  # True only if wallet has been added to archive
     }
     """
-    def __init__(self, model_context):
+    def __init__(self, model_context, content_cache=None):
         """
         :param model_context: used to get tool configuration
+        :param content_cache: optional ArchiveContentCache used to share identical wallet directories
         """
         self._model_context = model_context
+        self._content_cache = content_cache
         self._directory_path_cache = {}  # directory path to cache entry
         self._single_file_cache = {}     # single file path to archive path
         self._last_dir_name_index = 0
@@ -115,7 +118,15 @@ class WalletCache(object):
 
         if add_to_archive:
             archive_file = self._model_context.get_archive_file()
-            archive_path = archive_file.addDatabaseWallet(wallet_name, wallet_path)
+
+            def _add_wallet():
+                return archive_file.addDatabaseWallet(wallet_name, wallet_path)
+
+            if self._content_cache is not None and not treat_as_single_file:
+                archive_path = self._content_cache.find_or_add(
+                    WLSDeployArchive.ArchiveEntryType.DB_WALLET.name(), wallet_path, _add_wallet)
+            else:
+                archive_path = _add_wallet()
             archive_path = archive_path.rstrip(WLSDeployArchive.ZIP_SEP)
 
             if treat_as_single_file:
@@ -1,15 +1,13 @@
 """
-Copyright (c) 2020, 2025, Oracle and/or its affiliates.
+Copyright (c) 2020, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 from wlsdeploy.exception import exception_helper
 from wlsdeploy.logging.platform_logger import PlatformLogger
 from wlsdeploy.tool.util.targets import model_crd_helper
-from wlsdeploy.tool.util.targets import schema_helper
 from wlsdeploy.tool.modelhelp import model_help_utils
 from wlsdeploy.tool.modelhelp.model_help_utils import ControlOptions
 import wlsdeploy.util.unicode_helper as str_helper
-from wlsdeploy.util import dictionary_utils
 from wlsdeploy.util.exit_code import ExitCode
 
 DESCRIPTION_LINE_LENGTH_LIMIT = 80
@@ -84,14 +82,14 @@ class ModelCrdSectionPrinter(object):
                 indent = indent + 1
 
             if show_children:
-                schema = crd_folder.get_schema()
+                schema_node = crd_folder.get_root_node()
                 in_array = crd_folder.is_array()
 
                 if model_help_utils.show_attributes(control_option):
-                    in_array = self._print_attributes_sample(schema, indent, in_array)
+                    in_array = self._print_attributes_sample(schema_node, indent, in_array)
 
                 if model_help_utils.show_folders(control_option):
-                    self._print_subfolders_sample(schema, control_option, indent, folder_path, in_array)
+                    self._print_subfolders_sample(schema_node, control_option, indent, folder_path, in_array)
             else:
                 self._print_indent("# see " + folder_path, indent)
 
@@ -137,11 +135,9 @@ class ModelCrdSectionPrinter(object):
             token_index += 1
             indent += 1
 
-        schema = crd_folder.get_schema()
-
         # process elements inside kubernetes sub-folders
 
-        current_folder = schema
+        current_folder = crd_folder.get_root_node()
         for token in model_path_tokens[token_index:]:
             lookup_token = token
             option_key = None
@@ -152,7 +148,7 @@ class ModelCrdSectionPrinter(object):
                 lookup_token = parts[0]
                 option_key = parts[1]
 
-            properties = _get_properties(current_folder)
+            properties = current_folder.get_properties()
 
             valid_subfolder_keys = _get_folder_names(properties)
             valid_attribute_keys = _get_attribute_names(properties)
@@ -163,7 +159,7 @@ class ModelCrdSectionPrinter(object):
 
                 # find matching option if folder has multiple options, such as (.../folder#option)
                 token_suffix = ''
-                folder_options = schema_helper.get_one_of_options(current_folder)
+                folder_options = current_folder.get_options()
                 if folder_options and option_key is not None:
                     token_suffix = '  # ' + option_key
                     current_folder = self._find_folder_option(folder_options, option_key,
@@ -173,7 +169,7 @@ class ModelCrdSectionPrinter(object):
                 indent += 1
 
                 # apply to the next folder in the path
-                in_object_array = schema_helper.is_object_array(current_folder)
+                in_object_array = current_folder.is_object_array()
                 model_path = model_path + "/" + token
 
             elif is_last_token and model_help_utils.allow_attribute_path(path_option):
@@ -209,7 +205,7 @@ class ModelCrdSectionPrinter(object):
             raise ex
 
         # if this is a folder with multiple options, list the options and return
-        folder_options = schema_helper.get_one_of_options(current_folder)
+        folder_options = current_folder.get_options()
         if folder_options:
             self._print_folder_options(folder_options, model_path, indent)
             return
@@ -226,26 +222,25 @@ class ModelCrdSectionPrinter(object):
     def _print_subfolders_sample(self, schema_folder, control_option, indent_level, path, in_object_array):
         """
         Prints a model sample section for the folders in a model location.
-        :param schema_folder: the schema folder being printed
+        :param schema_folder: the compiled schema node being printed
         :param control_option: a command-line switch that controls what is output to STDOUT
         :param indent_level: the level to indent by, before printing output
         :param path: indicates path to request for child folder help
         :param in_object_array: if True, a hyphen is printed before the first attribute
         """
-        folder_info = _get_properties(schema_folder)
+        folder_info = schema_folder.get_properties()
         folder_map = dict()
         object_array_keys = []
 
         for key in folder_info:
-            property_map = folder_info[key]
+            property_node = folder_info[key]
 
-            if property_map is not None:
-                if schema_helper.is_single_object(property_map):
-                    folder_map[key] = property_map
+            if property_node.is_single_object():
+                folder_map[key] = property_node
 
-                elif schema_helper.is_object_array(property_map):
-                    folder_map[key] = schema_helper.get_array_item_info(property_map)
-                    object_array_keys.append(key)
+            elif property_node.is_object_array():
+                folder_map[key] = property_node
+                object_array_keys.append(key)
 
         folder_keys = list(folder_map.keys())
         folder_keys.sort()
@@ -275,19 +270,18 @@ class ModelCrdSectionPrinter(object):
     def _print_attributes_sample(self, schema_folder, indent_level, in_object_array):
         """
         Prints a model sample for the attributes in a model location
-        :param schema_folder: the schema folder to be printed
+        :param schema_folder: the compiled schema node to be printed
         :param indent_level: the level of indentation for this folder
         :param in_object_array: if True, a hyphen is printed before the first attribute
         :return: value of in_object_array, or False if an attribute was printed with a hyphen
         """
         attribute_map = dict()
-        properties = _get_properties(schema_folder)
+        properties = schema_folder.get_properties()
 
         for key in properties:
-            property_map = properties[key]
-            if property_map is not None:
-                if not schema_helper.is_object_type(property_map):
-                    attribute_map[key] = _get_attribute_type_label(property_map)
+            property_node = properties[key]
+            if not property_node.is_object_type():
+                attribute_map[key] = _get_attribute_type_label(property_node)
 
         if attribute_map:
             attr_list = attribute_map.keys()
@@ -320,7 +314,7 @@ class ModelCrdSectionPrinter(object):
         _method_name = '_find_folder_option'
 
         for folder_option in folder_options:
-            key = _get_kind_value(folder_option)
+            key = folder_option.get_kind_value()
             if key == option_key:
                 return folder_option
 
@@ -344,12 +338,12 @@ class ModelCrdSectionPrinter(object):
         """
         self._print_indent("# " + exception_helper.get_message('WLSDPLY-10114', len(folder_options)), indent_level)
         for index, one_of_option in enumerate(folder_options):
-            key = _get_kind_value(one_of_option) or index
+            key = one_of_option.get_kind_value() or index
             self._output_buffer.add_output()
             self._print_indent("# see " + model_path + "#" + str_helper.to_string(key), indent_level)
 
-    def _print_attribute_details(self, name, properties):
-        description = dictionary_utils.get_dictionary_element(properties, "description")
+    def _print_attribute_details(self, name, property_node):
+        description = property_node.get_description()
         if description:
             self._output_buffer.add_output('')
 
@@ -386,71 +380,44 @@ class ModelCrdSectionPrinter(object):
         self._output_buffer.add_output('%s%s' % (result, msg))
 
 
-def _get_properties(schema_folder):
-    # in array elements, the properties are under "items"
-    if schema_helper.is_object_array(schema_folder):
-        item_info = schema_helper.get_array_item_info(schema_folder)
-        return schema_helper.get_properties(item_info)
-    else:
-        return schema_helper.get_properties(schema_folder)
-
-
 def _get_folder_names(schema_properties):
     """
     Return the object keys (single or array) described by the schema properties.
-    :param schema_properties: the properties to be examined
+    :param schema_properties: the compiled property nodes to be examined
     :return: a list of folder names
     """
     folder_names = []
     for key in schema_properties:
-        property_map = schema_properties[key]
-        if property_map is not None:
-            if schema_helper.is_object_type(property_map):
-                folder_names.append(key)
+        if schema_properties[key].is_object_type():
+            folder_names.append(key)
     return folder_names
 
 
 def _get_attribute_names(schema_properties):
     """
     Return the object keys (single or array) described by the schema properties.
-    :param schema_properties: the properties to be examined
+    :param schema_properties: the compiled property nodes to be examined
     :return: a list of folder names
     """
     attribute_names = []
     for key in schema_properties:
-        property_map = schema_properties[key]
-        if property_map is not None:
-            if not schema_helper.is_object_type(property_map):
-                attribute_names.append(key)
+        if not schema_properties[key].is_object_type():
+            attribute_names.append(key)
     return attribute_names
 
 
-def _get_kind_value(folder_option):
-    """
-    Return the "kind" value of the specified folder option.
-    If the option doesn't have a kind value, return None.
-    :param folder_option: the folder option to be examined
-    :return: the value of the "kind" field, or None
-    """
-    properties = schema_helper.get_properties(folder_option)
-    kind = dictionary_utils.get_dictionary_element(properties, "kind")
-    enum = dictionary_utils.get_dictionary_element(kind, "enum")
-    if enum and len(enum):
-        return enum[0]
-
-
-def _get_attribute_type_label(property_map):
-    if schema_helper.is_simple_map(property_map):
+def _get_attribute_type_label(property_node):
+    if property_node.is_simple_map():
         # map of key / value pairs
         return 'properties'
 
-    elif schema_helper.is_simple_array(property_map):
+    elif property_node.is_simple_array():
         # array of simple type
-        return 'list of ' + schema_helper.get_array_element_type(property_map)
+        return 'list of ' + property_node.get_element_type()
 
     else:
-        type_text = schema_helper.get_type(property_map)
-        enum_values = schema_helper.get_enum_values(property_map)
+        type_text = property_node.get_type()
+        enum_values = property_node.get_enum_values()
         if enum_values:
             type_text += ' (' + ', '.join(enum_values) + ')'
         return type_text
@@ -0,0 +1,474 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+A precomputed, searchable index of the model folders and attributes for a WebLogic Server version.
+The index is built once from the aliases and the MBean help, and is stored as a JSON file.
+A stored index can be searched without loading the aliases.
+"""
+import difflib
+import os
+import re
+
+from oracle.weblogic.deploy.aliases import AliasException
+from oracle.weblogic.deploy.json import JsonException
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+from oracle.weblogic.deploy.util import WebLogicDeployToolingVersion
+from oracle.weblogic.deploy.util import WLSBeanHelp
+
+from wlsdeploy.aliases.location_context import LocationContext
+from wlsdeploy.aliases.model_constants import KNOWN_TOPLEVEL_MODEL_SECTIONS
+from wlsdeploy.aliases.wlst_modes import WlstModes
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.util import dictionary_utils
+from wlsdeploy.util import env_helper
+from wlsdeploy.util import path_helper
+import wlsdeploy.util.unicode_helper as str_helper
+
+INDEX_DIRECTORY = 'modelhelp'
+INDEX_FILE_PREFIX = 'modelHelpIndex-'
+INDEX_FILE_SUFFIX = '.json'
+
+# index file keys
+WDT_VERSION = 'wdtVersion'
+WLS_VERSION = 'wlsVersion'
+WLST_MODE = 'wlstMode'
+FOLDERS = 'folders'
+PATH = 'path'
+ATTRIBUTES = 'attributes'
+NAME = 'name'
+TYPE = 'type'
+DEFAULT = 'default'
+ACCESS = 'access'
+LEGAL_VALUES = 'legalValues'
+MIN = 'min'
+MAX = 'max'
+HELP = 'help'
+
+# the number of similar names suggested when a search has no results
+SUGGESTION_COUNT = 5
+
+_class_name = 'model_help_index'
+_logger = PlatformLogger('wlsdeploy.modelhelp')
+
+_word_pattern = re.compile(r'[a-z0-9]+')
+# characters that the JSON writer does not preserve are stored as %XX, and % itself is stored as %25
+_encode_pattern = re.compile(r'[%\\\x00-\x1f]')
+_decode_pattern = re.compile(r'%(u[0-9A-F]{4}|[0-9A-F]{2})')
+_camel_case_pattern = re.compile(r'[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+|[0-9]+')
+
+
+def get_index_file_name(wls_version, wlst_mode):
+    """
+    Get the relative path of the index file for a WebLogic Server version and WLST mode.
+    :param wls_version: the WebLogic Server version
+    :param wlst_mode: the WLST mode name, such as offline
+    :return: the relative path, such as modelhelp/modelHelpIndex-14.1.2.0.0-offline.json
+    """
+    return os.path.join(INDEX_DIRECTORY, '%s%s-%s%s' % (INDEX_FILE_PREFIX, wls_version, wlst_mode, INDEX_FILE_SUFFIX))
+
+
+def get_index(model_context, aliases_factory):
+    """
+    Get the index for the WebLogic Server version and WLST mode of the model context.
+    An index file from the custom configuration directory or the installation is used if it matches
+    the current versions. Otherwise, the index is built from the aliases and stored for the next use.
+    :param model_context: the model context
+    :param aliases_factory: a function that returns the Aliases object, called only if the index is built
+    :return: the ModelHelpIndex
+    """
+    _method_name = 'get_index'
+
+    wls_version = model_context.get_local_wls_version()
+    wlst_mode = WlstModes.from_value(model_context.get_target_wlst_mode()).lower()
+    index_file_name = get_index_file_name(wls_version, wlst_mode)
+
+    index_file = path_helper.get_path_helper().find_local_config_path(index_file_name)
+    index_dictionary = _read_index_file(index_file, wls_version, wlst_mode)
+    if index_dictionary is not None:
+        _logger.info('WLSDPLY-10148', index_file, class_name=_class_name, method_name=_method_name)
+        return ModelHelpIndex(index_dictionary)
+
+    _logger.info('WLSDPLY-10149', wls_version, wlst_mode, class_name=_class_name, method_name=_method_name)
+    index_dictionary = ModelHelpIndexBuilder(aliases_factory(), wls_version, wlst_mode).build()
+    _write_index_file(index_dictionary, _get_writable_index_file(index_file_name))
+    return ModelHelpIndex(index_dictionary)
+
+
+class ModelHelpIndexBuilder(object):
+    """
+    Builds the index dictionary by walking every model folder and attribute in the aliases.
+    Only the folders and attributes that are valid for the aliases version and WLST mode are included.
+    """
+    def __init__(self, aliases, wls_version, wlst_mode):
+        """
+        :param aliases: the aliases for the version and WLST mode
+        :param wls_version: the WebLogic Server version, recorded in the index
+        :param wlst_mode: the WLST mode name, recorded in the index
+        """
+        self._aliases = aliases
+        self._wls_version = wls_version
+        self._wlst_mode = wlst_mode
+        self._folders = []
+
+    def build(self):
+        """
+        Build the index dictionary.
+        :return: the index dictionary
+        """
+        self._folders = []
+        for section_name in KNOWN_TOPLEVEL_MODEL_SECTIONS:
+            attributes_location = self._aliases.get_model_section_attribute_location(section_name)
+            if attributes_location is not None:
+                self._add_folder(section_name + ':', attributes_location, include_folder_help=False)
+
+            model_location = LocationContext()
+            for folder_name in self._aliases.get_model_section_top_level_folder_names(section_name):
+                self._add_folder_tree(section_name + ':', model_location, folder_name)
+
+        result = OrderedDict()
+        result[WDT_VERSION] = WebLogicDeployToolingVersion.getVersion()
+        result[WLS_VERSION] = self._wls_version
+        result[WLST_MODE] = self._wlst_mode
+        result[FOLDERS] = self._folders
+        return result
+
+    def _add_folder_tree(self, parent_path, model_location, folder_name):
+        """
+        Add the folder and its sub-folders to the index.
+        :param parent_path: the model path of the parent folder
+        :param model_location: the location of the parent folder, restored before returning
+        :param folder_name: the name of the folder to add
+        """
+        _method_name = '_add_folder_tree'
+
+        folder_path = '%s/%s' % (parent_path, folder_name)
+        model_location.append_location(folder_name)
+        try:
+            try:
+                if not self._aliases.is_model_location_valid(model_location):
+                    return
+
+                name_token = self._aliases.get_name_token(model_location)
+                if name_token is not None:
+                    model_location.add_name_token(name_token, folder_name)
+
+                self._add_folder(folder_path, model_location)
+
+                subfolder_names = self._aliases.get_model_subfolder_names(model_location)
+                subfolder_names.sort()
+            except AliasException, ex:
+                # the folder is left out of the index, but the rest of the index can be built
+                _logger.fine('WLSDPLY-10154', folder_path, ex.getLocalizedMessage(),
+                             class_name=_class_name, method_name=_method_name)
+                return
+
+            for subfolder_name in subfolder_names:
+                self._add_folder_tree(folder_path, model_location, subfolder_name)
+        finally:
+            model_location.pop_location()
+
+    def _add_folder(self, folder_path, model_location, include_folder_help=True):
+        """
+        Add an entry for the folder and its attributes.
+        :param folder_path: the model path of the folder
+        :param model_location: the location of the folder
+        :param include_folder_help: True if the bean help for the folder should be included
+        """
+        online_bean = self._aliases.get_online_bean_name(model_location)
+
+        folder = OrderedDict()
+        folder[PATH] = folder_path
+        if include_folder_help:
+            _add_value(folder, HELP, WLSBeanHelp.getDescription(online_bean, None))
+
+        attributes = []
+        attribute_types = self._aliases.get_model_attribute_names_and_types(model_location)
+        attribute_names = attribute_types.keys()
+        attribute_names.sort()
+        for attribute_name in attribute_names:
+            attribute = OrderedDict()
+            attribute[NAME] = attribute_name
+            _add_value(attribute, TYPE, attribute_types[attribute_name])
+
+            default_value = self._aliases.get_model_attribute_default_value(model_location, attribute_name)
+            if default_value is not None:
+                _add_value(attribute, DEFAULT, str_helper.to_string(default_value))
+
+            _add_value(attribute, ACCESS, self._aliases.get_model_attribute_access(model_location, attribute_name))
+            _add_value(attribute, LEGAL_VALUES, list(WLSBeanHelp.getLegalValues(online_bean, attribute_name)))
+            _add_value(attribute, MIN, WLSBeanHelp.getLegalMin(online_bean, attribute_name))
+            _add_value(attribute, MAX, WLSBeanHelp.getLegalMax(online_bean, attribute_name))
+            _add_value(attribute, HELP, WLSBeanHelp.getDescription(online_bean, attribute_name))
+            attributes.append(attribute)
+
+        if attributes:
+            folder[ATTRIBUTES] = attributes
+        self._folders.append(folder)
+
+
+class SearchResults(object):
+    """
+    The results of an index search.
+    Name matches are folders and attributes with the search text as their name, ignoring case.
+    Text matches are other folders and attributes with every search word in their path, name, or help text.
+    Suggestions are similar names, only provided if there are no matches.
+    Each match is a tuple of (folder path, attribute dictionary or None for a folder).
+    """
+    def __init__(self, name_matches, text_matches, suggestions):
+        self.name_matches = name_matches
+        self.text_matches = text_matches
+        self.suggestions = suggestions
+
+    def has_matches(self):
+        return len(self.name_matches) > 0 or len(self.text_matches) > 0
+
+
+class ModelHelpIndex(object):
+    """
+    A searchable view of an index dictionary.
+    The name and word lookup tables are built once when the index is loaded.
+    """
+    def __init__(self, index_dictionary):
+        self._wls_version = dictionary_utils.get_element(index_dictionary, WLS_VERSION)
+
+        # entry number -> (folder path, attribute dictionary or None)
+        self._entries = []
+        # lower-case name -> list of entry numbers
+        self._names = {}
+        # word -> set of entry numbers
+        self._words = {}
+        # lower-case name -> name, for suggestions
+        self._name_cases = {}
+
+        for folder in dictionary_utils.get_element(index_dictionary, FOLDERS, []):
+            folder_path = folder[PATH]
+            folder_name = _get_folder_name(folder_path)
+            self._add_entry(folder_path, None, folder_name, dictionary_utils.get_element(folder, HELP))
+            for attribute in dictionary_utils.get_element(folder, ATTRIBUTES, []):
+                self._add_entry(folder_path, attribute, attribute[NAME], dictionary_utils.get_element(attribute, HELP))
+
+    def get_wls_version(self):
+        return self._wls_version
+
+    def get_entry_count(self):
+        return len(self._entries)
+
+    def search(self, search_text):
+        """
+        Search the index for folders and attributes.
+        :param search_text: a folder or attribute name, or words to be found
+        :return: the SearchResults
+        """
+        search_key = search_text.strip().lower()
+        name_numbers = dictionary_utils.get_element(self._names, search_key, [])
+
+        text_numbers = None
+        for word in _word_pattern.findall(search_key):
+            word_numbers = set(dictionary_utils.get_element(self._words, word, []))
+            # a word can also be part of a name, such as "timeout" in "ConnectTimeout"
+            for name, numbers in self._names.iteritems():
+                if word in name:
+                    word_numbers.update(numbers)
+
+            if text_numbers is None:
+                text_numbers = word_numbers
+            else:
+                text_numbers = text_numbers.intersection(word_numbers)
+
+        if text_numbers is None:
+            text_numbers = set()
+        text_numbers = text_numbers.difference(name_numbers)
+        text_numbers = list(text_numbers)
+        text_numbers.sort()
+
+        suggestions = []
+        if not name_numbers and not text_numbers:
+            close_names = difflib.get_close_matches(search_key, self._name_cases.keys(), SUGGESTION_COUNT)
+            for close_name in close_names:
+                suggestions.append(self._name_cases[close_name])
+
+        return SearchResults(self._get_entries(name_numbers), self._get_entries(text_numbers), suggestions)
+
+    def _add_entry(self, folder_path, attribute, name, help_text):
+        entry_number = len(self._entries)
+        self._entries.append((folder_path, attribute))
+
+        name_key = name.lower()
+        self._names.setdefault(name_key, []).append(entry_number)
+        self._name_cases[name_key] = name
+
+        words = _word_pattern.findall(folder_path.lower())
+        for name_word in _camel_case_pattern.findall(name):
+            words.append(name_word.lower())
+        if help_text:
+            words.extend(_word_pattern.findall(help_text.lower()))
+
+        for word in words:
+            word_entries = self._words.get(word)
+            if word_entries is None:
+                word_entries = set()
+                self._words[word] = word_entries
+            word_entries.add(entry_number)
+
+    def _get_entries(self, entry_numbers):
+        result = []
+        for entry_number in entry_numbers:
+            result.append(self._entries[entry_number])
+        return result
+
+
+def get_entry_path(entry):
+    """
+    Get the model path for a search result entry.
+    :param entry: a tuple of (folder path, attribute dictionary or None)
+    :return: the model path of the folder or attribute
+    """
+    folder_path, attribute = entry
+    if attribute is None:
+        return folder_path
+    return '%s/%s' % (folder_path, attribute[NAME])
+
+
+def _get_folder_name(folder_path):
+    slash_index = folder_path.rfind('/')
+    if slash_index < 0:
+        return folder_path.replace(':', '')
+    return folder_path[slash_index + 1:]
+
+
+def _add_value(dictionary, key, value):
+    """
+    Add the value to the dictionary, unless it is None or empty, to keep the index compact.
+    """
+    if value is not None and value != '' and value != []:
+        dictionary[key] = value
+
+
+def _read_index_file(index_file, wls_version, wlst_mode):
+    """
+    Read the index file, if it exists and matches the current versions.
+    :return: the index dictionary, or None if the index file cannot be used
+    """
+    _method_name = '_read_index_file'
+
+    if index_file is None or not os.path.isfile(index_file):
+        return None
+
+    try:
+        from wlsdeploy.json.json_translator import JsonToPython
+        index_dictionary = _convert_strings(JsonToPython(index_file).parse(), _decode_text)
+    except JsonException, ex:
+        _logger.warning('WLSDPLY-10153', index_file, ex.getLocalizedMessage(),
+                        class_name=_class_name, method_name=_method_name)
+        return None
+
+    wdt_version = WebLogicDeployToolingVersion.getVersion()
+    index_wdt_version = dictionary_utils.get_element(index_dictionary, WDT_VERSION)
+    index_wls_version = dictionary_utils.get_element(index_dictionary, WLS_VERSION)
+    index_wlst_mode = dictionary_utils.get_element(index_dictionary, WLST_MODE)
+    if index_wdt_version != wdt_version or index_wls_version != wls_version or index_wlst_mode != wlst_mode:
+        _logger.info('WLSDPLY-10152', index_file, index_wdt_version, index_wls_version,
+                     class_name=_class_name, method_name=_method_name)
+        return None
+
+    return index_dictionary
+
+
+def _get_writable_index_file(index_file_name):
+    """
+    Get the path for a new index file, in the custom configuration directory if it is set,
+    otherwise in the lib directory of the installation.
+    """
+    config_directory = env_helper.getenv(path_helper.PathHelper.CUSTOM_CONFIG_VARIABLE)
+    if not config_directory:
+        wls_deploy_path = path_helper.get_path_helper().get_local_wls_deploy_path()
+        if wls_deploy_path is None:
+            wls_deploy_path = ''
+        config_directory = os.path.join(wls_deploy_path, 'lib')
+    return os.path.join(config_directory, index_file_name)
+
+
+def _write_index_file(index_dictionary, index_file):
+    """
+    Write the index file. A failure is logged, and the index is used for this run only.
+    """
+    _method_name = '_write_index_file'
+
+    try:
+        index_directory = os.path.dirname(index_file)
+        if not os.path.isdir(index_directory):
+            os.makedirs(index_directory)
+
+        from wlsdeploy.json.json_translator import PythonToJson
+        PythonToJson(_convert_strings(index_dictionary, _encode_text)).write_to_json_file(index_file)
+        _logger.info('WLSDPLY-10150', index_file, class_name=_class_name, method_name=_method_name)
+    except JsonException, ex:
+        _logger.warning('WLSDPLY-10151', index_file, ex.getLocalizedMessage(),
+                        class_name=_class_name, method_name=_method_name)
+    except (IOError, OSError), ex:
+        _logger.warning('WLSDPLY-10151', index_file, str_helper.to_string(ex),
+                        class_name=_class_name, method_name=_method_name)
+
+
+def _convert_strings(value, convert_function):
+    """
+    Copy the index dictionary, list, or value, converting each string value with the function.
+    Dictionary keys are not converted.
+    """
+    if isinstance(value, dict):
+        result = OrderedDict()
+        for key, item in value.iteritems():
+            result[key] = _convert_strings(item, convert_function)
+        return result
+    if isinstance(value, list):
+        result = []
+        for item in value:
+            result.append(_convert_strings(item, convert_function))
+        return result
+    if isinstance(value, basestring):
+        return convert_function(value)
+    return value
+
+
+def _encode_text(text):
+    """
+    Encode the text so that it is written to the JSON file and read back exactly.
+    The JSON writer does not preserve backslashes and control characters such as newlines,
+    and removes leading and trailing whitespace, so these characters are stored as %XX or %uXXXX.
+    """
+    result = _encode_pattern.sub(_encode_match, text)
+    stripped = result.strip()
+    if len(stripped) != len(result):
+        leading_count = len(result) - len(result.lstrip())
+        trailing_count = len(result) - len(result.rstrip())
+        result = _encode_characters(result[:leading_count]) + stripped + \
+            _encode_characters(result[len(result) - trailing_count:])
+    return result
+
+
+def _decode_text(text):
+    """
+    Decode the text that was encoded by _encode_text.
+    """
+    if '%' not in text:
+        return text
+    return _decode_pattern.sub(_decode_match, text)
+
+
+def _encode_match(match):
+    return '%%%02X' % ord(match.group(0))
+
+
+def _encode_characters(text):
+    result = ''
+    for character in text:
+        result += '%%u%04X' % ord(character)
+    return result
+
+
+def _decode_match(match):
+    code = match.group(1)
+    if code.startswith('u'):
+        return unichr(int(code[1:], 16))
+    return chr(int(code, 16))
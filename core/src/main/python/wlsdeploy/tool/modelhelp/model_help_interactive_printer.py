@@ -1,5 +1,5 @@
 """
-Copyright (c) 2020, 2024, Oracle and/or its affiliates.
+Copyright (c) 2020, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 import re
@@ -48,7 +48,7 @@ class ModelHelpInteractivePrinter(ModelHelpPrinter):
             from org.jline.reader import LineReaderBuilder
             from org.jline.reader.impl.completer import StringsCompleter
 
-            completer = StringsCompleter(['cat', 'cd', 'ls', 'top', 'exit'])
+            completer = StringsCompleter(['cat', 'cd', 'find', 'ls', 'top', 'exit'])
             terminal = TerminalBuilder.terminal()
             reader = LineReaderBuilder.builder().terminal(terminal).completer(completer).build()
 
@@ -88,6 +88,10 @@ class ModelHelpInteractivePrinter(ModelHelpPrinter):
                 for line in history:
                     self._output_buffer.add_output(line)
 
+            elif command_str.startswith('find '):
+                # the search text may contain several words
+                self.print_search_results(command_str[5:].strip(), print_output=False)
+
             elif len(command_str.split()) > 2:
                 self._output_buffer.clear()
                 self._output_buffer.add_output()
@@ -242,6 +246,7 @@ class ModelHelpInteractivePrinter(ModelHelpPrinter):
         self._add_message('WLSDPLY-10127', prefix='  top, cd, cd /, cd top   - ')
         self._add_message('WLSDPLY-10128', prefix='  cd [path]               - ')
         self._add_message('WLSDPLY-10140', prefix='  cat [path]              - ')
+        self._add_message('WLSDPLY-10147', prefix='  find [text]             - ')
         self._add_message('WLSDPLY-10129', prefix='  history                 - ')
         self._add_message('WLSDPLY-10130', prefix='  exit                    - ')
         self._output_buffer.add_output()
@@ -261,6 +266,8 @@ class ModelHelpInteractivePrinter(ModelHelpPrinter):
         self._output_buffer.add_output('  cd topology:/Server/Log/StdoutSeverity')
         self._output_buffer.add_output('  cd /Server/Log/StdoutSeverity')
         self._output_buffer.add_output('  cd ../../../ServerTemplate/DynamicServers')
+        self._output_buffer.add_output('  find ListenPort')
+        self._output_buffer.add_output('  find timeout')
         self._output_buffer.add_output()
 
     def _handle_error_message(self, key, *args):
@@ -1,13 +1,15 @@
 """
-Copyright (c) 2020, 2023, Oracle and/or its affiliates.
+Copyright (c) 2020, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 import re
 
 
+from wlsdeploy.aliases.aliases import Aliases
 from wlsdeploy.aliases.model_constants import CRD_MODEL_SECTIONS
 from wlsdeploy.aliases.model_constants import KNOWN_TOPLEVEL_MODEL_SECTIONS
 from wlsdeploy.exception import exception_helper
+from wlsdeploy.tool.modelhelp import model_help_index
 from wlsdeploy.tool.modelhelp.model_help_utils import ControlOptions
 from wlsdeploy.tool.modelhelp.model_crd_section_printer import ModelCrdSectionPrinter
 from wlsdeploy.tool.modelhelp.model_help_utils import PathOptions
@@ -57,13 +59,14 @@ class ModelHelpPrinter(object):
     def __init__(self, model_context, aliases, logger):
         """
         :param model_context: The model context
-        :param aliases: A reference to an Aliases class instance
+        :param aliases: A reference to an Aliases class instance, or None if it is only loaded when needed
         :param logger: A reference to the platform logger to write to, if a log entry needs to be made
         """
         self._logger = logger
         self._aliases = aliases
         self._model_context = model_context
         self._output_buffer = ModelHelpOutputBuffer()
+        self._index = None
 
     def get_output_buffer(self):
         return self._output_buffer
@@ -113,6 +116,63 @@ class ModelHelpPrinter(object):
         if print_output:
             self._output_buffer.print_output()
 
+    def print_search_results(self, search_text, print_output=True):
+        """
+        Prints the folders and attributes that match the search text, using the model help index.
+        The index is loaded or built the first time it is needed.
+        :param search_text: a folder or attribute name, or words to be found in names and descriptions
+        :param print_output: determine if the result is printed to the output
+        """
+        if self._index is None:
+            self._index = model_help_index.get_index(self._model_context, self._get_aliases)
+
+        results = self._index.search(search_text)
+
+        self._output_buffer.add_output()
+        self._output_buffer.add_message('WLSDPLY-10142', search_text, self._index.get_wls_version())
+
+        if results.name_matches:
+            self._output_buffer.add_output()
+            self._output_buffer.add_message('WLSDPLY-10143', search_text)
+            self._add_search_entries(results.name_matches)
+
+        if results.text_matches:
+            self._output_buffer.add_output()
+            self._output_buffer.add_message('WLSDPLY-10144', search_text)
+            self._add_search_entries(results.text_matches)
+
+        if not results.has_matches():
+            self._output_buffer.add_output()
+            self._output_buffer.add_message('WLSDPLY-10145', search_text)
+            if results.suggestions:
+                self._output_buffer.add_message('WLSDPLY-10146', ', '.join(results.suggestions))
+
+        if print_output:
+            self._output_buffer.print_output()
+
+    def _add_search_entries(self, entries):
+        """
+        Add a line for each search result entry, with the type and default value of attributes.
+        :param entries: the search result entries
+        """
+        for entry in entries:
+            entry_path = model_help_index.get_entry_path(entry)
+            attribute = entry[1]
+            if attribute is None:
+                self._output_buffer.add_output('    %s/' % entry_path)
+                continue
+
+            line = '    %s # %s' % (entry_path, attribute.get(model_help_index.TYPE, ''))
+            default_value = attribute.get(model_help_index.DEFAULT)
+            if default_value is not None:
+                line += ' (default=%s)' % default_value
+            self._output_buffer.add_output(line)
+
+    def _get_aliases(self):
+        if self._aliases is None:
+            self._aliases = Aliases(self._model_context, wlst_mode=self._model_context.get_target_wlst_mode())
+        return self._aliases
+
     def _parse_model_path(self, model_path):
         """
         Parse the specified model_path into a Python list of elements.
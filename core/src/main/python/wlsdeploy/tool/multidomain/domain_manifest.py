@@ -0,0 +1,243 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+The manifest for the multi-domain runner, listing the domains and the tool to run for each one.
+"""
+import os
+import re
+
+from wlsdeploy.exception import exception_helper
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.util import dictionary_utils
+from wlsdeploy.util.cla_utils import CommandLineArgUtil
+from wlsdeploy.util.exit_code import ExitCode
+
+# top-level manifest keys
+MAX_PARALLEL = 'maxParallel'
+COMMON_MODEL_FILES = 'commonModelFiles'
+DOMAINS = 'domains'
+
+# domain keys
+NAME = 'name'
+TOOL = 'tool'
+ORACLE_HOME = 'oracleHome'
+DOMAIN_HOME = 'domainHome'
+DOMAIN_TYPE = 'domainType'
+MODEL_FILES = 'modelFiles'
+VARIABLE_FILES = 'variableFiles'
+ARCHIVE_FILES = 'archiveFiles'
+ARGS = 'args'
+
+# tools that can be run for a domain
+CREATE_DOMAIN_TOOL = 'createDomain'
+DEPLOY_APPS_TOOL = 'deployApps'
+UPDATE_DOMAIN_TOOL = 'updateDomain'
+VALIDATE_MODEL_TOOL = 'validateModel'
+
+ALL_TOOLS = [
+    CREATE_DOMAIN_TOOL,
+    DEPLOY_APPS_TOOL,
+    UPDATE_DOMAIN_TOOL,
+    VALIDATE_MODEL_TOOL
+]
+
+_MANIFEST_KEYS = [MAX_PARALLEL, COMMON_MODEL_FILES, DOMAINS]
+_DOMAIN_KEYS = [NAME, TOOL, ORACLE_HOME, DOMAIN_HOME, DOMAIN_TYPE, COMMON_MODEL_FILES, MODEL_FILES,
+                VARIABLE_FILES, ARCHIVE_FILES, ARGS]
+
+_DEFAULT_MAX_PARALLEL = 4
+
+# domain names are used as directory names in the output directory
+_NAME_PATTERN = re.compile('^[A-Za-z0-9_.-]+$')
+
+_class_name = 'DomainManifest'
+_logger = PlatformLogger('wlsdeploy.multidomain')
+
+
+class DomainManifest(object):
+    """
+    The validated contents of a multi-domain manifest file.
+    """
+
+    def __init__(self, manifest_dict, manifest_dir):
+        """
+        Create a manifest from the contents of a manifest file.
+        :param manifest_dict: the dictionary parsed from the manifest file
+        :param manifest_dir: the directory of the manifest file, used to resolve relative file paths
+        :raises CLAException: if the manifest is not valid
+        """
+        _method_name = '__init__'
+
+        _check_keys(manifest_dict, _MANIFEST_KEYS, 'manifest')
+
+        self._max_parallel = dictionary_utils.get_element(manifest_dict, MAX_PARALLEL)
+        if self._max_parallel is None:
+            self._max_parallel = _DEFAULT_MAX_PARALLEL
+        if not isinstance(self._max_parallel, (int, long)) or self._max_parallel < 1:
+            ex = exception_helper.create_cla_exception(ExitCode.ARG_VALIDATION_ERROR, 'WLSDPLY-33401',
+                                                       MAX_PARALLEL, self._max_parallel)
+            _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+            raise ex
+
+        common_model_files = _get_path_list(manifest_dict, COMMON_MODEL_FILES, 'manifest', manifest_dir)
+
+        domain_dicts = dictionary_utils.get_element(manifest_dict, DOMAINS)
+        if not isinstance(domain_dicts, list) or len(domain_dicts) == 0:
+            ex = exception_helper.create_cla_exception(ExitCode.ARG_VALIDATION_ERROR, 'WLSDPLY-33406', DOMAINS)
+            _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+            raise ex
+
+        self._domains = []
+        for domain_dict in domain_dicts:
+            domain = DomainEntry(domain_dict, manifest_dir, common_model_files)
+            for existing in self._domains:
+                if existing.name == domain.name:
+                    ex = exception_helper.create_cla_exception(ExitCode.ARG_VALIDATION_ERROR, 'WLSDPLY-33408',
+                                                               domain.name)
+                    _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+                    raise ex
+            self._domains.append(domain)
+
+    def get_max_parallel(self):
+        """
+        Get the maximum number of domains that are processed at the same time.
+        :return: the maximum number of domains
+        """
+        return self._max_parallel
+
+    def get_domains(self):
+        """
+        Get the domain entries, in manifest order.
+        :return: a list of DomainEntry objects
+        """
+        return list(self._domains)
+
+    def get_common_model_file_sets(self):
+        """
+        Get each distinct set of common model files used by the domains, in the order they are first used.
+        :return: a list of tuples of model file paths
+        """
+        result = []
+        for domain in self._domains:
+            if domain.common_model_files and domain.common_model_files not in result:
+                result.append(domain.common_model_files)
+        return result
+
+
+class DomainEntry(object):
+    """
+    A domain in the manifest, with the tool to run and its model, variable, and archive files.
+    """
+
+    def __init__(self, domain_dict, manifest_dir, common_model_files):
+        """
+        :param domain_dict: the dictionary for the domain from the manifest
+        :param manifest_dir: the directory of the manifest file, used to resolve relative file paths
+        :param common_model_files: the manifest common model files, used if the domain does not specify them
+        :raises CLAException: if the domain entry is not valid
+        """
+        _method_name = '__init__'
+
+        if not isinstance(domain_dict, dict):
+            ex = exception_helper.create_cla_exception(ExitCode.ARG_VALIDATION_ERROR, 'WLSDPLY-33407', DOMAINS)
+            _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+            raise ex
+
+        self.name = dictionary_utils.get_element(domain_dict, NAME)
+        if not isinstance(self.name, basestring) or not _NAME_PATTERN.match(self.name):
+            ex = exception_helper.create_cla_exception(ExitCode.ARG_VALIDATION_ERROR, 'WLSDPLY-33403', self.name)
+            _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+            raise ex
+
+        location = DOMAINS + '/' + self.name
+        _check_keys(domain_dict, _DOMAIN_KEYS, location)
+
+        self.tool = dictionary_utils.get_element(domain_dict, TOOL)
+        if self.tool not in ALL_TOOLS:
+            ex = exception_helper.create_cla_exception(ExitCode.ARG_VALIDATION_ERROR, 'WLSDPLY-33402', self.name,
+                                                       self.tool, ', '.join(ALL_TOOLS))
+            _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+            raise ex
+
+        self.oracle_home = dictionary_utils.get_element(domain_dict, ORACLE_HOME)
+        self.domain_home = dictionary_utils.get_element(domain_dict, DOMAIN_HOME)
+        self.domain_type = dictionary_utils.get_element(domain_dict, DOMAIN_TYPE)
+
+        if COMMON_MODEL_FILES in domain_dict:
+            self.common_model_files = _get_path_list(domain_dict, COMMON_MODEL_FILES, location, manifest_dir)
+        else:
+            self.common_model_files = common_model_files
+        self.model_files = _get_path_list(domain_dict, MODEL_FILES, location, manifest_dir)
+        self.variable_files = _get_path_list(domain_dict, VARIABLE_FILES, location, manifest_dir)
+        self.archive_files = _get_path_list(domain_dict, ARCHIVE_FILES, location, manifest_dir)
+        self.args = _get_string_list(domain_dict, ARGS, location)
+
+        if not self.common_model_files and not self.model_files:
+            ex = exception_helper.create_cla_exception(ExitCode.ARG_VALIDATION_ERROR, 'WLSDPLY-33404', self.name)
+            _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+            raise ex
+
+    def get_tool_arguments(self, oracle_home, common_model_file=None):
+        """
+        Get the command-line arguments for the tool script.
+        The common model files are first in the model file list, so the domain model files are merged into them.
+        :param oracle_home: the Oracle Home to use if the domain does not specify one
+        :param common_model_file: the merged common model file, or None to use the common model files
+        :return: a list of arguments
+        """
+        arguments = [CommandLineArgUtil.ORACLE_HOME_SWITCH, self.oracle_home or oracle_home]
+        if self.domain_home:
+            arguments.extend([CommandLineArgUtil.DOMAIN_HOME_SWITCH, self.domain_home])
+        if self.domain_type:
+            arguments.extend([CommandLineArgUtil.DOMAIN_TYPE_SWITCH, self.domain_type])
+
+        if common_model_file is not None:
+            model_files = [common_model_file] + list(self.model_files)
+        else:
+            model_files = list(self.common_model_files) + list(self.model_files)
+        arguments.extend([CommandLineArgUtil.MODEL_FILE_SWITCH, ','.join(model_files)])
+
+        if self.variable_files:
+            arguments.extend([CommandLineArgUtil.VARIABLE_FILE_SWITCH, ','.join(self.variable_files)])
+        if self.archive_files:
+            arguments.extend([CommandLineArgUtil.ARCHIVE_FILE_SWITCH, ','.join(self.archive_files)])
+        arguments.extend(self.args)
+        return arguments
+
+
+def _check_keys(dictionary, valid_keys, location):
+    _method_name = '_check_keys'
+
+    for key in dictionary:
+        if key not in valid_keys:
+            ex = exception_helper.create_cla_exception(ExitCode.ARG_VALIDATION_ERROR, 'WLSDPLY-33400', key,
+                                                       location, ', '.join(valid_keys))
+            _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+            raise ex
+
+
+def _get_string_list(dictionary, key, location):
+    _method_name = '_get_string_list'
+
+    value = dictionary_utils.get_element(dictionary, key)
+    if value is None:
+        return []
+
+    if not isinstance(value, list) or [item for item in value if not isinstance(item, basestring)]:
+        ex = exception_helper.create_cla_exception(ExitCode.ARG_VALIDATION_ERROR, 'WLSDPLY-33405', key, location)
+        _logger.throwing(ex, class_name=_class_name, method_name=_method_name)
+        raise ex
+    return list(value)
+
+
+def _get_path_list(dictionary, key, location, manifest_dir):
+    """
+    Get a tuple of absolute file paths, resolving relative paths against the manifest directory.
+    """
+    result = []
+    for path in _get_string_list(dictionary, key, location):
+        if not os.path.isabs(path):
+            path = os.path.join(manifest_dir, path)
+        result.append(os.path.normpath(path))
+    return tuple(result)
@@ -0,0 +1,328 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+Runs the tool for each domain in a multi-domain manifest, and creates the summary of the results.
+Each domain is processed by the installed tool script in a separate process, since WLST allows only one
+session in each JVM. Each process has its own model context, output file, and log directory.
+Each distinct set of common model files is parsed and merged once, and the merged model is passed to every
+domain that shares that set, so the shared files are not parsed and merged again for each domain.
+Variable tokens are not resolved in the merged model, so each domain resolves them with its own variable files.
+"""
+import exceptions
+import os
+import time
+
+from java.io import File as JFile
+from java.lang import Exception as JException
+from java.lang import ProcessBuilder
+from java.lang import System as JSystem
+
+from oracle.weblogic.deploy.json import JsonException
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+
+from wlsdeploy.exception import exception_helper
+from wlsdeploy.json.json_translator import PythonToJson
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.util import cla_helper
+from wlsdeploy.util import env_helper
+from wlsdeploy.util import parallel_utils
+from wlsdeploy.util import variables
+from wlsdeploy.util.exit_code import ExitCode
+from wlsdeploy.util.model_translator import FileToPython
+from wlsdeploy.yaml.yaml_translator import PythonToYaml
+
+SUMMARY_FILE_NAME = 'multi-domain-summary.json'
+
+# summary keys
+TIMESTAMP = 'timestamp'
+DOMAIN_COUNT = 'domainCount'
+FAILED_COUNT = 'failedCount'
+DOMAINS = 'domains'
+NAME = 'name'
+TOOL = 'tool'
+EXIT_CODE = 'exitCode'
+STATUS = 'status'
+ELAPSED_MILLIS = 'elapsedMillis'
+OUTPUT_FILE = 'outputFile'
+LOG_DIRECTORY = 'logDirectory'
+
+# domain status values
+OK_STATUS = 'ok'
+WARNING_STATUS = 'warning'
+ERROR_STATUS = 'error'
+
+# exit codes that complete the tool, but should be reviewed
+_WARNING_EXIT_CODES = [ExitCode.WARNING, ExitCode.RESTART_REQUIRED, ExitCode.CANCEL_CHANGES_IF_RESTART]
+
+_COMMON_DIR_NAME = 'common'
+_COMMON_MODEL_FILE_PREFIX = 'common-model-'
+_LOG_DIR_NAME = 'logs'
+_TOOL_OUTPUT_SUFFIX = '-output.log'
+_LOG_DIRECTORY_VARIABLE = 'WLSDEPLOY_LOG_DIRECTORY'
+
+_class_name = 'MultiDomainRunner'
+_logger = PlatformLogger('wlsdeploy.multidomain')
+
+
+class DomainResult(object):
+    """
+    The result of running the tool for one domain.
+    """
+    def __init__(self, domain, exit_code, elapsed_millis, output_file, log_dir):
+        """
+        :param domain: the DomainEntry
+        :param exit_code: the exit code of the tool script
+        :param elapsed_millis: the elapsed time of the tool, in milliseconds
+        :param output_file: the file with the output of the tool script
+        :param log_dir: the log directory of the tool
+        """
+        self.domain = domain
+        self.exit_code = exit_code
+        self.elapsed_millis = elapsed_millis
+        self.output_file = output_file
+        self.log_dir = log_dir
+
+
+class MultiDomainRunner(object):
+    """
+    Runs the tool for each domain in the manifest, with up to the manifest maximum running at the same time.
+    """
+
+    def __init__(self, model_context, manifest):
+        """
+        :param model_context: the model context for the multi-domain runner
+        :param manifest: the DomainManifest
+        """
+        self._model_context = model_context
+        self._manifest = manifest
+        self._output_dir = model_context.get_output_dir()
+        self._script_dir = os.path.join(env_helper.getenv('WLSDEPLOY_HOME', ''), 'bin')
+        self._common_model_files = {}
+
+    def run(self):
+        """
+        Merge the common model files, then run the tool for each domain.
+        :return: a list of DomainResult objects, in manifest order
+        :raises TranslateException: if a common model file cannot be parsed
+        :raises YamlException: if a merged common model file cannot be written
+        """
+        _method_name = 'run'
+        _logger.entering(class_name=_class_name, method_name=_method_name)
+
+        self._merge_common_model_files()
+        results = parallel_utils.run_parallel(self._run_domain, self._manifest.get_domains(),
+                                              self._manifest.get_max_parallel())
+
+        _logger.exiting(class_name=_class_name, method_name=_method_name, result=len(results))
+        return results
+
+    def _merge_common_model_files(self):
+        """
+        Merge each distinct set of common model files into a single model file in the output directory.
+        Variable tokens are not resolved, so each domain resolves them with its own variable files.
+        A set is not merged if a model name in one file could match a name in another file only after
+        variables are resolved, and the domains that use that set are given the common model files instead.
+        """
+        _method_name = '_merge_common_model_files'
+
+        common_dir = os.path.join(self._output_dir, _COMMON_DIR_NAME)
+        index = 1
+        for file_set in self._manifest.get_common_model_file_sets():
+            merged_model = merge_common_model_files(file_set)
+            if merged_model is None:
+                _logger.info('WLSDPLY-33409', ', '.join(file_set), class_name=_class_name, method_name=_method_name)
+                continue
+
+            if not os.path.isdir(common_dir):
+                os.makedirs(common_dir)
+            merged_file = os.path.join(common_dir, _COMMON_MODEL_FILE_PREFIX + str(index) + '.yaml')
+            PythonToYaml(merged_model).write_to_yaml_file(merged_file)
+            self._common_model_files[file_set] = merged_file
+            _logger.info('WLSDPLY-33410', ', '.join(file_set), merged_file,
+                         class_name=_class_name, method_name=_method_name)
+            index += 1
+
+    def _run_domain(self, domain):
+        """
+        Run the tool script for the domain, with its output and logs in the domain output directory.
+        Failures are logged and returned in the result, so the other domains are not affected.
+        :param domain: the DomainEntry
+        :return: the DomainResult
+        """
+        _method_name = '_run_domain'
+
+        domain_dir = os.path.join(self._output_dir, domain.name)
+        log_dir = os.path.join(domain_dir, _LOG_DIR_NAME)
+        output_file = os.path.join(domain_dir, domain.tool + _TOOL_OUTPUT_SUFFIX)
+
+        start_time = JSystem.currentTimeMillis()
+        exit_code = ExitCode.ERROR
+        try:
+            script = self._get_tool_script(domain.tool)
+            if not os.path.isfile(script):
+                _logger.severe('WLSDPLY-33413', domain.tool, domain.name, script,
+                               class_name=_class_name, method_name=_method_name)
+            else:
+                if not os.path.isdir(log_dir):
+                    os.makedirs(log_dir)
+
+                command = [script]
+                common_model_file = self._common_model_files.get(domain.common_model_files)
+                command.extend(domain.get_tool_arguments(self._model_context.get_oracle_home(), common_model_file))
+
+                _logger.info('WLSDPLY-33411', domain.tool, domain.name, output_file,
+                             class_name=_class_name, method_name=_method_name)
+                exit_code = self._run_tool(command, log_dir, output_file)
+        except (exceptions.Exception, JException), ex:
+            _logger.severe('WLSDPLY-33414', domain.tool, domain.name, str(ex), error=ex,
+                           class_name=_class_name, method_name=_method_name)
+
+        elapsed_millis = JSystem.currentTimeMillis() - start_time
+        _logger.info('WLSDPLY-33412', domain.tool, domain.name, exit_code, elapsed_millis,
+                     class_name=_class_name, method_name=_method_name)
+        return DomainResult(domain, exit_code, elapsed_millis, output_file, log_dir)
+
+    def _get_tool_script(self, tool_name):
+        """
+        Get the path of the installed script for the tool.
+        :return: the script path
+        """
+        script_extension = '.sh'
+        if JSystem.getProperty('os.name').startswith('Windows'):
+            script_extension = '.cmd'
+        return os.path.join(self._script_dir, tool_name + script_extension)
+
+    def _run_tool(self, command, log_dir, output_file):
+        """
+        Run the tool script in a separate process, and wait for it to complete.
+        :param command: the script and its arguments
+        :param log_dir: the log directory for the tool
+        :param output_file: the file for the output of the tool script
+        :return: the exit code of the tool script
+        """
+        process_builder = ProcessBuilder(command)
+        process_builder.environment().put(_LOG_DIRECTORY_VARIABLE, log_dir)
+        process_builder.redirectErrorStream(True)
+        process_builder.redirectOutput(JFile(output_file))
+        process = process_builder.start()
+
+        # the tools cannot prompt for input, so passwords must be provided with arguments
+        process.getOutputStream().close()
+        return process.waitFor()
+
+
+def merge_common_model_files(file_set):
+    """
+    Parse and merge the common model files, without resolving variable tokens.
+    Names with @@ENV tokens are resolved for matching, as they are in each domain tool.
+    :param file_set: the tuple of common model files, in merge order
+    :return: the merged model dictionary, or None if a name could match only after variables are resolved
+    :raises TranslateException: if a common model file cannot be parsed
+    """
+    merged_model = OrderedDict()
+    for model_file in file_set:
+        model = FileToPython(model_file, True).parse()
+        if _has_variable_name_match(merged_model, model):
+            return None
+        cla_helper.merge_model_dictionaries(merged_model, model, None)
+    return merged_model
+
+
+def _has_variable_name_match(dictionary, new_dictionary):
+    """
+    Determine if a key in the new dictionary could match a different key in the existing dictionary
+    after variables are resolved. Keys that are the same text always match, and do not depend on variables.
+    :param dictionary: the existing dictionary
+    :param new_dictionary: the dictionary to be merged into it
+    :return: True if the merge could depend on the variables of a domain
+    """
+    if not isinstance(dictionary, dict) or not isinstance(new_dictionary, dict):
+        return False
+
+    variable_keys = [key for key in dictionary if variables.has_variables(key)]
+    for new_key in new_dictionary:
+        if new_key in dictionary:
+            if _has_variable_name_match(dictionary[new_key], new_dictionary[new_key]):
+                return True
+        elif len(dictionary) > 0 and (variables.has_variables(new_key) or len(variable_keys) > 0):
+            return True
+    return False
+
+
+def get_status(exit_code):
+    """
+    Get the summary status for a tool exit code.
+    :param exit_code: the exit code of the tool
+    :return: the status value
+    """
+    if exit_code == ExitCode.OK:
+        return OK_STATUS
+    if exit_code in _WARNING_EXIT_CODES:
+        return WARNING_STATUS
+    return ERROR_STATUS
+
+
+def get_exit_code(results):
+    """
+    Get the exit code of the multi-domain runner from the domain results.
+    :param results: the list of DomainResult objects
+    :return: ExitCode.ERROR if any domain failed, ExitCode.WARNING if any domain completed with a warning,
+        otherwise ExitCode.OK
+    """
+    statuses = [get_status(result.exit_code) for result in results]
+    if ERROR_STATUS in statuses:
+        return ExitCode.ERROR
+    if WARNING_STATUS in statuses:
+        return ExitCode.WARNING
+    return ExitCode.OK
+
+
+def create_summary(results):
+    """
+    Create a summary dictionary from the domain results.
+    :param results: the list of DomainResult objects
+    :return: the summary dictionary
+    """
+    domains = []
+    failed_count = 0
+    for result in results:
+        status = get_status(result.exit_code)
+        if status == ERROR_STATUS:
+            failed_count += 1
+
+        domain = OrderedDict()
+        domain[NAME] = result.domain.name
+        domain[TOOL] = result.domain.tool
+        domain[EXIT_CODE] = result.exit_code
+        domain[STATUS] = status
+        domain[ELAPSED_MILLIS] = result.elapsed_millis
+        domain[OUTPUT_FILE] = result.output_file
+        domain[LOG_DIRECTORY] = result.log_dir
+        domains.append(domain)
+
+    summary = OrderedDict()
+    summary[TIMESTAMP] = time.strftime('%Y-%m-%dT%H:%M:%S')
+    summary[DOMAIN_COUNT] = len(results)
+    summary[FAILED_COUNT] = failed_count
+    summary[DOMAINS] = domains
+    return summary
+
+
+def write_summary(summary, summary_file):
+    """
+    Write the summary to a JSON file.
+    :param summary: the summary dictionary
+    :param summary_file: the file to be written
+    :raises CLAException: if the file cannot be written
+    """
+    _method_name = 'write_summary'
+
+    try:
+        PythonToJson(summary).write_to_json_file(summary_file)
+    except JsonException, ex:
+        cla_ex = exception_helper.create_cla_exception(ExitCode.ERROR, 'WLSDPLY-33416', summary_file,
+                                                       ex.getLocalizedMessage(), error=ex)
+        _logger.throwing(cla_ex, class_name=_class_name, method_name=_method_name)
+        raise cla_ex
+    _logger.info('WLSDPLY-33415', summary_file, class_name=_class_name, method_name=_method_name)
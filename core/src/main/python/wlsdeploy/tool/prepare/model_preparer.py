@@ -1,5 +1,5 @@
 """
-Copyright (c) 2021, 2024, Oracle and/or its affiliates.
+Copyright (c) 2021, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 
@@ -28,7 +28,7 @@ from wlsdeploy.tool.validate.content_validator import ContentValidator
 from wlsdeploy.tool.validate.validator import Validator
 from wlsdeploy.util import cla_helper
 from wlsdeploy.util import target_configuration_helper
-import wlsdeploy.util.unicode_helper as str_helper
+from wlsdeploy.util import token_index
 from wlsdeploy.util.model import Model
 from wlsdeploy.util.model_translator import FileToPython
 from wlsdeploy.yaml.yaml_translator import PythonToYaml
@@ -102,31 +102,13 @@ class ModelPreparer:
         # a warning is issued in inject_variables_keyword_file() if that was the case.
         return variable_model
 
-    def _add_model_variables(self, model_dictionary, all_variables):
-        """
-        Add any variable values found in the model dictionary to the variables list
-        :param model_dictionary: the dictionary to be examined
-        :param all_variables: the list to be appended
-        """
-        for key in model_dictionary:
-            value = model_dictionary[key]
-            if isinstance(value, dict):
-                self._add_model_variables(value, all_variables)
-            else:
-                matches = variables.get_variable_matches(str_helper.to_string(value))
-                for token, variable_key in matches:
-                    all_variables.append(variable_key)
-
-    def _clean_variable_files(self, merged_model_dictionary):
+    def _clean_variable_files(self, model_token_index):
         """
         Remove any unused variables that are not in the merged model from the variable file.
-        :param merged_model_dictionary: a model with every property.
+        :param model_token_index: the TokenIndex for a model with every property.
         """
         _method_name = '_clean_variable_files'
 
-        all_model_variables = []
-        self._add_model_variables(merged_model_dictionary, all_model_variables)
-
         original_file = self.model_context.get_variable_file()
         if original_file:
             output_file = os.path.join(self.output_dir, os.path.basename(original_file))
@@ -139,7 +121,7 @@ class ModelPreparer:
 
                     variable_dict = {}
                     for key in list(properties.keySet()):
-                        if key in all_model_variables:
+                        if model_token_index.has_name(token_index.PROPERTY, key):
                             variable_dict[key] = properties.get(key)
 
                     # use this method instead of Properties.store() to maintain order
@@ -191,6 +173,7 @@ class ModelPreparer:
 
         # create a merged model that is not substituted
         merged_model_dictionary = {}
+        merged_token_index = token_index.TokenIndex()
         try:
             model_file_list = self.model_files.split(',')
             target = self.model_context.get_target()
@@ -248,12 +231,16 @@ class ModelPreparer:
                 pty = PythonToYaml(self.current_dict)
                 pty.write_to_yaml_file(file_name)
 
-                cla_helper.merge_model_dictionaries(merged_model_dictionary, self.current_dict, None)
+                cla_helper.merge_model_dictionaries(merged_model_dictionary, self.current_dict, None,
+                                                    token_index=merged_token_index)
 
-            # filter variables or secrets that are no longer in the merged, filtered model
-            filter_helper.apply_filters(merged_model_dictionary, "discover", self.model_context)
-            self.credential_injector.filter_unused_credentials(merged_model_dictionary)
-            self._clean_variable_files(merged_model_dictionary)
+            # filter variables or secrets that are no longer in the merged, filtered model.
+            # filters can change any part of the model, so the index is built again if any were applied.
+            if filter_helper.apply_filters(merged_model_dictionary, "discover", self.model_context):
+                merged_token_index = token_index.TokenIndex(merged_model_dictionary)
+            self.credential_injector.filter_unused_credentials(merged_model_dictionary,
+                                                               token_index=merged_token_index)
+            self._clean_variable_files(merged_token_index)
             self._clean_archive_files()
 
             # resolve variables in the model AFTER the clean and filter has been done,
@@ -0,0 +1,201 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+A merged, read-only index of the entries in one or more archive files.
+"""
+import bisect
+
+from java.lang import IllegalArgumentException
+
+from oracle.weblogic.deploy.util import WLSDeployArchive
+
+from wlsdeploy.exception import exception_helper
+from wlsdeploy.logging.platform_logger import PlatformLogger
+
+ZIP_SEP = WLSDeployArchive.ZIP_SEP
+
+_class_name = 'ArchiveEntryIndex'
+_logger = PlatformLogger('wlsdeploy.tool.util')
+
+
+class ArchiveEntryIndex(object):
+    """
+    An index of the entries in a list of archive files, built once from the entry list of each archive.
+    Each entry path and directory prefix is mapped to the archive that owns it.
+    When an entry is in multiple archives, the last archive in the list owns it,
+    matching the override order used for multiple archive files.
+    The index does not reflect changes made to the archives after it is built.
+    """
+    def __init__(self, archive_files):
+        """
+        Build the index for the archive files.
+        :param archive_files: the list of WLSDeployArchive objects, in command-line order
+        :raises: WLSDeployArchiveIOException: if an archive's entries cannot be read
+        """
+        _method_name = '__init__'
+        _logger.entering(len(archive_files), class_name=_class_name, method_name=_method_name)
+
+        self._archive_files = archive_files
+
+        # entry path -> index of owning archive
+        self._entry_owners = {}
+        # directory path with trailing separator -> index of owning archive
+        self._directory_owners = {}
+        # entry path -> list of archive indexes that contain it, for entries in more than one archive
+        self._duplicates = {}
+        # sorted entry lists for each archive, for prefix lookups
+        self._sorted_entries = []
+
+        for archive_index in range(len(archive_files)):
+            entries = list(archive_files[archive_index].getArchiveEntries())
+            entries.sort()
+            self._sorted_entries.append(entries)
+
+            for entry in entries:
+                self._add_entry(entry, archive_index)
+
+        _logger.exiting(class_name=_class_name, method_name=_method_name, result=len(self._entry_owners))
+
+    def contains_file(self, path):
+        """
+        Determine if an archive contains the specified entry path.
+        :param path: the path into the archive
+        :return: True if the path is an entry in any archive, False otherwise
+        :raises: IllegalArgumentException: if the path is empty
+        """
+        _validate_path(path, 'contains_file')
+        return WLSDeployArchive.isPathIntoArchive(path) and path in self._entry_owners
+
+    def contains_path(self, path):
+        """
+        Determine if an archive contains the specified directory path.
+        :param path: the directory path into the archive, with or without a trailing separator
+        :return: True if the path is a directory in any archive, False otherwise
+        :raises: IllegalArgumentException: if the path is empty
+        """
+        _validate_path(path, 'contains_path')
+        return WLSDeployArchive.isPathIntoArchive(path) and _directory_key(path) in self._directory_owners
+
+    def contains_file_or_path(self, path):
+        """
+        Determine if an archive contains the specified entry or directory path.
+        :param path: the path into the archive
+        :return: True if the path is in any archive, False otherwise
+        :raises: IllegalArgumentException: if the path is empty
+        """
+        return self.find_archive(path) is not None
+
+    def find_archive(self, path):
+        """
+        Find the archive that owns the specified entry or directory path.
+        Exact entry and directory matches are resolved from the index.
+        Other paths are checked as a prefix of the entries in each archive, from the end of the list.
+        :param path: the path into the archive
+        :return: the owning WLSDeployArchive, or None if no archive contains the path
+        :raises: IllegalArgumentException: if the path is empty
+        """
+        _validate_path(path, 'find_archive')
+        if not WLSDeployArchive.isPathIntoArchive(path):
+            return None
+
+        owner_index = self._entry_owners.get(path)
+        directory_owner_index = self._directory_owners.get(_directory_key(path))
+        if directory_owner_index is not None and (owner_index is None or directory_owner_index > owner_index):
+            owner_index = directory_owner_index
+
+        if owner_index is None:
+            for archive_index in range(len(self._sorted_entries) - 1, -1, -1):
+                entries = self._sorted_entries[archive_index]
+                position = bisect.bisect_left(entries, path)
+                if position < len(entries) and entries[position].startswith(path):
+                    owner_index = archive_index
+                    break
+
+        if owner_index is None:
+            return None
+        return self._archive_files[owner_index]
+
+    def get_shadowed_entries(self):
+        """
+        Get the entries that are in more than one archive.
+        Only the last archive's copy of each of these entries is used.
+        :return: a dictionary of entry paths to lists of archive file names, in archive order
+        """
+        result = {}
+        for entry, archive_indexes in self._duplicates.iteritems():
+            names = []
+            for archive_index in archive_indexes:
+                names.append(self._archive_files[archive_index].getArchiveFileName())
+            result[entry] = names
+        return result
+
+    def log_shadowed_entries(self):
+        """
+        Log each entry that is shadowed by the same entry in a later archive.
+        """
+        _method_name = 'log_shadowed_entries'
+
+        shadowed_entries = self.get_shadowed_entries()
+        entries = shadowed_entries.keys()
+        entries.sort()
+        for entry in entries:
+            archive_names = shadowed_entries[entry]
+            _logger.info('WLSDPLY-19319', entry, archive_names[-1], ', '.join(archive_names[:-1]),
+                         class_name=_class_name, method_name=_method_name)
+
+    def _add_entry(self, entry, archive_index):
+        if entry.endswith(ZIP_SEP):
+            # explicit directory entries are indexed as directories only
+            self._add_directory(entry, archive_index)
+        else:
+            previous_index = self._entry_owners.get(entry)
+            if previous_index is not None:
+                if entry not in self._duplicates:
+                    self._duplicates[entry] = [previous_index]
+                self._duplicates[entry].append(archive_index)
+            self._entry_owners[entry] = archive_index
+
+        # register each parent directory up to the root
+        parent = _get_parent_directory(entry)
+        while parent is not None:
+            if self._directory_owners.get(parent) == archive_index:
+                # the remaining parent directories were registered by an earlier entry in this archive
+                break
+            self._directory_owners[parent] = archive_index
+            parent = _get_parent_directory(parent)
+
+    def _add_directory(self, directory, archive_index):
+        self._directory_owners[directory] = archive_index
+
+
+def _validate_path(path, method_name):
+    """
+    Raise the same exception as WLSDeployArchive for an empty path.
+    """
+    if path is None or len(path) == 0:
+        message = exception_helper.get_message('WLSDPLY-01104', method_name, _class_name, 'path')
+        raise IllegalArgumentException(message)
+
+
+def _directory_key(path):
+    """
+    Get the directory key for the path, which has a trailing separator.
+    """
+    if path.endswith(ZIP_SEP):
+        return path
+    return path + ZIP_SEP
+
+
+def _get_parent_directory(path):
+    """
+    Get the parent directory of the entry path, with a trailing separator.
+    :return: the parent directory, or None if the path is at the top level
+    """
+    trimmed = path
+    if trimmed.endswith(ZIP_SEP):
+        trimmed = trimmed[:-1]
+    separator_index = trimmed.rfind(ZIP_SEP)
+    if separator_index < 0:
+        return None
+    return trimmed[:separator_index + 1]
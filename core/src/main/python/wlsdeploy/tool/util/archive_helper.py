@@ -19,6 +19,7 @@ from oracle.weblogic.deploy.util import WLSDeployArchiveIOException
 
 from wlsdeploy.exception import exception_helper
 from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.tool.util.archive_entry_index import ArchiveEntryIndex
 from wlsdeploy.util.cla_utils import CommandLineArgUtil
 
 class ArchiveList(object):
@@ -45,10 +46,15 @@ class ArchiveList(object):
         self.__exception_type = exception_type
 
         self.__archive_files = []
+        # built on first use, see _get_entry_index()
+        self.__entry_index = None
+        extraction_threads = model_context.get_model_config().get_archive_extraction_threads()
         file_names = archive_files_text.split(CommandLineArgUtil.ARCHIVE_FILES_SEPARATOR)
         for file_name in file_names:
             try:
-                self.__archive_files.append(WLSDeployArchive(file_name))
+                archive_file = WLSDeployArchive(file_name)
+                archive_file.setExtractionThreads(extraction_threads)
+                self.__archive_files.append(archive_file)
             except (IllegalArgumentException, IllegalStateException), e:
                 ex = exception_helper.create_exception(exception_type, 'WLSDPLY-19300', file_name,
                                                        e.getLocalizedMessage(), error=e)
@@ -73,17 +79,13 @@ class ArchiveList(object):
         _method_name = 'contains_file'
         self.__logger.entering(path, class_name=self.__class_name, method_name=_method_name)
 
-        result = False
-        for archive_file in self.__archive_files:
-            try:
-                result = archive_file.containsFile(path)
-                if result:
-                    break
-            except (IllegalArgumentException, WLSDeployArchiveIOException), e:
-                ex = exception_helper.create_exception(self.__exception_type, "WLSDPLY-19302", path,
-                                                       self.__archive_files_text, e.getLocalizedMessage(), error=e)
-                self.__logger.throwing(ex, class_name=self.__class_name, method_name=_method_name)
-                raise ex
+        try:
+            result = self._get_entry_index().contains_file(path)
+        except (IllegalArgumentException, WLSDeployArchiveIOException), e:
+            ex = exception_helper.create_exception(self.__exception_type, "WLSDPLY-19302", path,
+                                                   self.__archive_files_text, e.getLocalizedMessage(), error=e)
+            self.__logger.throwing(ex, class_name=self.__class_name, method_name=_method_name)
+            raise ex
 
         self.__logger.exiting(class_name=self.__class_name, method_name=_method_name, result=result)
         return result
@@ -98,17 +100,13 @@ class ArchiveList(object):
         _method_name = 'contains_path'
         self.__logger.entering(path, class_name=self.__class_name, method_name=_method_name)
 
-        result = False
-        for archive_file in self.__archive_files:
-            try:
-                result = archive_file.containsPath(path)
-                if result:
-                    break
-            except (IllegalArgumentException, WLSDeployArchiveIOException), e:
-                ex = exception_helper.create_exception(self.__exception_type, "WLSDPLY-19302", path,
-                                                       archive_file, e.getLocalizedMessage(), error=e)
-                self.__logger.throwing(ex, class_name=self.__class_name, method_name=_method_name)
-                raise ex
+        try:
+            result = self._get_entry_index().contains_path(path)
+        except (IllegalArgumentException, WLSDeployArchiveIOException), e:
+            ex = exception_helper.create_exception(self.__exception_type, "WLSDPLY-19302", path,
+                                                   self.__archive_files_text, e.getLocalizedMessage(), error=e)
+            self.__logger.throwing(ex, class_name=self.__class_name, method_name=_method_name)
+            raise ex
 
         self.__logger.exiting(class_name=self.__class_name, method_name=_method_name, result=result)
         return result
@@ -123,17 +121,13 @@ class ArchiveList(object):
         _method_name = 'contains_file_or_path'
         self.__logger.entering(path, class_name=self.__class_name, method_name=_method_name)
 
-        result = False
-        for archive_file in self.__archive_files:
-            try:
-                result = archive_file.containsFileOrPath(path)
-                if result:
-                    break
-            except (IllegalArgumentException, WLSDeployArchiveIOException), e:
-                ex = exception_helper.create_exception(self.__exception_type, "WLSDPLY-19309", path,
-                                                       self.__archive_files_text, e.getLocalizedMessage(), error=e)
-                self.__logger.throwing(ex, class_name=self.__class_name, method_name=_method_name)
-                raise ex
+        try:
+            result = self._get_entry_index().contains_file_or_path(path)
+        except (IllegalArgumentException, WLSDeployArchiveIOException), e:
+            ex = exception_helper.create_exception(self.__exception_type, "WLSDPLY-19309", path,
+                                                   self.__archive_files_text, e.getLocalizedMessage(), error=e)
+            self.__logger.throwing(ex, class_name=self.__class_name, method_name=_method_name)
+            raise ex
 
         self.__logger.exiting(class_name=self.__class_name, method_name=_method_name, result=result)
         return result
@@ -149,18 +143,16 @@ class ArchiveList(object):
         self.__logger.entering(path, class_name=self.__class_name, method_name=_method_name)
 
         result = False
-        for archive_file in self.__archive_files:
-            try:
-                if archive_file.containsFileOrPath(path):
-                    if (not path.startswith(WLSDeployArchive.ARCHIVE_SHLIBS_TARGET_DIR) and
-                            not path.startswith(WLSDeployArchive.ARCHIVE_APPS_TARGET_DIR)):
-                        result = True
-                        break
-            except (IllegalArgumentException), e:
-                ex = exception_helper.create_exception(self.__exception_type, "WLSDPLY-19309", path,
-                                                       self.__archive_files_text, e.getLocalizedMessage(), error=e)
-                self.__logger.throwing(ex, class_name=self.__class_name, method_name=_method_name)
-                raise ex
+        try:
+            if self._get_entry_index().contains_file_or_path(path):
+                if (not path.startswith(WLSDeployArchive.ARCHIVE_SHLIBS_TARGET_DIR) and
+                        not path.startswith(WLSDeployArchive.ARCHIVE_APPS_TARGET_DIR)):
+                    result = True
+        except (IllegalArgumentException, WLSDeployArchiveIOException), e:
+            ex = exception_helper.create_exception(self.__exception_type, "WLSDPLY-19309", path,
+                                                   self.__archive_files_text, e.getLocalizedMessage(), error=e)
+            self.__logger.throwing(ex, class_name=self.__class_name, method_name=_method_name)
+            raise ex
 
         self.__logger.exiting(class_name=self.__class_name, method_name=_method_name, result=result)
         return result
@@ -476,6 +468,9 @@ class ArchiveList(object):
                                                        error=e)
                 self.__logger.throwing(ex, class_name=self.__class_name, method_name=_method_name)
                 raise ex
+
+        # the index no longer matches the archive contents
+        self.__entry_index = None
         self.__logger.exiting(class_name=self.__class_name, method_name=_method_name)
 
     def get_archive_entries(self):
@@ -581,10 +576,9 @@ class ArchiveList(object):
         Determine if any archive contains an RCU wallet path.
         :return: True if an RCU wallet path is found, False otherwise
         """
-        for archive_file in self.__archive_files:
-            if (archive_file.containsPath(WLSDeployArchive.DEFAULT_RCU_WALLET_PATH)
-                    or archive_file.containsPath(WLSDeployArchive.DEPRECATED_RCU_WALLET_PATH)):
-                return True
+        entry_index = self._get_entry_index()
+        return (entry_index.contains_path(WLSDeployArchive.DEFAULT_RCU_WALLET_PATH)
+                or entry_index.contains_path(WLSDeployArchive.DEPRECATED_RCU_WALLET_PATH))
 
     def get_wallet_entries(self, wallet_path):
         _method_name = 'get_wallet_entries'
@@ -681,8 +675,8 @@ class ArchiveList(object):
 
     def _find_archive_for_path(self, path, required=False):
         """
-        Find the archive file containing the specified path.
-        Search from the end of the list, as later entries override previous ones.
+        Find the archive file containing the specified path, using the entry index.
+        Later archives in the list override previous ones.
         :param path: the path to find
         :param required: if True, throw an exception if path is not found
         :return: the archive containing the path, or None
@@ -690,9 +684,9 @@ class ArchiveList(object):
         """
         _method_name = '_find_archive_for_path'
 
-        for archive_file in self.__archive_files[::-1]:
-            if archive_file.containsFileOrPath(path):
-                return archive_file
+        archive_file = self._get_entry_index().find_archive(path)
+        if archive_file is not None:
+            return archive_file
 
         if required:
             args = [path, self.__archive_files_text]
@@ -702,6 +696,19 @@ class ArchiveList(object):
 
         return None
 
+    def _get_entry_index(self):
+        """
+        Get the merged entry index for the archive files, building it on first use.
+        Entries that are shadowed by a later archive are logged when the index is built.
+        :return: the ArchiveEntryIndex
+        :raises: WLSDeployArchiveIOException: if an archive's entries cannot be read
+        """
+        if self.__entry_index is None:
+            self.__entry_index = ArchiveEntryIndex(self.__archive_files)
+            if len(self.__archive_files) > 1:
+                self.__entry_index.log_shadowed_entries()
+        return self.__entry_index
+
     def get_domain_home_file(self):
         # don't initialize in constructor, online home may not be established
         return File(self.__model_context.get_domain_home())
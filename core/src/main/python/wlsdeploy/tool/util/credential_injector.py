@@ -1,5 +1,5 @@
 """
-Copyright (c) 2020, 2024, Oracle and/or its affiliates.
+Copyright (c) 2020, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 
@@ -30,8 +30,8 @@ from wlsdeploy.tool.util.variable_injector import VARIABLE_VALUE
 from wlsdeploy.tool.util.variable_injector import VariableInjector
 from wlsdeploy.util import model
 from wlsdeploy.util import target_configuration_helper
-import wlsdeploy.util.unicode_helper as str_helper
 from wlsdeploy.util import variables
+from wlsdeploy.util.token_index import TokenIndex
 from wlsdeploy.util.target_configuration import CONFIG_OVERRIDES_SECRETS_METHOD
 from wlsdeploy.util.target_configuration import SECRETS_METHOD
 from wlsdeploy.util.target_configuration_helper import WEBLOGIC_CREDENTIALS_SECRET_NAME
@@ -246,11 +246,12 @@ class CredentialInjector(VariableInjector):
         else:
             return VariableInjector._check_tokenized(self, attribute_value)
 
-    def filter_unused_credentials(self, model_dictionary):
+    def filter_unused_credentials(self, model_dictionary, token_index=None):
         """
         Remove credentials from the cache that are no longer present in the model.
         Check for variables or secrets, depending on target configuration.
         :param model_dictionary: the model to be checked
+        :param token_index: the TokenIndex for the model, or None if it should be built here
         """
         _method_name = 'filter_unused_credentials'
 
@@ -261,8 +262,8 @@ class CredentialInjector(VariableInjector):
             _logger.info("WLSDPLY-19650", credentials_method, class_name=_class_name, method_name=_method_name)
             return
 
-        all_variables = []
-        self._add_model_variables(model_dictionary, all_variables)
+        if token_index is None:
+            token_index = TokenIndex(model_dictionary)
 
         cache_keys = self.get_variable_cache().keys()
         for key in cache_keys:
@@ -274,7 +275,7 @@ class CredentialInjector(VariableInjector):
             else:
                 variable_name = '@@PROP:%s@@' % key
 
-            if variable_name not in all_variables:
+            if not token_index.has_token(variable_name):
                 _logger.info("WLSDPLY-19651", variable_name, class_name=_class_name, method_name=_method_name)
                 del self.get_variable_cache()[key]
 
@@ -292,21 +293,6 @@ class CredentialInjector(VariableInjector):
         self.__walk_model_section(model.get_model_resources_key(), model_dictionary,
                                   self._aliases.get_model_resources_top_level_folder_names())
 
-    def _add_model_variables(self, model_dictionary, variables_list):
-        """
-        Add any variable values found in the model dictionary to the variables list
-        :param model_dictionary: the dictionary to be examined
-        :param variables_list: the list to be appended
-        """
-        for key in model_dictionary:
-            value = model_dictionary[key]
-            if isinstance(value, dict):
-                self._add_model_variables(value, variables_list)
-            else:
-                text = str_helper.to_string(value)
-                if text.startswith('@@'):
-                    variables_list.append(text)
-
     def __walk_model_section(self, model_section_key, model_dict, valid_section_folders):
         """
         Tokenize credential attributes in a model section.
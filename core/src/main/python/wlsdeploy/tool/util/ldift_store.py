@@ -0,0 +1,283 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+An LDIFT file of security provider bootstrap entries, such as XACMLAuthorizerInit.ldift.
+The file is indexed by entry key without keeping the entries in memory,
+and model entries are merged into a new file in a single pass.
+"""
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.tool.util.ldif_entry import LDIFEntry
+
+_class_name = 'LdiftStore'
+_logger = PlatformLogger('wlsdeploy.tool.util')
+
+_COPY_BUFFER_SIZE = 65536
+
+
+class LdiftStore(object):
+    """
+    Index and update the entries of an LDIFT file.
+    Each entry must start with a dn line, every line must be an assignment or a continuation line,
+    and each entry must include the required attributes.
+    Entries with the same key as an earlier entry are left unchanged.
+    """
+    def __init__(self, file_path, key_function, required_attributes):
+        """
+        :param file_path: the path of the LDIFT file
+        :param key_function: a function that returns the key for an LDIFEntry, or None if it has no key
+        :param required_attributes: the names of the attributes that each entry must have
+        """
+        self._file_path = file_path
+        self._key_function = key_function
+        self._required_attributes = required_attributes
+        self._index = None
+
+    def get_index(self):
+        """
+        Get the index of the entries in the file, reading the file the first time.
+        :return: an ordered dictionary of entry keys to _EntryLocation objects, in file order
+        :raises ValueError: if an entry is not valid
+        :raises IOError: if the file cannot be read
+        """
+        if self._index is None:
+            self._index = OrderedDict()
+            for location, entry in self._iterate_entries():
+                key = self._key_function(entry)
+                if key is not None and key not in self._index:
+                    location.key = key
+                    self._index[key] = location
+        return self._index
+
+    def contains_key(self, key):
+        return key in self.get_index()
+
+    def read_entry(self, key):
+        """
+        Read the entry with the specified key from the file.
+        :param key: the key of the entry
+        :return: the LDIFEntry, or None if there is no entry for the key
+        :raises IOError: if the file cannot be read
+        """
+        location = self.get_index().get(key)
+        if location is None:
+            return None
+
+        source = open(self._file_path, 'rb')
+        try:
+            source.seek(location.start)
+            text = source.read(location.end - location.start)
+        finally:
+            source.close()
+        lines = []
+        for line in text.splitlines():
+            if not line.startswith('#'):
+                lines.append(line)
+        return _create_entry(lines, location.line_number, self._file_path)
+
+    def merge(self, target_path, model_entries):
+        """
+        Write the file to the target path, with model entries replacing the entries that have the same key.
+        Entries that are not replaced are copied unchanged, and model entries with new keys are added at the end.
+        :param target_path: the path of the file to write, which must not be the path of this file
+        :param model_entries: an ordered dictionary of entry keys to LDIFEntry objects
+        :return: an LdiftMergeResult with the keys that were added and replaced, and the unchanged count
+        :raises ValueError: if an entry is not valid
+        :raises IOError: if a file cannot be read or written
+        """
+        _method_name = 'merge'
+        _logger.entering(self._file_path, target_path, class_name=_class_name, method_name=_method_name)
+
+        index = self.get_index()
+        result = LdiftMergeResult()
+
+        source = open(self._file_path, 'rb')
+        try:
+            target = _TargetWriter(open(target_path, 'wb'))
+            try:
+                position = 0
+                for key, location in index.iteritems():
+                    if key in model_entries:
+                        # copy the text before the entry, then the replacement
+                        _copy(source, target, position, location.start - position)
+                        target.write(_get_entry_text(model_entries[key]))
+                        position = location.end
+                        result.replaced.append(key)
+                    else:
+                        result.unchanged_count += 1
+
+                _copy(source, target, position, None)
+
+                for key, entry in model_entries.iteritems():
+                    if key not in index:
+                        target.start_entry()
+                        target.write(_get_entry_text(entry))
+                        result.added.append(key)
+            finally:
+                target.close()
+        finally:
+            source.close()
+
+        _logger.exiting(class_name=_class_name, method_name=_method_name, result=result)
+        return result
+
+    def _iterate_entries(self):
+        """
+        Read the file once, and yield the location and content of each entry.
+        :raises ValueError: if an entry is not valid
+        """
+        source = open(self._file_path, 'rb')
+        try:
+            offset = 0
+            line_number = 0
+            location = None
+            lines = None
+            line = source.readline()
+            while line:
+                line_number += 1
+                text = line.rstrip('\r\n')
+                if len(text.strip()) == 0:
+                    if lines is not None:
+                        location.end = offset
+                        yield location, self._create_valid_entry(lines, location.line_number)
+                        location = None
+                        lines = None
+                elif not text.startswith('#'):
+                    if lines is None:
+                        location = _EntryLocation(offset, line_number)
+                        lines = []
+                    lines.append(text)
+
+                offset += len(line)
+                line = source.readline()
+
+            if lines is not None:
+                location.end = offset
+                yield location, self._create_valid_entry(lines, location.line_number)
+        finally:
+            source.close()
+
+    def _create_valid_entry(self, lines, line_number):
+        entry = _create_entry(lines, line_number, self._file_path)
+        for attribute in self._required_attributes:
+            if entry.get_single_value(attribute) is None:
+                raise ValueError('LDIFT entry at line %s of %s does not have the %s attribute'
+                                 % (line_number, self._file_path, attribute))
+        return entry
+
+
+class LdiftMergeResult(object):
+    """
+    The keys of the entries that were added and replaced by a merge, and the number of unchanged entries.
+    """
+    def __init__(self):
+        self.added = []
+        self.replaced = []
+        self.unchanged_count = 0
+
+    def __str__(self):
+        return 'added=%s, replaced=%s, unchanged=%s' % (len(self.added), len(self.replaced), self.unchanged_count)
+
+
+class _EntryLocation(object):
+    """
+    The byte offsets of an entry in the file, and its first line number.
+    """
+    def __init__(self, start, line_number):
+        self.key = None
+        self.start = start
+        self.end = None
+        self.line_number = line_number
+
+
+class _TargetWriter(object):
+    """
+    Write to a file, tracking the end of the text so that added entries are separated by a blank line.
+    """
+    def __init__(self, target_file):
+        self._file = target_file
+        self._tail = ''
+
+    def write(self, text):
+        if len(text) > 0:
+            self._file.write(text)
+            self._tail = (self._tail + text)[-2:]
+
+    def start_entry(self):
+        if len(self._tail) == 0:
+            return
+        if not self._tail.endswith('\n'):
+            self.write('\n\n')
+        elif self._tail != '\n\n':
+            self.write('\n')
+
+    def close(self):
+        self._file.close()
+
+
+def _create_entry(lines, line_number, file_path):
+    """
+    Create an LDIFEntry from the lines of an entry, joining continuation lines.
+    Lines without a colon that follow a base64 assignment are also joined, since earlier versions
+    of the XACML helpers could write base64 values on several lines.
+    :raises ValueError: if the entry does not start with a dn line, or a line is not an assignment
+    """
+    entry = LDIFEntry()
+    assignment = None
+    for line in lines:
+        if line.startswith(' '):
+            if assignment is None:
+                raise ValueError('LDIFT entry at line %s of %s starts with a continuation line'
+                                 % (line_number, file_path))
+            assignment += line[1:]
+            continue
+
+        if ':' not in line and assignment is not None and '::' in assignment:
+            assignment += line.strip()
+            continue
+
+        if assignment is not None:
+            entry.add_assignment_line(assignment)
+        if ':' not in line:
+            raise ValueError('LDIFT entry at line %s of %s has a line that is not an assignment: %s'
+                             % (line_number, file_path, line))
+        assignment = line.strip()
+
+    if assignment is not None:
+        entry.add_assignment_line(assignment)
+
+    assignment_lines = entry.get_assignment_lines()
+    if not assignment_lines or not assignment_lines[0].startswith('dn:'):
+        raise ValueError('LDIFT entry at line %s of %s does not start with dn' % (line_number, file_path))
+    return entry
+
+
+def _get_entry_text(entry):
+    text = '\n'.join(entry.get_assignment_lines()) + '\n'
+    if isinstance(text, unicode):
+        text = text.encode('utf-8')
+    return text
+
+
+def _copy(source, target, start, length):
+    """
+    Copy bytes from the source file to the target.
+    :param source: the source file
+    :param target: the _TargetWriter
+    :param start: the offset in the source file
+    :param length: the number of bytes to copy, or None to copy to the end of the file
+    """
+    source.seek(start)
+    remaining = length
+    while remaining is None or remaining > 0:
+        size = _COPY_BUFFER_SIZE
+        if remaining is not None:
+            size = min(size, remaining)
+        data = source.read(size)
+        if not data:
+            break
+        target.write(data)
+        if remaining is not None:
+            remaining -= len(data)
@@ -1,5 +1,5 @@
 """
-Copyright (c) 2017, 2025, Oracle and/or its affiliates.
+Copyright (c) 2017, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 import exceptions
@@ -13,8 +13,10 @@ from java.lang import Exception as JException
 from java.lang import IllegalArgumentException
 from java.lang import System
 from java.sql import DriverManager
+from java.sql import SQLException
 from java.util import Properties
 from oracle.weblogic.deploy.create import CreateDomainLifecycleHookScriptRunner
+from oracle.weblogic.deploy.create import CreateException
 from oracle.weblogic.deploy.create import RCURunner
 from oracle.weblogic.deploy.create.RCURunner import COMPONENT_INFO_LOCATION_SWITCH
 from oracle.weblogic.deploy.create.RCURunner import DB2_DB_TYPE
@@ -64,6 +66,7 @@ from wlsdeploy.exception import exception_helper
 from wlsdeploy.exception.exception_types import ExceptionType
 from wlsdeploy.logging.platform_logger import PlatformLogger
 from wlsdeploy.logging.platform_logger import get_logged_value
+from wlsdeploy.tool.create import rcu_schema_state
 from wlsdeploy.tool.create import rcudbinfo_helper
 from wlsdeploy.tool.create.domain_typedef import POST_CREATE_RCU_SCHEMAS_LIFECYCLE_HOOK
 from wlsdeploy.tool.create.jps_config_helper import JpsConfigHelper
@@ -310,6 +313,25 @@ class RCUHelper(object):
         _method_name = 'precheck_rcu_connectivity'
         self.__logger.entering(class_name=self.__class_name, method_name=_method_name)
 
+        # the connection that tests connectivity is also used to report the schema state
+        connection = self.__open_rcu_connection()
+        if connection is not None:
+            try:
+                self.__inspect_rcu_schemas(connection)
+            finally:
+                self.__close_rcu_connection(connection)
+
+        self.__logger.exiting(class_name=self.__class_name, method_name=_method_name)
+
+    def __open_rcu_connection(self):
+        """
+        Open a JDBC connection to the RCU database as the service table schema user.
+        :return: the open connection, or None if the domain type has no service table schema
+        :raises CreateException: if the connection fails
+        """
+        _method_name = '__open_rcu_connection'
+        self.__logger.entering(class_name=self.__class_name, method_name=_method_name)
+
         domain_typename = self._model_context.get_domain_typedef().get_domain_type()
 
         schema_name = None
@@ -321,7 +343,7 @@ class RCUHelper(object):
 
         if schema_name is None or schema_name not in self._model_context.get_domain_typedef().get_rcu_schemas():
             self.__logger.exiting(class_name=self.__class_name, method_name=_method_name)
-            return
+            return None
 
         db_conn_props = None
 
@@ -353,7 +375,7 @@ class RCUHelper(object):
 
             # Force the driver to be loaded and registered...
             JClass.forName(jdbc_driver_name)
-            DriverManager.getConnection(jdbc_conn_string, props)
+            connection = DriverManager.getConnection(jdbc_conn_string, props)
 
         except exceptions.Exception, e:
             exc_type, exc_obj, _exc_tb = sys.exc_info()
@@ -373,6 +395,72 @@ class RCUHelper(object):
             raise ex
 
         self.__logger.exiting(class_name=self.__class_name, method_name=_method_name)
+        return connection
+
+    def __close_rcu_connection(self, connection):
+        _method_name = '__close_rcu_connection'
+        try:
+            connection.close()
+        except SQLException, se:
+            self.__logger.fine('WLSDPLY-12293', se.getLocalizedMessage(),
+                               class_name=self.__class_name, method_name=_method_name)
+
+    def __inspect_rcu_schemas(self, connection):
+        """
+        Query the schema version registry for the state of the domain type's RCU schemas, and log the state.
+        :param connection: an open connection to the RCU database
+        :return: the RcuSchemaState, or None if the state could not be determined
+        """
+        _method_name = '__inspect_rcu_schemas'
+        self.__logger.entering(class_name=self.__class_name, method_name=_method_name)
+
+        rcu_prefix = self._rcu_db_info.get_rcu_prefix()
+        if not self._rcu_db_info.is_oracle_database_type():
+            self.__logger.info('WLSDPLY-12289', rcu_prefix, self._rcu_db_info.get_rcu_database_type(),
+                               class_name=self.__class_name, method_name=_method_name)
+            self.__logger.exiting(class_name=self.__class_name, method_name=_method_name)
+            return None
+
+        rcu_schemas = self._domain_typedef.get_rcu_schemas()
+        try:
+            schema_state = rcu_schema_state.inspect_schemas(connection, rcu_prefix, rcu_schemas,
+                                                            self._model_context.get_local_wls_version())
+        except SQLException, se:
+            self.__logger.warning('WLSDPLY-12290', rcu_prefix, se.getLocalizedMessage(),
+                                  class_name=self.__class_name, method_name=_method_name)
+            self.__logger.exiting(class_name=self.__class_name, method_name=_method_name)
+            return None
+
+        for schema in schema_state.get_schema_names():
+            self.__logger.info('WLSDPLY-12291', rcu_prefix, schema, schema_state.get_state(schema),
+                               schema_state.get_version(schema), schema_state.get_expected_release(),
+                               class_name=self.__class_name, method_name=_method_name)
+
+        self.__logger.exiting(class_name=self.__class_name, method_name=_method_name)
+        return schema_state
+
+    def __get_existing_rcu_schema_state(self):
+        """
+        Get the state of the RCU schemas before running RCU.
+        The service table schema user may not exist yet, so a connection failure is not an error.
+        :return: the RcuSchemaState, or None if the state could not be determined
+        """
+        _method_name = '__get_existing_rcu_schema_state'
+
+        try:
+            connection = self.__open_rcu_connection()
+        except CreateException, ce:
+            self.__logger.info('WLSDPLY-12292', self._rcu_db_info.get_rcu_prefix(), ce.getLocalizedMessage(),
+                               class_name=self.__class_name, method_name=_method_name)
+            return None
+
+        if connection is None:
+            return None
+
+        try:
+            return self.__inspect_rcu_schemas(connection)
+        finally:
+            self.__close_rcu_connection(connection)
 
     def __run_rcu(self):
         """
@@ -393,6 +481,26 @@ class RCUHelper(object):
             self.__logger.exiting(class_name=self.__class_name, method_name=_method_name)
             return
 
+        disable_rcu_drop_schema = self._model_context.get_model_config().get_disable_rcu_drop_schema() == 'true'
+
+        # if existing schemas can be reused, create only the missing schemas, without dropping any schemas.
+        # stale schemas require the full drop and create.
+        if self._model_context.get_model_config().get_reuse_existing_rcu_schemas() == 'true':
+            schema_state = self.__get_existing_rcu_schema_state()
+            if schema_state is not None and not schema_state.has_stale_schemas():
+                missing_schemas = schema_state.get_missing_schemas()
+                if not missing_schemas:
+                    self.__logger.info('WLSDPLY-12294', schema_state.get_rcu_prefix(),
+                                       class_name=self.__class_name, method_name=_method_name)
+                    self.__logger.exiting(class_name=self.__class_name, method_name=_method_name)
+                    return
+
+                if len(missing_schemas) < len(rcu_schemas):
+                    self.__logger.info('WLSDPLY-12295', schema_state.get_rcu_prefix(), missing_schemas,
+                                       class_name=self.__class_name, method_name=_method_name)
+                    rcu_schemas = missing_schemas
+                    disable_rcu_drop_schema = True
+
         self.__logger.info("WLSDPLY-12287", class_name=self.__class_name, method_name=_method_name)
 
         rcu_db_info = self._rcu_db_info
@@ -429,7 +537,6 @@ class RCUHelper(object):
             self.__logger.throwing(ex, class_name=self.__class_name, method_name=_method_name)
             raise ex
 
-        disable_rcu_drop_schema = self._model_context.get_model_config().get_disable_rcu_drop_schema() == 'true'
         rcu_runner = RCURunner(oracle_home, java_home, rcu_database_type, oracle_database_connection_type,
                                rcu_db_conn_string, rcu_prefix, rcu_admin_user, oracle_database_admin_role,
                                rcu_schemas, extra_rcu_args_map, ssl_conn_properties)
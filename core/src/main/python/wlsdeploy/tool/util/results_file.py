@@ -1,5 +1,5 @@
 """
-Copyright (c) 2023, Oracle and/or its affiliates.
+Copyright (c) 2023, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 import os
@@ -19,12 +19,15 @@ RESULTS_FILE_NAME = 'results.json'
 
 NON_DYNAMIC_CHANGES_FOLDER = 'nonDynamicChanges'
 RESTARTS_FOLDER = 'restarts'
+ROLLING_RESTART_FOLDER = 'rollingRestart'
 
 CLUSTER_KEY = 'cluster'
+DURATION_MILLIS_KEY = 'durationMillis'
 NON_DYNAMIC_CHANGES_TEXT_KEY = 'nonDynamicChangesText'
 RESOURCE_NAME_KEY = 'resourceName'
 RESOURCE_TYPE_KEY = 'resourceType'
 SERVER_KEY = 'server'
+STATUS_KEY = 'status'
 TEXT_KEY = 'text'
 
 _results_dict = PyOrderedDict()
@@ -62,6 +65,11 @@ def add_restart_entry(cluster, server, resource_name, resource_type):
     restarts.append(restart)
 
 
+def add_rolling_restart_entry(entry):
+    rolling_restart = _add_or_create_array(_results_dict, ROLLING_RESTART_FOLDER)
+    rolling_restart.append(entry)
+
+
 def add_non_dynamic_change(bean_name, attribute_name):
     non_dynamic_changes = _add_or_create_folder(_results_dict, NON_DYNAMIC_CHANGES_FOLDER)
     bean_array = _add_or_create_array(non_dynamic_changes, bean_name)
@@ -1,5 +1,5 @@
 """
-Copyright (c) 2022, 2025, Oracle and/or its affiliates.
+Copyright (c) 2022, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 
 Methods to update an output file with information from the kubernetes section of the model.
@@ -14,7 +14,6 @@ from wlsdeploy.aliases import alias_utils
 from wlsdeploy.aliases.model_constants import MODEL_LIST_DELIMITER
 from wlsdeploy.exception import exception_helper
 from wlsdeploy.logging.platform_logger import PlatformLogger
-from wlsdeploy.tool.util.targets import schema_helper
 from wlsdeploy.tool.validate.crd_sections_validator import CrdSectionsValidator
 from wlsdeploy.util import dictionary_utils
 import wlsdeploy.util.unicode_helper as str_helper
@@ -116,8 +115,8 @@ def _update_crd_domain(crd_dictionary, model_dictionary, crd_helper, output_file
     keyless_crd_folder = crd_helper.get_keyless_crd_folder()
     if keyless_crd_folder:
         # this WKO version does not use model CRD sub-folders, use the single schema
-        schema = keyless_crd_folder.get_schema()
-        _update_dictionary(crd_dictionary, model_dictionary, schema, None, keyless_crd_folder, output_file_path)
+        schema_node = keyless_crd_folder.get_root_node()
+        _update_dictionary(crd_dictionary, model_dictionary, schema_node, output_file_path)
     else:
         # this WKO version uses CRD sub-folders, use the domain folder
         _update_crd(crd_dictionary, model_dictionary, 'domain', crd_helper, output_file_path)
@@ -140,8 +139,8 @@ def _update_crd_cluster(crd_dictionary, model_dictionary, crd_helper, output_fil
         model_cluster = _find_model_cluster(crd_name, model_clusters)
         if model_cluster:
             cluster_crd_folder = crd_helper.get_crd_folder(folder_key)
-            schema = cluster_crd_folder.get_schema()
-            _update_dictionary(crd_dictionary, model_cluster, schema, None, cluster_crd_folder, output_file_path)
+            schema_node = cluster_crd_folder.get_root_node()
+            _update_dictionary(crd_dictionary, model_cluster, schema_node, output_file_path)
 
 
 def _update_crd(crd_dictionary, model_dictionary, folder_key, crd_helper, output_file_path):
@@ -158,8 +157,8 @@ def _update_crd(crd_dictionary, model_dictionary, folder_key, crd_helper, output
     domain_crd_folder = crd_helper.get_crd_folder(folder_key)
     model_content = dictionary_utils.get_element(model_dictionary, folder_key)
     if model_content:
-        schema = domain_crd_folder.get_schema()
-        _update_dictionary(crd_dictionary, model_content, schema, None, domain_crd_folder, output_file_path)
+        schema_node = domain_crd_folder.get_root_node()
+        _update_dictionary(crd_dictionary, model_content, schema_node, output_file_path)
 
 
 def _find_model_cluster(crd_name, model_clusters):
@@ -175,78 +174,71 @@ def _get_cluster_name(cluster):
     return dictionary_utils.get_element(spec, CLUSTER_NAME)
 
 
-def _update_dictionary(output_dictionary, model_dictionary, schema_folder, schema_path, model_crd_folder,
-                       output_file_path):
+def _update_dictionary(output_dictionary, model_dictionary, schema_node, output_file_path):
     """
     Update output_dictionary with attributes from model_dictionary.
     :param output_dictionary: the dictionary to be updated
     :param model_dictionary: the dictionary to update from (type previously validated)
-    :param schema_folder: the schema for this folder
-    :param schema_path: used for schema_helper lookups and logging
-    :param model_crd_folder: required for object list matching
+    :param schema_node: the compiled schema node for this folder, includes the object list key
     :param output_file_path: used for logging
     """
     _method_name = '_update_dictionary'
+    schema_path = schema_node.get_path()
     if not isinstance(output_dictionary, dict):
         __logger.warning('WLSDPLY-01677', schema_path, output_file_path, class_name=__class_name,
                          method_name=_method_name)
         return
 
     # no type checking for elements of simple (single type) map
-    if schema_helper.is_simple_map(schema_folder):
+    if schema_node.is_simple_map():
         for key, value in model_dictionary.items():
             output_dictionary[key] = value
         return
 
     # if this folder has multiple content options, choose the matching one
-    folder_options = schema_helper.get_one_of_options(schema_folder)
+    folder_options = schema_node.get_options()
     if folder_options:
         model_context = ModelContext(__class_name, {})
         validator = CrdSectionsValidator(model_context)
-        folder_option = validator.find_folder_option(model_dictionary, folder_options, schema_path, schema_path)
+        folder_option = validator.find_folder_option(model_dictionary, folder_options, schema_path)
         if not folder_option:
             __logger.warning("WLSDPLY-05043", schema_path, len(folder_options),
                              class_name=__class_name, method_name=_method_name)
             return
-        properties = schema_helper.get_properties(folder_option)
+        properties = folder_option.get_properties()
     else:
-        properties = schema_helper.get_properties(schema_folder)
+        properties = schema_node.get_properties()
 
     for key, value in model_dictionary.items():
-        property_folder = properties[key]
-        element_type = schema_helper.get_type(property_folder)
+        property_node = properties[key]
+        element_type = property_node.get_type()
 
         value = _convert_value(value, element_type)
 
         if isinstance(value, dict):
             output_dictionary[key] = dictionary_utils.get_element(output_dictionary, key, PyOrderedDict())
-            next_schema_path = schema_helper.append_path(schema_path, key)
-            _update_dictionary(output_dictionary[key], value, property_folder, next_schema_path, model_crd_folder,
-                               output_file_path)
+            _update_dictionary(output_dictionary[key], value, property_node, output_file_path)
         elif isinstance(value, list):
             if not value:
                 # if the model has an empty list, override output value
                 output_dictionary[key] = value
             else:
                 output_dictionary[key] = dictionary_utils.get_element(output_dictionary, key, [])
-                next_schema_path = schema_helper.append_path(schema_path, key)
-                _update_list(output_dictionary[key], value, property_folder, next_schema_path, model_crd_folder,
-                             output_file_path)
+                _update_list(output_dictionary[key], value, property_node, output_file_path)
         else:
             output_dictionary[key] = value
 
 
-def _update_list(output_list, model_list, schema_folder, schema_path, model_crd_folder, output_file_path):
+def _update_list(output_list, model_list, schema_node, output_file_path):
     """
     Update output_list from model_list, overriding or merging existing values
     :param output_list: the list to be updated
     :param model_list: the list to update from (type previously validated)
-    :param schema_folder: the schema for members of this list
-    :param schema_path: used for schema_helper lookups and logging
-    :param model_crd_folder: required for object list matching
+    :param schema_node: the compiled schema node for this list
     :param output_file_path: used for logging
     """
     _method_name = '_update_list'
+    schema_path = schema_node.get_path()
     if not isinstance(output_list, list):
         __logger.warning('WLSDPLY-01678', schema_path, output_file_path, class_name=__class_name,
                          method_name=_method_name)
@@ -254,28 +246,25 @@ def _update_list(output_list, model_list, schema_folder, schema_path, model_crd_
 
     for item in model_list:
         if isinstance(item, dict):
-            match = _find_object_match(item, output_list, schema_path, model_crd_folder)
+            match = _find_object_match(item, output_list, schema_node)
             if match:
-                next_schema_folder = schema_helper.get_array_item_info(schema_folder)
-                _update_dictionary(match, item, next_schema_folder, schema_path, model_crd_folder, output_file_path)
+                _update_dictionary(match, item, schema_node, output_file_path)
             else:
                 output_list.append(item)
         elif item not in output_list:
-            element_type = schema_helper.get_array_element_type(schema_folder)
-            item = _convert_value(item, element_type)
+            item = _convert_value(item, schema_node.get_element_type())
             output_list.append(item)
 
 
-def _find_object_match(item, match_list, schema_path, model_crd_folder):
+def _find_object_match(item, match_list, schema_node):
     """
     Find an object in match_list that has a name matching the item.
     :param item: the item to be matched
     :param match_list: a list of items
-    :param schema_path: used for schema_helper key lookup
-    :param model_crd_folder: required for object list matching
+    :param schema_node: the compiled schema node for the list, provides the object list key
     :return: a matching dictionary object
     """
-    key = model_crd_folder.get_object_list_key(schema_path)
+    key = schema_node.get_object_list_key()
     item_key = _get_key_value(item, key)
     if item_key:
         for match_item in match_list:
@@ -0,0 +1,171 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+Compiles mustache-style file templates into a reusable tree that can be rendered in a single pass.
+"""
+import re
+
+_substitution_pattern = re.compile("({{{([^}]*)}}})")
+_block_start_pattern = re.compile("({{#(.*)}})")
+_block_end_pattern = re.compile("({{/(.*)}})")
+
+
+def compile_template(template_lines):
+    """
+    Compile the lines of a template into a CompiledTemplate.
+    :param template_lines: the template lines, without line terminators
+    :return: the CompiledTemplate
+    """
+    return CompiledTemplate(_parse_lines(template_lines))
+
+
+class CompiledTemplate(object):
+    """
+    A parsed template, made of text lines with their substitution tokens, and blocks.
+    A compiled template is not changed by rendering, and can be rendered any number of times.
+    """
+    def __init__(self, nodes):
+        self._nodes = nodes
+
+    def render(self, template_hash, writer):
+        """
+        Apply the template hash to the template, and write the result.
+        :param template_hash: a dictionary of substitution values
+        :param writer: the object to write, with a write(text) method
+        """
+        _render_nodes(self._nodes, [template_hash], writer)
+
+
+class _TextLine(object):
+    """
+    A template line that is written with its tokens substituted.
+    """
+    def __init__(self, line):
+        self._line = line
+        self._tokens = _substitution_pattern.findall(line)
+        self._text = line + "\n"
+
+    def render(self, scopes, writer):
+        if not self._tokens:
+            writer.write(self._text)
+            return
+
+        line = self._line
+        for token, key in self._tokens:
+            replacement = _lookup(scopes, key)
+            if replacement is not None:
+                line = line.replace(token, replacement)
+        writer.write(line + "\n")
+
+
+class _Block(object):
+    """
+    A template block, written once for each element of its value.
+    A dictionary element adds its keys to the values available inside the block.
+    """
+    def __init__(self, key, nodes):
+        self._key = key
+        self._nodes = nodes
+
+    def render(self, scopes, writer):
+        value = _lookup(scopes, self._key)
+
+        # skip block for value of False, None, or empty collection
+        if not value:
+            return
+
+        if not isinstance(value, list):
+            value = [value]
+
+        for list_element in value:
+            if isinstance(list_element, dict):
+                scopes.append(list_element)
+                try:
+                    _render_nodes(self._nodes, scopes, writer)
+                finally:
+                    scopes.pop()
+            else:
+                _render_nodes(self._nodes, scopes, writer)
+
+
+def _parse_lines(template_lines):
+    """
+    Parse the template lines into a list of text line and block nodes.
+    A block ends at the first end tag with the block's key, and its lines are parsed in the same way.
+    Lines in a block that is not ended are discarded.
+    :param template_lines: the lines to be parsed
+    :return: a list of nodes
+    """
+    nodes = []
+    block_key = None
+    block_lines = []
+
+    for line in template_lines:
+        # if inside a block, collect lines until end key is found, then parse the block.
+        if block_key is not None:
+            if _get_block_end_key(line) == block_key:
+                nodes.append(_Block(block_key, _parse_lines(block_lines)))
+                block_key = None
+            else:
+                block_lines.append(line)
+            continue
+
+        # if this is a block start, begin collecting block lines
+        block_start_key = _get_block_start_key(line)
+        if block_start_key is not None:
+            block_key = block_start_key
+            block_lines = []
+
+        # otherwise, this line is substituted and written
+        else:
+            nodes.append(_TextLine(line))
+
+    return nodes
+
+
+def _render_nodes(nodes, scopes, writer):
+    for node in nodes:
+        node.render(scopes, writer)
+
+
+def _lookup(scopes, key):
+    """
+    Find the value for the key in the innermost scope that contains it.
+    :param scopes: a list of dictionaries, from outermost to innermost
+    :param key: the key to find
+    :return: the value, or None if no scope contains the key
+    """
+    index = len(scopes) - 1
+    while index >= 0:
+        scope = scopes[index]
+        if key in scope:
+            return scope[key]
+        index -= 1
+    return None
+
+
+def _get_block_start_key(line):
+    """
+    If the line contains a start block tag, return the associated key.
+    Any other text on the line is discarded.
+    :param line: the line to be evaluated
+    :return: the key, or None
+    """
+    matches = _block_start_pattern.findall(line)
+    if matches:
+        return matches[0][1]
+    return None
+
+
+def _get_block_end_key(line):
+    """
+    If the line contains an end block tag, return the associated key.
+    Any other text on the line is discarded.
+    :param line: the line to be evaluated
+    :return: the key, or None
+    """
+    matches = _block_end_pattern.findall(line)
+    if matches:
+        return matches[0][1]
+    return None
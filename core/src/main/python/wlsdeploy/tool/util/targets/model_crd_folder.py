@@ -1,8 +1,8 @@
 """
-Copyright (c) 2022, Oracle and/or its affiliates.
+Copyright (c) 2022, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
-from wlsdeploy.util import dictionary_utils
+from wlsdeploy.tool.util.targets import schema_index
 
 NO_FOLDER_KEY = "__NO_KEY__"
 
@@ -13,11 +13,10 @@ class ModelCrdFolder:
     """
     _class_name = "ModelCrdFolder"
 
-    def __init__(self, model_key, schema, is_array):
+    def __init__(self, model_key, crd_schema_index, is_array):
         self._model_key = model_key
-        self._schema = schema
+        self._schema_index = crd_schema_index
         self._is_array = is_array
-        self._object_list_keys = {}
 
     def get_model_key(self):
         return self._model_key
@@ -26,7 +25,17 @@ class ModelCrdFolder:
         return self._is_array
 
     def get_schema(self):
-        return self._schema
+        return self._schema_index.get_schema()
+
+    def get_schema_index(self):
+        return self._schema_index
+
+    def get_root_node(self):
+        """
+        Return the compiled schema node for the top of this folder.
+        :return: the root SchemaNode
+        """
+        return self._schema_index.get_root()
 
     def has_model_key(self):
         return self._model_key != NO_FOLDER_KEY
@@ -35,7 +44,7 @@ class ModelCrdFolder:
     # we need to know the key in order to merge object lists correctly.
 
     def add_object_list_key(self, schema_path, key):
-        self._object_list_keys[schema_path] = key
+        self._schema_index.set_object_list_key(schema_path, key)
 
     def get_object_list_key(self, schema_path):
         """
@@ -44,7 +53,7 @@ class ModelCrdFolder:
         :param schema_path: the path to be checked
         :return: the object key
         """
-        mapped_key = dictionary_utils.get_element(self._object_list_keys, schema_path)
-        if mapped_key is not None:
-            return mapped_key
-        return 'name'
+        node = self._schema_index.get_node(schema_path)
+        if node is not None:
+            return node.get_object_list_key()
+        return schema_index.DEFAULT_OBJECT_LIST_KEY
@@ -1,5 +1,5 @@
 """
-Copyright (c) 2022, 2025, Oracle and/or its affiliates.
+Copyright (c) 2022, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 from wlsdeploy.aliases.model_constants import KUBERNETES
@@ -7,7 +7,7 @@ from wlsdeploy.exception import exception_helper
 from wlsdeploy.exception.exception_types import ExceptionType
 from wlsdeploy.logging import platform_logger
 from wlsdeploy.tool.util.targets import model_crd_folder
-from wlsdeploy.tool.util.targets import schema_helper
+from wlsdeploy.tool.util.targets import schema_index
 from wlsdeploy.tool.util.targets.model_crd_folder import ModelCrdFolder
 from wlsdeploy.util import dictionary_utils
 
@@ -85,12 +85,12 @@ def get_product_helper(product_key, product_version, exception_type=ExceptionTyp
     if product_version == WKO_VERSION_4:
         helper.set_model_section(KUBERNETES)
 
-        cluster_schema = schema_helper.get_schema(WKO_4_CLUSTER_SCHEMA_NAME, exception_type)
-        cluster_folder = ModelCrdFolder("clusters", cluster_schema, True)
+        cluster_index = schema_index.get_schema_index(WKO_4_CLUSTER_SCHEMA_NAME, exception_type)
+        cluster_folder = ModelCrdFolder("clusters", cluster_index, True)
         helper.add_crd_folder(cluster_folder)
 
-        domain_schema = schema_helper.get_schema(WKO_4_DOMAIN_SCHEMA_NAME, exception_type)
-        domain_folder = ModelCrdFolder("domain", domain_schema, False)
+        domain_index = schema_index.get_schema_index(WKO_4_DOMAIN_SCHEMA_NAME, exception_type)
+        domain_folder = ModelCrdFolder("domain", domain_index, False)
         domain_folder.add_object_list_key('spec/adminServer/adminService/channels', 'channelName')
         domain_folder.add_object_list_key('spec/managedServers', 'serverName')
         helper.add_crd_folder(domain_folder)
@@ -98,8 +98,8 @@ def get_product_helper(product_key, product_version, exception_type=ExceptionTyp
     elif product_version == WKO_VERSION_3:
         helper.set_model_section(KUBERNETES)
 
-        domain_schema = schema_helper.get_schema(WKO_3_DOMAIN_SCHEMA_NAME, exception_type)
-        domain_folder = ModelCrdFolder(model_crd_folder.NO_FOLDER_KEY, domain_schema, False)
+        domain_index = schema_index.get_schema_index(WKO_3_DOMAIN_SCHEMA_NAME, exception_type)
+        domain_folder = ModelCrdFolder(model_crd_folder.NO_FOLDER_KEY, domain_index, False)
         domain_folder.add_object_list_key('spec/adminServer/adminService/channels', 'channelName')
         domain_folder.add_object_list_key('spec/managedServers', 'serverName')
         domain_folder.add_object_list_key('spec/clusters', 'clusterName')
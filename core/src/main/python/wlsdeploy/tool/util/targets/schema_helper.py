@@ -1,5 +1,5 @@
 """
-Copyright (c) 2020, 2024, Oracle and/or its affiliates.
+Copyright (c) 2020, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 from oracle.weblogic.deploy.util import FileUtils
@@ -35,12 +35,27 @@ UNSUPPORTED_FOLDERS = [
 _logger = platform_logger.PlatformLogger('wlsdeploy.deploy')
 _class_name = 'schema_helper'
 
+# schema name -> schema dictionary, each schema resource is read once per process
+_schemas = {}
+
 
 def get_schema(schema_name, exception_type=ExceptionType.DEPLOY):
+    """
+    Get the CRD schema, reading it from its resource path the first time it is requested.
+    The returned schema is shared, and should not be modified.
+    """
+    schema = dictionary_utils.get_element(_schemas, schema_name)
+    if schema is None:
+        schema = _read_schema(schema_name, exception_type)
+        _schemas[schema_name] = schema
+    return schema
+
+
+def _read_schema(schema_name, exception_type):
     """
     Read the CRD schema from its resource path.
     """
-    _method_name = 'get_schema'
+    _method_name = '_read_schema'
 
     resource_name = schema_name + SCHEMA_RESOURCE_EXTENSION
     resource_path = SCHEMA_RESOURCE_PATH + '/' + resource_name
@@ -0,0 +1,220 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+A pre-compiled, path-indexed view of a CRD schema.
+"""
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+
+from wlsdeploy.exception.exception_types import ExceptionType
+from wlsdeploy.tool.util.targets import schema_helper
+from wlsdeploy.util import dictionary_utils
+
+DEFAULT_OBJECT_LIST_KEY = 'name'
+
+# schema name -> SchemaIndex, shared by all the CRD helpers in this process
+_schema_indexes = {}
+
+
+def get_schema_index(schema_name, exception_type=ExceptionType.DEPLOY):
+    """
+    Get the index for the named CRD schema.
+    The schema is read and indexed the first time it is requested.
+    :param schema_name: the name of the schema resource, without the extension
+    :param exception_type: the exception type to throw if the schema cannot be read
+    :return: the SchemaIndex for the schema
+    """
+    index = dictionary_utils.get_element(_schema_indexes, schema_name)
+    if index is None:
+        index = SchemaIndex(schema_helper.get_schema(schema_name, exception_type))
+        _schema_indexes[schema_name] = index
+    return index
+
+
+class SchemaIndex(object):
+    """
+    The folders of a CRD schema, compiled into SchemaNode objects and indexed by schema path.
+    Schema paths do not include array indices, and the root folder has the path None.
+    Paths inside "one of" folder options are not indexed, they are reached through the option nodes.
+    """
+    def __init__(self, schema):
+        self._schema = schema
+        self._nodes = {}
+        # schema path -> list of nodes with that path, including those inside folder options
+        self._path_nodes = {}
+        self._root = SchemaNode(schema, None)
+        self._compile(self._root, True)
+
+    def get_schema(self):
+        """
+        :return: the raw schema dictionary
+        """
+        return self._schema
+
+    def get_root(self):
+        """
+        :return: the SchemaNode for the root folder of the schema
+        """
+        return self._root
+
+    def get_node(self, schema_path):
+        """
+        Get the node for the specified schema path.
+        :param schema_path: the schema path, such as spec/adminServer
+        :return: the SchemaNode, or None if the path is not in the schema
+        """
+        return dictionary_utils.get_element(self._nodes, schema_path)
+
+    def set_object_list_key(self, schema_path, key):
+        """
+        Set the key attribute for the objects in the object list at the specified path.
+        :param schema_path: the path of the object list
+        :param key: the name of the key attribute
+        """
+        for node in dictionary_utils.get_element(self._path_nodes, schema_path, []):
+            node._object_list_key = key
+
+    def _compile(self, node, indexed):
+        """
+        Compile the properties and folder options of the node, and their descendants.
+        :param node: the node to be compiled
+        :param indexed: True if the node's descendants should be added to the path index
+        """
+        if indexed:
+            self._nodes[node.get_path()] = node
+        if node.is_object_array():
+            self._path_nodes.setdefault(node.get_path(), []).append(node)
+
+        folder_map = node.get_schema_map()
+        if node.is_object_array():
+            folder_map = schema_helper.get_array_item_info(folder_map)
+
+        options = schema_helper.get_one_of_options(folder_map)
+        if options:
+            node._options = []
+            for option_map in options:
+                option_node = SchemaNode(option_map, node.get_path())
+                node._options.append(option_node)
+                self._compile(option_node, False)
+
+        properties = schema_helper.get_properties(folder_map)
+        for key in properties:
+            property_map = properties[key]
+            if property_map is not None:
+                child_node = SchemaNode(property_map, schema_helper.append_path(node.get_path(), key))
+                node._properties[key] = child_node
+                self._compile(child_node, indexed)
+
+
+class SchemaNode(object):
+    """
+    A compiled schema folder or attribute, with its type information resolved once.
+    For an object array, the properties and folder options are those of the array items.
+    """
+    def __init__(self, schema_map, schema_path):
+        self._schema_map = schema_map
+        self._path = schema_path
+        self._type = schema_helper.get_type(schema_map)
+        self._is_single_object = schema_helper.is_single_object(schema_map)
+        self._is_object_array = schema_helper.is_object_array(schema_map)
+        self._is_simple_map = schema_helper.is_simple_map(schema_map)
+        self._is_simple_array = schema_helper.is_simple_array(schema_map)
+        self._is_simple_type = schema_helper.is_simple_type(schema_map)
+        self._unsupported = schema_path is not None and schema_helper.is_unsupported_folder(schema_path)
+        self._object_list_key = DEFAULT_OBJECT_LIST_KEY
+
+        self._element_type = None
+        if self._is_simple_map:
+            self._element_type = schema_helper.get_map_element_type(schema_map)
+        elif self._is_simple_array:
+            self._element_type = schema_helper.get_array_element_type(schema_map)
+
+        self._enum_values = schema_helper.get_enum_values(schema_map)
+        self._enum_set = None
+        if self._enum_values:
+            self._enum_set = set(self._enum_values)
+
+        # assigned by SchemaIndex
+        self._properties = OrderedDict()
+        self._options = None
+
+    def get_schema_map(self):
+        return self._schema_map
+
+    def get_path(self):
+        return self._path
+
+    def get_type(self):
+        return self._type
+
+    def get_element_type(self):
+        """
+        :return: the element type of a simple map or simple array, otherwise None
+        """
+        return self._element_type
+
+    def get_enum_values(self):
+        """
+        :return: the list of allowed values, in schema order, or None if the values are not restricted
+        """
+        return self._enum_values
+
+    def is_enum_value(self, value):
+        return self._enum_set is None or value in self._enum_set
+
+    def is_single_object(self):
+        return self._is_single_object
+
+    def is_object_array(self):
+        return self._is_object_array
+
+    def is_object_type(self):
+        return self._is_single_object or self._is_object_array
+
+    def is_simple_map(self):
+        return self._is_simple_map
+
+    def is_simple_array(self):
+        return self._is_simple_array
+
+    def is_simple_type(self):
+        return self._is_simple_type
+
+    def is_unsupported(self):
+        return self._unsupported
+
+    def get_object_list_key(self):
+        """
+        :return: the name of the attribute that identifies the objects in an object list
+        """
+        return self._object_list_key
+
+    def get_properties(self):
+        """
+        :return: an ordered dictionary of property names to SchemaNode objects
+        """
+        return self._properties
+
+    def get_property(self, key):
+        return dictionary_utils.get_element(self._properties, key)
+
+    def get_options(self):
+        """
+        :return: a list of SchemaNode objects for the "one of" folder options, or None
+        """
+        return self._options
+
+    def get_description(self):
+        return dictionary_utils.get_element(self._schema_map, 'description')
+
+    def get_kind_value(self):
+        """
+        Return the "kind" value of a folder option, used to identify the option.
+        :return: the first enum value of the "kind" property, or None
+        """
+        kind_node = self.get_property('kind')
+        if kind_node is not None:
+            enum_values = kind_node.get_enum_values()
+            if enum_values:
+                return enum_values[0]
+        return None
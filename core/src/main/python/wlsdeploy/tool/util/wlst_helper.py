@@ -1,5 +1,5 @@
 """
-Copyright (c) 2019, 2025, Oracle and/or its affiliates.
+Copyright (c) 2019, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 
@@ -836,6 +836,23 @@ class WlstHelper(object):
             raise pwe
         self.__logger.exiting(class_name=self.__class_name, method_name=_method_name)
 
+    def write_template(self, template_file):
+        """
+        Write the current domain configuration to a domain template file.
+        :param template_file: the path of the template file to be written
+        :raises: Exception for the specified tool type: if a WLST error occurs
+        """
+        _method_name = 'write_template'
+        self.__logger.entering(template_file, class_name=self.__class_name, method_name=_method_name)
+        try:
+            self.__load_global('writeTemplate')(template_file)
+        except offlineWLSTException, e:
+            pwe = exception_helper.create_exception(self.__exception_type, 'WLSDPLY-00138', template_file,
+                                                    e.getLocalizedMessage(), error=e)
+            self.__logger.throwing(class_name=self.__class_name, method_name=_method_name, error=pwe)
+            raise pwe
+        self.__logger.exiting(class_name=self.__class_name, method_name=_method_name)
+
     def update_domain(self):
         """
         Update the existing domain configuration with the edits made during the offline session.
@@ -1705,6 +1722,13 @@ class WlstHelper(object):
         """
         return self.get_domain_runtime_service().getServerRuntimes()
 
+    def get_mbean_server_connection(self):
+        """
+        Return the MBean server connection for the current MBean tree.
+        :return: the MBeanServerConnection instance
+        """
+        return self.__load_global('mbs')
+
     def get_domain_runtime_service(self):
         """
         Return the DomainRuntimeServiceMBean instance.
@@ -1,5 +1,5 @@
 """
-Copyright (c) 2017, 2025, Oracle and/or its affiliates.
+Copyright (c) 2017, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 
@@ -12,6 +12,7 @@ from wlsdeploy.aliases.model_constants import MASKED_PASSWORD
 from wlsdeploy.aliases.validation_codes import ValidationCodes
 from wlsdeploy.logging.platform_logger import PlatformLogger
 from wlsdeploy.tool.validate import validation_utils
+from wlsdeploy.tool.validate.validation_metadata import ValidationMetadataCache
 from wlsdeploy.util import dictionary_utils
 from wlsdeploy.util import path_helper
 from wlsdeploy.util import variables
@@ -30,7 +31,7 @@ class ModelValidator(object):
     Subclasses can extend methods for more specific validations.
     """
     def __init__(self, variables_map, archive_helper, validation_mode, model_context, aliases,
-                 wlst_mode):
+                 wlst_mode, validation_cache=None):
         """
         Create a validator instance.
         :param variables_map: map of variables used in the model
@@ -38,8 +39,10 @@ class ModelValidator(object):
         :param model_context: used to get command-line options
         :param aliases: used to validate folders, attributes. also determines exception type
         :param wlst_mode: online or offline mode
+        :param validation_cache: used to reuse the results for unchanged top-level folders, or None
         """
         self._logger = _logger
+        self._validation_cache = validation_cache
 
         self._variable_properties = variables_map
         self._archive_helper = archive_helper
@@ -62,6 +65,7 @@ class ModelValidator(object):
             self._wls_version = model_context.get_effective_wls_version()
 
         self._aliases = aliases
+        self._metadata_cache = ValidationMetadataCache(aliases, self._wls_version, self._wlst_mode)
 
         # need a token here for alias path resolution
         self._name_tokens_location = LocationContext()
@@ -175,7 +179,8 @@ class ModelValidator(object):
         """
         _method_name = '_validate_folder'
 
-        result, message = self._aliases.is_version_valid_location(validation_location)
+        metadata = self._metadata_cache.get_folder_metadata(validation_location)
+        result, message = metadata.is_version_valid_location(validation_location)
         if result == ValidationCodes.CONTEXT_INVALID:
             self._log_context_invalid(message, _method_name)
             return
@@ -184,9 +189,8 @@ class ModelValidator(object):
             return
 
         # generate and add a flattened folder token, if required
-        flattened_folder_info = self._aliases.get_wlst_flattened_folder_info(validation_location)
-        if flattened_folder_info is not None:
-            path_token = flattened_folder_info.get_path_token()
+        path_token = metadata.get_flattened_path_token()
+        if path_token is not None:
             validation_location.add_name_token(path_token, '%s-0' % path_token)
 
         model_folder_path = self._aliases.get_model_folder_path(validation_location)
@@ -197,7 +201,7 @@ class ModelValidator(object):
             self._logger.severe('WLSDPLY-05038', model_folder_path, class_name=_class_name, method_name=_method_name)
             return
 
-        if self._aliases.supports_multiple_mbean_instances(validation_location):
+        if metadata.supports_multiple_mbean_instances():
             self._logger.finer('model_node_type={0}',
                                _ModelNodeTypes.from_value(_ModelNodeTypes.NAME_TYPE),
                                class_name=_class_name, method_name=_method_name)
@@ -212,7 +216,7 @@ class ModelValidator(object):
 
                 new_location = LocationContext(validation_location)
 
-                name_token = self._aliases.get_name_token(new_location)
+                name_token = metadata.get_name_token()
                 self._logger.finest('WLSDPLY-05014', str_helper.to_string(validation_location), name_token,
                                     class_name=_class_name, method_name=_method_name)
 
@@ -224,9 +228,9 @@ class ModelValidator(object):
 
                 value_dict = model_node[name]
 
-                self._validate_folder_content(value_dict, new_location)
+                self._validate_top_level_content(value_dict, new_location)
 
-        elif self._aliases.requires_artificial_type_subfolder_handling(validation_location):
+        elif metadata.requires_artificial_type_subfolder_handling():
             self._logger.finer('model_node_type={0}',
                                _ModelNodeTypes.from_value(_ModelNodeTypes.ARTIFICIAL_TYPE),
                                class_name=_class_name, method_name=_method_name)
@@ -241,7 +245,7 @@ class ModelValidator(object):
 
                 new_location = LocationContext(validation_location)
 
-                name_token = self._aliases.get_name_token(new_location)
+                name_token = metadata.get_name_token()
                 self._logger.finest('name_token={0}', name_token,
                                     class_name=_class_name, method_name=_method_name)
 
@@ -260,7 +264,7 @@ class ModelValidator(object):
                                _ModelNodeTypes.from_value(_ModelNodeTypes.FOLDER_TYPE),
                                class_name=_class_name, method_name=_method_name)
 
-            name_token = self._aliases.get_name_token(validation_location)
+            name_token = metadata.get_name_token()
             self._logger.finest('name_token={0}', name_token,
                                 class_name=_class_name, method_name=_method_name)
 
@@ -276,7 +280,22 @@ class ModelValidator(object):
                 self._logger.finest('validation_location={0}', validation_location,
                                     class_name=_class_name, method_name=_method_name)
 
+            self._validate_top_level_content(model_node, validation_location)
+
+    def _validate_top_level_content(self, model_node, validation_location):
+        """
+        Validate the content of a model folder, using the validation cache for folders directly below
+        the model sections, such as topology:/Server/m1 or topology:/JTA.
+        :param model_node: the model node dictionary
+        :param validation_location: the alias location for the folder
+        """
+        if self._validation_cache is None or len(validation_location.get_model_folders()) != 1:
             self._validate_folder_content(model_node, validation_location)
+            return
+
+        model_folder_path = self._aliases.get_model_folder_path(validation_location)
+        self._validation_cache.validate(model_folder_path, model_node,
+                                        lambda: self._validate_folder_content(model_node, validation_location))
 
     def _validate_folder_content(self, model_node, validation_location):
         """
@@ -295,8 +314,9 @@ class ModelValidator(object):
             self._logger.severe('WLSDPLY-05038', model_folder_path, class_name=_class_name, method_name=_method_name)
             return
 
-        valid_folder_keys = self._aliases.get_model_subfolder_names(validation_location)
-        valid_attr_infos = self._aliases.get_model_attribute_names_and_types(validation_location)
+        metadata = self._metadata_cache.get_folder_metadata(validation_location)
+        valid_folder_keys = metadata.get_subfolder_names()
+        valid_attr_infos = metadata.get_attribute_infos()
 
         self._logger.finest('aliases.get_model_subfolder_names(validation_location) returned: {0}',
                             str_helper.to_string(valid_folder_keys),
@@ -315,22 +335,21 @@ class ModelValidator(object):
                                class_name=_class_name, method_name=_method_name)
 
             folder_validation_code, folder_validation_message = \
-                self._aliases.is_valid_model_folder_name(validation_location, key)
+                metadata.is_valid_model_folder_name(validation_location, key)
             attribute_validation_code, attribute_validation_message = \
-                self._aliases.is_valid_model_attribute_name(validation_location, key)
+                metadata.is_valid_model_attribute_name(validation_location, key)
 
             if folder_validation_code == ValidationCodes.VALID:
                 new_location = LocationContext(validation_location).append_location(key)
                 self._logger.finer('new_location={0}', new_location,
                                    class_name=_class_name, method_name=_method_name)
 
-                if self._aliases.is_artificial_type_folder(new_location):
+                new_metadata = self._metadata_cache.get_folder_metadata(new_location)
+                if new_metadata.is_artificial_type_folder():
                     # key is an ARTIFICIAL_TYPE folder
                     self._logger.finest('is_artificial_type_folder=True',
                                         class_name=_class_name, method_name=_method_name)
-                    valid_attr_infos = self._aliases.get_model_attribute_names_and_types(new_location)
-
-                    self._validate_attributes(value, valid_attr_infos, new_location)
+                    self._validate_attributes(value, new_metadata.get_attribute_infos(), new_location)
                 else:
                     self._validate_folder(value, new_location)
             elif attribute_validation_code == ValidationCodes.VALID:
@@ -344,8 +363,7 @@ class ModelValidator(object):
                     self.__validate_properties(properties, valid_prop_infos, validation_location)
 
                 else:
-                    path_tokens_attr_keys = \
-                        self._aliases.get_model_uses_path_tokens_attribute_names(validation_location)
+                    path_tokens_attr_keys = metadata.get_path_tokens_attribute_names()
 
                     self._validate_attribute(key, value, valid_attr_infos, path_tokens_attr_keys, model_folder_path,
                                              validation_location)
@@ -353,7 +371,7 @@ class ModelValidator(object):
                 self._log_context_invalid(folder_validation_message, _method_name)
             elif attribute_validation_code == ValidationCodes.CONTEXT_INVALID:
                 self._log_context_invalid(attribute_validation_message, _method_name)
-            elif self._aliases.is_custom_folder_allowed(validation_location):
+            elif metadata.is_custom_folder_allowed():
                 # custom folders are not validated, just log this and continue
                 self._logger.info('WLSDPLY-05037', model_folder_path,
                                   class_name=_class_name, method_name=_method_name)
@@ -398,7 +416,8 @@ class ModelValidator(object):
             self._logger.severe('WLSDPLY-05038', model_folder_path, class_name=_class_name, method_name=_method_name)
             return
 
-        path_tokens_attr_keys = self._aliases.get_model_uses_path_tokens_attribute_names(validation_location)
+        metadata = self._metadata_cache.get_folder_metadata(validation_location)
+        path_tokens_attr_keys = metadata.get_path_tokens_attribute_names()
         self._logger.finer('WLSDPLY-05013', str_helper.to_string(validation_location),
                            str_helper.to_string(path_tokens_attr_keys),
                            class_name=_class_name, method_name=_method_name)
@@ -429,7 +448,8 @@ class ModelValidator(object):
             self._logger.finer('WLSDPLY-05016', attribute_name, expected_data_type, actual_data_type,
                                class_name=_class_name, method_name=_method_name)
             if validation_utils.is_compatible_data_type(expected_data_type, actual_data_type) is False:
-                if not self._aliases.model_attribute_has_set_method(validation_location, attribute_name):
+                metadata = self._metadata_cache.get_folder_metadata(validation_location)
+                if not metadata.model_attribute_has_set_method(attribute_name):
                     self._logger.warning('WLSDPLY-05017', attribute_name, model_folder_path, expected_data_type,
                                          actual_data_type, class_name=_class_name, method_name=_method_name)
 
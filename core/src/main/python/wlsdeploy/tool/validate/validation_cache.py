@@ -0,0 +1,403 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+An opt-in cache of validation results for model folders, used to validate only the folders that changed.
+The cache is enabled by setting the WLSDEPLOY_VALIDATION_CACHE_DIR environment variable to the cache directory.
+"""
+import os
+
+from java.lang import System
+from java.util.logging import Handler
+from java.util.logging import Level
+from java.util.logging import Logger as JLogger
+
+from oracle.weblogic.deploy.json import JsonException
+from oracle.weblogic.deploy.logging import DeprecationLevel
+from oracle.weblogic.deploy.logging import NotificationLevel
+from oracle.weblogic.deploy.logging import ToDoLevel
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+from oracle.weblogic.deploy.util import WebLogicDeployToolingVersion
+
+from wlsdeploy.aliases.wlst_modes import WlstModes
+from wlsdeploy.exception import exception_helper
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.util import dictionary_utils
+from wlsdeploy.util import env_helper
+from wlsdeploy.util import hash_utils
+from wlsdeploy.util import unicode_helper as str_helper
+from wlsdeploy.util import variables
+
+CACHE_DIR_ENV_VARIABLE = 'WLSDEPLOY_VALIDATION_CACHE_DIR'
+CACHE_FILE_SUFFIX = '.json'
+
+# records are captured from all the tool loggers
+CAPTURE_LOGGER_NAME = 'wlsdeploy'
+
+# context input keys
+WDT_VERSION = 'wdtVersion'
+WLS_VERSION = 'wlsVersion'
+WLST_MODE = 'wlstMode'
+VALIDATION_MODE = 'validationMode'
+VALIDATE_CONFIGURATION = 'validateConfiguration'
+REMOTE = 'remote'
+SKIP_ARCHIVE = 'skipArchive'
+VARIABLE_FILE = 'variableFile'
+ARCHIVE_FILES = 'archiveFiles'
+
+# cache file keys
+KEY = 'key'
+FOLDER_PATH = 'folderPath'
+RECORDS = 'records'
+LOGGER = 'logger'
+BUNDLE = 'bundle'
+LEVEL = 'level'
+MESSAGE = 'message'
+PARAMETERS = 'parameters'
+SOURCE_CLASS = 'class'
+SOURCE_METHOD = 'method'
+
+# tokens with values that are not part of the key, folders that use them are always validated
+_UNCACHED_TOKEN_TYPES = ['ENV', 'FILE', 'SECRET']
+
+# the levels that are captured and replayed, records at lower levels are not replayed
+_CAPTURED_LEVELS = [Level.SEVERE, Level.WARNING, DeprecationLevel.DEPRECATION, NotificationLevel.NOTIFICATION,
+                    ToDoLevel.TODO, Level.INFO]
+
+_class_name = 'validation_cache'
+_logger = PlatformLogger('wlsdeploy.validate')
+
+
+def get_validation_cache(model_context, wls_version, wlst_mode, validation_mode, variables_map):
+    """
+    Get the validation cache, if it is enabled.
+    :param model_context: the model context
+    :param wls_version: the WebLogic Server version used for validation
+    :param wlst_mode: the WLST mode used for validation
+    :param validation_mode: the validation mode name, such as STANDALONE
+    :param variables_map: the variable names and values used for validation
+    :return: the ValidationCache, or None if the cache directory is not set
+    """
+    _method_name = 'get_validation_cache'
+
+    cache_directory = env_helper.getenv(CACHE_DIR_ENV_VARIABLE)
+    if not cache_directory:
+        return None
+
+    cache_directory = os.path.abspath(cache_directory)
+    _logger.fine('WLSDPLY-33300', cache_directory, class_name=_class_name, method_name=_method_name)
+    inputs = compute_context_inputs(model_context, wls_version, wlst_mode, validation_mode)
+    return ValidationCache(cache_directory, inputs, variables_map)
+
+
+def compute_context_inputs(model_context, wls_version, wlst_mode, validation_mode):
+    """
+    Compute the inputs that affect the validation of every model folder.
+    Archive files are identified by the SHA-256 hash of their content.
+    :param model_context: the model context
+    :param wls_version: the WebLogic Server version used for validation
+    :param wlst_mode: the WLST mode used for validation
+    :param validation_mode: the validation mode name, such as STANDALONE
+    :return: an ordered dictionary of the inputs
+    """
+    validate_configuration = model_context.get_validate_configuration()
+    configuration = OrderedDict()
+    configuration['allowUnresolvedArchiveReferences'] = \
+        validate_configuration.allow_unresolved_archive_references()
+    configuration['allowUnresolvedVariableTokens'] = validate_configuration.allow_unresolved_variable_tokens()
+    configuration['allowVersionInvalidAttributes'] = validate_configuration.allow_version_invalid_attributes()
+    configuration['disregardVersionInvalidAttributes'] = \
+        validate_configuration.disregard_version_invalid_attributes()
+
+    inputs = OrderedDict()
+    inputs[WDT_VERSION] = WebLogicDeployToolingVersion.getVersion()
+    inputs[WLS_VERSION] = wls_version
+    inputs[WLST_MODE] = WlstModes.from_value(wlst_mode)
+    inputs[VALIDATION_MODE] = validation_mode
+    inputs[VALIDATE_CONFIGURATION] = configuration
+    inputs[REMOTE] = model_context.is_remote()
+    inputs[SKIP_ARCHIVE] = model_context.is_skip_archive()
+    inputs[VARIABLE_FILE] = model_context.get_variable_file()
+
+    archive_files = OrderedDict()
+    archive_file_name = model_context.get_archive_file_name()
+    if archive_file_name:
+        for archive_file in archive_file_name.split(','):
+            archive_hash = None
+            if os.path.isfile(archive_file):
+                archive_hash = hash_utils.hash_file(archive_file)
+            archive_files[archive_file] = archive_hash
+    inputs[ARCHIVE_FILES] = archive_files
+    return inputs
+
+
+class ValidationCache(object):
+    """
+    A directory of validation results for model folders, each in a file named for its key.
+    The key is the hash of the folder path, the folder content in model order, the values of the variables used
+    in the folder, and the context inputs. The results are the log records at INFO level and above that were
+    logged while the folder was validated. When the key matches, the records are logged again instead of
+    validating the folder, so the summary and the validation status are the same as for a full validation.
+    Folders that use environment, file, or secret tokens are always validated, and failures to read or store
+    results are logged at FINE level, so the cache does not change the validation result.
+    """
+    def __init__(self, cache_directory, context_inputs, variables_map):
+        """
+        :param cache_directory: the cache directory
+        :param context_inputs: the inputs that affect every folder, from compute_context_inputs()
+        :param variables_map: the variable names and values used for validation
+        """
+        self._cache_directory = cache_directory
+        self._context_key = compute_digest(context_inputs)
+        self._variables_map = variables_map
+        if self._variables_map is None:
+            self._variables_map = {}
+
+        self._loggers = {}
+        self._folder_count = 0
+        self._reused_count = 0
+
+    def get_cache_directory(self):
+        return self._cache_directory
+
+    def get_folder_count(self):
+        return self._folder_count
+
+    def get_reused_count(self):
+        return self._reused_count
+
+    def compute_key(self, folder_path, folder):
+        """
+        Compute the cache key for a model folder.
+        :param folder_path: the model folder path, such as resources:/JDBCSystemResource/ds1
+        :param folder: the folder dictionary
+        :return: the hexadecimal key, or None if the folder uses tokens that are not cached
+        """
+        property_values = OrderedDict()
+        for text in _get_folder_text(folder):
+            for token, token_type, name in variables.get_token_references(text):
+                if token_type in _UNCACHED_TOKEN_TYPES:
+                    return None
+                property_values[name] = dictionary_utils.get_element(self._variables_map, name)
+
+        return compute_digest([self._context_key, folder_path, folder, property_values])
+
+    def validate(self, folder_path, folder, validate_function):
+        """
+        Validate a model folder, or log the cached results of a previous validation with the same key.
+        :param folder_path: the model folder path, such as resources:/JDBCSystemResource/ds1
+        :param folder: the folder dictionary
+        :param validate_function: a function with no arguments that validates the folder
+        """
+        _method_name = 'validate'
+
+        self._folder_count += 1
+        key = self.compute_key(folder_path, folder)
+        if key is None:
+            _logger.fine('WLSDPLY-33304', folder_path, class_name=_class_name, method_name=_method_name)
+            validate_function()
+            return
+
+        cache_file = os.path.join(self._cache_directory, key + CACHE_FILE_SUFFIX)
+        records = self._read_records(cache_file, key)
+        if records is not None:
+            self._reused_count += 1
+            _logger.fine('WLSDPLY-33301', folder_path, class_name=_class_name, method_name=_method_name)
+            for record in records:
+                self._replay(record)
+            return
+
+        capture_logger = JLogger.getLogger(CAPTURE_LOGGER_NAME)
+        handler = _CaptureHandler()
+        capture_logger.addHandler(handler)
+        try:
+            validate_function()
+        finally:
+            capture_logger.removeHandler(handler)
+
+        if handler.get_reason() is not None:
+            _logger.fine('WLSDPLY-33303', folder_path, handler.get_reason(),
+                         class_name=_class_name, method_name=_method_name)
+            return
+
+        contents = OrderedDict()
+        contents[KEY] = key
+        contents[FOLDER_PATH] = folder_path
+        contents[RECORDS] = handler.get_records()
+        self._write_cache_file(cache_file, contents, folder_path)
+
+    def log_summary(self):
+        """
+        Log the number of folders that used cached results.
+        """
+        _method_name = 'log_summary'
+        _logger.fine('WLSDPLY-33306', self._reused_count, self._folder_count,
+                     class_name=_class_name, method_name=_method_name)
+
+    def _read_records(self, cache_file, key):
+        _method_name = '_read_records'
+
+        if not os.path.isfile(cache_file):
+            return None
+
+        try:
+            from wlsdeploy.json.json_translator import JsonToPython
+            contents = JsonToPython(cache_file).parse()
+        except JsonException, ex:
+            _logger.fine('WLSDPLY-33305', cache_file, ex.getLocalizedMessage(),
+                         class_name=_class_name, method_name=_method_name)
+            return None
+
+        if dictionary_utils.get_element(contents, KEY) != key:
+            return None
+        return dictionary_utils.get_element(contents, RECORDS, [])
+
+    def _write_cache_file(self, cache_file, contents, folder_path):
+        _method_name = '_write_cache_file'
+
+        # write to a temporary file, so concurrent runs never read a partial file
+        temp_file = '%s.%s.tmp' % (cache_file, str_helper.to_string(System.nanoTime()))
+        try:
+            try:
+                if not os.path.isdir(self._cache_directory):
+                    os.makedirs(self._cache_directory)
+                from wlsdeploy.json.json_translator import PythonToJson
+                PythonToJson(contents).write_to_json_file(temp_file)
+                if os.path.isfile(cache_file):
+                    os.remove(cache_file)
+                os.rename(temp_file, cache_file)
+                _logger.fine('WLSDPLY-33302', folder_path, cache_file,
+                             class_name=_class_name, method_name=_method_name)
+            except JsonException, ex:
+                _logger.fine('WLSDPLY-33303', folder_path, ex.getLocalizedMessage(),
+                             class_name=_class_name, method_name=_method_name)
+            except (IOError, OSError), ex:
+                _logger.fine('WLSDPLY-33303', folder_path, str_helper.to_string(ex),
+                             class_name=_class_name, method_name=_method_name)
+        finally:
+            if os.path.isfile(temp_file):
+                os.remove(temp_file)
+
+    def _replay(self, record):
+        logger_name = dictionary_utils.get_element(record, LOGGER)
+        bundle_name = dictionary_utils.get_element(record, BUNDLE)
+        logger = self._loggers.get((logger_name, bundle_name))
+        if logger is None:
+            logger = PlatformLogger(logger_name, resource_bundle_name=bundle_name)
+            self._loggers[(logger_name, bundle_name)] = logger
+
+        level = _get_level(dictionary_utils.get_element(record, LEVEL))
+        parameters = dictionary_utils.get_element(record, PARAMETERS, [])
+        logger.log(level, dictionary_utils.get_element(record, MESSAGE), *parameters,
+                   class_name=dictionary_utils.get_element(record, SOURCE_CLASS),
+                   method_name=dictionary_utils.get_element(record, SOURCE_METHOD))
+
+
+class _CaptureHandler(Handler):
+    """
+    Captures the log records at INFO level and above, in a form that can be stored and logged again.
+    Records with exceptions or custom levels cannot be logged again, and prevent the results from being stored.
+    """
+    def __init__(self):
+        Handler.__init__(self)
+        self.setLevel(Level.INFO)
+        self._records = []
+        self._reason = None
+
+    def get_records(self):
+        return self._records
+
+    def get_reason(self):
+        """
+        :return: the reason the records cannot be stored, or None
+        """
+        return self._reason
+
+    def publish(self, log_record):
+        if not self.isLoggable(log_record):
+            return
+
+        level_name = log_record.getLevel().getName()
+        if log_record.getThrown() is not None:
+            self._reason = exception_helper.get_message('WLSDPLY-33307', log_record.getMessage())
+            return
+        if _get_level(level_name) is None:
+            self._reason = exception_helper.get_message('WLSDPLY-33308', log_record.getMessage(), level_name)
+            return
+
+        parameters = []
+        for parameter in log_record.getParameters() or []:
+            parameters.append(str_helper.to_string(parameter))
+
+        record = OrderedDict()
+        record[LOGGER] = log_record.getLoggerName()
+        record[BUNDLE] = log_record.getResourceBundleName()
+        record[LEVEL] = level_name
+        record[MESSAGE] = log_record.getMessage()
+        record[PARAMETERS] = parameters
+        record[SOURCE_CLASS] = log_record.getSourceClassName()
+        record[SOURCE_METHOD] = log_record.getSourceMethodName()
+        self._records.append(record)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def compute_digest(value):
+    """
+    Compute the SHA-256 hash of the canonical form of a value.
+    Dictionaries are hashed in iteration order, because that is the order of the validation messages.
+    Each scalar is hashed with its type, because validation checks the data type of attribute values.
+    :param value: a dictionary, list, or scalar value
+    :return: the hexadecimal hash
+    """
+    digest = hash_utils.create_digest()
+    _update_digest(digest, value)
+    return hash_utils.to_hex(digest.digest())
+
+
+def _update_digest(digest, value):
+    if isinstance(value, dict):
+        _update_text(digest, 'dict:%d' % len(value))
+        for key in value:
+            _update_digest(digest, key)
+            _update_digest(digest, value[key])
+    elif isinstance(value, (list, tuple)):
+        _update_text(digest, 'list:%d' % len(value))
+        for member in value:
+            _update_digest(digest, member)
+    else:
+        text = str_helper.to_string(value)
+        # the length prefix keeps values with separators from matching other values
+        _update_text(digest, '%s:%d:%s' % (type(value).__name__, len(text), text))
+
+
+def _update_text(digest, text):
+    hash_utils.update_digest(digest, text + '\n')
+
+
+def _get_folder_text(folder):
+    """
+    Get the text of the keys and values in a folder and its sub-folders, to be checked for tokens.
+    """
+    result = []
+    if isinstance(folder, dict):
+        for key in folder:
+            result.append(str_helper.to_string(key))
+            result.extend(_get_folder_text(folder[key]))
+    elif isinstance(folder, (list, tuple)):
+        for member in folder:
+            result.extend(_get_folder_text(member))
+    elif folder is not None:
+        result.append(str_helper.to_string(folder))
+    return result
+
+
+def _get_level(level_name):
+    for level in _CAPTURED_LEVELS:
+        if level.getName() == level_name:
+            return level
+    return None
@@ -0,0 +1,188 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+Cache of the alias metadata used when validating model folders.
+"""
+from wlsdeploy.aliases.location_context import LocationContext
+from wlsdeploy.aliases.validation_codes import ValidationCodes
+from wlsdeploy.logging.platform_logger import PlatformLogger
+
+_class_name = 'ValidationMetadataCache'
+_logger = PlatformLogger('wlsdeploy.validate')
+
+
+class ValidationMetadataCache(object):
+    """
+    Cache of alias metadata for model folders, keyed by the alias folder path, WLS version and WLST mode.
+    Multiple instances of a folder (such as Server/ms1, Server/ms2) share the same entry,
+    so the aliases are queried once per folder type instead of once per model node.
+    """
+    def __init__(self, aliases, wls_version, wlst_mode):
+        """
+        Create a cache instance.
+        :param aliases: the aliases used to populate the cache entries
+        :param wls_version: the WLS version used by the aliases
+        :param wlst_mode: the WLST mode used by the aliases
+        """
+        self._aliases = aliases
+        self._wls_version = wls_version
+        self._wlst_mode = wlst_mode
+        self._folder_metadata = {}
+
+    def get_folder_metadata(self, location):
+        """
+        Get the metadata for the folder at the specified location, creating it if needed.
+        :param location: the location of the folder
+        :return: the FolderMetadata for the location
+        """
+        key = (location.get_folder_path(), self._wls_version, self._wlst_mode)
+        metadata = self._folder_metadata.get(key)
+        if metadata is None:
+            _logger.finer('Creating validation metadata for {0}', key[0],
+                          class_name=_class_name, method_name='get_folder_metadata')
+            metadata = FolderMetadata(self._aliases, location)
+            self._folder_metadata[key] = metadata
+        return metadata
+
+    def size(self):
+        """
+        Get the number of folder entries in the cache.
+        :return: the number of entries
+        """
+        return len(self._folder_metadata)
+
+
+class FolderMetadata(object):
+    """
+    The alias metadata for a single model folder.
+    Values are looked up from the aliases on first use, then reused for every instance of the folder.
+    Only values that do not depend on the instance names in the location are held here.
+    Messages for invalid folders and attributes include the instance path, so they are always
+    requested from the aliases using the caller's location.
+    """
+    def __init__(self, aliases, location):
+        self._aliases = aliases
+        # copy the location, the caller may add name tokens as it navigates
+        self._location = LocationContext(location)
+        self._values = {}
+        self._folder_codes = {}
+        self._attribute_codes = {}
+        self._set_method_names = {}
+
+    def get_attribute_infos(self):
+        """
+        Get the valid model attribute names and types for the folder.
+        The returned dictionary is shared, and should not be modified.
+        :return: a dictionary of model attribute names to types
+        """
+        return self._get_value('attribute_infos', self._aliases.get_model_attribute_names_and_types)
+
+    def get_path_tokens_attribute_names(self):
+        """
+        Get the names of attributes in the folder that use path tokens.
+        :return: a list of model attribute names
+        """
+        return self._get_value('path_tokens_attrs', self._aliases.get_model_uses_path_tokens_attribute_names)
+
+    def get_subfolder_names(self):
+        """
+        Get the valid model subfolder names for the folder.
+        :return: a list of model folder names
+        """
+        return self._get_value('subfolder_names', self._aliases.get_model_subfolder_names)
+
+    def get_name_token(self):
+        """
+        Get the name token for the folder.
+        :return: the name token, or None
+        """
+        return self._get_value('name_token', self._aliases.get_name_token)
+
+    def get_flattened_path_token(self):
+        """
+        Get the path token for the flattened folder, if the folder has one.
+        :return: the path token, or None if the folder has no flattened folder
+        """
+        return self._get_value('flattened_path_token', self.__get_flattened_path_token)
+
+    def supports_multiple_mbean_instances(self):
+        return self._get_value('multiple', self._aliases.supports_multiple_mbean_instances)
+
+    def requires_artificial_type_subfolder_handling(self):
+        return self._get_value('artificial_subfolders', self._aliases.requires_artificial_type_subfolder_handling)
+
+    def is_artificial_type_folder(self):
+        return self._get_value('artificial', self._aliases.is_artificial_type_folder)
+
+    def is_custom_folder_allowed(self):
+        return self._get_value('custom', self._aliases.is_custom_folder_allowed)
+
+    def is_version_valid_location(self, location):
+        """
+        Determine if the folder is valid for the WLS version and WLST mode.
+        :param location: the instance location, used for messages
+        :return: ValidationCode, message (message is None for VALID)
+        """
+        code = self._values.get('version_valid')
+        if code == ValidationCodes.VALID:
+            return code, None
+
+        code, message = self._aliases.is_version_valid_location(location)
+        self._values['version_valid'] = code
+        return code, message
+
+    def is_valid_model_folder_name(self, location, folder_name):
+        """
+        Determine if the folder name is a valid subfolder for this folder.
+        :param location: the instance location, used for messages
+        :param folder_name: the name of the subfolder
+        :return: ValidationCode, message (message is None for VALID)
+        """
+        return self.__check_name(self._folder_codes, self._aliases.is_valid_model_folder_name, location,
+                                 folder_name)
+
+    def is_valid_model_attribute_name(self, location, attribute_name):
+        """
+        Determine if the attribute name is valid for this folder.
+        :param location: the instance location, used for messages
+        :param attribute_name: the name of the attribute
+        :return: ValidationCode, message (message is None for VALID)
+        """
+        return self.__check_name(self._attribute_codes, self._aliases.is_valid_model_attribute_name, location,
+                                 attribute_name)
+
+    def model_attribute_has_set_method(self, attribute_name):
+        """
+        Determine if the attribute has a set method defined in the aliases.
+        :param attribute_name: the name of the attribute
+        :return: True if the attribute has a set method, False otherwise
+        """
+        if attribute_name not in self._set_method_names:
+            self._set_method_names[attribute_name] = \
+                self._aliases.model_attribute_has_set_method(self._location, attribute_name)
+        return self._set_method_names[attribute_name]
+
+    def _get_value(self, key, lookup_method):
+        if key not in self._values:
+            self._values[key] = lookup_method(self._location)
+        return self._values[key]
+
+    def __get_flattened_path_token(self, location):
+        flattened_folder_info = self._aliases.get_wlst_flattened_folder_info(location)
+        if flattened_folder_info is not None:
+            return flattened_folder_info.get_path_token()
+        return None
+
+    def __check_name(self, codes, check_method, location, name):
+        """
+        Return the cached code for a valid name, or ask the aliases for the code and message.
+        Only the code is retained, since invalid messages include the instance path.
+        """
+        code = codes.get(name)
+        if code == ValidationCodes.VALID:
+            return code, None
+
+        code, message = check_method(location, name)
+        codes[name] = code
+        return code, message
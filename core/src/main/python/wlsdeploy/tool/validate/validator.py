@@ -1,5 +1,5 @@
 """
-Copyright (c) 2017, 2024, Oracle and/or its affiliates.
+Copyright (c) 2017, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 import copy
@@ -16,6 +16,7 @@ from wlsdeploy.exception import exception_helper
 from wlsdeploy.exception.exception_types import ExceptionType
 from wlsdeploy.logging.platform_logger import PlatformLogger
 from wlsdeploy.tool.util.archive_helper import ArchiveList
+from wlsdeploy.tool.validate import validation_cache
 from wlsdeploy.tool.validate.crd_sections_validator import CrdSectionsValidator
 from wlsdeploy.tool.validate.deployments_validator import DeploymentsValidator
 from wlsdeploy.tool.validate.domain_info_validator import DomainInfoValidator
@@ -224,8 +225,14 @@ class Validator(object):
 
         domain_info_validator.validate(model_dict)
 
+        # the cache is only used for topology and resources, other sections have checks across folders
+        cache = validation_cache.get_validation_cache(self._model_context, self._wls_version, self._wlst_mode,
+                                                      _ValidationModes.from_value(self._validation_mode),
+                                                      variables_map)
+
         base_validator = ModelValidator(variables_map, self._archive_helper, self._validation_mode,
-                                        self._model_context, self._aliases, self._wlst_mode)
+                                        self._model_context, self._aliases, self._wlst_mode,
+                                        validation_cache=cache)
 
         base_validator.validate_model_section(model.get_model_topology_key(), model_dict,
                                               self._aliases.get_model_topology_top_level_folder_names())
@@ -233,6 +240,9 @@ class Validator(object):
         base_validator.validate_model_section(model.get_model_resources_key(), model_dict,
                                               self._aliases.get_model_resources_top_level_folder_names())
 
+        if cache is not None:
+            cache.log_summary()
+
         deployments_validator = DeploymentsValidator(variables_map, self._archive_helper, self._validation_mode,
                                                      self._model_context, self._aliases, self._wlst_mode)
 
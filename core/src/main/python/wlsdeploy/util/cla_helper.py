@@ -1,5 +1,5 @@
 """
-Copyright (c) 2019, 2024, Oracle and/or its affiliates.
+Copyright (c) 2019, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v1.0 as shown at https://oss.oracle.com/licenses/upl.
 
 Utility CLS methods shared by multiple tools.
@@ -30,6 +30,7 @@ from wlsdeploy.util import model_config
 from wlsdeploy.util import model_helper
 from wlsdeploy.util import model_translator
 from wlsdeploy.util import path_helper
+from wlsdeploy.util import profiler
 from wlsdeploy.util import string_utils
 from wlsdeploy.util import unicode_helper as str_helper
 
@@ -243,7 +244,32 @@ def load_model(program_name, model_context, aliases, filter_type, wlst_mode, val
     :param validate_crd_sections: True if CRD sections (such as kubernetes) should be validated
     :return: the resulting model dictionary
     """
-    _method_name = 'load_model'
+    profiler.start_phase(profiler.LOAD_MODEL_PHASE)
+    try:
+        model_dictionary = _load_model_dictionary(program_name, model_context, aliases, filter_type)
+    finally:
+        profiler.end_phase(profiler.LOAD_MODEL_PHASE)
+
+    profiler.start_phase(profiler.VALIDATE_MODEL_PHASE)
+    try:
+        validate_model(program_name, model_dictionary, model_context, aliases, wlst_mode,
+                       validate_crd_sections=validate_crd_sections)
+    finally:
+        profiler.end_phase(profiler.VALIDATE_MODEL_PHASE)
+
+    return model_dictionary
+
+
+def _load_model_dictionary(program_name, model_context, aliases, filter_type):
+    """
+    Load the model files, apply the variable substitution and any model filters, and persist the model if requested.
+    :param program_name: the program name, for logging
+    :param model_context: the model context
+    :param aliases: the alias configuration
+    :param filter_type: the type of any filters to be applied
+    :return: the resulting model dictionary
+    """
+    _method_name = '_load_model_dictionary'
 
     variable_map = {}
     try:
@@ -285,10 +311,6 @@ def load_model(program_name, model_context, aliases, filter_type, wlst_mode, val
     filter_helper.apply_filters(model_dictionary, filter_type, model_context)
 
     persist_model(model_context, model_dictionary)
-
-    validate_model(program_name, model_dictionary, model_context, aliases, wlst_mode,
-                   validate_crd_sections=validate_crd_sections)
-
     return model_dictionary
 
 
@@ -367,13 +389,21 @@ def merge_model_files(model_file_value, variable_map=None):
     return merged_model
 
 
-def merge_model_dictionaries(dictionary, new_dictionary, variable_map):
+def merge_model_dictionaries(dictionary, new_dictionary, variable_map, token_index=None):
     """
     Merge the values from the new dictionary to the existing one.
     Use variables to resolve keys.
     :param dictionary: the existing dictionary
     :param new_dictionary: the new dictionary to be merged
     :param variable_map: variables to be used for name resolution, or None
+    :param token_index: a TokenIndex for the existing dictionary to be updated with the changes, or None
+    """
+    _merge_model_dictionaries(dictionary, new_dictionary, variable_map, token_index, ())
+
+
+def _merge_model_dictionaries(dictionary, new_dictionary, variable_map, token_index, location):
+    """
+    Merge the values from the new dictionary to the existing one, at the specified location in the model.
     """
     for new_key in new_dictionary:
         new_value = new_dictionary[new_key]
@@ -382,20 +412,29 @@ def merge_model_dictionaries(dictionary, new_dictionary, variable_map):
         # the key is not in the original dictionary, just add it
         if dictionary_key is None:
             dictionary[new_key] = new_value
+            if token_index is not None:
+                token_index.add_value(location + (new_key,), new_key, new_value)
 
         # the new key should replace the existing one - delete the existing key and add the new one
         elif replace_key:
             del dictionary[dictionary_key]
+            if token_index is not None:
+                token_index.remove_location(location + (dictionary_key,))
+
             if not model_helper.is_delete_name(new_key):
                 dictionary[new_key] = new_value
+                if token_index is not None:
+                    token_index.add_value(location + (new_key,), new_key, new_value)
 
         # the key is in both dictionaries - merge if the values are dictionaries, otherwise replace the value
         else:
             value = dictionary[dictionary_key]
             if isinstance(value, dict) and isinstance(new_value, dict):
-                merge_model_dictionaries(value, new_value, variable_map)
+                _merge_model_dictionaries(value, new_value, variable_map, token_index, location + (dictionary_key,))
             else:
                 dictionary[new_key] = new_value
+                if token_index is not None:
+                    token_index.replace_value(location + (new_key,), new_key, new_value)
 
 
 def _find_dictionary_merge_key(dictionary, new_key, variable_map):
@@ -1,5 +1,5 @@
 """
-Copyright (c) 2017, 2025, Oracle and/or its affiliates.
+Copyright (c) 2017, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v1.0 as shown at https://oss.oracle.com/licenses/upl.
 
 Module that handles command-line argument parsing and common validation.
@@ -87,6 +87,7 @@ class CommandLineArgUtil(object):
     ATTRIBUTES_ONLY_SWITCH     = '-attributes_only'
     FOLDERS_ONLY_SWITCH        = '-folders_only'
     RECURSIVE_SWITCH           = '-recursive'
+    SEARCH_SWITCH              = '-search'
     # undocumented arg used by operator when using the old JRF on MII support
     UPDATE_RCU_SCHEMA_PASS_SWITCH = '-updateRCUSchemaPassword'
     VALIDATION_METHOD          = '-method'
@@ -118,6 +119,13 @@ class CommandLineArgUtil(object):
     DISCOVER_RCU_DATASOURCES_SWITCH  = '-discover_rcu_datasources'
     DISCOVER_SECURITY_PROVIDER_DATA_SWITCH = '-discover_security_provider_data'
     DISCOVER_OPSS_WALLET_SWITCH = '-discover_opss_wallet'
+    # args for the benchmark tool
+    BENCHMARK_FILE_SWITCH      = '-benchmark_file'
+    BASELINE_FILE_SWITCH       = '-baseline_file'
+    # args for the multi-domain runner
+    MANIFEST_FILE_SWITCH       = '-manifest_file'
+    # args for the artifact collector
+    COLLECTION_PLAN_FILE_SWITCH = '-collection_plan_file'
 
     # arguments that are true if specified, false if not
     BOOLEAN_SWITCHES = [
@@ -406,6 +414,25 @@ class CommandLineArgUtil(object):
                 value, idx = self._get_arg_value(args, idx)
                 value = self._validate_discover_security_provider_data_arg(value)
                 self._add_arg(key, value)
+            elif self.is_search_switch(key):
+                value, idx = self._get_arg_value(args, idx)
+                self._add_arg(key, value)
+            elif self.is_benchmark_file_switch(key):
+                value, idx = self._get_arg_value(args, idx)
+                full_path = self._validate_benchmark_file_arg(value)
+                self._add_arg(key, full_path, True)
+            elif self.is_baseline_file_switch(key):
+                value, idx = self._get_arg_value(args, idx)
+                full_path = self._validate_baseline_file_arg(value)
+                self._add_arg(key, full_path, True)
+            elif self.is_manifest_file_switch(key):
+                value, idx = self._get_arg_value(args, idx)
+                full_path = self._validate_manifest_file_arg(value)
+                self._add_arg(key, full_path, True)
+            elif self.is_collection_plan_file_switch(key):
+                value, idx = self._get_arg_value(args, idx)
+                full_path = self._validate_collection_plan_file_arg(value)
+                self._add_arg(key, full_path, True)
             else:
                 ex = create_cla_exception(ExitCode.USAGE_ERROR, 'WLSDPLY-01601', self._program_name, key)
                 _logger.throwing(ex, class_name=self._class_name, method_name=method_name)
@@ -1122,6 +1149,69 @@ class CommandLineArgUtil(object):
             raise ex
         return new_value.getAbsolutePath()
 
+    def is_search_switch(self, key):
+        return key == self.SEARCH_SWITCH
+
+    def is_benchmark_file_switch(self, key):
+        return key == self.BENCHMARK_FILE_SWITCH
+
+    def _validate_benchmark_file_arg(self, value):
+        method_name = '_validate_benchmark_file_arg'
+
+        try:
+            benchmark_file = JFileUtils.validateExistingFile(value)
+        except JIllegalArgumentException, iae:
+            ex = create_cla_exception(ExitCode.ARG_VALIDATION_ERROR,
+                                      'WLSDPLY-00918', value, iae.getLocalizedMessage(), error=iae)
+            _logger.throwing(ex, class_name=self._class_name, method_name=method_name)
+            raise ex
+        return benchmark_file.getAbsolutePath()
+
+    def is_baseline_file_switch(self, key):
+        return key == self.BASELINE_FILE_SWITCH
+
+    def _validate_baseline_file_arg(self, value):
+        method_name = '_validate_baseline_file_arg'
+
+        try:
+            baseline_file = JFileUtils.validateExistingFile(value)
+        except JIllegalArgumentException, iae:
+            ex = create_cla_exception(ExitCode.ARG_VALIDATION_ERROR,
+                                      'WLSDPLY-00919', value, iae.getLocalizedMessage(), error=iae)
+            _logger.throwing(ex, class_name=self._class_name, method_name=method_name)
+            raise ex
+        return baseline_file.getAbsolutePath()
+
+    def is_manifest_file_switch(self, key):
+        return key == self.MANIFEST_FILE_SWITCH
+
+    def _validate_manifest_file_arg(self, value):
+        method_name = '_validate_manifest_file_arg'
+
+        try:
+            manifest_file = JFileUtils.validateExistingFile(value)
+        except JIllegalArgumentException, iae:
+            ex = create_cla_exception(ExitCode.ARG_VALIDATION_ERROR,
+                                      'WLSDPLY-00920', value, iae.getLocalizedMessage(), error=iae)
+            _logger.throwing(ex, class_name=self._class_name, method_name=method_name)
+            raise ex
+        return manifest_file.getAbsolutePath()
+
+    def is_collection_plan_file_switch(self, key):
+        return key == self.COLLECTION_PLAN_FILE_SWITCH
+
+    def _validate_collection_plan_file_arg(self, value):
+        method_name = '_validate_collection_plan_file_arg'
+
+        try:
+            plan_file = JFileUtils.validateExistingFile(value)
+        except JIllegalArgumentException, iae:
+            ex = create_cla_exception(ExitCode.ARG_VALIDATION_ERROR,
+                                      'WLSDPLY-00921', value, iae.getLocalizedMessage(), error=iae)
+            _logger.throwing(ex, class_name=self._class_name, method_name=method_name)
+            raise ex
+        return plan_file.getAbsolutePath()
+
     def is_ssh_user_switch(self, key):
         return key == self.SSH_USER_SWITCH
 
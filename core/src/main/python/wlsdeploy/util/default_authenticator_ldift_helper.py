@@ -1,10 +1,9 @@
 """
-Copyright (c) 2024, Oracle and/or its affiliates.
+Copyright (c) 2024, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v1.0 as shown at https://oss.oracle.com/licenses/upl.
 
 Module that contains the class for working with DefaultAuthenticator LDIFT files.
 """
-from oracle.weblogic.deploy.encrypt import EncryptionException
 from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
 
 from wlsdeploy.aliases.alias_constants import PASSWORD_TOKEN
@@ -45,7 +44,7 @@ class DefaultAuthenticatorLdiftEntry(object):
                         self._is_group_entry = True
                     elif ldift_line.get_value() == 'wlsUser':
                         self._is_user_entry = True
-                self._lines.append(LdiftLine(line))
+                self._lines.append(ldift_line)
 
     def is_user_entry(self):
         return self._is_user_entry
@@ -207,13 +206,20 @@ class DefaultAuthenticatorLdift(LdiftBase):
 
     # Override
     def read_ldift_file(self, ldift_file_name):
+        """
+        Read the user and group entries from the LDIFT file, one entry at a time.
+        Other entries, such as the realm and organizational units, are not kept.
+        :param ldift_file_name: the LDIFT file name
+        :return: the list of user and group entries, in file order
+        """
         _method_name = 'read_ldift_file'
         _logger.entering(ldift_file_name, class_name=self.__class_name, method_name=_method_name)
 
         entries = list()
-        string_entries = LdiftBase.read_ldift_file(self, ldift_file_name)
-        for string_entry in string_entries:
-            entries.append(DefaultAuthenticatorLdiftEntry(string_entry, self._exception_type))
+        for string_entry in self.iterate_ldift_file(ldift_file_name):
+            entry = DefaultAuthenticatorLdiftEntry(string_entry, self._exception_type)
+            if entry.is_user_entry() or entry.is_group_entry():
+                entries.append(entry)
 
         _logger.exiting(class_name=self.__class_name, method_name=_method_name, result=entries)
         return entries
@@ -222,35 +228,41 @@ class DefaultAuthenticatorLdift(LdiftBase):
         _method_name = 'get_users_dictionary'
         _logger.entering(filter_defaults, class_name=self.__class_name, method_name=_method_name)
 
-        result = OrderedDict()
+        user_entries = list()
         for ldift_entry in self._ldift_entries:
             if ldift_entry.is_user_entry():
-                user_name = ldift_entry.get_user_name()
-                if filter_defaults and user_name in self.__DEFAULT_USER_LIST:
+                if filter_defaults and ldift_entry.get_user_name() in self.__DEFAULT_USER_LIST:
                     continue
+                user_entries.append(ldift_entry)
 
-                user_password = self._get_encrypted_password(user_name, ldift_entry.get_user_password())
-                user_description = ldift_entry.get_user_description()
-                user_groups_names = ldift_entry.get_user_group_memberships().keys()
-                user_attributes_dict = ldift_entry.get_user_attributes()
-
-                user_entry = OrderedDict()
-                user_entry[PASSWORD] = user_password
-
-                if self._credential_injector is not None:
-                    location = LocationContext().append_location(SECURITY).append_location(USER)
-                    name_token = self._aliases.get_name_token(location)
-                    location.add_name_token(name_token, user_name)
-                    self._credential_injector.check_and_tokenize(user_entry, PASSWORD, location)
+        user_passwords = self._get_encrypted_passwords(user_entries)
 
-                if not string_utils.is_empty(user_description):
-                    user_entry[DESCRIPTION] = user_description
-                if len(user_groups_names) > 0:
-                    user_entry[GROUP_MEMBER_OF] = user_groups_names
-                if user_attributes_dict:
-                    user_entry[USER_ATTRIBUTES] = user_attributes_dict
-
-                result[user_name] = user_entry
+        result = OrderedDict()
+        for index in range(len(user_entries)):
+            ldift_entry = user_entries[index]
+            user_name = ldift_entry.get_user_name()
+            user_password = user_passwords[index]
+            user_description = ldift_entry.get_user_description()
+            user_groups_names = ldift_entry.get_user_group_memberships().keys()
+            user_attributes_dict = ldift_entry.get_user_attributes()
+
+            user_entry = OrderedDict()
+            user_entry[PASSWORD] = user_password
+
+            if self._credential_injector is not None:
+                location = LocationContext().append_location(SECURITY).append_location(USER)
+                name_token = self._aliases.get_name_token(location)
+                location.add_name_token(name_token, user_name)
+                self._credential_injector.check_and_tokenize(user_entry, PASSWORD, location)
+
+            if not string_utils.is_empty(user_description):
+                user_entry[DESCRIPTION] = user_description
+            if len(user_groups_names) > 0:
+                user_entry[GROUP_MEMBER_OF] = user_groups_names
+            if user_attributes_dict:
+                user_entry[USER_ATTRIBUTES] = user_attributes_dict
+
+            result[user_name] = user_entry
 
         _logger.exiting(class_name=self.__class_name, method_name=_method_name, result=result.keys())
         return result
@@ -359,16 +371,29 @@ class DefaultAuthenticatorLdift(LdiftBase):
         _logger.exiting(class_name=self.__class_name, method_name=_method_name, result=result)
         return result
 
-    def _get_encrypted_password(self, user_name, password):
-        _method_name = '_get_encrypted_password'
-        _logger.entering(user_name, class_name=self.__class_name, method_name=_method_name)
-
-        try:
-            result = self.get_password_for_model(password)
-        except EncryptionException, ee:
-            result = PASSWORD_TOKEN
-            _logger.warning('WLSDPLY-07115', user_name, result,ee.getLocalizedMessage(),
-                            error=ee, class_name=self.__class_name, method_name=_method_name)
+    def _get_encrypted_passwords(self, user_entries):
+        """
+        Get the model passwords for the user entries, in the same order.
+        :param user_entries: the list of user entries
+        :return: the list of model passwords
+        """
+        _method_name = '_get_encrypted_passwords'
+        _logger.entering(len(user_entries), class_name=self.__class_name, method_name=_method_name)
+
+        passwords = list()
+        for user_entry in user_entries:
+            passwords.append(user_entry.get_user_password())
+
+        result = list()
+        password_results = self.get_passwords_for_model(passwords)
+        for index in range(len(user_entries)):
+            password, ee = password_results[index]
+            if ee is not None:
+                password = PASSWORD_TOKEN
+                _logger.warning('WLSDPLY-07115', user_entries[index].get_user_name(), password,
+                                ee.getLocalizedMessage(), error=ee,
+                                class_name=self.__class_name, method_name=_method_name)
+            result.append(password)
 
         _logger.exiting(class_name=self.__class_name, method_name=_method_name)
         return result
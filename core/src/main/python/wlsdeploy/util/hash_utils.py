@@ -0,0 +1,72 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+Utility methods for computing SHA-256 hashes of files and text, used to detect content that has not changed.
+"""
+from java.io import FileInputStream
+from java.lang import String
+from java.math import BigInteger
+from java.security import MessageDigest
+import jarray
+
+SHA_256 = 'SHA-256'
+
+_READ_BUFFER_SIZE = 65536
+
+
+def create_digest():
+    """
+    Create a SHA-256 message digest.
+    :return: the MessageDigest
+    """
+    return MessageDigest.getInstance(SHA_256)
+
+
+def update_digest(digest, text):
+    """
+    Add the UTF-8 bytes of the text to the message digest.
+    :param digest: the MessageDigest
+    :param text: the text to add
+    """
+    digest.update(String(text).getBytes('UTF-8'))
+
+
+def hash_file(file_path):
+    """
+    Compute the SHA-256 hash of the file content.
+    :param file_path: the path of the file
+    :return: the hexadecimal hash
+    :raises: IOException: if the file cannot be read
+    """
+    digest = create_digest()
+    buffer = jarray.zeros(_READ_BUFFER_SIZE, 'b')
+    stream = FileInputStream(file_path)
+    try:
+        count = stream.read(buffer)
+        while count >= 0:
+            digest.update(buffer, 0, count)
+            count = stream.read(buffer)
+    finally:
+        stream.close()
+    return to_hex(digest.digest())
+
+
+def hash_text(text):
+    """
+    Compute the SHA-256 hash of the UTF-8 bytes of the text.
+    :param text: the text
+    :return: the hexadecimal hash
+    """
+    digest = create_digest()
+    update_digest(digest, text)
+    return to_hex(digest.digest())
+
+
+def to_hex(digest_bytes):
+    """
+    Get the hexadecimal form of a SHA-256 digest, with leading zeros.
+    :param digest_bytes: the digest bytes
+    :return: the 64-character hexadecimal text
+    """
+    return BigInteger(1, digest_bytes).toString(16).zfill(64)
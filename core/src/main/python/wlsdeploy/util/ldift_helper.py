@@ -1,5 +1,5 @@
 """
-Copyright (c) 2024, Oracle and/or its affiliates.
+Copyright (c) 2024, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v1.0 as shown at https://oss.oracle.com/licenses/upl.
 
 Module that contains the base class for working with LDIFT files of various types.
@@ -13,6 +13,7 @@ from java.nio.charset import StandardCharsets
 from com.bea.common.security.utils.encoders import BASE64Decoder
 from com.bea.common.security.utils.encoders import BASE64Encoder
 
+from oracle.weblogic.deploy.encrypt import EncryptionException
 from oracle.weblogic.deploy.encrypt import EncryptionUtils
 from oracle.weblogic.deploy.json import JsonException
 from oracle.weblogic.deploy.json import JsonStreamTranslator
@@ -23,6 +24,7 @@ from wlsdeploy.aliases.alias_constants import PASSWORD_TOKEN
 from wlsdeploy.exception import exception_helper
 from wlsdeploy.exception.exception_types import ExceptionType
 from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.util import parallel_utils
 from wlsdeploy.util import path_helper
 from wlsdeploy.util import string_utils
 
@@ -81,6 +83,7 @@ class LdiftBase(object):
         self._exception_type = exception_type
         self._download_temporary_dir = download_temporary_dir
         self._weblogic_helper = model_context.get_weblogic_helper()
+        self._decryption_base_dir = None
 
     def read_ldift_file(self, ldift_file_name):
         """
@@ -91,6 +94,28 @@ class LdiftBase(object):
         _method_name = 'read_ldift_file'
         _logger.entering(ldift_file_name, class_name=self.__class_name, method_name=_method_name)
 
+        entries = list(self.iterate_ldift_file(ldift_file_name))
+
+        _logger.exiting(class_name=self.__class_name, method_name=_method_name, result=len(entries))
+        return entries
+
+    def iterate_ldift_file(self, ldift_file_name):
+        """
+        Get an iterator over the entries in the LDIFT file, where each entry is a list of lines for that entry.
+        The file is read one line at a time, so only the current entry is held in memory.
+        LDIFT files support line continuation by starting the following line with a single space.
+        For example, the following entry:
+            cn: ou=abcdef
+             ghi,realm=myrealm
+        is the same as:
+            cn: ou=abcdefghi,realm=myrealm
+        :param ldift_file_name: the LDIFT file name
+        :return: an iterator of lists of lines
+        :raises: an exception of the type for this object if the file cannot be opened
+        """
+        _method_name = 'iterate_ldift_file'
+        _logger.entering(ldift_file_name, class_name=self.__class_name, method_name=_method_name)
+
         if string_utils.is_empty(ldift_file_name):
             ex = exception_helper.create_exception(self._exception_type, 'WLSDPLY-07100')
             _logger.throwing(ex, class_name=self.__class_name, method_name=_method_name)
@@ -100,46 +125,69 @@ class LdiftBase(object):
             _logger.throwing(ex, class_name=self.__class_name, method_name=_method_name)
             raise ex
 
-        reader = None
-        all_lines = None
         try:
-            try:
-                reader = open(ldift_file_name, 'r')
-                all_lines = reader.readlines()
-            except IOError, err:
-                ex = exception_helper.create_exception(self._exception_type, 'WLSDPLY-07102',
-                                                       ldift_file_name, err.message, error=err)
-                _logger.throwing(ex, class_name=self.__class_name, method_name=_method_name)
-                raise ex
-        finally:
-            if reader is not None:
-                try:
-                    reader.close()
-                except IOError:
-                    # best effort only
-                    pass
-
-        entries = list()
-        current_entry = None
-        for line in all_lines:
-            # TODO - LDIFT files support line continuation by starting the following line with a single space.
-            #  For example, the following entry:
-            #      cn: ou=abcdef
-            #       ghi,realm=myrealm
-            #  is the same as:
-            #      cn: ou=abcdefghi,realm=myrealm
-            #
-            line_text = line.strip()
-            if string_utils.is_empty(line_text):
-                current_entry = None
-            else:
-                if current_entry is None:
-                    current_entry = list()
-                    entries.append(current_entry)
-                current_entry.append(line_text)
+            reader = open(ldift_file_name, 'r')
+        except IOError, err:
+            ex = exception_helper.create_exception(self._exception_type, 'WLSDPLY-07102',
+                                                   ldift_file_name, err.message, error=err)
+            _logger.throwing(ex, class_name=self.__class_name, method_name=_method_name)
+            raise ex
 
-        _logger.exiting(class_name=self.__class_name, method_name=_method_name, result=len(entries))
-        return entries
+        _logger.exiting(class_name=self.__class_name, method_name=_method_name)
+        return self.__iterate_entries(reader, ldift_file_name)
+
+    def __iterate_entries(self, reader, ldift_file_name):
+        """
+        Generate the entries from the open LDIFT file, and close the file when the generator completes.
+        """
+        _method_name = '__iterate_entries'
+
+        try:
+            current_entry = None
+            current_line = None
+            while True:
+                try:
+                    line = reader.readline()
+                except IOError, err:
+                    ex = exception_helper.create_exception(self._exception_type, 'WLSDPLY-07102',
+                                                           ldift_file_name, err.message, error=err)
+                    _logger.throwing(ex, class_name=self.__class_name, method_name=_method_name)
+                    raise ex
+
+                if not line:
+                    break
+
+                line = line.rstrip('\r\n')
+                is_blank = string_utils.is_empty(line.strip())
+                if line.startswith(' ') and not is_blank and current_line is not None:
+                    # a continuation of the previous line, without the leading space
+                    current_line += line[1:]
+                    continue
+
+                if current_line is not None:
+                    current_entry.append(current_line.strip())
+                    current_line = None
+
+                if is_blank:
+                    # a line with only whitespace ends the entry
+                    if current_entry is not None:
+                        yield current_entry
+                    current_entry = None
+                else:
+                    if current_entry is None:
+                        current_entry = list()
+                    current_line = line
+
+            if current_line is not None:
+                current_entry.append(current_line.strip())
+            if current_entry is not None:
+                yield current_entry
+        finally:
+            try:
+                reader.close()
+            except IOError:
+                # best effort only
+                pass
 
     def load_provider_defaults_file(self, provider_type, file_name):
         _method_name = 'load_provider_defaults_file'
@@ -172,7 +220,57 @@ class LdiftBase(object):
         _method_name = 'get_password_for_model'
         _logger.entering(class_name=self.__class_name, method_name=_method_name)
 
+        result, encrypt = self._prepare_password_for_model(password)
+        if encrypt:
+            result = self._encrypt_password_for_model(result)
+
+        _logger.exiting(class_name=self.__class_name, method_name=_method_name)
+        return result
+
+    def get_passwords_for_model(self, passwords):
+        """
+        Get the model values for a list of passwords, like get_password_for_model().
+        The passwords are decrypted in order, and the slower WDT encryption is done on a bounded number of threads.
+        :param passwords: the list of passwords from the LDIFT file
+        :return: a list of (model value, EncryptionException) tuples in the same order as the passwords,
+                 where either the value or the exception is None
+        """
+        _method_name = 'get_passwords_for_model'
+        _logger.entering(len(passwords), class_name=self.__class_name, method_name=_method_name)
+
+        results = []
+        encrypt_indexes = []
+        clear_texts = []
+        for password in passwords:
+            try:
+                value, encrypt = self._prepare_password_for_model(password)
+                if encrypt:
+                    encrypt_indexes.append(len(results))
+                    clear_texts.append(value)
+                results.append((value, None))
+            except EncryptionException, ee:
+                results.append((None, ee))
+
+        if clear_texts:
+            max_threads = self._model_context.get_model_config().get_password_encryption_threads()
+            encrypted_results = parallel_utils.run_parallel(self._encrypt_password_or_error, clear_texts, max_threads)
+            for index in range(len(encrypt_indexes)):
+                results[encrypt_indexes[index]] = encrypted_results[index]
+
+        _logger.exiting(class_name=self.__class_name, method_name=_method_name)
+        return results
+
+    def _prepare_password_for_model(self, password):
+        """
+        Decrypt the password, and determine if it should be encrypted with WDT encryption for the model.
+        :param password: the password from the LDIFT file
+        :return: a tuple of the model value or clear text, and True if the clear text should be encrypted
+        :raises: EncryptionException: if the password cannot be decrypted
+        """
+        _method_name = '_prepare_password_for_model'
+
         result = PASSWORD_TOKEN
+        encrypt = False
         if not string_utils.is_empty(password):
             # Only proceed if either WDT encryption is supported or the user has
             # specified to not encrypt passwords in the model
@@ -183,12 +281,8 @@ class LdiftBase(object):
                 if decrypted_password == PASSWORD_TOKEN:
                     result = PASSWORD_TOKEN
                 elif self._model_context.is_encryption_supported():
-                    if store_in_cipher_text:
-                        wdt_encryption_passphrase = self._model_context.get_encryption_passphrase()
-                        encryption_passphrase = String(wdt_encryption_passphrase).toCharArray()
-                        result = EncryptionUtils.encryptString(decrypted_password, encryption_passphrase)
-                    else:
-                        result = decrypted_password
+                    result = decrypted_password
+                    encrypt = store_in_cipher_text
                 else:
                     if not store_in_cipher_text:
                         result = decrypted_password
@@ -199,15 +293,33 @@ class LdiftBase(object):
                 _logger.warning('WLSDPLY-07114', PASSWORD_TOKEN,
                                 class_name=self.__class_name, method_name=_method_name)
 
-        _logger.exiting(class_name=self.__class_name, method_name=_method_name)
-        return result
+        return result, encrypt
+
+    def _encrypt_password_for_model(self, clear_text):
+        """
+        Encrypt the clear text password with WDT encryption. This is safe to call from multiple threads.
+        :param clear_text: the clear text password
+        :return: the encrypted password
+        :raises: EncryptionException: if the password cannot be encrypted
+        """
+        wdt_encryption_passphrase = self._model_context.get_encryption_passphrase()
+        encryption_passphrase = String(wdt_encryption_passphrase).toCharArray()
+        return EncryptionUtils.encryptString(clear_text, encryption_passphrase)
+
+    def _encrypt_password_or_error(self, clear_text):
+        try:
+            return self._encrypt_password_for_model(clear_text), None
+        except EncryptionException, ee:
+            return None, ee
 
     def _decrypt_password(self, password):
         _method_name = '_decrypt_password'
         _logger.entering(class_name=self.__class_name, method_name=_method_name)
 
         if self._is_encrypted_password(password):
-            base_dir = self._get_domain_decryption_base_dir()
+            if self._decryption_base_dir is None:
+                self._decryption_base_dir = self._get_domain_decryption_base_dir()
+            base_dir = self._decryption_base_dir
             result = self._weblogic_helper.decrypt(password, base_dir)
         else:
             result = password
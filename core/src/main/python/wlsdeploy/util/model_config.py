@@ -1,5 +1,5 @@
 """
-Copyright (c) 2020, 2025, Oracle and/or its affiliates.
+Copyright (c) 2020, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 
@@ -24,8 +24,14 @@ _config_object = None
 # WLST TIMEOUT PROPERTIES
 ACTIVATE_TIMEOUT_PROP = 'activate.timeout'
 ACTIVATE_TIMEOUT_DEFAULT = '180000'
+ARCHIVE_COLLECTION_THREADS_PROP = 'archive.collection.threads'
+ARCHIVE_COLLECTION_THREADS_DEFAULT = '4'
 ARCHIVE_CUSTOM_FOLDER_SIZE_LIMIT_PROP = 'archive.custom.folder.size.limit'
 ARCHIVE_CUSTOM_FOLDER_SIZE_LIMIT_DEFAULT = '1048576' # 1 MB
+ARCHIVE_DEDUPLICATION_PROP = 'archive.deduplication'
+ARCHIVE_DEDUPLICATION_DEFAULT = 'true'
+ARCHIVE_EXTRACTION_THREADS_PROP = 'archive.extraction.threads'
+ARCHIVE_EXTRACTION_THREADS_DEFAULT = '4'
 CONNECT_TIMEOUT_PROP = 'connect.timeout'
 CONNECT_TIMEOUT_DEFAULT = '120000'
 DEPLOY_TIMEOUT_PROP = 'deploy.timeout'
@@ -38,6 +44,20 @@ ENABLE_CREATE_DOMAIN_PASSWORD_VALIDATION_PROP = 'enable.create.domain.password.v
 ENABLE_CREATE_DOMAIN_PASSWORD_VALIDATION_DEFAULT = 'true'
 MERGE_SERVER_START_ARGUMENTS = 'merge.server.start.arguments'
 MERGE_SERVER_START_ARGUMENTS_DEFAULT = 'true'
+ONLINE_CHANGE_PLAN_PROP = 'online.change.plan'
+ONLINE_CHANGE_PLAN_DEFAULT = 'false'
+ONLINE_ROLLING_RESTART_PROP = 'online.rolling.restart'
+ONLINE_ROLLING_RESTART_DEFAULT = 'false'
+ONLINE_ROLLING_RESTART_MIN_MEMBERS_PROP = 'online.rolling.restart.min.members'
+ONLINE_ROLLING_RESTART_MIN_MEMBERS_DEFAULT = '1'
+ONLINE_ROLLING_RESTART_THREADS_PROP = 'online.rolling.restart.threads'
+ONLINE_ROLLING_RESTART_THREADS_DEFAULT = '4'
+ONLINE_ROLLING_RESTART_TIMEOUT_PROP = 'online.rolling.restart.timeout'
+ONLINE_ROLLING_RESTART_TIMEOUT_DEFAULT = '600000'
+PASSWORD_ENCRYPTION_THREADS_PROP = 'password.encryption.threads'
+PASSWORD_ENCRYPTION_THREADS_DEFAULT = '4'
+REUSE_EXISTING_RCU_SCHEMAS_PROP = 'reuse.existing.rcu.schemas'
+REUSE_EXISTING_RCU_SCHEMAS_DEFAULT = 'false'
 REDEPLOY_TIMEOUT_PROP = 'redeploy.timeout'
 REDEPLOY_TIMEOUT_DEFAULT = '180000'
 SET_SERVER_GRPS_TIMEOUT_PROP = 'set.server.groups.timeout'
@@ -193,6 +213,13 @@ class ModelConfiguration(object):
         """
         return self._get_from_dict(DISABLE_RCU_DROP_SCHEMA_PROP, DISABLE_RCU_DROP_SCHEMA_DEFAULT)
 
+    def get_reuse_existing_rcu_schemas(self):
+        """
+        Returns the value to determine whether RCU should skip schemas that already exist at the expected version.
+        :return: the string 'true' or 'false' (default)
+        """
+        return self._get_from_dict(REUSE_EXISTING_RCU_SCHEMAS_PROP, REUSE_EXISTING_RCU_SCHEMAS_DEFAULT)
+
     def get_enable_create_domain_password_validation(self):
         """
         Returns the value to determine whether to enable
@@ -245,6 +272,27 @@ class ModelConfiguration(object):
         return self._get_from_dict_as_long(ARCHIVE_CUSTOM_FOLDER_SIZE_LIMIT_PROP,
                                            ARCHIVE_CUSTOM_FOLDER_SIZE_LIMIT_DEFAULT)
 
+    def is_archive_deduplication(self):
+        """
+        Return whether discovery should add byte-identical archive content only once.
+        :return: True if identical content is added once, False otherwise
+        """
+        return self._get_from_dict_as_boolean(ARCHIVE_DEDUPLICATION_PROP, ARCHIVE_DEDUPLICATION_DEFAULT)
+
+    def get_archive_collection_threads(self):
+        """
+        Return the maximum number of collection plan entries that the Collect Artifacts Tool transfers at the same time.
+        :return: the maximum number of threads
+        """
+        return self._get_from_dict_as_long(ARCHIVE_COLLECTION_THREADS_PROP, ARCHIVE_COLLECTION_THREADS_DEFAULT)
+
+    def get_archive_extraction_threads(self):
+        """
+        Return the maximum number of files that are written at the same time when extracting an archive directory.
+        :return: the maximum number of threads
+        """
+        return self._get_from_dict_as_long(ARCHIVE_EXTRACTION_THREADS_PROP, ARCHIVE_EXTRACTION_THREADS_DEFAULT)
+
     def get_store_discovered_passwords_in_clear_text(self):
         """
         Whether to store discovered passwords in clear text in the model
@@ -262,6 +310,49 @@ class ModelConfiguration(object):
         return self._get_from_dict_as_boolean(STORE_DISCOVER_ADMIN_CREDENTIALS_PROP,
                                               STORE_DISCOVER_ADMIN_CREDENTIALS_DEFAULT)
 
+    def is_online_change_plan(self):
+        """
+        Return whether online update and deploy should compute the change plan before acquiring the edit lock.
+        :return: True if the change plan is computed, False otherwise
+        """
+        return self._get_from_dict_as_boolean(ONLINE_CHANGE_PLAN_PROP, ONLINE_CHANGE_PLAN_DEFAULT)
+
+    def is_online_rolling_restart(self):
+        """
+        Return whether online update and deploy should restart the servers that require a restart after activation.
+        :return: True if the servers are restarted, False otherwise
+        """
+        return self._get_from_dict_as_boolean(ONLINE_ROLLING_RESTART_PROP, ONLINE_ROLLING_RESTART_DEFAULT)
+
+    def get_online_rolling_restart_min_members(self):
+        """
+        Return the minimum number of running members in a cluster while its members are restarted.
+        :return: the minimum number of running members
+        """
+        return self._get_from_dict_as_long(ONLINE_ROLLING_RESTART_MIN_MEMBERS_PROP,
+                                           ONLINE_ROLLING_RESTART_MIN_MEMBERS_DEFAULT)
+
+    def get_online_rolling_restart_threads(self):
+        """
+        Return the maximum number of clusters and stand-alone servers that are restarted at the same time.
+        :return: the maximum number of threads
+        """
+        return self._get_from_dict_as_long(ONLINE_ROLLING_RESTART_THREADS_PROP, ONLINE_ROLLING_RESTART_THREADS_DEFAULT)
+
+    def get_online_rolling_restart_timeout(self):
+        """
+        Return the number of milliseconds to wait for a server to shut down, and to reach the RUNNING state.
+        :return: the timeout in milliseconds
+        """
+        return self._get_from_dict_as_long(ONLINE_ROLLING_RESTART_TIMEOUT_PROP, ONLINE_ROLLING_RESTART_TIMEOUT_DEFAULT)
+
+    def get_password_encryption_threads(self):
+        """
+        Return the maximum number of threads used to encrypt discovered security provider passwords.
+        :return: the maximum number of threads
+        """
+        return self._get_from_dict_as_long(PASSWORD_ENCRYPTION_THREADS_PROP, PASSWORD_ENCRYPTION_THREADS_DEFAULT)
+
     def _get_from_dict(self, name, default_value=None):
         _method_name = '_get_from_dict'
         _logger.entering(name, default_value, class_name=_class_name, method_name=_method_name)
@@ -1,5 +1,5 @@
 """
-Copyright (c) 2017, 2024, Oracle and/or its affiliates.
+Copyright (c) 2017, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 
@@ -97,6 +97,7 @@ class ModelContext(object):
         self._recursive = False
         self._attributes_only = False
         self._folders_only = False
+        self._search_text = None
         self._opss_wallet_passphrase = None
         self._opss_wallet = None
         self._update_rcu_schema_pass = False
@@ -129,6 +130,10 @@ class ModelContext(object):
         self._discover_rcu_datasources = False
         self._discover_security_provider_data = None
         self._discover_opss_wallet = False
+        self._benchmark_file = None
+        self._baseline_file = None
+        self._manifest_file = None
+        self._collection_plan_file = None
         self._path_helper = path_helper.get_path_helper()
 
         self._trailing_args = []
@@ -218,6 +223,9 @@ class ModelContext(object):
         if CommandLineArgUtil.RECURSIVE_SWITCH in arg_map:
             self._recursive = arg_map[CommandLineArgUtil.RECURSIVE_SWITCH]
 
+        if CommandLineArgUtil.SEARCH_SWITCH in arg_map:
+            self._search_text = arg_map[CommandLineArgUtil.SEARCH_SWITCH]
+
         if CommandLineArgUtil.VARIABLE_FILE_SWITCH in arg_map:
             self._variable_file_name = arg_map[CommandLineArgUtil.VARIABLE_FILE_SWITCH]
 
@@ -264,6 +272,18 @@ class ModelContext(object):
         if CommandLineArgUtil.LOCAL_OUTPUT_DIR_SWITCH in arg_map:
             self._local_output_dir = arg_map[CommandLineArgUtil.LOCAL_OUTPUT_DIR_SWITCH]
 
+        if CommandLineArgUtil.BENCHMARK_FILE_SWITCH in arg_map:
+            self._benchmark_file = arg_map[CommandLineArgUtil.BENCHMARK_FILE_SWITCH]
+
+        if CommandLineArgUtil.BASELINE_FILE_SWITCH in arg_map:
+            self._baseline_file = arg_map[CommandLineArgUtil.BASELINE_FILE_SWITCH]
+
+        if CommandLineArgUtil.MANIFEST_FILE_SWITCH in arg_map:
+            self._manifest_file = arg_map[CommandLineArgUtil.MANIFEST_FILE_SWITCH]
+
+        if CommandLineArgUtil.COLLECTION_PLAN_FILE_SWITCH in arg_map:
+            self._collection_plan_file = arg_map[CommandLineArgUtil.COLLECTION_PLAN_FILE_SWITCH]
+
         if CommandLineArgUtil.RUN_RCU_SWITCH in arg_map:
             self._run_rcu = arg_map[CommandLineArgUtil.RUN_RCU_SWITCH]
 
@@ -366,6 +386,8 @@ class ModelContext(object):
             arg_map[CommandLineArgUtil.FOLDERS_ONLY_SWITCH] = self._folders_only
         if self._recursive is not None:
             arg_map[CommandLineArgUtil.RECURSIVE_SWITCH] = self._recursive
+        if self._search_text is not None:
+            arg_map[CommandLineArgUtil.SEARCH_SWITCH] = self._search_text
         if self._remote is not None:
             arg_map[CommandLineArgUtil.REMOTE_SWITCH] = self._remote
         if self._skip_archive is not None:
@@ -397,6 +419,14 @@ class ModelContext(object):
             arg_map[CommandLineArgUtil.REMOTE_OUTPUT_DIR_SWITCH] = self._remote_output_dir
         if self._local_output_dir is not None:
             arg_map[CommandLineArgUtil.LOCAL_OUTPUT_DIR_SWITCH] = self._local_output_dir
+        if self._benchmark_file is not None:
+            arg_map[CommandLineArgUtil.BENCHMARK_FILE_SWITCH] = self._benchmark_file
+        if self._baseline_file is not None:
+            arg_map[CommandLineArgUtil.BASELINE_FILE_SWITCH] = self._baseline_file
+        if self._manifest_file is not None:
+            arg_map[CommandLineArgUtil.MANIFEST_FILE_SWITCH] = self._manifest_file
+        if self._collection_plan_file is not None:
+            arg_map[CommandLineArgUtil.COLLECTION_PLAN_FILE_SWITCH] = self._collection_plan_file
         if self._variable_file_name is not None:
             arg_map[CommandLineArgUtil.VARIABLE_FILE_SWITCH] = self._variable_file_name
         if self._run_rcu:
@@ -753,6 +783,13 @@ class ModelContext(object):
         """
         return self._recursive
 
+    def get_search_text(self):
+        """
+        Get the -search command-line argument for model help tool.
+        :return: the search text, or None if it was not specified
+        """
+        return self._search_text
+
     def get_variable_file(self):
         """
         Get the variable file.
@@ -1057,6 +1094,34 @@ class ModelContext(object):
         """
         return self._local_output_dir
 
+    def get_benchmark_file(self):
+        """
+        Get the location of the benchmark definition file.
+        :return: the absolute path to the benchmark file, or None
+        """
+        return self._benchmark_file
+
+    def get_baseline_file(self):
+        """
+        Get the location of the baseline benchmark report used for regression checks.
+        :return: the absolute path to the baseline report, or None
+        """
+        return self._baseline_file
+
+    def get_manifest_file(self):
+        """
+        Get the location of the manifest file that lists the domains for the multi-domain runner.
+        :return: the absolute path to the manifest file, or None
+        """
+        return self._manifest_file
+
+    def get_collection_plan_file(self):
+        """
+        Get the location of the artifact collection plan written by discoverDomain in remote mode.
+        :return: the absolute path to the collection plan file, or None
+        """
+        return self._collection_plan_file
+
     def get_remote_oracle_home(self):
         """
         Get the location of the Oracle Home on the remote machine.
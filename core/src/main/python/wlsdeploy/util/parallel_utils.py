@@ -0,0 +1,52 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+Utility methods for running independent tasks on a bounded number of threads.
+"""
+from java.util.concurrent import Callable
+from java.util.concurrent import Executors
+
+
+def run_parallel(function, arguments, max_threads):
+    """
+    Call the function once for each argument, using up to max_threads threads.
+    The function should handle its own expected exceptions and return a value that describes them,
+    since an exception raised by the function stops the remaining results from being collected.
+    If max_threads is less than 2, or there is only one argument, the calls are made in the current thread.
+    :param function: a function with one argument, that is safe to call from multiple threads
+    :param arguments: the list of arguments
+    :param max_threads: the maximum number of threads to use
+    :return: the list of results, in the same order as the arguments
+    """
+    thread_count = min(max_threads, len(arguments))
+    if thread_count < 2:
+        results = []
+        for argument in arguments:
+            results.append(function(argument))
+        return results
+
+    executor = Executors.newFixedThreadPool(thread_count)
+    try:
+        futures = []
+        for argument in arguments:
+            futures.append(executor.submit(_Task(function, argument)))
+
+        results = []
+        for future in futures:
+            results.append(future.get())
+        return results
+    finally:
+        executor.shutdownNow()
+
+
+class _Task(Callable):
+    """
+    A Callable that calls a Python function with a single argument.
+    """
+    def __init__(self, function, argument):
+        self._function = function
+        self._argument = argument
+
+    def call(self):
+        return self._function(self._argument)
@@ -0,0 +1,674 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+Opt-in profiling of the tool phases, and of the calls made to WLST, aliases, model files, archives and encryption.
+Profiling is enabled by setting the WLSDEPLOY_PROFILE environment variable to true.
+When it is not enabled, no methods are wrapped, and the phase functions return immediately.
+"""
+import os
+import sys
+import threading
+import types
+
+from java.lang import System
+from java.lang.reflect import Modifier
+
+from oracle.weblogic.deploy.json import JsonException
+from oracle.weblogic.deploy.logging import WLSDeployLoggingConfig
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+from oracle.weblogic.deploy.util import WebLogicDeployToolingVersion
+
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.util import env_helper
+
+PROFILE_ENV_VARIABLE = 'WLSDEPLOY_PROFILE'
+PROFILE_FILE_SUFFIX = '-profile.json'
+
+# call categories
+WLST = 'wlst'
+ALIASES = 'aliases'
+MODEL_FILE = 'modelFile'
+ARCHIVE = 'archive'
+ENCRYPTION = 'encryption'
+
+# phase names used by the shared tool code
+PROCESS_ARGS_PHASE = 'processArgs'
+LOAD_MODEL_PHASE = 'loadModel'
+VALIDATE_MODEL_PHASE = 'validateModel'
+
+# profile file keys
+PROGRAM = 'program'
+WDT_VERSION = 'wdt_version'
+PHASES = 'phases'
+CALLS = 'calls'
+PHASE = 'phase'
+CATEGORY = 'category'
+OPERATION = 'operation'
+FOLDER = 'folder'
+COUNT = 'count'
+TOTAL_MILLIS = 'total_millis'
+MAX_MILLIS = 'max_millis'
+
+# the number of folders listed in the logged summary for each category, the profile file lists all of them
+SUMMARY_FOLDER_LIMIT = 10
+
+# modules that refer to the Java classes that are replaced with profiling versions
+_ENCRYPTION_MODULES = [
+    'wlsdeploy.aliases.aliases',
+    'wlsdeploy.aliases.password_utils',
+    'wlsdeploy.tool.discover.opss_wallet_discoverer',
+    'wlsdeploy.tool.encrypt.encryption_utils',
+    'wlsdeploy.util.ldift_helper',
+    'wlsdeploy.util.target_configuration_helper'
+]
+_ENCRYPTION_METHODS = ['encryptString', 'decryptString']
+_ARCHIVE_MODULES = [
+    'wlsdeploy.tool.util.archive_helper'
+]
+
+# the index of the WLST path argument for WlstHelper methods that have one, counting self
+_WLST_PATH_ARGUMENTS = {
+    'cd': 1,
+    'get_existing_object_list': 1,
+    'get_mbean': 1,
+    'get_mbi': 1,
+    'get_singleton_name': 1,
+    'lsa': 1,
+    'lsc': 1,
+    'path_exists': 1,
+    'subfolder_exists': 2
+}
+
+_class_name = 'profiler'
+_logger = PlatformLogger('wlsdeploy.util')
+
+_enabled = str(env_helper.getenv(PROFILE_ENV_VARIABLE, 'false')).lower() == 'true'
+_profile = None
+
+# the profiling versions of the Java classes, created when they are first installed
+_encryption_proxy = None
+_archive_class = None
+
+
+def is_enabled():
+    """
+    Determine if profiling was enabled for this process.
+    :return: True if profiling is enabled, False otherwise
+    """
+    return _enabled
+
+
+def start_profile(program_name, tool_globals=None):
+    """
+    Start profiling the tool, if profiling is enabled and a profile is not already running.
+    The profiling versions of the instrumented classes are installed the first time a profile is started,
+    and record their calls in the running profile.
+    :param program_name: the name of the tool
+    :param tool_globals: the globals of the tool module, so its references can be replaced
+    """
+    global _profile
+    _method_name = 'start_profile'
+
+    if not _enabled or _profile is not None:
+        return
+
+    _profile = Profile(program_name)
+    _install(tool_globals)
+    _logger.info('WLSDPLY-33100', program_name, get_profile_file(program_name),
+                 class_name=_class_name, method_name=_method_name)
+
+
+def start_phase(name):
+    """
+    Start a phase of the tool. Calls are recorded for the most recently started phase.
+    :param name: the name of the phase
+    """
+    if _profile is not None:
+        _profile.start_phase(name)
+
+
+def end_phase(name):
+    """
+    End a phase of the tool, and any phases started after it.
+    :param name: the name of the phase
+    """
+    if _profile is not None:
+        _profile.end_phase(name)
+
+
+def end_profile():
+    """
+    End profiling, if it was started. Any phases that are still running are ended.
+    The summary tables are logged, and the profile file is written to the log directory.
+    """
+    global _profile
+    _method_name = 'end_profile'
+
+    if _profile is None:
+        return
+
+    profile = _profile
+    _profile = None
+    profile.end_all_phases()
+    log_summary(profile)
+
+    profile_file = get_profile_file(profile.get_program_name())
+    try:
+        from wlsdeploy.json.json_translator import PythonToJson
+        PythonToJson(profile.to_dictionary()).write_to_json_file(profile_file)
+        _logger.info('WLSDPLY-33101', profile_file, class_name=_class_name, method_name=_method_name)
+    except JsonException, ex:
+        _logger.warning('WLSDPLY-33102', profile_file, ex.getLocalizedMessage(), error=ex,
+                        class_name=_class_name, method_name=_method_name)
+
+
+def get_profile_file(program_name):
+    """
+    Get the profile file for the tool, in the log directory.
+    :param program_name: the name of the tool
+    :return: the path of the profile file
+    """
+    log_directory = WLSDeployLoggingConfig.getLoggingDirectory().getPath()
+    return os.path.join(log_directory, program_name + PROFILE_FILE_SUFFIX)
+
+
+def log_summary(profile):
+    """
+    Log the summary tables for the profile.
+    The tables list the phases, the calls in each category for each phase,
+    and the folders with the highest total time for each category.
+    :param profile: the profile to be summarized
+    """
+    _method_name = 'log_summary'
+
+    _logger.info('WLSDPLY-33103', profile.get_program_name(), class_name=_class_name, method_name=_method_name)
+    for line in _format_summary(profile):
+        _logger.info('WLSDPLY-33104', line, class_name=_class_name, method_name=_method_name)
+
+
+def get_mbean_folder(wlst_path):
+    """
+    Get the MBean folder for a WLST path, with the bean names replaced by '*'.
+    WLST paths alternate between type and name elements, such as /Servers/AdminServer/Log/AdminServer.
+    A tree prefix such as serverConfig: is removed.
+    :param wlst_path: the absolute WLST path
+    :return: the MBean folder, such as /Servers/*/Log/*, or None if the path is not absolute
+    """
+    if wlst_path is None:
+        return None
+
+    path = str(wlst_path)
+    tree_index = path.find(':/')
+    if tree_index >= 0:
+        path = path[tree_index + 1:]
+    if not path.startswith('/'):
+        return None
+
+    elements = []
+    for element in path.split('/'):
+        if element:
+            elements.append(element)
+
+    folder = ''
+    for index in range(len(elements)):
+        if index % 2 == 0:
+            folder += '/' + elements[index]
+        else:
+            folder += '/*'
+    return folder or '/'
+
+
+def resolve_wlst_path(current_path, path):
+    """
+    Resolve a WLST path that may be relative to the current WLST path.
+    :param current_path: the current absolute WLST path
+    :param path: the absolute or relative path
+    :return: the resolved absolute path
+    """
+    path = str(path)
+    tree_index = path.find(':/')
+    if tree_index >= 0:
+        path = path[tree_index + 1:]
+    if path.startswith('/'):
+        elements = []
+    else:
+        elements = current_path.split('/')
+
+    for element in path.split('/'):
+        if element == '..':
+            if elements:
+                elements.pop()
+        elif element and element != '.':
+            elements.append(element)
+
+    result = ''
+    for element in elements:
+        if element:
+            result += '/' + element
+    return result or '/'
+
+
+def instrument_class(profile, python_class, category, folder_function=None):
+    """
+    Replace the public methods of a Python class with methods that record their calls in the profile.
+    :param profile: the profile for the calls, or None to use the running profile
+    :param python_class: the class to be instrumented
+    :param category: the call category
+    :param folder_function: a function that returns the folder for the method name and arguments, or None
+    """
+    for name, value in python_class.__dict__.items():
+        if not name.startswith('_') and isinstance(value, types.FunctionType):
+            setattr(python_class, name, _create_wrapper(profile, value, category, name, folder_function))
+
+
+class Profile(object):
+    """
+    The call and phase statistics for a single run of a tool.
+    The statistics are kept for each phase, and for each category, operation and folder within the phase.
+    A call made while another call in the same category is running in the same thread is included
+    in the time of the outer call, and is not recorded separately.
+    Calls can be recorded from multiple threads, but phases are started and ended by the main thread.
+    """
+    def __init__(self, program_name):
+        self._program_name = program_name
+        self._phase_stack = []
+        self._phases = OrderedDict()
+        self._calls = {}
+        # the categories with a running call, for each thread
+        self._thread_state = threading.local()
+        self._calls_lock = threading.Lock()
+        self._wlst_path = '/'
+
+    def get_program_name(self):
+        return self._program_name
+
+    def get_current_phase(self):
+        """
+        Get the most recently started phase that has not ended.
+        :return: the phase name, or the program name if no phase is running
+        """
+        if self._phase_stack:
+            return self._phase_stack[-1][0]
+        return self._program_name
+
+    def start_phase(self, name):
+        self._phase_stack.append((name, System.nanoTime()))
+
+    def end_phase(self, name):
+        """
+        End the named phase, and any phases started after it.
+        If the phase is not running, nothing is ended.
+        :param name: the name of the phase
+        """
+        running = False
+        for phase_name, start_time in self._phase_stack:
+            if phase_name == name:
+                running = True
+        if not running:
+            return
+
+        end_time = System.nanoTime()
+        while self._phase_stack:
+            phase_name, start_time = self._phase_stack.pop()
+            self._get_statistics(self._phases, phase_name).add(end_time - start_time)
+            if phase_name == name:
+                break
+
+    def end_all_phases(self):
+        if self._phase_stack:
+            self.end_phase(self._phase_stack[0][0])
+
+    def call(self, category, operation, folder, function, args, kwargs):
+        """
+        Call the function, and record the elapsed time if no other call in the category is running in this thread.
+        :return: the result of the function
+        """
+        active_categories = getattr(self._thread_state, 'active_categories', None)
+        if active_categories is None:
+            active_categories = set()
+            self._thread_state.active_categories = active_categories
+
+        if category in active_categories:
+            return function(*args, **kwargs)
+
+        active_categories.add(category)
+        start_time = System.nanoTime()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = System.nanoTime() - start_time
+            active_categories.discard(category)
+            self.record(category, operation, folder, elapsed)
+
+    def record(self, category, operation, folder, elapsed_nanos):
+        """
+        Record a call in the current phase.
+        :param category: the call category, such as wlst
+        :param operation: the operation, such as the method name
+        :param folder: the folder for the call, or None
+        :param elapsed_nanos: the elapsed time of the call, in nanoseconds
+        """
+        key = (self.get_current_phase(), category, operation, folder)
+        self._calls_lock.acquire()
+        try:
+            self._get_statistics(self._calls, key).add(elapsed_nanos)
+        finally:
+            self._calls_lock.release()
+
+    def get_wlst_path(self):
+        return self._wlst_path
+
+    def set_wlst_path(self, path):
+        self._wlst_path = resolve_wlst_path(self._wlst_path, path)
+
+    def get_phases(self):
+        """
+        :return: a list of (phase, Statistics) tuples, in the order the phases ended
+        """
+        return self._phases.items()
+
+    def get_calls(self):
+        """
+        :return: a list of ((phase, category, operation, folder), Statistics) tuples, highest total time first
+        """
+        self._calls_lock.acquire()
+        try:
+            calls = self._calls.items()
+        finally:
+            self._calls_lock.release()
+        calls.sort(lambda a, b: cmp(b[1].total_nanos, a[1].total_nanos))
+        return calls
+
+    def get_totals(self, key_function):
+        """
+        Combine the call statistics that have the same key.
+        :param key_function: a function that returns the key for a (phase, category, operation, folder) tuple,
+                             or None if the call should be skipped
+        :return: a list of (key, Statistics) tuples, highest total time first
+        """
+        totals = {}
+        for call_key, statistics in self.get_calls():
+            key = key_function(call_key)
+            if key is not None:
+                self._get_statistics(totals, key).merge(statistics)
+        result = totals.items()
+        result.sort(lambda a, b: cmp(b[1].total_nanos, a[1].total_nanos))
+        return result
+
+    def to_dictionary(self):
+        """
+        Get the profile as a dictionary, for the profile file.
+        :return: the profile dictionary
+        """
+        result = OrderedDict()
+        result[PROGRAM] = self._program_name
+        result[WDT_VERSION] = WebLogicDeployToolingVersion.getVersion()
+
+        phases = OrderedDict()
+        for phase, statistics in self.get_phases():
+            phases[phase] = statistics.to_dictionary()
+        result[PHASES] = phases
+
+        calls = []
+        for (phase, category, operation, folder), statistics in self.get_calls():
+            call = OrderedDict()
+            call[PHASE] = phase
+            call[CATEGORY] = category
+            call[OPERATION] = operation
+            if folder is not None:
+                call[FOLDER] = folder
+            for key, value in statistics.to_dictionary().items():
+                call[key] = value
+            calls.append(call)
+        result[CALLS] = calls
+        return result
+
+    def _get_statistics(self, statistics_map, key):
+        statistics = statistics_map.get(key)
+        if statistics is None:
+            statistics = Statistics()
+            statistics_map[key] = statistics
+        return statistics
+
+
+class Statistics(object):
+    """
+    The count, total and maximum elapsed times for a set of calls or phases.
+    """
+    def __init__(self):
+        self.count = 0
+        self.total_nanos = 0L
+        self.max_nanos = 0L
+
+    def add(self, elapsed_nanos):
+        self.count += 1
+        self.total_nanos += elapsed_nanos
+        self.max_nanos = max(self.max_nanos, elapsed_nanos)
+
+    def merge(self, statistics):
+        self.count += statistics.count
+        self.total_nanos += statistics.total_nanos
+        self.max_nanos = max(self.max_nanos, statistics.max_nanos)
+
+    def to_dictionary(self):
+        result = OrderedDict()
+        result[COUNT] = self.count
+        result[TOTAL_MILLIS] = _to_millis(self.total_nanos)
+        result[MAX_MILLIS] = _to_millis(self.max_nanos)
+        return result
+
+
+def _install(tool_globals):
+    """
+    Install the profiling versions of the instrumented classes, if they have not been installed.
+    The installed methods record their calls in the running profile.
+    Java classes are replaced in the modules that refer to them, if those modules have been loaded.
+    """
+    global _encryption_proxy, _archive_class
+
+    from oracle.weblogic.deploy.encrypt import EncryptionUtils
+    from oracle.weblogic.deploy.util import WLSDeployArchive
+
+    if _archive_class is None:
+        from wlsdeploy.aliases.aliases import Aliases
+        from wlsdeploy.tool.util.wlst_helper import WlstHelper
+        from wlsdeploy.util.model_translator import FileToPython
+        from wlsdeploy.util.model_translator import PythonToFile
+
+        WlstHelper.cd = _create_cd_tracker(WlstHelper.cd)
+        instrument_class(None, WlstHelper, WLST, _get_wlst_folder)
+        instrument_class(None, Aliases, ALIASES, _get_alias_folder)
+        instrument_class(None, FileToPython, MODEL_FILE)
+        instrument_class(None, PythonToFile, MODEL_FILE)
+
+        _encryption_proxy = _StaticMethodProxy(EncryptionUtils, ENCRYPTION, _ENCRYPTION_METHODS)
+        _archive_class = _create_archive_class(WLSDeployArchive)
+
+    # references are only replaced if they still refer to the Java class
+    _replace_references(EncryptionUtils, _encryption_proxy, _ENCRYPTION_MODULES, tool_globals)
+    _replace_references(WLSDeployArchive, _archive_class, _ARCHIVE_MODULES, tool_globals)
+
+
+def _replace_references(java_class, replacement, module_names, tool_globals):
+    """
+    Replace the module-level references to a Java class in the named modules and the tool globals.
+    """
+    namespaces = []
+    for module_name in module_names:
+        module = sys.modules.get(module_name)
+        if module is not None:
+            namespaces.append(module.__dict__)
+    if tool_globals is not None:
+        namespaces.append(tool_globals)
+
+    class_name = java_class.getSimpleName()
+    for namespace in namespaces:
+        if namespace.get(class_name) is java_class:
+            namespace[class_name] = replacement
+
+
+def _create_wrapper(profile, function, category, operation, folder_function):
+    """
+    Create a function that records the calls to the function in the profile.
+    If the profile is None, calls are recorded in the running profile, if there is one.
+    """
+    def wrapper(*args, **kwargs):
+        call_profile = profile or _profile
+        if call_profile is None:
+            return function(*args, **kwargs)
+
+        folder = None
+        if folder_function is not None:
+            folder = folder_function(call_profile, operation, args)
+        return call_profile.call(category, operation, folder, function, args, kwargs)
+
+    wrapper.__name__ = function.__name__
+    wrapper.__doc__ = function.__doc__
+    return wrapper
+
+
+def _create_cd_tracker(cd_function):
+    """
+    Wrap the WlstHelper cd method to track the current WLST path in the running profile,
+    for the folder of other WLST calls.
+    """
+    def cd(self, path):
+        result = cd_function(self, path)
+        if _profile is not None:
+            _profile.set_wlst_path(path)
+        return result
+
+    cd.__doc__ = cd_function.__doc__
+    return cd
+
+
+def _create_archive_class(archive_class):
+    """
+    Create a subclass of the WLSDeployArchive Java class that records the calls to its public instance methods.
+    Calls made within the archive class to its own methods are not recorded separately.
+    """
+    instance_names = set()
+    static_names = set()
+    for method in archive_class.getDeclaredMethods():
+        modifiers = method.getModifiers()
+        if Modifier.isStatic(modifiers) or Modifier.isFinal(modifiers):
+            static_names.add(method.getName())
+        elif Modifier.isPublic(modifiers):
+            instance_names.add(method.getName())
+
+    # a method name that also has static or final overloads is not replaced
+    methods = {}
+    for name in instance_names - static_names:
+        methods[name] = _create_wrapper(None, getattr(archive_class, name), ARCHIVE, name, None)
+    return type('Profiled' + archive_class.getSimpleName(), (archive_class,), methods)
+
+
+class _StaticMethodProxy(object):
+    """
+    Replaces a Java class with static methods, recording the calls to the named methods.
+    Other attributes are taken from the Java class.
+    """
+    def __init__(self, java_class, category, method_names):
+        self._java_class = java_class
+        for name in method_names:
+            setattr(self, name, _create_wrapper(None, getattr(java_class, name), category, name, None))
+
+    def __getattr__(self, name):
+        return getattr(self._java_class, name)
+
+
+def _get_wlst_folder(profile, operation, args):
+    """
+    Get the MBean folder for a WlstHelper call.
+    This is the path argument, if the method has one, otherwise the current WLST path.
+    """
+    wlst_path = profile.get_wlst_path()
+    index = _WLST_PATH_ARGUMENTS.get(operation)
+    if index is not None and len(args) > index and args[index] is not None:
+        wlst_path = resolve_wlst_path(wlst_path, args[index])
+    return get_mbean_folder(wlst_path)
+
+
+def _get_alias_folder(profile, operation, args):
+    """
+    Get the model folder path for an Aliases call, from the location argument.
+    """
+    if len(args) > 1 and hasattr(args[1], 'get_folder_path'):
+        return args[1].get_folder_path()
+    return None
+
+
+def _format_summary(profile):
+    """
+    Format the summary tables as a list of text lines.
+    """
+    phase_rows = []
+    for phase, statistics in profile.get_phases():
+        phase_rows.append([phase, statistics])
+
+    category_rows = []
+    for (phase, category), statistics in profile.get_totals(lambda key: (key[0], key[1])):
+        category_rows.append([phase, category, statistics])
+
+    folder_rows = []
+    folder_counts = {}
+    for (category, folder), statistics in profile.get_totals(_get_folder_total_key):
+        count = folder_counts.get(category, 0)
+        if count < SUMMARY_FOLDER_LIMIT:
+            folder_rows.append([category, folder, statistics])
+            folder_counts[category] = count + 1
+
+    lines = []
+    lines.extend(_format_table(['Phase'], phase_rows))
+    lines.append('')
+    lines.extend(_format_table(['Phase', 'Category'], category_rows))
+    if folder_rows:
+        lines.append('')
+        lines.extend(_format_table(['Category', 'Folder'], folder_rows))
+    return lines
+
+
+def _get_folder_total_key(call_key):
+    phase, category, operation, folder = call_key
+    if folder is None:
+        return None
+    return category, folder
+
+
+def _format_table(headings, rows):
+    """
+    Format a table with text columns for the headings, followed by count, total and max columns.
+    Each row is a list of the text column values, followed by a Statistics object.
+    """
+    headings = headings + ['Count', 'Total ms', 'Max ms']
+    text_rows = [headings]
+    for row in rows:
+        statistics = row[-1]
+        text_row = row[:-1] + [str(statistics.count), '%.1f' % _to_millis(statistics.total_nanos),
+                               '%.1f' % _to_millis(statistics.max_nanos)]
+        text_rows.append(text_row)
+
+    widths = []
+    for column in range(len(headings)):
+        width = 0
+        for text_row in text_rows:
+            width = max(width, len(text_row[column]))
+        widths.append(width)
+
+    # text columns are left-aligned, number columns are right-aligned
+    text_column_count = len(headings) - 3
+    lines = []
+    for text_row in text_rows:
+        cells = []
+        for column in range(len(headings)):
+            if column < text_column_count:
+                cells.append(text_row[column].ljust(widths[column]))
+            else:
+                cells.append(text_row[column].rjust(widths[column]))
+        lines.append('  '.join(cells))
+    return lines
+
+
+def _to_millis(nanos):
+    return round(nanos / 1000000.0, 3)
@@ -1,5 +1,5 @@
 """
-Copyright (c) 2023, 2024, Oracle and/or its affiliates.
+Copyright (c) 2023, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 
 Module that handles OS-specifics for SSH.
@@ -15,9 +15,17 @@ __logger = PlatformLogger('wlsdeploy.util')
 class SSHCommandLineHelper(object):
     __class_name = 'SSHCommandLineHelper'
 
+    __sha256_regex = re.compile(r'^[0-9a-fA-F]{64}$')
+
     def __init__(self, is_windows):
         self._is_windows = is_windows
 
+    def _get_checksum_from_tokens(self, tokens):
+        checksum = ''.join(tokens)
+        if self.__sha256_regex.match(checksum) is not None:
+            return checksum.lower()
+        return None
+
     def _filter_directory_contents(self, dir_name, contents_dict, files_only, file_pattern_to_match):
         results = list()
         path_separator = '/'
@@ -143,6 +151,18 @@ class SSHWindowsCommandLineHelper(SSHCommandLineHelper):
     def _format_environment_variable_deference(self, env_var_name):
         return str_helper.to_string('%') + str_helper.to_string(env_var_name) + str_helper.to_string('%')
 
+    def get_file_checksum_command(self, file_path):
+        path = file_path.replace('/', '\\')
+        return 'certutil -hashfile "%s" SHA256' % path
+
+    def get_file_checksum(self, output_lines):
+        # certutil prints a header line, the hash (with spaces between bytes in older versions), and a status line
+        for output_line in output_lines:
+            result = self._get_checksum_from_tokens(output_line.split())
+            if result is not None:
+                return result
+        return None
+
 
 class SSHUnixCommandLineHelper(SSHCommandLineHelper):
     __class_name = 'SSHUnixCommandLineHelper'
@@ -221,3 +241,13 @@ class SSHUnixCommandLineHelper(SSHCommandLineHelper):
                 result = line
                 break
         return result
+
+    def get_file_checksum_command(self, file_path):
+        return 'sha256sum "%s"' % file_path
+
+    def get_file_checksum(self, output_lines):
+        for output_line in output_lines:
+            tokens = output_line.split()
+            if len(tokens) > 0:
+                return self._get_checksum_from_tokens(tokens[:1])
+        return None
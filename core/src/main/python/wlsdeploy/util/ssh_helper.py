@@ -32,6 +32,10 @@ from wlsdeploy.util.ssh_command_line_helper import SSHWindowsCommandLineHelper
 __class_name = 'ssh_helper'
 __logger = PlatformLogger('wlsdeploy.util')
 
+# tools that use SSH without connecting to the Administration Server
+_OFFLINE_SSH_PROGRAMS = ['verifySSH', 'collectArtifacts']
+
+
 def initialize_ssh(model_context, argument_map, exception_type=ExceptionType.SSH):
     _method_name = 'initialize_ssh'
     __logger.entering(exception_type, class_name=__class_name, method_name=_method_name)
@@ -65,7 +69,7 @@ def __validate_ssh_arguments(argument_map, model_context):
     _method_name = '__validate_ssh_arguments'
     __logger.entering(class_name=__class_name, method_name=_method_name)
 
-    if model_context.get_program_name() != 'verifySSH':
+    if model_context.get_program_name() not in _OFFLINE_SSH_PROGRAMS:
         if CommandLineArgUtil.REMOTE_SWITCH in argument_map:
             ex = exception_helper.create_cla_exception(ExitCode.ARG_VALIDATION_ERROR, 'WLSDPLY-32039',
                 CommandLineArgUtil.SSH_HOST_SWITCH, CommandLineArgUtil.REMOTE_SWITCH)
@@ -397,6 +401,31 @@ class SSHContext(object):
         self._logger.exiting(class_name=self._class_name, method_name=_method_name, result=result)
         return result
 
+    def get_file_checksum(self, file_path):
+        """
+        Get the SHA-256 checksum of a file on the remote machine.
+        :param file_path: the absolute path of the remote file
+        :return: the lowercase hexadecimal checksum
+        :raises: the exception type of the context if the checksum command fails
+        """
+        _method_name = 'get_file_checksum'
+        self._logger.entering(file_path, class_name=self._class_name, method_name=_method_name)
+
+        command = self._os_helper.get_file_checksum_command(file_path)
+        exit_code, output_lines = self._run_exec_command(command)
+        result = None
+        if exit_code == 0:
+            result = self._os_helper.get_file_checksum(output_lines)
+        if result is None:
+            ex = exception_helper.create_exception(self._exception_type, 'WLSDPLY-32045', file_path,
+                                                   command, self._ssh_client.getRemoteHostname(),
+                                                   self._join_lines(output_lines))
+            self._logger.throwing(ex, class_name=self._class_name, method_name=_method_name)
+            raise ex
+
+        self._logger.exiting(class_name=self._class_name, method_name=_method_name, result=result)
+        return result
+
     def create_temp_directory_for_security_data_export(self):
         _method_name = 'create_temp_directory_for_security_data_export'
         self._logger.entering(class_name=self._class_name, method_name=_method_name)
@@ -0,0 +1,231 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+
+An index of the @@PROP:, @@ENV:, @@FILE:, and @@SECRET: tokens in a model, and the model locations that use them.
+"""
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+
+from wlsdeploy.util import dictionary_utils
+from wlsdeploy.util import variables
+import wlsdeploy.util.unicode_helper as str_helper
+
+PROPERTY = 'PROP'
+ENVIRONMENT = 'ENV'
+FILE = 'FILE'
+SECRET = 'SECRET'
+
+TOKEN_TYPES = [PROPERTY, ENVIRONMENT, FILE, SECRET]
+
+
+class TokenIndex(object):
+    """
+    Maps each token in a model to the model locations that reference it.
+    A location is a tuple of the dictionary keys from the top of the model to a key or value that contains a token,
+    such as ('topology', 'Server', 'm1', 'ListenPort').
+    The index is built in one pass over the model, and can be updated as folders are added, replaced, or removed.
+    """
+    def __init__(self, model_dictionary=None):
+        """
+        :param model_dictionary: the model to be indexed, or None to start with an empty index
+        """
+        # token -> list of locations
+        self._token_locations = {}
+        # token type -> {name -> list of tokens}
+        self._type_names = {}
+        # token -> (token type, name)
+        self._token_names = {}
+        # location -> list of tokens at that location
+        self._location_tokens = {}
+        # location prefix -> set of indexed locations at or below the prefix, for subtree removal
+        self._prefix_locations = {}
+
+        if model_dictionary is not None:
+            self.add_folder((), model_dictionary)
+
+    def add_folder(self, location, folder):
+        """
+        Add the tokens in the keys and values of the folder, and its sub-folders.
+        :param location: the location of the folder
+        :param folder: the folder dictionary
+        """
+        for key in folder:
+            self.add_value(location + (key,), key, folder[key])
+
+    def add_value(self, location, key, value):
+        """
+        Add the tokens in the key and value at the specified location.
+        If the value is a dictionary, its contents are added.
+        :param location: the location of the key
+        :param key: the dictionary key
+        :param value: the value of the key
+        """
+        self._add_text(location, key)
+        if isinstance(value, dict):
+            self.add_folder(location, value)
+        elif isinstance(value, list):
+            for member in value:
+                self._add_text(location, member)
+        elif value is not None:
+            self._add_text(location, value)
+
+    def remove_location(self, location):
+        """
+        Remove the tokens at the specified location, and at any location below it.
+        :param location: the location to be removed
+        """
+        removed_locations = self._prefix_locations.get(location)
+        if not removed_locations:
+            return
+
+        # the set for the location is changed as its locations are removed
+        for removed_location in list(removed_locations):
+            for token in self._location_tokens[removed_location]:
+                locations = self._token_locations[token]
+                locations.remove(removed_location)
+                if not locations:
+                    self._remove_token(token)
+            del self._location_tokens[removed_location]
+
+            for size in range(len(removed_location) + 1):
+                prefix = removed_location[:size]
+                prefix_locations = self._prefix_locations[prefix]
+                prefix_locations.discard(removed_location)
+                if not prefix_locations:
+                    del self._prefix_locations[prefix]
+
+    def replace_value(self, location, key, value):
+        """
+        Replace the tokens at the specified location with those in the new key and value.
+        :param location: the location of the key
+        :param key: the dictionary key
+        :param value: the value of the key
+        """
+        self.remove_location(location)
+        self.add_value(location, key, value)
+
+    def has_token(self, token):
+        """
+        Determine if the token is referenced in the model.
+        :param token: the full token, such as @@PROP:name@@
+        :return: True if the token is referenced, False otherwise
+        """
+        return token in self._token_locations
+
+    def has_name(self, token_type, name):
+        """
+        Determine if a token with the specified type and name is referenced in the model.
+        :param token_type: the token type, such as PROP
+        :param name: the token name
+        :return: True if a token is referenced, False otherwise
+        """
+        type_names = dictionary_utils.get_element(self._type_names, token_type, {})
+        return name in type_names
+
+    def get_tokens(self, token_type=None):
+        """
+        Get the tokens that are referenced in the model.
+        :param token_type: the token type, such as PROP, or None for all types
+        :return: a sorted list of tokens
+        """
+        if token_type is None:
+            tokens = self._token_locations.keys()
+        else:
+            tokens = []
+            for name_tokens in dictionary_utils.get_element(self._type_names, token_type, {}).values():
+                tokens.extend(name_tokens)
+        tokens.sort()
+        return tokens
+
+    def get_names(self, token_type):
+        """
+        Get the names of the tokens of the specified type that are referenced in the model.
+        :param token_type: the token type, such as SECRET
+        :return: a sorted list of names, such as <name>:<key> for secrets
+        """
+        names = dictionary_utils.get_element(self._type_names, token_type, {}).keys()
+        names.sort()
+        return names
+
+    def get_locations(self, token):
+        """
+        Get the locations that reference the token.
+        :param token: the full token, such as @@PROP:name@@
+        :return: a list of locations, in the order they were added
+        """
+        return list(dictionary_utils.get_element(self._token_locations, token, []))
+
+    def get_name_locations(self, token_type, name):
+        """
+        Get the locations that reference any token with the specified type and name.
+        :param token_type: the token type, such as PROP
+        :param name: the token name
+        :return: a list of locations
+        """
+        result = []
+        type_names = dictionary_utils.get_element(self._type_names, token_type, {})
+        for token in dictionary_utils.get_element(type_names, name, []):
+            for location in self._token_locations[token]:
+                if location not in result:
+                    result.append(location)
+        return result
+
+    def get_usage(self, token_type=None):
+        """
+        Get the model paths that use each token, for a "where is this variable used" report.
+        :param token_type: the token type, such as PROP, or None for all types
+        :return: an ordered dictionary of token -> list of model paths, sorted by token
+        """
+        result = OrderedDict()
+        for token in self.get_tokens(token_type):
+            paths = []
+            for location in self._token_locations[token]:
+                paths.append(get_model_path(location))
+            result[token] = paths
+        return result
+
+    def _add_text(self, location, value):
+        text = str_helper.to_string(value)
+        for token, token_type, name in variables.get_token_references(text):
+            locations = self._token_locations.get(token)
+            if locations is None:
+                locations = []
+                self._token_locations[token] = locations
+                self._token_names[token] = (token_type, name)
+                type_names = self._type_names.setdefault(token_type, {})
+                type_names.setdefault(name, []).append(token)
+
+            if location not in locations:
+                locations.append(location)
+                location_tokens = self._location_tokens.get(location)
+                if location_tokens is None:
+                    location_tokens = []
+                    self._location_tokens[location] = location_tokens
+                    for size in range(len(location) + 1):
+                        self._prefix_locations.setdefault(location[:size], set()).add(location)
+                location_tokens.append(token)
+
+    def _remove_token(self, token):
+        token_type, name = self._token_names[token]
+        del self._token_names[token]
+        del self._token_locations[token]
+
+        type_names = self._type_names[token_type]
+        name_tokens = type_names[name]
+        name_tokens.remove(token)
+        if not name_tokens:
+            del type_names[name]
+
+
+def get_model_path(location):
+    """
+    Get the model path for a location, such as topology:/Server/m1/ListenPort.
+    :param location: a tuple of dictionary keys
+    :return: the model path
+    """
+    if not location:
+        return ''
+    names = []
+    for key in location[1:]:
+        names.append(str_helper.to_string(key))
+    return '%s:/%s' % (str_helper.to_string(location[0]), '/'.join(names))
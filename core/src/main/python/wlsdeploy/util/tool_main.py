@@ -1,5 +1,5 @@
 """
-Copyright (c) 2017, 2024, Oracle and/or its affiliates.
+Copyright (c) 2017, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 import exceptions
@@ -28,6 +28,7 @@ from wlsdeploy.exception.exception_types import ExceptionType
 from wlsdeploy.tool.util import model_context_helper
 from wlsdeploy.util import cla_helper
 from wlsdeploy.util import path_helper
+from wlsdeploy.util import profiler
 import wlsdeploy.util.unicode_helper as str_helper
 from wlsdeploy.util.exit_code import ExitCode
 
@@ -71,10 +72,15 @@ def run_tool(main, process_args, args, program_name, class_name, logger):
         logger.info('WLSDPLY-20045', args[0], class_name=class_name, method_name=_method_name)
 
     __initialize_path_helper(program_name)
+    profiler.start_profile(program_name, main.func_globals)
     model_context_obj = model_context_helper.create_exit_context(program_name)
     try:
+        profiler.start_phase(profiler.PROCESS_ARGS_PHASE)
         model_context_obj = process_args(args, is_encryption_supported=is_encryption_supported)
         __update_model_context(model_context_obj, logger, is_encryption_supported)
+        profiler.end_phase(profiler.PROCESS_ARGS_PHASE)
+
+        profiler.start_phase(program_name)
         exit_code = main(model_context_obj)
     except CLAException, ex:
         exit_code = ex.getExitCode()
@@ -90,6 +96,7 @@ def run_tool(main, process_args, args, program_name, class_name, logger):
         __handle_unexpected_exception(ex, model_context_obj, class_name, _method_name, logger)
 
     cla_helper.clean_up_temp_files()
+    profiler.end_profile()
     __exit_tool(model_context_obj, exit_code)
 
 def __assertWebLogicDeployToolingLoggingIsConfigured(program_name):
@@ -31,6 +31,7 @@ _property_pattern = re.compile("(@@PROP:([\\w.-]+)@@)")
 _environment_pattern = re.compile("(@@ENV:([\\w.-]+)@@)")
 _secret_pattern = re.compile("(@@SECRET:([\\w.-]+):([\\w.-]+)@@)")
 _file_nested_variable_pattern = re.compile("(@@FILE:(@@[\w]+@@[\w.\\\/:-]+)@@)")
+_secret_nested_variable_pattern = re.compile("(@@SECRET:(@@ENV:[\\w.-]+@@[\\w.-]*):([\\w.-]+)@@)")
 _variable_reference_pattern = re.compile("\\$\\{([^{}]+)\\}")
 
 # these match a string containing ONLY a token
@@ -643,6 +644,32 @@ def has_tokens(text):
     matches = _unresolved_token_pattern.findall(text)
     return len(matches) > 0
 
+def get_token_references(text):
+    """
+    Return a list containing a tuple for each token in the specified text.
+    Each tuple contains the full token, the token type (PROP, ENV, FILE, or SECRET), and the token name.
+    The name is the text between the type and the closing @@, such as <key> or <name>:<key> for a secret.
+    Tokens nested in other tokens are included, such as @@ENV:DOMAIN_UID@@ in a discovered secret token.
+    :param text: the text to be evaluated
+    :return: a list of tuples
+    """
+    references = []
+    if '@@' not in text:
+        return references
+
+    for token, key in _property_pattern.findall(text):
+        references.append((token, 'PROP', key))
+    for token, key in _environment_pattern.findall(text):
+        references.append((token, 'ENV', key))
+    for pattern in [_secret_pattern, _secret_nested_variable_pattern]:
+        for token, name, key in pattern.findall(text):
+            references.append((token, 'SECRET', name + ':' + key))
+    for pattern in [_file_variable_pattern, _file_nested_variable_pattern]:
+        for token, path in pattern.findall(text):
+            references.append((token, 'FILE', path))
+    return references
+
+
 def get_variable_matches(text):
     """
     Return a list containing a tuple for each property key in the specified text.
@@ -1,5 +1,5 @@
 """
-Copyright (c) 2017, 2025, Oracle and/or its affiliates.
+Copyright (c) 2017, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 import os
@@ -62,6 +62,8 @@ class WebLogicHelper(object):
         :param wls_version: represented by this helper instance. If None, then retrieve version from weblogic tool
         """
         self.logger = logger
+        # domain home -> encryption service, built once for each domain
+        self.__encryption_services = {}
         if wls_version is not None:
             self.wl_version = str_helper.to_string(wls_version)
             self.wl_version_actual = get_local_weblogic_version()
@@ -388,11 +390,25 @@ class WebLogicHelper(object):
     def __get_encryption_service(self, domain_home):
         """
         Get the encryption service for the specified domain.
+        The service is created the first time it is requested for the domain, and reused after that.
         :param domain_home: the domain home directory
         :return: the encryption service
         :raises: EncryptionException: if an error occurs getting the WebLogic encryption services
         """
-        _method_name = '__get_encryption_service'
+        encryption_service = self.__encryption_services.get(domain_home)
+        if encryption_service is None:
+            encryption_service = self.__create_encryption_service(domain_home)
+            self.__encryption_services[domain_home] = encryption_service
+        return encryption_service
+
+    def __create_encryption_service(self, domain_home):
+        """
+        Create the encryption service for the specified domain.
+        :param domain_home: the domain home directory
+        :return: the encryption service
+        :raises: EncryptionException: if an error occurs getting the WebLogic encryption services
+        """
+        _method_name = '__create_encryption_service'
 
         system_ini = SerializedSystemIni.getEncryptionService(domain_home)
         if system_ini is None:
@@ -1,5 +1,5 @@
 """
-Copyright (c) 2024, Oracle and/or its affiliates.
+Copyright (c) 2024, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 import os
@@ -13,6 +13,7 @@ from com.bea.common.security.xacml import URISyntaxException
 from com.bea.security.providers.xacml.entitlement import EntitlementConverter
 from com.bea.security.xacml.cache.resource import ResourcePolicyIdUtil
 
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
 from oracle.weblogic.deploy.util import XACMLException
 from oracle.weblogic.deploy.util import XACMLUtil
 
@@ -22,8 +23,8 @@ from wlsdeploy.aliases.model_constants import WLS_POLICIES
 from wlsdeploy.aliases.model_constants import XACML_DOCUMENT
 from wlsdeploy.aliases.model_constants import XACML_STATUS
 from wlsdeploy.exception import exception_helper
-from wlsdeploy.tool.util import ldif_entry
 from wlsdeploy.tool.util.ldif_entry import LDIFEntry
+from wlsdeploy.tool.util.ldift_store import LdiftStore
 from wlsdeploy.util import dictionary_utils
 from wlsdeploy.util import string_utils
 from wlsdeploy.util import unicode_helper as str_helper
@@ -109,62 +110,59 @@ class WebLogicPoliciesHelper(object):
         self._logger.finer('WLSDPLY-02006', self._target_xacml_authorizer_ldift_file,
                            class_name=self.__class_name, method_name=_method_name)
 
-        target_ldift_file = None
         try:
-            try:
-                existing_policies = ldif_entry.read_entries(File(self._source_xacml_authorizer_ldift_file))
-
-                # build a map of resource IDs to existing policies
-                existing_policy_map = {}
-                for policy in existing_policies:
-                    cn = policy.get_single_value('cn')
-                    if cn:
-                        policy_id = self._escaper.unescapeString(cn)
-                        resource_id = ResourcePolicyIdUtil.getResourceId(policy_id)
-                        resource_key = _get_resource_key(resource_id)
-                        existing_policy_map[resource_key] = policy
-
-                # for each model policy, update an existing policy, or add a new one
-                new_policies = []
-                for model_policy_name, model_policy_dict in model_policies_dict.iteritems():
-                    model_resource_id = dictionary_utils.get_dictionary_element(model_policy_dict, RESOURCE_ID)
-                    model_policy = dictionary_utils.get_element(model_policy_dict, POLICY)
-                    model_xacml_status = dictionary_utils.get_element(model_policy_dict, XACML_STATUS, '3')
-                    if not isinstance(model_xacml_status, (str, unicode)):
-                        model_xacml_status = str_helper.to_string(model_xacml_status)
-                    model_xacml_document = dictionary_utils.get_element(model_policy_dict, XACML_DOCUMENT)
-
-                    resource_key = _get_resource_key(model_resource_id)
-                    existing_policy = dictionary_utils.get_element(existing_policy_map, resource_key)  # LDIFEntry
-                    if existing_policy:
-                        self._update_policy_from_model(existing_policy, model_policy, model_xacml_status,
-                                                       model_xacml_document, model_policy_name)
-                    else:
-                        new_policy = self._create_policy_from_model(model_resource_id, model_policy, model_xacml_status,
-                                                                    model_xacml_document, model_policy_name)
-                        new_policies.append(new_policy)
-
-                target_ldift_file = open(self._target_xacml_authorizer_ldift_file, 'w')
-                first = True
-                all_policies = existing_policies + new_policies
-                for policy in all_policies:
-                    if not first:
-                        target_ldift_file.write('\n')
-                    lines_text = '\n'.join(policy.get_assignment_lines()) + '\n'
-                    target_ldift_file.writelines(lines_text)
-                    first = False
-
-            except (ValueError,IOError,OSError), error:
-                ex = exception_helper.create_exception(self._exception_type, 'WLSDPLY-02008',
-                                                       str_helper.to_string(error), error=error)
-                self._logger.throwing(ex, class_name=self.__class_name, method_name=_method_name)
-                raise ex
-        finally:
-            if target_ldift_file is not None:
-                target_ldift_file.close()
+            policy_store = LdiftStore(self._source_xacml_authorizer_ldift_file, self._get_policy_key, [])
+
+            # for each model policy, update a copy of the existing policy, or create a new one
+            model_entries = OrderedDict()
+            for model_policy_name, model_policy_dict in model_policies_dict.iteritems():
+                model_resource_id = dictionary_utils.get_dictionary_element(model_policy_dict, RESOURCE_ID)
+                model_policy = dictionary_utils.get_element(model_policy_dict, POLICY)
+                model_xacml_status = dictionary_utils.get_element(model_policy_dict, XACML_STATUS, '3')
+                if not isinstance(model_xacml_status, (str, unicode)):
+                    model_xacml_status = str_helper.to_string(model_xacml_status)
+                model_xacml_document = dictionary_utils.get_element(model_policy_dict, XACML_DOCUMENT)
+
+                resource_key = _get_resource_key(model_resource_id)
+                policy_entry = dictionary_utils.get_element(model_entries, resource_key)
+                if policy_entry is None:
+                    policy_entry = policy_store.read_entry(resource_key)
+
+                if policy_entry is not None:
+                    self._update_policy_from_model(policy_entry, model_policy, model_xacml_status,
+                                                   model_xacml_document, model_policy_name)
+                else:
+                    policy_entry = self._create_policy_from_model(model_resource_id, model_policy,
+                                                                  model_xacml_status, model_xacml_document,
+                                                                  model_policy_name)
+                model_entries[resource_key] = policy_entry
+
+            result = policy_store.merge(self._target_xacml_authorizer_ldift_file, model_entries)
+            self._logger.info('WLSDPLY-02016', self._target_xacml_authorizer_ldift_file, len(result.added),
+                              len(result.replaced), result.unchanged_count,
+                              class_name=self.__class_name, method_name=_method_name)
+
+        except (ValueError,IOError,OSError), error:
+            ex = exception_helper.create_exception(self._exception_type, 'WLSDPLY-02008',
+                                                   str_helper.to_string(error), error=error)
+            self._logger.throwing(ex, class_name=self.__class_name, method_name=_method_name)
+            raise ex
 
         self._logger.exiting(class_name=self.__class_name, method_name=_method_name)
 
+    def _get_policy_key(self, policy_entry):
+        """
+        Get the key for an existing policy entry, from the resource ID in its CN.
+        :param policy_entry: the LDIFEntry for the policy
+        :return: the resource key, or None if the entry has no CN
+        """
+        cn = policy_entry.get_single_value('cn')
+        if not cn:
+            return None
+        policy_id = self._escaper.unescapeString(cn)
+        resource_id = ResourcePolicyIdUtil.getResourceId(policy_id)
+        return _get_resource_key(resource_id)
+
     def _update_policy_from_model(self, policy_entry, model_policy, model_xacml_status, model_xacml_document,
                                   model_policy_name):
         _method_name = '_update_policy_from_model'
@@ -1,5 +1,5 @@
 """
-Copyright (c) 2019, 2024, Oracle Corporation and/or its affiliates.  All rights reserved.
+Copyright (c) 2019, 2026, Oracle Corporation and/or its affiliates.  All rights reserved.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 import os
@@ -13,6 +13,7 @@ import com.bea.common.security.xacml.URISyntaxException as URISyntaxException
 import com.bea.security.providers.xacml.entitlement.EntitlementConverter as EntitlementConverter
 import com.bea.security.xacml.cache.resource.ResourcePolicyIdUtil as ResourcePolicyIdUtil
 
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
 from oracle.weblogic.deploy.util import XACMLException
 from oracle.weblogic.deploy.util import XACMLUtil
 
@@ -20,6 +21,8 @@ from wlsdeploy.aliases.model_constants import EXPRESSION
 from wlsdeploy.aliases.model_constants import XACML_DOCUMENT
 from wlsdeploy.aliases.model_constants import XACML_STATUS
 from wlsdeploy.exception import exception_helper
+from wlsdeploy.tool.util.ldif_entry import LDIFEntry
+from wlsdeploy.tool.util.ldift_store import LdiftStore
 from wlsdeploy.util import dictionary_utils
 from wlsdeploy.util import string_utils
 from wlsdeploy.util import unicode_helper as str_helper
@@ -52,7 +55,7 @@ class WebLogicRolesHelper(object):
         _method_name = '_create_xacml_role_mapper_entries'
         self.logger.entering(class_name=self.__class_name, method_name=_method_name)
 
-        entries = dict()
+        entries = OrderedDict()
         if roles_provisioning_map:
             for role_name, role_dict in roles_provisioning_map.iteritems():
                 role, role_entry = self._get_role_entry(role_name, role_dict)
@@ -82,17 +85,16 @@ class WebLogicRolesHelper(object):
         xacml = self._b64encoder.encodeBuffer(String(xacml_string).getBytes('UTF-8'))
 
         # Setup the lines that make up the role entry
-        entry = []
-        entry.append('dn: cn=%s+xacmlVersion=1.0,ou=Policies,ou=XACMLRole,ou=@realm@,dc=@domain@\n' % cn)
-        entry.append('objectclass: top\n')
-        entry.append('objectclass: xacmlEntry\n')
-        entry.append('objectclass: xacmlRoleAssignmentPolicy\n')
-        entry.append('cn: %s\n' % cn)
-        entry.append('xacmlVersion: 1.0\n')
-        entry.append('xacmlStatus: %s\n' % xacml_status)
-        entry.append('xacmlDocument:: %s\n' % xacml)
-        entry.append('xacmlRole: %s\n' % role)
-        entry.append('\n')
+        entry = LDIFEntry()
+        entry.add_assignment_line('dn: cn=%s+xacmlVersion=1.0,ou=Policies,ou=XACMLRole,ou=@realm@,dc=@domain@' % cn)
+        entry.add_assignment('objectclass', 'top')
+        entry.add_assignment('objectclass', 'xacmlEntry')
+        entry.add_assignment('objectclass', 'xacmlRoleAssignmentPolicy')
+        entry.add_assignment('cn', cn)
+        entry.add_assignment('xacmlVersion', '1.0')
+        entry.add_assignment('xacmlStatus', xacml_status)
+        entry.add_assignment('xacmlDocument:', xacml)  # double colon assignment
+        entry.add_assignment('xacmlRole', role)
 
         self.logger.exiting(class_name=self.__class_name, method_name=_method_name)
         return role, entry
@@ -138,37 +140,15 @@ class WebLogicRolesHelper(object):
             ldift_filename = File(self._domain_security_folder, WLS_XACML_ROLE_MAPPER_LDIFT_FILENAME).getPath()
             self.logger.finer('WLSDPLY-01800', ldift_filename, class_name=self.__class_name, method_name=_method_name)
 
-            # Update the XACML ldift file
-            ldift_file = None
-            update_file = None
+            # Merge the model roles into a new XACML ldift file, replacing existing roles with the same name
             update_filename = ldift_filename + '.new'
-            try:
-                update_file = open(update_filename, 'w')
-                ldift_file = open(ldift_filename)
-                # Look for existing entries to be replaced
-                for line in ldift_file:
-                    if line.startswith('dn: cn='):
-                        role_entry_lines = self.__read_xacml_role_entry(line, ldift_file)
-                        role_name = self.__get_xacml_role_entry_name(role_entry_lines)
-                        if role_name in role_entries_map:
-                            self.logger.finer('WLSDPLY-01802', role_name, class_name=self.__class_name, method_name=_method_name)
-                            update_file.writelines(role_entries_map[role_name])
-                            del role_entries_map[role_name]
-                        else:
-                            update_file.writelines(role_entry_lines)
-                    else:
-                        update_file.write(line)
-                # Append any remaining entries
-                role_names = role_entries_map.keys()
-                self.logger.finer('WLSDPLY-01803', role_names, class_name=self.__class_name, method_name=_method_name)
-                for role_name in role_names:
-                    update_file.write('\n')
-                    update_file.writelines(role_entries_map[role_name])
-            finally:
-                if ldift_file is not None:
-                    ldift_file.close()
-                if update_file is not None:
-                    update_file.close()
+            role_store = LdiftStore(ldift_filename, _get_xacml_role_entry_name, ['cn', 'xacmlRole'])
+            result = role_store.merge(update_filename, role_entries_map)
+            for role_name in result.replaced:
+                self.logger.finer('WLSDPLY-01802', role_name, class_name=self.__class_name, method_name=_method_name)
+            self.logger.finer('WLSDPLY-01803', result.added, class_name=self.__class_name, method_name=_method_name)
+            self.logger.info('WLSDPLY-01807', ldift_filename, len(result.added), len(result.replaced),
+                             result.unchanged_count, class_name=self.__class_name, method_name=_method_name)
 
             # Backup or remove the existing ldift file
             backup_filename = ldift_filename + '.bak'
@@ -199,24 +179,11 @@ class WebLogicRolesHelper(object):
 
         self.logger.exiting(class_name=self.__class_name, method_name=_method_name)
 
-    def __read_xacml_role_entry(self, start_line, ldift_file):
-        count = 1
-        lines = [start_line]
-        for line in ldift_file:
-            count += 1
-            lines.append(line)
-            if count == 10:
-                break
 
-        if len(lines) != 10:
-            raise ValueError('Error reading XACML role entry!')
-
-        if not lines[-2].startswith('xacmlRole: '):
-            raise ValueError('Unable to find XACML role entry!')
-
-        return lines
-
-    def __get_xacml_role_entry_name(self, role_entry_lines):
-        role_name_entry = role_entry_lines[-2]
-        role_name = role_name_entry[10:]
-        return role_name.strip()
+def _get_xacml_role_entry_name(role_entry):
+    """
+    Get the escaped role name of a role entry.
+    :param role_entry: the LDIFEntry for the role
+    :return: the role name
+    """
+    return role_entry.get_single_value('xacmlRole')
@@ -0,0 +1,176 @@
+/*
+ * Copyright (c) 2026, Oracle and/or its affiliates.
+ * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+ */
+package oracle.weblogic.deploy.tool;
+
+import java.io.File;
+import java.io.FileOutputStream;
+import java.io.PrintWriter;
+import java.io.StringWriter;
+import java.nio.charset.StandardCharsets;
+import java.util.Arrays;
+import java.util.List;
+import java.util.logging.Level;
+
+import oracle.weblogic.deploy.logging.PlatformLogger;
+import oracle.weblogic.deploy.logging.WLSDeployLogFactory;
+import oracle.weblogic.deploy.util.ExitCode;
+import oracle.weblogic.deploy.util.FileUtils;
+import oracle.weblogic.deploy.util.WLSDeployArchive;
+import oracle.weblogic.deploy.util.WLSDeployZipFileTest;
+import org.junit.jupiter.api.BeforeAll;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.Test;
+
+import static oracle.weblogic.deploy.tool.ArchiveHelper.LOGGER_NAME;
+import static org.junit.jupiter.api.Assertions.assertEquals;
+import static org.junit.jupiter.api.Assertions.assertFalse;
+import static org.junit.jupiter.api.Assertions.assertTrue;
+
+public class ArchiveHelperSyncTest {
+    private static final File UNIT_TEST_TARGET_DIR =
+        new File(new File(WLSDeployZipFileTest.UNIT_TEST_TARGET_DIR, "archiveHelper"), "sync");
+    private static final File SOURCE_DIR = new File(UNIT_TEST_TARGET_DIR, "source");
+    private static final File ARCHIVE_FILE = new File(UNIT_TEST_TARGET_DIR, "sync-test.zip");
+
+    private static final String APP_ENTRY = "wlsdeploy/applications/my-app.war";
+    private static final String LIB_ENTRY = "wlsdeploy/domainLibraries/my-lib.jar";
+    private static final String OTHER_LIB_ENTRY = "wlsdeploy/domainLibraries/my-other-lib.jar";
+    private static final String FILE_STORE_ENTRY = "wlsdeploy/stores/fs1/";
+
+    @BeforeAll
+    static void initialize() throws Exception {
+        if(!UNIT_TEST_TARGET_DIR.exists() && !UNIT_TEST_TARGET_DIR.mkdirs()) {
+            throw new Exception("Unable to create unit test directory: " + UNIT_TEST_TARGET_DIR);
+        }
+
+        PlatformLogger logger = WLSDeployLogFactory.getLogger(LOGGER_NAME);
+        logger.setLevel(Level.OFF);
+        WLSDeployLogFactory.getLogger("wlsdeploy.archive").setLevel(Level.OFF);
+    }
+
+    @BeforeEach
+    void setup() throws Exception {
+        FileUtils.deleteDirectory(SOURCE_DIR);
+        if (ARCHIVE_FILE.exists() && !ARCHIVE_FILE.delete()) {
+            throw new Exception("Unable to delete archive file: " + ARCHIVE_FILE);
+        }
+
+        writeSourceFile(APP_ENTRY, "my application");
+        writeSourceFile(LIB_ENTRY, "my library");
+        File fileStoreDir = new File(SOURCE_DIR, FILE_STORE_ENTRY);
+        if (!fileStoreDir.mkdirs()) {
+            throw new Exception("Unable to create file store directory: " + fileStoreDir);
+        }
+    }
+
+    @Test
+    void testSyncFromDirectory() throws Exception {
+        assertEquals(ExitCode.OK, sync("-source_dir", SOURCE_DIR.getAbsolutePath()), "unexpected exit code");
+        List<String> entries = getArchiveEntries();
+        assertEquals(3, entries.size(), "unexpected archive entries after the first sync: " + entries);
+        assertTrue(entries.containsAll(Arrays.asList(APP_ENTRY, LIB_ENTRY, FILE_STORE_ENTRY)),
+            "unexpected archive entries after the first sync: " + entries);
+
+        long lastModified = ARCHIVE_FILE.lastModified();
+        assertEquals(ExitCode.OK, sync("-source_dir", SOURCE_DIR.getAbsolutePath()), "unexpected exit code");
+        assertEquals(lastModified, ARCHIVE_FILE.lastModified(), "expected unchanged archive file to not be written");
+
+        writeSourceFile(APP_ENTRY, "my changed application");
+        writeSourceFile(OTHER_LIB_ENTRY, "my other library");
+        assertTrue(new File(SOURCE_DIR, LIB_ENTRY).delete(), "expected to delete source library");
+
+        StringWriter out = new StringWriter();
+        assertEquals(ExitCode.OK, sync(out, "-source_dir", SOURCE_DIR.getAbsolutePath(), "-dry_run"),
+            "unexpected exit code");
+        String output = out.toString();
+        assertTrue(output.contains("add     " + OTHER_LIB_ENTRY), "expected planned addition: " + output);
+        assertTrue(output.contains("replace " + APP_ENTRY), "expected planned replacement: " + output);
+        assertTrue(output.contains("remove  " + LIB_ENTRY), "expected planned removal: " + output);
+        assertTrue(getArchiveEntries().contains(LIB_ENTRY), "expected dry run to not change the archive file");
+
+        assertEquals(ExitCode.OK, sync("-source_dir", SOURCE_DIR.getAbsolutePath()), "unexpected exit code");
+        entries = getArchiveEntries();
+        assertEquals(3, entries.size(), "unexpected archive entries after the last sync: " + entries);
+        assertTrue(entries.containsAll(Arrays.asList(APP_ENTRY, OTHER_LIB_ENTRY, FILE_STORE_ENTRY)),
+            "unexpected archive entries after the last sync: " + entries);
+    }
+
+    @Test
+    void testSyncFromManifestWithoutRemove() throws Exception {
+        assertEquals(ExitCode.OK, sync("-source_dir", SOURCE_DIR.getAbsolutePath()), "unexpected exit code");
+
+        File manifestFile = new File(UNIT_TEST_TARGET_DIR, "sync-manifest.json");
+        writeFile(manifestFile, "{ \"entries\": [\n" +
+            "  { \"archivePath\": \"wlsdeploy/domainLibraries/\", \"sourcePath\": \"source/other\" },\n" +
+            "  { \"archivePath\": \"wlsdeploy/stores/fs2/\" }\n" +
+            "] }");
+        writeSourceFile("other/my-other-lib.jar", "my other library");
+
+        assertEquals(ExitCode.OK, sync("-manifest_file", manifestFile.getAbsolutePath(), "-no_remove"),
+            "unexpected exit code");
+        List<String> entries = getArchiveEntries();
+        assertTrue(entries.containsAll(Arrays.asList(APP_ENTRY, LIB_ENTRY, OTHER_LIB_ENTRY, "wlsdeploy/stores/fs2/")),
+            "unexpected archive entries: " + entries);
+    }
+
+    @Test
+    void testBothSources_Fails() {
+        int actual = sync("-source_dir", SOURCE_DIR.getAbsolutePath(), "-manifest_file", "missing.json");
+        assertEquals(ExitCode.USAGE_ERROR, actual, "expected command to exit with exit code " + ExitCode.USAGE_ERROR);
+    }
+
+    @Test
+    void testPathOutsideArchiveDirectories_Fails() throws Exception {
+        writeSourceFile("README.txt", "not an archive entry");
+
+        int actual = sync("-source_dir", SOURCE_DIR.getAbsolutePath());
+        assertEquals(ExitCode.ARG_VALIDATION_ERROR, actual,
+            "expected command to exit with exit code " + ExitCode.ARG_VALIDATION_ERROR);
+        assertFalse(ARCHIVE_FILE.exists(), "expected archive file to not be created");
+    }
+
+    private int sync(String... options) {
+        return sync(new StringWriter(), options);
+    }
+
+    private int sync(StringWriter outStringWriter, String... options) {
+        StringWriter errStringWriter = new StringWriter();
+        String[] args = new String[options.length + 3];
+        args[0] = "sync";
+        args[1] = "-archive_file";
+        args[2] = ARCHIVE_FILE.getAbsolutePath();
+        System.arraycopy(options, 0, args, 3, options.length);
+
+        int actual;
+        try (PrintWriter out = new PrintWriter(outStringWriter);
+             PrintWriter err = new PrintWriter(errStringWriter)) {
+            actual = ArchiveHelper.executeCommand(out, err, args);
+        }
+        return actual;
+    }
+
+    private List<String> getArchiveEntries() throws Exception {
+        WLSDeployArchive archive = new WLSDeployArchive(ARCHIVE_FILE.getAbsolutePath());
+        try {
+            return archive.getArchiveEntries();
+        } finally {
+            archive.close();
+        }
+    }
+
+    private static void writeSourceFile(String relativePath, String content) throws Exception {
+        writeFile(new File(SOURCE_DIR, relativePath), content);
+    }
+
+    private static void writeFile(File file, String content) throws Exception {
+        File parentDir = file.getParentFile();
+        if (!parentDir.exists() && !parentDir.mkdirs()) {
+            throw new Exception("Unable to create directory: " + parentDir);
+        }
+        try (FileOutputStream output = new FileOutputStream(file, false)) {
+            output.write(content.getBytes(StandardCharsets.UTF_8));
+        }
+    }
+}
@@ -1,5 +1,5 @@
 /*
- * Copyright (c) 2017, 2022, Oracle Corporation and/or its affiliates.  All rights reserved.
+ * Copyright (c) 2017, 2026, Oracle and/or its affiliates.
  * Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
  */
 package oracle.weblogic.deploy.util;
@@ -106,6 +106,74 @@ public class PyOrderedDictTest {
         assertEquals(myOrderedDict.keys(), anotherOrderedDict.keys());
     }
 
+    @Test
+    void testCopyIsIndependent() {
+        PyOrderedDict myOrderedDict = new PyOrderedDict();
+        myOrderedDict.__setitem__("one", new PyInteger(1));
+
+        PyOrderedDict copyOrderedDict = myOrderedDict.copy();
+        copyOrderedDict.__setitem__("two", new PyInteger(2));
+        myOrderedDict.__delitem__(new PyString("one"));
+
+        assertEquals(0, myOrderedDict.__len__(), "original has no entries");
+        assertEquals(2, copyOrderedDict.__len__(), "copy has two entries");
+        assertEquals(new PyString("one"), copyOrderedDict.keys().pyget(0), "copy keeps the first key");
+    }
+
+    @Test
+    void testCopiesChangedInThreads() throws Exception {
+        PyOrderedDict myOrderedDict = new PyOrderedDict();
+        for (int i = 0; i < 1000; i++) {
+            myOrderedDict.__setitem__("key" + i, new PyInteger(i));
+        }
+
+        // each copy shares the original store until it is changed in its own thread
+        final PyOrderedDict[] copies = new PyOrderedDict[8];
+        Thread[] threads = new Thread[copies.length];
+        for (int i = 0; i < copies.length; i++) {
+            copies[i] = myOrderedDict.copy();
+            final int index = i;
+            threads[i] = new Thread(new Runnable() {
+                @Override
+                public void run() {
+                    copies[index].__setitem__("thread" + index, new PyInteger(index));
+                    copies[index].__delitem__(new PyString("key0"));
+                }
+            });
+        }
+        for (Thread thread : threads) {
+            thread.start();
+        }
+        for (Thread thread : threads) {
+            thread.join();
+        }
+
+        assertEquals(1000, myOrderedDict.__len__(), "original has no new entries");
+        assertTrue(myOrderedDict.has_key(new PyString("key0")), "original keeps the first key");
+        for (int i = 0; i < copies.length; i++) {
+            assertEquals(1000, copies[i].__len__(), "copy has one new entry and one removed entry");
+            assertEquals(new PyInteger(i), copies[i].get(new PyString("thread" + i)), "copy has its own new entry");
+        }
+    }
+
+    @Test
+    void testDeepCopyIsIndependent() {
+        PyOrderedDict attributes = new PyOrderedDict();
+        attributes.__setitem__("ListenPort", new PyInteger(7001));
+        PyOrderedDict folder = new PyOrderedDict();
+        folder.__setitem__("Attributes", attributes);
+
+        PyOrderedDict folderCopy = folder.__deepcopy__(new PyDictionary());
+        PyOrderedDict attributesCopy = (PyOrderedDict) folderCopy.get(new PyString("Attributes"));
+
+        attributes.__setitem__("ListenPort", new PyInteger(7002));
+        attributesCopy.__setitem__("Enabled", new PyInteger(1));
+
+        assertEquals(new PyInteger(7001), attributesCopy.get(new PyString("ListenPort")), "copy keeps the old value");
+        assertEquals(1, attributes.__len__(), "original does not have the new key");
+        assertEquals(2, attributesCopy.__len__(), "copy has the new key");
+    }
+
     @Test
     void testUpdate() {
         PyOrderedDict myOrderedDict = new PyOrderedDict();
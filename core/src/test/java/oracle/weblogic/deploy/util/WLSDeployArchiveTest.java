@@ -5,6 +5,9 @@
 package oracle.weblogic.deploy.util;
 
 import java.io.File;
+import java.io.FileOutputStream;
+import java.io.InputStream;
+import java.util.ArrayList;
 import java.util.Arrays;
 import java.util.List;
 import java.util.logging.Level;
@@ -27,7 +30,9 @@ public class WLSDeployArchiveTest {
 
     private static final String APPS_ARCHIVE_FILE_NAME = "target/unit-tests/appsArchive.zip";
     private static final String EXTRACT_DIRECTORY_ARCHIVE_FILE_NAME = "target/unit-tests/extractDirectoryArchive.zip";
+    private static final String INCREMENTAL_EXTRACT_ARCHIVE_FILE_NAME = "target/unit-tests/incrementalExtractArchive.zip";
     private static final String FOREIGN_SERVER_ARCHIVE_FILE_NAME = "target/unit-tests/foreignServerArchive.zip";
+    private static final String TRANSFORM_ARCHIVE_FILE_NAME = "target/unit-tests/transformArchive.zip";
     private static final String APP1_TO_ADD = "src/test/resources/my-app.war";
     private static final String APP2_TO_ADD = "src/test/resources/my-other-app.war";
     private static final String APP1_ENTRY_NAME1 = "wlsdeploy/applications/my-app.war";
@@ -75,10 +80,18 @@ public class WLSDeployArchiveTest {
         if (extractDirectoryArchiveFile.exists()) {
             extractDirectoryArchiveFile.delete();
         }
+        File incrementalExtractArchiveFile = new File(INCREMENTAL_EXTRACT_ARCHIVE_FILE_NAME).getCanonicalFile();
+        if (incrementalExtractArchiveFile.exists()) {
+            incrementalExtractArchiveFile.delete();
+        }
         File foreignServerArchiveFile = new File(FOREIGN_SERVER_ARCHIVE_FILE_NAME).getCanonicalFile();
         if (foreignServerArchiveFile.exists()) {
             foreignServerArchiveFile.delete();
         }
+        File transformArchiveFile = new File(TRANSFORM_ARCHIVE_FILE_NAME).getCanonicalFile();
+        if (transformArchiveFile.exists()) {
+            transformArchiveFile.delete();
+        }
 
         PlatformLogger logger = WLSDeployLogFactory.getLogger("wlsdeploy.archive");
         logger.setLevel(Level.OFF);
@@ -113,6 +126,36 @@ public class WLSDeployArchiveTest {
         archive.close();
     }
 
+    @Test
+    void testAddItemWithTransformers() throws Exception {
+        final List<String> transformedNames = new ArrayList<>();
+        ArchiveEntryTransformer transformer = new ArchiveEntryTransformer() {
+            @Override
+            public InputStream transform(String entryName, InputStream content) {
+                transformedNames.add(entryName);
+                return entryName.equals("WEB-INF/weblogic.xml") ? null : content;
+            }
+        };
+        List<ArchiveEntryTransformer> transformers = Arrays.asList(transformer);
+
+        WLSDeployArchive archive = new WLSDeployArchive(TRANSFORM_ARCHIVE_FILE_NAME);
+        String appName = archive.addItem(WLSDeployArchive.ArchiveEntryType.APPLICATION, APP_DIR_TO_ADD, transformers);
+        assertEquals(APP_DIR_ENTRY_NAME, appName, "unexpected app name: " + appName);
+        assertTrue(transformedNames.contains("WEB-INF/web.xml"), "expected relative entry names");
+        assertTrue(archive.containsFile(APP_DIR_ENTRY_NAME + "WEB-INF/web.xml"), "expected web.xml in archive");
+        assertFalse(archive.containsFile(APP_DIR_ENTRY_NAME + "WEB-INF/weblogic.xml"),
+            "expected weblogic.xml to be excluded");
+
+        appName = archive.addItem(WLSDeployArchive.ArchiveEntryType.APPLICATION, APP1_TO_ADD, transformers);
+        assertEquals(APP1_ENTRY_NAME1, appName, "unexpected app name: " + appName);
+        assertTrue(transformedNames.contains("my-app.war"), "expected the file name for a single file");
+
+        appName = archive.addItem(WLSDeployArchive.ArchiveEntryType.APPLICATION, APP1_TO_ADD, transformers);
+        assertEquals(APP1_ENTRY_NAME2, appName, "unexpected app name: " + appName);
+        assertTrue(transformedNames.contains("my-app(1).war"), "expected the renamed file name for a single file");
+        archive.close();
+    }
+
     @Test
     void testExtractDirectoryToDifferentTargetPath() throws Exception {
         WLSDeployArchive archive = new WLSDeployArchive(EXTRACT_DIRECTORY_ARCHIVE_FILE_NAME);
@@ -133,6 +176,43 @@ public class WLSDeployArchiveTest {
         archive.close();
     }
 
+    @Test
+    void testExtractDirectorySkipsMatchingFiles() throws Exception {
+        WLSDeployArchive archive = new WLSDeployArchive(INCREMENTAL_EXTRACT_ARCHIVE_FILE_NAME);
+        archive.addApplication(APP_DIR_TO_ADD);
+        archive.setExtractionThreads(2);
+
+        File domainHome = new File("target/unit-tests/incremental-extract-target").getCanonicalFile();
+        FileUtils.deleteDirectory(domainHome);
+        if (!domainHome.mkdirs()) {
+            fail("Failed to create test domain home directory " + domainHome.getAbsolutePath());
+        }
+
+        ArchiveExtractor.Result result = archive.extractDirectoryFromZip(APP_DIR_ENTRY_NAME, domainHome);
+        assertEquals(5, result.getWrittenCount(), "unexpected written count on first extract");
+        assertEquals(0, result.getSkippedCount(), "unexpected skipped count on first extract");
+
+        result = archive.extractDirectoryFromZip(APP_DIR_ENTRY_NAME, domainHome);
+        assertEquals(0, result.getWrittenCount(), "unexpected written count on second extract");
+        assertEquals(5, result.getSkippedCount(), "unexpected skipped count on second extract");
+
+        // a changed file is written again, and a file where a directory is needed is removed
+        File appDir = new File(domainHome, APP_DIR_ENTRY_NAME);
+        try (FileOutputStream output = new FileOutputStream(new File(appDir, "WEB-INF/web.xml"))) {
+            output.write("changed".getBytes());
+        }
+        File metaInfDir = new File(appDir, "META-INF");
+        FileUtils.deleteDirectory(metaInfDir);
+        assertTrue(metaInfDir.createNewFile(), "expected to create a file in place of the directory");
+
+        result = archive.extractDirectoryFromZip(APP_DIR_ENTRY_NAME, domainHome);
+        assertEquals(2, result.getWrittenCount(), "unexpected written count on third extract");
+        assertEquals(3, result.getSkippedCount(), "unexpected skipped count on third extract");
+        assertEquals(1, result.getRemovedCount(), "unexpected removed count on third extract");
+        assertTrue(new File(metaInfDir, "MANIFEST.MF").isFile(), "expected the manifest to be extracted");
+        archive.close();
+    }
+
     @Test
     void testForeignServerBindingSupportsFileOrDirectory() throws Exception {
         WLSDeployArchive archive = new WLSDeployArchive(FOREIGN_SERVER_ARCHIVE_FILE_NAME);
@@ -1,5 +1,5 @@
 """
-Copyright (c) 2017, 2020, Oracle Corporation and/or its affiliates.  All rights reserved.
+Copyright (c) 2017, 2026, Oracle and/or its affiliates.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 import copy
@@ -151,6 +151,69 @@ class CollectionsTestCase(unittest.TestCase):
         new_list.extend([6, 7, 8, 9, 10])
         self.assertEqual(len(my_list), 5, 'expected deepcopy to make a copy of my_list but it did not')
 
+    def testDeepcopySharedEntries(self):
+        # the copy of a folder with only attribute values shares its entries until one of them is changed
+        attributes = OrderedDict()
+        attributes['ListenPort'] = 7001
+        attributes['Notes'] = 'original'
+        folder = OrderedDict()
+        folder['Attributes'] = attributes
+        folder['Targets'] = ['cluster1']
+
+        folder_copy = copy.deepcopy(folder)
+        attributes_copy = folder_copy['Attributes']
+        self.assertEqual(attributes, attributes_copy)
+
+        # a reference to the original that was held before the copy still changes only the original
+        attributes['ListenPort'] = 7002
+        del attributes['Notes']
+        self.assertEqual(7001, attributes_copy['ListenPort'])
+        self.assertEqual('original', attributes_copy['Notes'])
+
+        attributes_copy['Enabled'] = True
+        self.assertEqual(False, 'Enabled' in attributes)
+        self.assertEqual(['ListenPort', 'Notes', 'Enabled'], attributes_copy.keys())
+
+        folder['Targets'].append('cluster2')
+        self.assertEqual(['cluster1'], folder_copy['Targets'])
+
+    def testCopySharedEntries(self):
+        original = OrderedDict()
+        original['one'] = 1
+        original['two'] = [2]
+
+        for original_copy in [original.copy(), OrderedDict(original)]:
+            original_copy['three'] = 3
+            self.assertEqual(['one', 'two'], original.keys())
+            self.assertEqual(['one', 'two', 'three'], original_copy.keys())
+
+            # a shallow copy has the same values
+            self.assertEqual(True, original_copy['two'] is original['two'])
+
+        original.clear()
+        self.assertEqual(0, len(original))
+
+    def testDictOperations(self):
+        ordered = OrderedDict()
+        ordered['b'] = 2
+        ordered['a'] = 1
+
+        plain = dict(ordered)
+        self.assertEqual({'a': 1, 'b': 2}, plain)
+
+        self.assertEqual(3, ordered.setdefault('c', 3))
+        self.assertEqual(2, ordered.setdefault('b', 5))
+        self.assertEqual(['b', 'a', 'c'], ordered.keys())
+        self.assertEqual([('b', 2), ('a', 1), ('c', 3)], list(ordered.iteritems()))
+        self.assertEqual(1, ordered.pop('a'))
+        self.assertEqual(['b', 'c'], [key for key in ordered])
+
+        try:
+            ordered['a']
+            self.fail('expected KeyError for removed key')
+        except KeyError:
+            pass
+
     def testDictDictUpdate(self):
         dict1 = dict()
         dict1['entry1'] = 'you'
@@ -0,0 +1,85 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+import unittest
+
+from wlsdeploy.aliases.location_context import LocationContext
+
+
+class LocationContextTestCase(unittest.TestCase):
+
+    def testFolderPath(self):
+        location = LocationContext()
+        self.assertEqual('/', location.get_folder_path())
+        self.assertEqual(True, location.is_empty())
+        self.assertEqual('Domain', location.get_current_model_folder())
+        self.assertEqual(None, location.get_parent_folder_path())
+
+        location.append_location('Server', 'SSL')
+        self.assertEqual('/Server/SSL', location.get_folder_path())
+        self.assertEqual(['Server', 'SSL'], location.get_model_folders())
+        self.assertEqual('SSL', location.get_current_model_folder())
+        self.assertEqual('/Server', location.get_parent_folder_path())
+        self.assertEqual(2, len(location))
+
+        # locations with the same folders share the same path string
+        other = LocationContext().append_location('Server').append_location('SSL')
+        self.assertTrue(location.get_folder_path() is other.get_folder_path())
+
+        self.assertEqual('SSL', location.pop_location())
+        self.assertEqual('/Server', location.get_folder_path())
+        self.assertEqual('Server', location.pop_location())
+        self.assertEqual(True, location.is_empty())
+        self.assertRaises(IndexError, location.pop_location)
+
+    def testPopIndex(self):
+        location = LocationContext().append_location('JDBCSystemResource', 'JdbcResource', 'JDBCDriverParams')
+        self.assertEqual('JDBCSystemResource', location.pop_location(0))
+        self.assertEqual('/JdbcResource/JDBCDriverParams', location.get_folder_path())
+
+    def testCopy(self):
+        location = LocationContext().append_location('Server')
+        location.add_name_token('SERVER', 'm1')
+
+        copy = LocationContext(location)
+        copy.append_location('SSL')
+        copy.add_name_token('SERVER', 'm2')
+        self.assertEqual('/Server', location.get_folder_path())
+        self.assertEqual('m1', location.get_name_for_token('SERVER'))
+        self.assertEqual('/Server/SSL', copy.get_folder_path())
+        self.assertEqual('m2', copy.get_name_for_token('SERVER'))
+
+        # changes to the original are not seen by the copy
+        copy = LocationContext(location)
+        location.add_name_token('DOMAIN', 'base_domain')
+        location.remove_name_token('SERVER')
+        self.assertEqual(None, copy.get_name_for_token('DOMAIN'))
+        self.assertEqual('m1', copy.get_name_for_token('SERVER'))
+        self.assertEqual(False, location.has_name_token('SERVER'))
+
+        # the returned collections are copies
+        copy.get_model_folders().append('SSL')
+        copy.get_name_tokens()['SERVER'] = 'm3'
+        self.assertEqual('/Server', copy.get_folder_path())
+        self.assertEqual('m1', copy.get_name_for_token('SERVER'))
+
+    def testParentAndChild(self):
+        location = LocationContext().append_location('Server').add_name_token('SERVER', 'm1')
+
+        child = location.get_child_location('SSL')
+        self.assertEqual('/Server/SSL', child.get_folder_path())
+        self.assertEqual('m1', child.get_name_for_token('SERVER'))
+        self.assertEqual('/Server', location.get_folder_path())
+
+        parent = child.get_parent_location()
+        self.assertTrue(parent.get_folder_path() is location.get_folder_path())
+        self.assertEqual(None, LocationContext().get_parent_location())
+
+        child.add_name_token('SERVER', 'm2')
+        self.assertEqual('m1', parent.get_name_for_token('SERVER'))
+        self.assertEqual('m1', location.get_name_for_token('SERVER'))
+
+
+if __name__ == '__main__':
+    unittest.main()
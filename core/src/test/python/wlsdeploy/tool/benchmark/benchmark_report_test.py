@@ -0,0 +1,85 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+from oracle.weblogic.deploy.util import CLAException
+
+from base_test import BaseTestCase
+from wlsdeploy.tool.benchmark import benchmark_configuration
+from wlsdeploy.tool.benchmark import benchmark_report
+from wlsdeploy.tool.benchmark.benchmark_configuration import BenchmarkConfiguration
+from wlsdeploy.tool.benchmark.benchmark_runner import PhaseResult
+from wlsdeploy.util.cla_utils import CommandLineArgUtil
+from wlsdeploy.util.model_context import ModelContext
+
+
+class BenchmarkReportTest(BaseTestCase):
+
+    def setUp(self):
+        BaseTestCase.setUp(self)
+        self._model_context = ModelContext('benchmarkTools', {
+            CommandLineArgUtil.ORACLE_HOME_SWITCH: '/oracleHome',
+            CommandLineArgUtil.TARGET_VERSION_SWITCH: self.ALIAS_WLS_VERSION
+        })
+        self._configuration = BenchmarkConfiguration({
+            benchmark_configuration.PHASES: [
+                benchmark_configuration.LOAD_MODEL_PHASE,
+                benchmark_configuration.VALIDATE_MODEL_PHASE
+            ]
+        })
+
+    def test_configuration_defaults(self):
+        """
+        Verify that defaults are used for values not in the benchmark file.
+        """
+        self.assertEqual(2, self._configuration.get_cluster_count())
+        self.assertEqual(3, self._configuration.get_iterations())
+        self.assertEqual(2, len(self._configuration.get_phases()))
+
+    def test_configuration_errors(self):
+        """
+        Verify that unknown keys, invalid values, and unknown phases are rejected.
+        """
+        self.assertRaises(CLAException, BenchmarkConfiguration, {'no_such_key': 1})
+        self.assertRaises(CLAException, BenchmarkConfiguration, {benchmark_configuration.CLUSTER_COUNT: 'two'})
+        self.assertRaises(CLAException, BenchmarkConfiguration, {benchmark_configuration.PHASES: ['noSuchPhase']})
+
+    def test_find_regressions(self):
+        """
+        Verify that phases slower than the baseline by more than the threshold are reported.
+        """
+        baseline = self._create_report([100, 100, 100], [200, 200, 200])
+
+        # loadModel is 5% slower, validateModel is 25% slower
+        report = self._create_report([105, 105, 105], [250, 250, 250])
+        regressions = benchmark_report.find_regressions(report, baseline, 10)
+        self.assertEqual(1, len(regressions))
+        self.assertEqual(benchmark_configuration.VALIDATE_MODEL_PHASE, regressions[0].phase)
+        self.assertEqual(25.0, regressions[0].percent_change)
+
+        regressions = benchmark_report.find_regressions(report, baseline, 30)
+        self.assertEqual(0, len(regressions))
+
+    def test_summarize_phase(self):
+        """
+        Verify the summary values for each phase in the report.
+        """
+        report = self._create_report([10, 20, 30], [5, 5, 5])
+        summary = report[benchmark_report.PHASES][benchmark_configuration.LOAD_MODEL_PHASE]
+        self.assertEqual(10, summary[benchmark_report.MIN_MILLIS])
+        self.assertEqual(20.0, summary[benchmark_report.MEAN_MILLIS])
+        self.assertEqual(30, summary[benchmark_report.MAX_MILLIS])
+        self.assertEqual(3000, summary[benchmark_report.PEAK_HEAP_BYTES])
+
+    def _create_report(self, load_millis, validate_millis):
+        results = {
+            benchmark_configuration.LOAD_MODEL_PHASE: self._create_results(load_millis),
+            benchmark_configuration.VALIDATE_MODEL_PHASE: self._create_results(validate_millis)
+        }
+        return benchmark_report.create_report(self._model_context, self._configuration, results)
+
+    def _create_results(self, millis_list):
+        results = []
+        for index in range(len(millis_list)):
+            results.append(PhaseResult(millis_list[index], (index + 1) * 1000))
+        return results
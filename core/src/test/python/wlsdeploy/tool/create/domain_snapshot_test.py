@@ -0,0 +1,180 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+import os
+import shutil
+import zipfile
+
+from base_test import BaseTestCase
+from wlsdeploy.tool.create import domain_snapshot
+from wlsdeploy.tool.create.domain_snapshot import DomainSnapshotCache
+from wlsdeploy.util import hash_utils
+
+
+class DomainSnapshotTest(BaseTestCase):
+
+    def setUp(self):
+        BaseTestCase.setUp(self)
+        self._test_dir = os.path.join(self.TEST_OUTPUT_DIR, 'domain-snapshot')
+        if os.path.isdir(self._test_dir):
+            shutil.rmtree(self._test_dir)
+        self._cache_dir = os.path.join(self._test_dir, 'cache')
+        os.makedirs(self._cache_dir)
+
+        self._custom_template = os.path.join(self._test_dir, 'custom.jar')
+        _write_file(self._custom_template, 'custom template')
+
+        # the test directory is the Oracle Home, with a template catalog for the named templates
+        self._wls_template = _write_template(self._test_dir, 'wlserver', 'wls.jar', 'Basic WebLogic Server Domain')
+        self._jrf_template = _write_template(self._test_dir, 'oracle_common', 'oracle.jrf_template.jar', 'Oracle JRF')
+
+    def testKeyInputs(self):
+        inputs = self._get_inputs()
+        key = domain_snapshot.compute_key(inputs)
+        self.assertEqual(64, len(key))
+        self.assertEqual(key, domain_snapshot.compute_key(self._get_inputs()))
+
+        # named templates are resolved to the catalog files, all template files are hashed
+        templates = inputs[domain_snapshot.TEMPLATES]
+        self.assertEqual([self._wls_template], templates[0][domain_snapshot.FILES])
+        self.assertEqual(hash_utils.hash_file(self._wls_template), templates[0][domain_snapshot.SHA256])
+        self.assertEqual([self._jrf_template], templates[1][domain_snapshot.FILES])
+        self.assertEqual(hash_utils.hash_file(self._custom_template), templates[2][domain_snapshot.SHA256])
+        self.assertEqual([], domain_snapshot.get_unresolved_templates(inputs))
+
+        # each input changes the key
+        self.assertNotEqual(key, domain_snapshot.compute_key(self._get_inputs(wl_version='14.1.2.0.0')))
+        self.assertNotEqual(key, domain_snapshot.compute_key(self._get_inputs(topology_profile='Compact')))
+
+        reordered = self._get_inputs(templates=[
+            (domain_snapshot.BASE_TEMPLATE, 'Basic WebLogic Server Domain'),
+            (domain_snapshot.CUSTOM_TEMPLATE, self._custom_template),
+            (domain_snapshot.EXTENSION_TEMPLATE, 'Oracle JRF')
+        ])
+        self.assertNotEqual(key, domain_snapshot.compute_key(reordered))
+
+        _write_file(self._custom_template, 'changed custom template')
+        self.assertNotEqual(key, domain_snapshot.compute_key(self._get_inputs()))
+
+        # a patched named template jar changes the key
+        key = domain_snapshot.compute_key(self._get_inputs())
+        _write_template(self._test_dir, 'oracle_common', 'oracle.jrf_template.jar', 'Oracle JRF', 'patched')
+        self.assertNotEqual(key, domain_snapshot.compute_key(self._get_inputs()))
+
+    def testStoreAndLookup(self):
+        cache = DomainSnapshotCache(self._cache_dir, 'createDomain')
+        self.assertEqual(None, cache.lookup(self._get_inputs()))
+        self.assertEqual(domain_snapshot.MISS, cache.get_report()[domain_snapshot.STATUS])
+
+        cache.store(_write_snapshot)
+        self.assertEqual(domain_snapshot.STORED, cache.get_report()[domain_snapshot.STATUS])
+
+        cache = DomainSnapshotCache(self._cache_dir, 'createDomain')
+        snapshot_file = cache.lookup(self._get_inputs())
+        self.assertEqual(domain_snapshot.HIT, cache.get_report()[domain_snapshot.STATUS])
+        self.assertEqual(domain_snapshot.SNAPSHOT_FILE_NAME, os.path.basename(snapshot_file))
+
+        # a changed template is a different key
+        _write_file(self._custom_template, 'changed custom template')
+        cache = DomainSnapshotCache(self._cache_dir, 'createDomain')
+        self.assertEqual(None, cache.lookup(self._get_inputs()))
+
+    def testInvalidSnapshot(self):
+        cache = DomainSnapshotCache(self._cache_dir, 'createDomain')
+        cache.lookup(self._get_inputs())
+        cache.store(_write_snapshot)
+        snapshot_file = cache.get_report()[domain_snapshot.SNAPSHOT_FILE]
+
+        # a changed snapshot file does not match the manifest hash
+        _write_file(snapshot_file, 'changed snapshot')
+        cache = DomainSnapshotCache(self._cache_dir, 'createDomain')
+        self.assertEqual(None, cache.lookup(self._get_inputs()))
+        self.assertEqual(domain_snapshot.MISS, cache.get_report()[domain_snapshot.STATUS])
+        self.assertNotEqual(None, cache.get_report()[domain_snapshot.REASON])
+
+        # the invalid snapshot is replaced
+        cache.store(_write_snapshot)
+        cache = DomainSnapshotCache(self._cache_dir, 'createDomain')
+        self.assertEqual(snapshot_file, cache.lookup(self._get_inputs()))
+
+        # a manifest with different inputs is not used
+        snapshot_directory = os.path.dirname(snapshot_file)
+        key = os.path.basename(snapshot_directory)
+        reason = cache.verify(snapshot_directory, key, self._get_inputs(domain_type='WLS'))
+        self.assertNotEqual(None, reason)
+
+    def testStoreFailed(self):
+        cache = DomainSnapshotCache(self._cache_dir, 'createDomain')
+        cache.lookup(self._get_inputs())
+        cache.store(_fail_snapshot)
+        self.assertEqual(domain_snapshot.STORE_FAILED, cache.get_report()[domain_snapshot.STATUS])
+        self.assertEqual([], os.listdir(self._cache_dir))
+
+        # a snapshot file that cannot be hashed is a failure, not an error
+        cache = DomainSnapshotCache(self._cache_dir, 'createDomain')
+        cache.lookup(self._get_inputs())
+        cache.store(_skip_snapshot)
+        self.assertEqual(domain_snapshot.STORE_FAILED, cache.get_report()[domain_snapshot.STATUS])
+        self.assertEqual([], os.listdir(self._cache_dir))
+
+    def testUnresolvedTemplate(self):
+        inputs = self._get_inputs(templates=[
+            (domain_snapshot.BASE_TEMPLATE, 'Basic WebLogic Server Domain'),
+            (domain_snapshot.EXTENSION_TEMPLATE, 'Oracle Enterprise Manager')
+        ])
+        self.assertEqual(['Oracle Enterprise Manager'], domain_snapshot.get_unresolved_templates(inputs))
+
+        # the cache is not used, and no snapshot is stored
+        cache = DomainSnapshotCache(self._cache_dir, 'createDomain')
+        self.assertEqual(None, cache.lookup(inputs))
+        self.assertEqual(domain_snapshot.MISS, cache.get_report()[domain_snapshot.STATUS])
+        self.assertNotEqual(None, cache.get_report()[domain_snapshot.REASON])
+        cache.store(_write_snapshot)
+        self.assertEqual(domain_snapshot.MISS, cache.get_report()[domain_snapshot.STATUS])
+        self.assertEqual([], os.listdir(self._cache_dir))
+
+    def _get_inputs(self, wl_version='12.2.1.4.0', domain_type='JRF', topology_profile=None, templates=None):
+        if templates is None:
+            templates = [
+                (domain_snapshot.BASE_TEMPLATE, 'Basic WebLogic Server Domain'),
+                (domain_snapshot.EXTENSION_TEMPLATE, 'Oracle JRF'),
+                (domain_snapshot.CUSTOM_TEMPLATE, self._custom_template)
+            ]
+        return domain_snapshot.compute_inputs(wl_version, domain_type, topology_profile, self._test_dir, templates)
+
+
+def _write_file(file_path, content):
+    output = open(file_path, 'w')
+    try:
+        output.write(content)
+    finally:
+        output.close()
+
+
+def _write_template(oracle_home, component, file_name, template_name, content='template'):
+    catalog_dir = os.path.join(oracle_home, component, domain_snapshot.TEMPLATE_CATALOG_PATH)
+    if not os.path.isdir(catalog_dir):
+        os.makedirs(catalog_dir)
+    template_file = os.path.join(catalog_dir, file_name)
+    template_jar = zipfile.ZipFile(template_file, 'w')
+    try:
+        template_jar.writestr(domain_snapshot.TEMPLATE_INFO_ENTRY,
+                              '<template-info name="%s" version="12.2.1.4.0"/>' % template_name)
+        template_jar.writestr('content.txt', content)
+    finally:
+        template_jar.close()
+    return template_file
+
+
+def _write_snapshot(file_path):
+    _write_file(file_path, 'snapshot')
+
+
+def _fail_snapshot(file_path):
+    raise IOError('write failed')
+
+
+def _skip_snapshot(file_path):
+    # the snapshot file is not written
+    pass
@@ -0,0 +1,59 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+from base_test import BaseTestCase
+from wlsdeploy.tool.create import rcu_schema_state
+from wlsdeploy.tool.create.rcu_schema_state import RcuSchemaState
+
+RCU_SCHEMAS = ['STB', 'WLS', 'MDS', 'IAU', 'OPSS']
+
+
+class RcuSchemaStateTest(BaseTestCase):
+
+    def testAllPresent(self):
+        # schemas from the same release can have different patch versions
+        rows = [
+            ('STB', 'DEV_STB', '12.2.1.3.0', 'VALID'),
+            ('WLS', 'DEV_WLS', '12.2.1.0.0', 'VALID'),
+            ('MDS', 'DEV_MDS', '12.2.1.4.0', 'VALID'),
+            ('IAU', 'DEV_IAU', '12.2.1.2.0', 'VALID'),
+            ('OPSS', 'DEV_OPSS', '12.2.1.0.0', 'VALID'),
+            ('SOAINFRA', 'DEV_SOAINFRA', '12.2.1.4.0', 'VALID')
+        ]
+        state = RcuSchemaState('DEV', RCU_SCHEMAS, '12.2.1.4.0', rows)
+        self.assertEqual(True, state.is_complete())
+        self.assertEqual([], state.get_missing_schemas())
+        self.assertEqual(False, state.has_stale_schemas())
+        self.assertEqual(RCU_SCHEMAS, state.get_schema_names())
+        self.assertEqual('12.2.1.3.0', state.get_version('STB'))
+
+    def testMissingSchemas(self):
+        rows = [
+            ('STB', 'DEV_STB', '14.1.2.0.0', 'VALID'),
+            ('OPSS', 'DEV_OPSS', '14.1.2.0.0', 'VALID')
+        ]
+        state = RcuSchemaState('DEV', RCU_SCHEMAS, '14.1.2.0.0', rows)
+        self.assertEqual(False, state.is_complete())
+        self.assertEqual(['WLS', 'MDS', 'IAU'], state.get_missing_schemas())
+        self.assertEqual(False, state.has_stale_schemas())
+        self.assertEqual(None, state.get_version('WLS'))
+
+        state = RcuSchemaState('DEV', RCU_SCHEMAS, '14.1.2.0.0', [])
+        self.assertEqual(RCU_SCHEMAS, state.get_missing_schemas())
+
+    def testStaleSchemas(self):
+        rows = [
+            ('STB', 'DEV_STB', '12.2.1.3.0', 'VALID'),
+            ('WLS', 'DEV_WLS', '14.1.2.0.0', 'VALID'),
+            ('MDS', 'DEV_MDS', '14.1.2.0.0', 'INVALID')
+        ]
+        state = RcuSchemaState('DEV', RCU_SCHEMAS, '14.1.2.0.0', rows)
+        self.assertEqual(True, state.has_stale_schemas())
+        self.assertEqual(['STB', 'MDS'], state.get_schemas(rcu_schema_state.STALE))
+        self.assertEqual(['WLS'], state.get_schemas(rcu_schema_state.PRESENT))
+
+    def testGetRelease(self):
+        self.assertEqual('12.2.1', rcu_schema_state.get_release('12.2.1.4.0'))
+        self.assertEqual('14.1.2', rcu_schema_state.get_release('14.1.2'))
+        self.assertEqual(None, rcu_schema_state.get_release(None))
@@ -0,0 +1,299 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+import os
+
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+
+from base_test import BaseTestCase
+from wlsdeploy.aliases.location_context import LocationContext
+from wlsdeploy.exception import exception_helper
+from wlsdeploy.json.json_translator import JsonToPython
+from wlsdeploy.tool.deploy import online_change_plan
+from wlsdeploy.tool.deploy.online_change_plan import OnlineChangePlan
+from wlsdeploy.tool.deploy.online_change_plan import OnlineChangePlanner
+from wlsdeploy.util.cla_utils import CommandLineArgUtil
+from wlsdeploy.util.model import Model
+from wlsdeploy.util.model_context import ModelContext
+
+
+class OnlineChangePlanTest(BaseTestCase):
+
+    def setUp(self):
+        BaseTestCase.setUp(self)
+        self._output_dir = os.path.join(self.TEST_OUTPUT_DIR, 'online-change-plan')
+        if not os.path.isdir(self._output_dir):
+            os.makedirs(self._output_dir)
+
+    def testPlanChanges(self):
+        plan = _create_plan()
+        self.assertEqual(5, len(plan.changes))
+        self.assertEqual(1, plan.get_change_count(online_change_plan.CREATE))
+        self.assertEqual(2, plan.get_change_count(online_change_plan.SET))
+        self.assertEqual(1, plan.get_change_count(online_change_plan.DELETE))
+        self.assertEqual(1, plan.get_change_count(online_change_plan.TARGET_CHANGE))
+
+        non_dynamic_changes = plan.get_non_dynamic_changes()
+        self.assertEqual(1, len(non_dynamic_changes))
+        self.assertEqual('ListenPort', non_dynamic_changes[0]['attribute'])
+
+    def testWritePlan(self):
+        model_context = ModelContext('updateDomain', {CommandLineArgUtil.OUTPUT_DIR_SWITCH: self._output_dir})
+        plan = _create_plan()
+        plan.planning_millis = 25
+        online_change_plan.record_execution_time(plan, model_context, 40)
+
+        plan_file = os.path.join(self._output_dir, online_change_plan.PLAN_FILE_NAME)
+        plan_dict = JsonToPython(plan_file).parse()
+        self.assertEqual(25, plan_dict['timing']['planningMillis'])
+        self.assertEqual(40, plan_dict['timing']['executionMillis'])
+        self.assertEqual(1, plan_dict['nonDynamicChangeCount'])
+        self.assertEqual('create', plan_dict['changes'][0]['action'])
+        self.assertEqual('9001', plan_dict['changes'][2]['currentValue'])
+
+    def testPlanFolder(self):
+        servers = OrderedDict()
+        servers['m1'] = OrderedDict()
+        servers['m1']['ListenAddress'] = 'host1'
+        servers['m1']['ListenPort'] = 9002
+        servers['m1']['Notes'] = 'first server'
+        servers['m1']['Log'] = {'FileName': 'm1.log'}
+        servers['m2'] = {'ListenPort': 9003}
+        servers['!m3'] = {}
+
+        plan = OnlineChangePlan()
+        _create_planner(servers)._plan_folder(plan, LocationContext(), 'Server', servers, True)
+
+        # ListenAddress matches the live value, and the Log folder cannot be resolved by the aliases
+        actions = [(change['action'], change['path'], change.get('attribute')) for change in plan.changes]
+        self.assertEqual([(online_change_plan.SET, 'topology:/Server/m1', 'ListenPort'),
+                          (online_change_plan.SET, 'topology:/Server/m1', 'Notes'),
+                          (online_change_plan.CREATE, 'topology:/Server/m2', None),
+                          (online_change_plan.SET, 'topology:/Server/m2', 'ListenPort'),
+                          (online_change_plan.DELETE, 'topology:/Server/m3', None)], actions)
+
+        self.assertEqual(9001, plan.changes[0]['currentValue'])
+        self.assertTrue(plan.changes[0]['nonDynamic'])
+        # the alias lookup for Notes failed, so the current value is unknown
+        self.assertEqual(None, plan.changes[1]['currentValue'])
+        self.assertFalse(plan.changes[1]['nonDynamic'])
+        # changes to new MBeans do not require a restart
+        self.assertFalse(plan.changes[3]['nonDynamic'])
+
+    def testPlanAttributes(self):
+        location = LocationContext().append_location('Server')
+        location.add_name_token('SERVER', 'm1')
+        model_nodes = OrderedDict()
+        model_nodes['ListenAddress'] = 'host2'
+        model_nodes['ListenPort'] = '9001'
+        model_nodes['PasswordEncrypted'] = 'welcome1'
+        model_nodes['Unknown'] = 'value'
+
+        plan = OnlineChangePlan()
+        _create_planner({})._plan_attributes(plan, location, model_nodes, True)
+
+        self.assertEqual(2, len(plan.changes))
+        self.assertEqual('ListenAddress', plan.changes[0]['attribute'])
+        self.assertEqual('host1', plan.changes[0]['currentValue'])
+        self.assertEqual('PasswordEncrypted', plan.changes[1]['attribute'])
+        self.assertEqual('********', plan.changes[1]['value'])
+        self.assertEqual(None, plan.changes[1]['currentValue'])
+
+    def testSkipUnchanged(self):
+        servers = OrderedDict()
+        servers['m1'] = {'ListenAddress': 'host1', 'ListenPort': 9002}
+        servers['m2'] = {'ListenPort': 9003}
+        servers['m3'] = {'ListenAddress': 'host3', 'ListenPort': 7001}
+
+        plan = OnlineChangePlan()
+        _create_planner(servers)._plan_folder(plan, LocationContext(), 'Server', servers, True)
+
+        self.assertFalse(plan.is_unchanged_folder('topology:/Server/m1'))
+        self.assertTrue(plan.is_unchanged_attribute('topology:/Server/m1', 'ListenAddress'))
+        self.assertFalse(plan.is_unchanged_attribute('topology:/Server/m1', 'ListenPort'))
+        # new folders are always processed
+        self.assertFalse(plan.is_unchanged_folder('topology:/Server/m2'))
+        self.assertFalse(plan.is_unchanged_attribute('topology:/Server/m2', 'ListenPort'))
+        self.assertTrue(plan.is_unchanged_folder('topology:/Server/m3'))
+
+    def testDeleteAndAddAgain(self):
+        servers = OrderedDict()
+        servers['!m3'] = {}
+        servers['m3'] = {'ListenAddress': 'host3'}
+
+        plan = OnlineChangePlan()
+        _create_planner(servers)._plan_folder(plan, LocationContext(), 'Server', servers, True)
+
+        actions = [(change['action'], change['path']) for change in plan.changes]
+        self.assertEqual([(online_change_plan.DELETE, 'topology:/Server/m3'),
+                          (online_change_plan.CREATE, 'topology:/Server/m3')], actions[:2])
+        self.assertFalse(plan.is_unchanged_folder('topology:/Server/m3'))
+
+    def testPathTokenAttributes(self):
+        servers = {'m3': {'ListenAddress': 'host3'}}
+
+        plan = OnlineChangePlan()
+        planner = _create_planner(servers)
+        planner._aliases = StubAliases(['ListenAddress'])
+        planner._plan_folder(plan, LocationContext(), 'Server', servers, True)
+
+        # the attribute matches, but archive files may need to be extracted
+        self.assertEqual(0, len(plan.changes))
+        self.assertFalse(plan.is_unchanged_folder('topology:/Server/m3'))
+        self.assertFalse(plan.is_unchanged_attribute('topology:/Server/m3', 'ListenAddress'))
+
+    def testChangedPaths(self):
+        plan = OnlineChangePlan()
+        for path in ['topology:/', 'topology:/Server/m1', 'topology:/Server/m1/SSL', 'topology:/Server/m2',
+                     'resources:/JDBCSystemResource/ds1', 'resources:/JDBCSystemResource/ds1/JdbcResource']:
+            plan.add_compared_path(path)
+
+        plan.add_change(online_change_plan.DELETE, 'topology:/Server/m1/NetworkAccessPoint/nap1')
+        self.assertFalse(plan.is_unchanged_folder('topology:/'))
+        self.assertFalse(plan.is_unchanged_folder('topology:/Server/m1'))
+        self.assertTrue(plan.is_unchanged_folder('topology:/Server/m1/SSL'))
+        self.assertTrue(plan.is_unchanged_folder('topology:/Server/m2'))
+        self.assertTrue(plan.is_unchanged_attribute('topology:/', 'AdminServerName'))
+        self.assertFalse(plan.is_unchanged_attribute('topology:/Server/m3', 'ListenPort'))
+
+        plan.require_update('topology:/Server/m2', 'SourcePath')
+        self.assertFalse(plan.is_unchanged_folder('topology:/Server/m2'))
+        self.assertFalse(plan.is_unchanged_attribute('topology:/Server/m2', 'SourcePath'))
+        self.assertTrue(plan.is_unchanged_attribute('topology:/Server/m2', 'ListenPort'))
+
+        plan.require_update('resources:/JDBCSystemResource/ds1')
+        self.assertFalse(plan.is_unchanged_folder('resources:/JDBCSystemResource/ds1'))
+        self.assertFalse(plan.is_unchanged_folder('resources:/JDBCSystemResource/ds1/JdbcResource'))
+        self.assertFalse(plan.is_unchanged_attribute('resources:/JDBCSystemResource/ds1/JdbcResource', 'Name'))
+        self.assertTrue(plan.is_unchanged_folder('topology:/Server/m1/SSL'))
+
+    def testActivationMarker(self):
+        wlst_helper = StubWlstHelper()
+        self.assertEqual('2:300', online_change_plan._get_activation_marker(wlst_helper))
+
+        wlst_helper.active_tasks.append(_ActivationTask(400))
+        self.assertEqual(None, online_change_plan._get_activation_marker(wlst_helper))
+
+    def testCompareValues(self):
+        self.assertTrue(online_change_plan._is_same_value('a, b', ['a', 'b']))
+        self.assertTrue(online_change_plan._is_same_value(True, 'true'))
+        self.assertTrue(online_change_plan._is_same_value(7001, '7001'))
+        self.assertFalse(online_change_plan._is_same_value('b,a', 'a,b'))
+        self.assertFalse(online_change_plan._is_same_value('7001', None))
+
+
+def _create_planner(servers):
+    model = Model({'topology': {'Server': servers}})
+    planner = OnlineChangePlanner(model, StubAliases(), ['topology'])
+    planner._wlst_helper = StubWlstHelper()
+    return planner
+
+
+def _create_plan():
+    plan = OnlineChangePlan()
+    plan.add_change(online_change_plan.CREATE, 'topology:/Server/m2')
+    plan.add_change(online_change_plan.SET, 'topology:/Server/m2', 'ListenPort', 9002)
+    plan.add_change(online_change_plan.SET, 'topology:/Server/m1', 'ListenPort', 9002, '9001', True)
+    plan.add_change(online_change_plan.DELETE, 'topology:/Server/m3')
+    plan.add_change(online_change_plan.TARGET_CHANGE, 'resources:/JDBCSystemResource/ds1', 'Target',
+                    'cluster1,m2', 'cluster1')
+    return plan
+
+
+class StubAliases(object):
+    """
+    Aliases for the Server folder, with a Log subfolder and a Notes attribute that cannot be resolved.
+    """
+    def __init__(self, path_token_attribute_names=None):
+        self._path_token_attribute_names = path_token_attribute_names or []
+
+    def is_model_location_valid(self, location):
+        if location.get_current_model_folder() == 'Log':
+            raise exception_helper.create_alias_exception('Log folder is not available')
+        return True
+
+    def get_wlst_flattened_folder_info(self, location):
+        return None
+
+    def supports_multiple_mbean_instances(self, location):
+        return True
+
+    def get_name_token(self, location):
+        return 'SERVER'
+
+    def get_model_subfolder_names(self, location):
+        return ['Log']
+
+    def get_model_attribute_names(self, location):
+        return ['ListenAddress', 'ListenPort', 'Notes', 'PasswordEncrypted']
+
+    def get_model_restart_required_attribute_names(self, location):
+        return ['ListenAddress', 'ListenPort']
+
+    def get_model_uses_path_tokens_attribute_names(self, location):
+        return self._path_token_attribute_names
+
+    def get_wlst_attributes_path(self, location):
+        return '/Servers/' + location.get_name_for_token('SERVER')
+
+    def is_model_password_attribute(self, location, model_attribute_name):
+        return model_attribute_name == 'PasswordEncrypted'
+
+    def get_wlst_attribute_name(self, location, model_attribute_name):
+        if model_attribute_name == 'Notes':
+            raise exception_helper.create_alias_exception('Notes attribute is not available')
+        return model_attribute_name
+
+    def get_model_attribute_name_and_value(self, location, wlst_attribute_name, wlst_attribute_value,
+                                           ignore_default_match=False):
+        return wlst_attribute_name, wlst_attribute_value
+
+    def get_wlst_list_path(self, location):
+        return '/Servers'
+
+    def get_model_folder_path(self, location):
+        path = 'topology:/Server'
+        name = location.get_name_for_token('SERVER')
+        if name is not None:
+            path += '/' + name
+        return path
+
+
+class StubWlstHelper(object):
+    """
+    A live configuration with servers m1 and m3, and two completed activations.
+    """
+    def __init__(self):
+        self._path = None
+        self._attributes = {
+            '/Servers/m1': {'ListenAddress': 'host1', 'ListenPort': 9001, 'Notes': None},
+            '/Servers/m3': {'ListenAddress': 'host3', 'ListenPort': 7001, 'Notes': None}
+        }
+        self.active_tasks = []
+
+    def cd(self, path):
+        self._path = path
+
+    def get(self, attribute_name):
+        return self._attributes[self._path][attribute_name]
+
+    def get_existing_object_list(self, path):
+        return ['m1', 'm3']
+
+    def get_config_manager(self):
+        return self
+
+    def get_active_activation_tasks(self, config_manager):
+        return self.active_tasks
+
+    def getCompletedActivationTasks(self):
+        return [_ActivationTask(300), _ActivationTask(200)]
+
+
+class _ActivationTask(object):
+    def __init__(self, start_time):
+        self._start_time = start_time
+
+    def getStartTime(self):
+        return self._start_time
@@ -0,0 +1,82 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+import unittest
+
+from wlsdeploy.tool.deploy import restart_inventory
+
+LOG_BEAN = 'com.bea:Name=AdminServer,Type=Log,Server=AdminServer'
+MAIL_BEAN = 'com.bea:Name=MailSession-0,Type=MailSession'
+
+
+class RestartInventoryTest(unittest.TestCase):
+
+    def testNonDynamicChanges(self):
+        changes = [
+            _Change(LOG_BEAN, 'RedirectStderrToServerLogEnabled', True),
+            _Change(MAIL_BEAN, 'Properties', False),
+            _Change(MAIL_BEAN, 'SessionPasswordEncrypted', True),
+            _Change(LOG_BEAN, 'RedirectStdoutToServerLogEnabled', True)
+        ]
+        self.assertTrue(restart_inventory.is_restart_required(changes))
+
+        non_dynamic_changes = restart_inventory.get_non_dynamic_changes(changes)
+        self.assertEqual([LOG_BEAN, MAIL_BEAN], non_dynamic_changes.keys())
+        self.assertEqual(['RedirectStderrToServerLogEnabled', 'RedirectStdoutToServerLogEnabled'],
+                         non_dynamic_changes[LOG_BEAN])
+        self.assertEqual(['SessionPasswordEncrypted'], non_dynamic_changes[MAIL_BEAN])
+
+        lines = restart_inventory.get_non_dynamic_changes_text(non_dynamic_changes).splitlines()
+        self.assertEqual('Server re-start is REQUIRED for the set of changes in progress.', lines[1])
+        self.assertTrue('MBean Changed : ' + LOG_BEAN in lines)
+        self.assertTrue('Attributes changed : RedirectStderrToServerLogEnabled, RedirectStdoutToServerLogEnabled'
+                        in lines)
+
+    def testAffectedBeanChanges(self):
+        changes = [
+            _Change(LOG_BEAN, 'RedirectStderrToServerLogEnabled', True),
+            _Change(MAIL_BEAN, 'SessionPasswordEncrypted', True, affected_bean=LOG_BEAN)
+        ]
+
+        # derived changes to an affected bean are left out for 12.2.1 and later
+        non_dynamic_changes = restart_inventory.get_non_dynamic_changes(changes, True)
+        self.assertEqual([LOG_BEAN], non_dynamic_changes.keys())
+        lines = restart_inventory.get_non_dynamic_changes_text(non_dynamic_changes).splitlines()
+        self.assertFalse('MBean Changed : ' + MAIL_BEAN in lines)
+
+        non_dynamic_changes = restart_inventory.get_non_dynamic_changes(changes)
+        self.assertEqual([LOG_BEAN, MAIL_BEAN], non_dynamic_changes.keys())
+
+    def testDynamicChanges(self):
+        changes = [_Change(MAIL_BEAN, 'Properties', False)]
+        self.assertFalse(restart_inventory.is_restart_required(changes))
+        non_dynamic_changes = restart_inventory.get_non_dynamic_changes(changes)
+        self.assertEqual('', restart_inventory.get_non_dynamic_changes_text(non_dynamic_changes))
+
+
+class _Change(object):
+    """
+    An unactivated change, as returned by the configuration manager.
+    """
+    def __init__(self, bean, attribute_name, restart_required, affected_bean=None):
+        self._bean = bean
+        self._attribute_name = attribute_name
+        self._restart_required = restart_required
+        self._affected_bean = affected_bean
+
+    def getBean(self):
+        return self._bean
+
+    def getAttributeName(self):
+        return self._attribute_name
+
+    def isRestartRequired(self):
+        return self._restart_required
+
+    def getAffectedBean(self):
+        return self._affected_bean
+
+
+if __name__ == '__main__':
+    unittest.main()
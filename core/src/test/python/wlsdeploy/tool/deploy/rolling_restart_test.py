@@ -0,0 +1,82 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+import unittest
+
+from wlsdeploy.tool.deploy import rolling_restart
+from wlsdeploy.tool.deploy.rolling_restart import RollingRestart
+from wlsdeploy.tool.util import results_file
+
+
+class RollingRestartTest(unittest.TestCase):
+
+    def testRestartClusterMembers(self):
+        domain_runtime = _DomainRuntime(['m1', 'm2', 'm3'])
+        group = rolling_restart._RestartGroup('cluster1', ['m1', 'm2', 'm3'])
+        group.server_names.extend(['m1', 'm2'])
+
+        report = RollingRestart(1, 1000, 4)._restart_group(domain_runtime, group)
+        self.assertEqual(2, len(report))
+        self.assertEqual('m1', report[0][results_file.SERVER_KEY])
+        self.assertEqual('cluster1', report[0][results_file.CLUSTER_KEY])
+        self.assertEqual(rolling_restart.RESTARTED, report[0][results_file.STATUS_KEY])
+        self.assertEqual(rolling_restart.RESTARTED, report[1][results_file.STATUS_KEY])
+
+        # members are restarted one at a time
+        self.assertEqual(['m1:shutdown', 'm1:start', 'm2:shutdown', 'm2:start'], domain_runtime.operations)
+
+    def testMinimumRunningMembers(self):
+        domain_runtime = _DomainRuntime(['m1', 'm2'])
+        domain_runtime.lifecycles['m2'].state = rolling_restart.SHUTDOWN_STATE
+        group = rolling_restart._RestartGroup('cluster1', ['m1', 'm2'])
+        group.server_names.append('m1')
+
+        report = RollingRestart(1, 1000, 4)._restart_group(domain_runtime, group)
+        self.assertEqual(rolling_restart.SKIPPED, report[0][results_file.STATUS_KEY])
+        self.assertEqual([], domain_runtime.operations)
+
+    def testStandaloneServer(self):
+        domain_runtime = _DomainRuntime(['s1'])
+        group = rolling_restart._RestartGroup(None, [])
+        group.server_names.append('s1')
+
+        report = RollingRestart(1, 1000, 4)._restart_group(domain_runtime, group)
+        self.assertEqual(rolling_restart.RESTARTED, report[0][results_file.STATUS_KEY])
+        self.assertFalse(results_file.CLUSTER_KEY in report[0])
+
+
+class _DomainRuntime(object):
+    """
+    A domain runtime with server life cycles that change state immediately.
+    """
+    def __init__(self, server_names):
+        self.operations = []
+        self.lifecycles = {}
+        for server_name in server_names:
+            self.lifecycles[server_name] = _ServerLifeCycle(server_name, self.operations)
+
+    def lookupServerLifeCycleRuntime(self, server_name):
+        return self.lifecycles.get(server_name)
+
+
+class _ServerLifeCycle(object):
+    def __init__(self, name, operations):
+        self.name = name
+        self.state = rolling_restart.RUNNING_STATE
+        self._operations = operations
+
+    def getState(self):
+        return self.state
+
+    def shutdown(self, timeout, ignore_sessions):
+        self._operations.append(self.name + ':shutdown')
+        self.state = rolling_restart.SHUTDOWN_STATE
+
+    def start(self):
+        self._operations.append(self.name + ':start')
+        self.state = rolling_restart.RUNNING_STATE
+
+
+if __name__ == '__main__':
+    unittest.main()
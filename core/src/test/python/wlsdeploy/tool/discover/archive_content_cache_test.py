@@ -0,0 +1,76 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+import os
+import shutil
+
+from base_test import BaseTestCase
+from wlsdeploy.tool.discover import archive_content_cache
+from wlsdeploy.tool.discover.archive_content_cache import ArchiveContentCache
+from wlsdeploy.util.model_context import ModelContext
+
+
+class ArchiveContentCacheTest(BaseTestCase):
+
+    def setUp(self):
+        BaseTestCase.setUp(self)
+        self._source_dir = os.path.join(self.TEST_OUTPUT_DIR, 'archive-content')
+        if os.path.isdir(self._source_dir):
+            shutil.rmtree(self._source_dir)
+        os.makedirs(self._source_dir)
+        self._added_paths = []
+
+    def testSharedContent(self):
+        app_1 = self._write_file('dir1/app.war', 'web application')
+        app_2 = self._write_file('dir2/app.war', 'web application')
+        app_3 = self._write_file('dir3/app.war', 'other web application')
+        app_4 = self._write_file('dir4/app.ear', 'web application')
+
+        cache = ArchiveContentCache(ModelContext('discoverDomain', {}))
+        self.assertEqual('wlsdeploy/applications/app.war', self._add(cache, 'APPLICATION', app_1))
+        self.assertEqual('wlsdeploy/applications/app.war', self._add(cache, 'APPLICATION', app_2))
+        self.assertEqual('wlsdeploy/applications/app.war', self._add(cache, 'APPLICATION', app_1))
+        self.assertEqual(1, len(self._added_paths))
+        self.assertEqual(2, cache.get_reused_count())
+        self.assertEqual(2 * len('web application'), cache.get_reused_bytes())
+
+        # different content, extension, or entry type is added separately
+        self._add(cache, 'APPLICATION', app_3)
+        self._add(cache, 'APPLICATION', app_4)
+        self._add(cache, 'SHARED_LIBRARY', app_2)
+        self.assertEqual(4, len(self._added_paths))
+
+    def testDirectoryHash(self):
+        self._write_file('wallet1/cwallet.sso', 'wallet')
+        self._write_file('wallet1/tnsnames.ora', 'names')
+        self._write_file('wallet2/tnsnames.ora', 'names')
+        self._write_file('wallet2/cwallet.sso', 'wallet')
+        self._write_file('wallet3/cwallet.sso', 'wallet')
+        self._write_file('wallet3/sub/tnsnames.ora', 'names')
+
+        hash_1, size_1 = archive_content_cache.hash_content(os.path.join(self._source_dir, 'wallet1'))
+        hash_2, size_2 = archive_content_cache.hash_content(os.path.join(self._source_dir, 'wallet2'))
+        hash_3, size_3 = archive_content_cache.hash_content(os.path.join(self._source_dir, 'wallet3'))
+        self.assertEqual(hash_1, hash_2)
+        self.assertNotEqual(hash_1, hash_3)
+        self.assertEqual(len('wallet') + len('names'), size_1)
+        self.assertEqual(size_1, size_3)
+
+    def _add(self, cache, entry_type_name, source_path):
+        def _add_to_archive():
+            self._added_paths.append(source_path)
+            return 'wlsdeploy/applications/' + os.path.basename(source_path)
+
+        return cache.find_or_add(entry_type_name, source_path, _add_to_archive)
+
+    def _write_file(self, relative_path, content):
+        file_path = os.path.join(self._source_dir, relative_path)
+        if not os.path.isdir(os.path.dirname(file_path)):
+            os.makedirs(os.path.dirname(file_path))
+        output = open(file_path, 'w')
+        try:
+            output.write(content)
+        finally:
+            output.close()
+        return file_path
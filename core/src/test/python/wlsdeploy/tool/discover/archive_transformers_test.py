@@ -0,0 +1,121 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+import os
+import shutil
+import unittest
+
+from java.io import BufferedReader
+from java.io import ByteArrayInputStream
+from java.io import InputStreamReader
+from java.lang import String
+
+from oracle.weblogic.deploy.util import WLSDeployArchive
+
+from base_test import BaseTestCase
+from wlsdeploy.tool.discover.archive_transformers import JdbcCredentialTransformer
+
+JDBC_MODULE = """<?xml version="1.0" encoding="UTF-8"?>
+<jdbc-data-source xmlns="http://xmlns.oracle.com/weblogic/jdbc-data-source">
+  <name>app-ds</name>
+  <jdbc-driver-params>
+    <url>jdbc:oracle:thin:@db:1521/pdb</url>
+    <driver-name>oracle.jdbc.OracleDriver</driver-name>
+    <properties>
+      <property>
+        <name>user</name>
+        <value>scott</value>
+      </property>
+    </properties>
+    <password-encrypted>{AES256}abc=</password-encrypted>
+  </jdbc-driver-params>
+</jdbc-data-source>
+"""
+
+
+class ArchiveTransformersTest(BaseTestCase):
+
+    def setUp(self):
+        BaseTestCase.setUp(self)
+        self._replacements = []
+        self._tokens = []
+
+    def testJdbcCredentials(self):
+        transformer = JdbcCredentialTransformer(self._get_replacement)
+        result = _read(transformer.transform('app-ds-jdbc.xml', _stream(JDBC_MODULE)))
+
+        self.assertTrue('<url>@@app-ds-jdbc-url@@</url>' in result)
+        self.assertTrue('<value>@@app-ds-jdbc-user:username=scott@@</value>' in result)
+        self.assertTrue('<password-encrypted>@@app-ds-jdbc-user:password@@</password-encrypted>' in result)
+        self.assertFalse('scott</value>' in result)
+        self.assertTrue('<driver-name>oracle.jdbc.OracleDriver</driver-name>' in result)
+        self.assertEqual(('-url', 'jdbc:oracle:thin:@db:1521/pdb'), self._replacements[2])
+
+    def testOtherFile(self):
+        transformer = JdbcCredentialTransformer(self._get_replacement)
+        content = _stream('$1 not xml')
+        self.assertTrue(transformer.transform('readme.txt', content) is content)
+        self.assertEqual(0, len(self._replacements))
+
+    def testSameNamedModules(self):
+        modules_dir = os.path.join(self.TEST_OUTPUT_DIR, 'jdbc-modules')
+        if os.path.isdir(modules_dir):
+            shutil.rmtree(modules_dir)
+        archive_file_name = os.path.join(modules_dir, 'jdbc-modules.zip')
+
+        archive = WLSDeployArchive(archive_file_name)
+        try:
+            transformers = [JdbcCredentialTransformer(self._get_replacement)]
+            entry_names = []
+            for module_dir_name in ['one', 'two']:
+                module_file = _write_file(os.path.join(modules_dir, module_dir_name, 'app-ds-jdbc.xml'), JDBC_MODULE)
+                entry_names.append(archive.addItem(WLSDeployArchive.ArchiveEntryType.APPLICATION, module_file,
+                                                   transformers))
+        finally:
+            archive.close()
+
+        self.assertEqual(['wlsdeploy/applications/app-ds-jdbc.xml', 'wlsdeploy/applications/app-ds-jdbc(1).xml'],
+                         entry_names)
+        self.assertTrue('app-ds-jdbc-user:password' in self._tokens)
+        self.assertTrue('app-ds-jdbc(1)-user:password' in self._tokens)
+        self.assertEqual(len(self._tokens), len(set(self._tokens)))
+
+    def _get_replacement(self, file_name, name, element, properties=None, username=''):
+        self._replacements.append((name, properties))
+        token = file_name[:-len('.xml')] + name
+        self._tokens.append(token)
+        if username:
+            token += '=' + username
+        return '<' + element + '>@@' + token + '@@</' + element + '>'
+
+
+def _stream(text):
+    return ByteArrayInputStream(String(text).getBytes())
+
+
+def _write_file(file_name, text):
+    parent_dir = os.path.dirname(file_name)
+    if not os.path.isdir(parent_dir):
+        os.makedirs(parent_dir)
+    output = open(file_name, 'w')
+    try:
+        output.write(text)
+    finally:
+        output.close()
+    return file_name
+
+
+def _read(stream):
+    reader = BufferedReader(InputStreamReader(stream))
+    lines = []
+    line = reader.readLine()
+    while line is not None:
+        lines.append(line)
+        line = reader.readLine()
+    reader.close()
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    unittest.main()
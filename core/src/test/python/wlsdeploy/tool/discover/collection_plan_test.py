@@ -0,0 +1,166 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+import os
+import shutil
+
+from oracle.weblogic.deploy.util import CLAException
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+from oracle.weblogic.deploy.util import WLSDeployArchive
+
+from base_test import BaseTestCase
+from wlsdeploy.tool.discover import artifact_collector
+from wlsdeploy.tool.discover import collection_plan
+from wlsdeploy.tool.discover import discoverer
+from wlsdeploy.tool.discover.artifact_collector import ArtifactCollector
+from wlsdeploy.util.exit_code import ExitCode
+from wlsdeploy.util.model_context import ModelContext
+
+
+class CollectionPlanTest(BaseTestCase):
+
+    def setUp(self):
+        BaseTestCase.setUp(self)
+        self._source_dir = os.path.join(self.TEST_OUTPUT_DIR, 'collection-plan')
+        if os.path.isdir(self._source_dir):
+            shutil.rmtree(self._source_dir)
+        os.makedirs(self._source_dir)
+
+    def testCreatePlan(self):
+        """
+        Verify the entry kinds, and that the expected size is only set for readable sources.
+        """
+        app_file = self._write_file('apps/orders.ear', 'orders application')
+        remote_map = OrderedDict()
+        _add_remote_entry(remote_map, app_file, 'wlsdeploy/applications/orders.ear', 'APPLICATION')
+        _add_remote_entry(remote_map, '/remote/apps/billing.ear', 'wlsdeploy/applications/billing.ear', 'APPLICATION')
+        _add_remote_entry(remote_map, '/domains/base/lib/*.jar', 'wlsdeploy/domainLibraries/*', 'DOMAIN_LIB')
+        _add_remote_entry(remote_map, '/domains/base/FileStore-0', 'wlsdeploy/stores/FileStore-0/', 'FILE_STORE')
+
+        entries = collection_plan.create_plan(remote_map, '/domains/base')[collection_plan.ENTRIES]
+        kinds = [entry[collection_plan.KIND] for entry in entries]
+        self.assertEqual([collection_plan.PATH_KIND, collection_plan.PATH_KIND, collection_plan.PATTERN_KIND,
+                          collection_plan.EMPTY_DIRECTORY_KIND], kinds)
+        self.assertEqual(len('orders application'), entries[0][collection_plan.EXPECTED_SIZE])
+        self.assertEqual(None, entries[1][collection_plan.EXPECTED_SIZE])
+        self.assertEqual('wlsdeploy/domainLibraries/', entries[2][collection_plan.ARCHIVE_PATH])
+        self.assertEqual(None, entries[3][collection_plan.SOURCE_PATH])
+
+    def testReadPlanErrors(self):
+        """
+        Verify that invalid plan entries are reported.
+        """
+        plan = _create_plan([_create_entry(collection_plan.PATH_KIND, None, 'wlsdeploy/applications/orders.ear')])
+        self._check_error(plan)
+
+        plan = _create_plan([_create_entry('archive', '/apps/orders.ear', 'wlsdeploy/applications/orders.ear')])
+        self._check_error(plan)
+
+        plan = _create_plan([_create_entry(collection_plan.PATH_KIND, '/apps/orders.ear', None)])
+        self._check_error(plan)
+
+    def testLocalCollect(self):
+        """
+        Verify that local entries are added to the archive, and that missing entries are reported.
+        """
+        app_file = self._write_file('apps/orders.ear', 'orders application')
+        self._write_file('lib/one.jar', 'one')
+        self._write_file('lib/two.jar', 'two')
+        self._write_file('lib/readme.txt', 'not a library')
+
+        plan = _create_plan([
+            _create_entry(collection_plan.PATH_KIND, app_file, 'wlsdeploy/applications/orders.ear'),
+            _create_entry(collection_plan.PATTERN_KIND, os.path.join(self._source_dir, 'lib', '*.jar'),
+                          'wlsdeploy/domainLibraries/'),
+            _create_entry(collection_plan.PATH_KIND, os.path.join(self._source_dir, 'missing.ear'),
+                          'wlsdeploy/applications/missing.ear'),
+            _create_entry(collection_plan.EMPTY_DIRECTORY_KIND, None, 'wlsdeploy/stores/FileStore-0/')
+        ])
+        plan_file = os.path.join(self._source_dir, collection_plan.PLAN_FILE_NAME)
+        collection_plan.write_plan(plan, plan_file)
+        plan = collection_plan.read_plan(plan_file)
+
+        archive_file_name = os.path.join(self._source_dir, 'archive.zip')
+        results = ArtifactCollector(ModelContext('collectArtifacts', {}), plan).collect(archive_file_name)
+
+        statuses = [result.status for result in results]
+        self.assertEqual([artifact_collector.COLLECTED_STATUS, artifact_collector.COLLECTED_STATUS,
+                          artifact_collector.MISSING_STATUS, artifact_collector.CREATED_STATUS], statuses)
+        self.assertEqual(2, len(results[1].files))
+        self.assertEqual(ExitCode.WARNING, artifact_collector.get_exit_code(results))
+
+        archive = WLSDeployArchive(archive_file_name)
+        try:
+            entries = list(archive.getArchiveEntries())
+        finally:
+            archive.close()
+        for path in ['wlsdeploy/applications/orders.ear', 'wlsdeploy/domainLibraries/one.jar',
+                     'wlsdeploy/domainLibraries/two.jar', 'wlsdeploy/stores/FileStore-0/']:
+            self.assertTrue(path in entries, path)
+        self.assertFalse('wlsdeploy/domainLibraries/readme.txt' in entries)
+
+    def testRelativeSourcePath(self):
+        """
+        Verify that relative source paths are resolved against the domain home of the plan.
+        """
+        jms_file = self._write_file('config/jms/orders-jms.xml', 'orders JMS module')
+        self._write_file('lib/one.jar', 'one')
+
+        plan = _create_plan([
+            _create_entry(collection_plan.PATH_KIND, 'config/jms/orders-jms.xml',
+                          'wlsdeploy/applications/orders-jms.xml'),
+            _create_entry(collection_plan.PATTERN_KIND, 'lib/*.jar', 'wlsdeploy/domainLibraries/')
+        ], self._source_dir)
+
+        archive_file_name = os.path.join(self._source_dir, 'relative-archive.zip')
+        results = ArtifactCollector(ModelContext('collectArtifacts', {}), plan).collect(archive_file_name)
+
+        statuses = [result.status for result in results]
+        self.assertEqual([artifact_collector.COLLECTED_STATUS, artifact_collector.COLLECTED_STATUS], statuses)
+        self.assertEqual(os.path.normpath(jms_file), os.path.normpath(results[0].files[0].source_path))
+        self.assertEqual('wlsdeploy/domainLibraries/one.jar', results[1].files[0].archive_path)
+
+    def _check_error(self, plan):
+        plan_file = os.path.join(self._source_dir, 'invalid-plan.json')
+        collection_plan.write_plan(plan, plan_file)
+        try:
+            collection_plan.read_plan(plan_file)
+            self.fail('Expected CLAException')
+        except CLAException, ex:
+            self.assertEqual(ExitCode.ARG_VALIDATION_ERROR, ex.getExitCode())
+
+    def _write_file(self, relative_path, content):
+        file_path = os.path.join(self._source_dir, relative_path)
+        parent_dir = os.path.dirname(file_path)
+        if not os.path.isdir(parent_dir):
+            os.makedirs(parent_dir)
+        output = open(file_path, 'w')
+        try:
+            output.write(content)
+        finally:
+            output.close()
+        return file_path
+
+
+def _add_remote_entry(remote_map, source_path, archive_path, entry_type):
+    remote_map[source_path] = OrderedDict()
+    remote_map[source_path][discoverer.REMOTE_TYPE] = entry_type
+    remote_map[source_path][discoverer.REMOTE_ARCHIVE_PATH] = archive_path
+
+
+def _create_entry(kind, source_path, archive_path):
+    entry = OrderedDict()
+    entry[collection_plan.SOURCE_PATH] = source_path
+    entry[collection_plan.ARCHIVE_PATH] = archive_path
+    entry[collection_plan.TYPE] = 'APPLICATION'
+    entry[collection_plan.KIND] = kind
+    entry[collection_plan.EXPECTED_SIZE] = None
+    return entry
+
+
+def _create_plan(entries, domain_home='/domains/base'):
+    plan = OrderedDict()
+    plan[collection_plan.DOMAIN_HOME] = domain_home
+    plan[collection_plan.ENTRIES] = entries
+    return plan
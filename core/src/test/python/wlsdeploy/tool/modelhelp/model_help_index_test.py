@@ -0,0 +1,120 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+import os
+import unittest
+
+from oracle.weblogic.deploy.util import WebLogicDeployToolingVersion
+
+from wlsdeploy.aliases.aliases import Aliases
+from wlsdeploy.aliases.wlst_modes import WlstModes
+from wlsdeploy.tool.modelhelp import model_help_index
+from wlsdeploy.tool.modelhelp.model_help_index import ModelHelpIndex
+from wlsdeploy.tool.modelhelp.model_help_index import ModelHelpIndexBuilder
+from wlsdeploy.util.model_context import ModelContext
+
+
+class ModelHelpIndexTestCase(unittest.TestCase):
+    """
+    Test the model help index builder and search.
+    """
+    _program_name = 'model_help_index_test'
+
+    def testSearchNames(self):
+        index = ModelHelpIndex(_get_index_dictionary())
+
+        results = index.search('listenport')
+        self.assertEqual(2, len(results.name_matches))
+        self.assertEqual('topology:/Server/ListenPort', model_help_index.get_entry_path(results.name_matches[0]))
+        self.assertEqual([], results.suggestions)
+
+        results = index.search('Server')
+        self.assertEqual(1, len(results.name_matches))
+        self.assertEqual('topology:/Server', model_help_index.get_entry_path(results.name_matches[0]))
+
+    def testSearchWords(self):
+        index = ModelHelpIndex(_get_index_dictionary())
+
+        # matches a part of a name, and a word in the help text
+        results = index.search('timeout')
+        self.assertEqual(0, len(results.name_matches))
+        paths = _get_paths(results.text_matches)
+        self.assertEqual(['topology:/Server/ConnectTimeout', 'topology:/Server/IdleTime'], paths)
+
+        # every word must match
+        results = index.search('timeout idle')
+        self.assertEqual(['topology:/Server/IdleTime'], _get_paths(results.text_matches))
+
+    def testSuggestions(self):
+        index = ModelHelpIndex(_get_index_dictionary())
+        results = index.search('ListenPrt')
+        self.assertEqual(False, results.has_matches())
+        self.assertEqual('ListenPort', results.suggestions[0])
+
+    def testBuildIndex(self):
+        model_context = ModelContext(self._program_name, {})
+        aliases = Aliases(model_context, WlstModes.OFFLINE, '12.2.1.3')
+        index_dictionary = ModelHelpIndexBuilder(aliases, '12.2.1.3', 'offline').build()
+        self.assertEqual('12.2.1.3', index_dictionary[model_help_index.WLS_VERSION])
+
+        index = ModelHelpIndex(index_dictionary)
+        paths = _get_paths(index.search('ListenPort').name_matches)
+        self.assertEqual(True, 'topology:/Server/ListenPort' in paths)
+        self.assertEqual(True, 'topology:/Server' in _get_paths(index.search('Server').name_matches))
+
+    def testIndexFileRoundTrip(self):
+        index_file = os.path.abspath(os.path.join(os.getcwd(), '../../unit-tests/modelhelp/index-round-trip.json'))
+        index_dictionary = _get_index_dictionary()
+        index_dictionary[model_help_index.WDT_VERSION] = WebLogicDeployToolingVersion.getVersion()
+        index_dictionary[model_help_index.WLST_MODE] = 'offline'
+        server_folder = index_dictionary[model_help_index.FOLDERS][0]
+        server_folder[model_help_index.HELP] = ' A server instance.\n\n\tUse C:\\domains for 100% of the\r\nservers. '
+
+        model_help_index._write_index_file(index_dictionary, index_file)
+        read_dictionary = model_help_index._read_index_file(index_file, '12.2.1.3', 'offline')
+        read_folder = read_dictionary[model_help_index.FOLDERS][0]
+        self.assertEqual(server_folder[model_help_index.HELP], read_folder[model_help_index.HELP])
+        self.assertEqual(len(server_folder[model_help_index.ATTRIBUTES]), len(read_folder[model_help_index.ATTRIBUTES]))
+
+        # a stored index searches the same as the built index
+        for search_text in ['domains', 'timeout', 'servers']:
+            built_results = ModelHelpIndex(index_dictionary).search(search_text)
+            read_results = ModelHelpIndex(read_dictionary).search(search_text)
+            self.assertEqual(_get_paths(built_results.text_matches), _get_paths(read_results.text_matches))
+
+
+def _get_index_dictionary():
+    return {
+        model_help_index.WLS_VERSION: '12.2.1.3',
+        model_help_index.FOLDERS: [
+            {
+                model_help_index.PATH: 'topology:/Server',
+                model_help_index.HELP: 'A server instance.',
+                model_help_index.ATTRIBUTES: [
+                    {model_help_index.NAME: 'ConnectTimeout', model_help_index.TYPE: 'integer'},
+                    {model_help_index.NAME: 'IdleTime', model_help_index.TYPE: 'integer',
+                     model_help_index.HELP: 'The idle time before a timeout occurs.'},
+                    {model_help_index.NAME: 'ListenPort', model_help_index.TYPE: 'integer',
+                     model_help_index.DEFAULT: '7001'}
+                ]
+            },
+            {
+                model_help_index.PATH: 'topology:/Server/SSL',
+                model_help_index.ATTRIBUTES: [
+                    {model_help_index.NAME: 'ListenPort', model_help_index.TYPE: 'integer'}
+                ]
+            }
+        ]
+    }
+
+
+def _get_paths(entries):
+    paths = []
+    for entry in entries:
+        paths.append(model_help_index.get_entry_path(entry))
+    return paths
+
+
+if __name__ == '__main__':
+    unittest.main()
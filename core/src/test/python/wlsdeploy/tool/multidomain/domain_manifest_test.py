@@ -0,0 +1,142 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+import os
+
+from oracle.weblogic.deploy.util import CLAException
+
+from base_test import BaseTestCase
+from wlsdeploy.tool.multidomain import domain_manifest
+from wlsdeploy.tool.multidomain import domain_runner
+from wlsdeploy.tool.multidomain.domain_manifest import DomainManifest
+from wlsdeploy.tool.multidomain.domain_runner import DomainResult
+from wlsdeploy.util.exit_code import ExitCode
+
+MANIFEST_DIR = os.sep + 'models'
+
+
+class DomainManifestTest(BaseTestCase):
+
+    def test_manifest(self):
+        """
+        Verify that paths are resolved, and that domains share the manifest common model files.
+        """
+        manifest = DomainManifest(_create_manifest_dict(), MANIFEST_DIR)
+        self.assertEqual(2, manifest.get_max_parallel())
+
+        domains = manifest.get_domains()
+        self.assertEqual(3, len(domains))
+        self.assertEqual((os.path.join(MANIFEST_DIR, 'common', 'base.yaml'),), domains[0].common_model_files)
+        self.assertEqual((os.path.join(MANIFEST_DIR, 'dev1', 'model.yaml'),), domains[0].model_files)
+        self.assertEqual((), domains[2].common_model_files)
+
+        # the first two domains share the same common model files
+        self.assertEqual(1, len(manifest.get_common_model_file_sets()))
+
+    def test_tool_arguments(self):
+        """
+        Verify that the merged common model file, or the common model files, are before the domain model files.
+        """
+        domain = DomainManifest(_create_manifest_dict(), MANIFEST_DIR).get_domains()[0]
+        arguments = domain.get_tool_arguments('/oracleHome', '/output/common/common-model-1.yaml')
+        model_index = arguments.index('-model_file')
+        self.assertEqual('/output/common/common-model-1.yaml,' + os.path.join(MANIFEST_DIR, 'dev1', 'model.yaml'),
+                         arguments[model_index + 1])
+
+        arguments = domain.get_tool_arguments('/oracleHome')
+        model_index = arguments.index('-model_file')
+        self.assertEqual(os.path.join(MANIFEST_DIR, 'common', 'base.yaml') + ',' +
+                         os.path.join(MANIFEST_DIR, 'dev1', 'model.yaml'), arguments[model_index + 1])
+        self.assertEqual('/oracleHome', arguments[arguments.index('-oracle_home') + 1])
+        self.assertEqual('-run_rcu', arguments[-1])
+
+    def test_manifest_errors(self):
+        """
+        Verify that invalid manifest values are reported.
+        """
+        manifest_dict = _create_manifest_dict()
+        manifest_dict[domain_manifest.DOMAINS][1][domain_manifest.NAME] = 'dev1'
+        self._check_error(manifest_dict, 'WLSDPLY-33408')
+
+        manifest_dict = _create_manifest_dict()
+        manifest_dict[domain_manifest.DOMAINS][1][domain_manifest.NAME] = 'dev 2'
+        self._check_error(manifest_dict, 'WLSDPLY-33403')
+
+        manifest_dict = _create_manifest_dict()
+        manifest_dict[domain_manifest.DOMAINS].append('dev3')
+        self._check_error(manifest_dict, 'WLSDPLY-33407')
+
+        manifest_dict = _create_manifest_dict()
+        manifest_dict[domain_manifest.DOMAINS][0][domain_manifest.TOOL] = 'discoverDomain'
+        self._check_error(manifest_dict)
+
+        manifest_dict = _create_manifest_dict()
+        manifest_dict[domain_manifest.DOMAINS][2][domain_manifest.MODEL_FILES] = []
+        self._check_error(manifest_dict)
+
+        manifest_dict = _create_manifest_dict()
+        manifest_dict['unknownKey'] = True
+        self._check_error(manifest_dict)
+
+        manifest_dict = _create_manifest_dict()
+        manifest_dict[domain_manifest.MAX_PARALLEL] = 0
+        self._check_error(manifest_dict)
+
+    def test_summary(self):
+        """
+        Verify the domain status values and the aggregated exit code.
+        """
+        domains = DomainManifest(_create_manifest_dict(), MANIFEST_DIR).get_domains()
+        results = [
+            DomainResult(domains[0], ExitCode.OK, 100, 'dev1.log', 'dev1'),
+            DomainResult(domains[1], ExitCode.RESTART_REQUIRED, 200, 'dev2.log', 'dev2')
+        ]
+        self.assertEqual(ExitCode.WARNING, domain_runner.get_exit_code(results))
+
+        results.append(DomainResult(domains[2], ExitCode.ARG_VALIDATION_ERROR, 300, 'test1.log', 'test1'))
+        self.assertEqual(ExitCode.ERROR, domain_runner.get_exit_code(results))
+
+        summary = domain_runner.create_summary(results)
+        self.assertEqual(3, summary[domain_runner.DOMAIN_COUNT])
+        self.assertEqual(1, summary[domain_runner.FAILED_COUNT])
+        statuses = [domain[domain_runner.STATUS] for domain in summary[domain_runner.DOMAINS]]
+        self.assertEqual([domain_runner.OK_STATUS, domain_runner.WARNING_STATUS, domain_runner.ERROR_STATUS],
+                         statuses)
+
+    def _check_error(self, manifest_dict, message_id=None):
+        try:
+            DomainManifest(manifest_dict, MANIFEST_DIR)
+            self.fail('Expected CLAException')
+        except CLAException, ex:
+            self.assertEqual(ExitCode.ARG_VALIDATION_ERROR, ex.getExitCode())
+            if message_id is not None:
+                self.assertEqual(message_id, ex.getMessageID())
+
+
+def _create_manifest_dict():
+    return {
+        domain_manifest.MAX_PARALLEL: 2,
+        domain_manifest.COMMON_MODEL_FILES: ['common/base.yaml'],
+        domain_manifest.DOMAINS: [
+            {
+                domain_manifest.NAME: 'dev1',
+                domain_manifest.TOOL: domain_manifest.CREATE_DOMAIN_TOOL,
+                domain_manifest.DOMAIN_HOME: '/domains/dev1',
+                domain_manifest.MODEL_FILES: ['dev1/model.yaml'],
+                domain_manifest.ARGS: ['-run_rcu']
+            },
+            {
+                domain_manifest.NAME: 'dev2',
+                domain_manifest.TOOL: domain_manifest.UPDATE_DOMAIN_TOOL,
+                domain_manifest.DOMAIN_HOME: '/domains/dev2',
+                domain_manifest.VARIABLE_FILES: ['dev2/variables.properties']
+            },
+            {
+                domain_manifest.NAME: 'test1',
+                domain_manifest.TOOL: domain_manifest.VALIDATE_MODEL_TOOL,
+                domain_manifest.COMMON_MODEL_FILES: [],
+                domain_manifest.MODEL_FILES: ['/models/test1/model.yaml']
+            }
+        ]
+    }
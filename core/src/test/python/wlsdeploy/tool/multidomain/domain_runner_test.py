@@ -0,0 +1,168 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+import os
+import shutil
+
+from base_test import BaseTestCase
+from wlsdeploy.tool.multidomain import domain_manifest
+from wlsdeploy.tool.multidomain import domain_runner
+from wlsdeploy.tool.multidomain.domain_manifest import DomainManifest
+from wlsdeploy.tool.multidomain.domain_runner import MultiDomainRunner
+from wlsdeploy.util.cla_utils import CommandLineArgUtil
+from wlsdeploy.util.exit_code import ExitCode
+from wlsdeploy.util.model_context import ModelContext
+
+SERVER_MODEL = 'topology:\n    Server:\n        %s:\n            ListenPort: %d\n'
+
+
+class DomainRunnerTest(BaseTestCase):
+
+    def setUp(self):
+        BaseTestCase.setUp(self)
+        self._output_dir = os.path.join(self.TEST_OUTPUT_DIR, 'multi-domain')
+        if os.path.isdir(self._output_dir):
+            shutil.rmtree(self._output_dir)
+        self._script_dir = os.path.join(self._output_dir, 'bin')
+        os.makedirs(self._script_dir)
+
+        self._manifest_dir = os.path.join(self.TEST_OUTPUT_DIR, 'multi-domain-models')
+        if os.path.isdir(self._manifest_dir):
+            shutil.rmtree(self._manifest_dir)
+        _write_file(self._manifest_dir, 'common/base.yaml', SERVER_MODEL % ('m1', 8001))
+        _write_file(self._manifest_dir, 'common/ports.yaml', SERVER_MODEL % ('m1', 9001))
+        _write_file(self._manifest_dir, 'common/names.yaml', SERVER_MODEL % ("'@@PROP:server@@'", 9001))
+
+        # validateModel has no script, so that domain cannot be run
+        for tool in [domain_manifest.CREATE_DOMAIN_TOOL, domain_manifest.UPDATE_DOMAIN_TOOL,
+                     domain_manifest.DEPLOY_APPS_TOOL]:
+            for extension in ['.sh', '.cmd']:
+                open(os.path.join(self._script_dir, tool + extension), 'w').close()
+
+    def test_run_domains(self):
+        """
+        Verify that the tool is run for each domain, and that a failed domain does not stop the others.
+        """
+        model_context = ModelContext('multiDomainRunner', {CommandLineArgUtil.OUTPUT_DIR_SWITCH: self._output_dir})
+        manifest = DomainManifest(_create_manifest_dict(), self._manifest_dir)
+        exit_codes = {'dev1': ExitCode.OK, 'dev2': None, 'dev3': ExitCode.RESTART_REQUIRED}
+        runner = RecordingRunner(model_context, manifest, self._script_dir, exit_codes)
+
+        results = runner.run()
+        self.assertEqual(['dev1', 'dev2', 'dev3', 'test1'], [result.domain.name for result in results])
+        self.assertEqual([ExitCode.OK, ExitCode.ERROR, ExitCode.RESTART_REQUIRED, ExitCode.ERROR],
+                         [result.exit_code for result in results])
+
+        # each domain with a tool script is run once, with its own arguments
+        self.assertEqual(['dev1', 'dev2', 'dev3'], sorted(runner.commands.keys()))
+        command = runner.commands['dev1']
+        self.assertEqual(os.path.join(self._script_dir, domain_manifest.CREATE_DOMAIN_TOOL),
+                         os.path.splitext(command[0])[0])
+        merged_file = os.path.join(self._output_dir, 'common', 'common-model-1.yaml')
+        self.assertEqual(merged_file + ',' + os.path.join(self._manifest_dir, 'dev1', 'model.yaml'),
+                         command[command.index('-model_file') + 1])
+        self.assertEqual(merged_file, runner.commands['dev2'][runner.commands['dev2'].index('-model_file') + 1])
+        self.assertEqual('/domains/dev2', runner.commands['dev2'][runner.commands['dev2'].index('-domain_home') + 1])
+        self.assertEqual(os.path.join(self._output_dir, 'dev1', 'logs'), results[0].log_dir)
+
+        self.assertEqual(ExitCode.ERROR, domain_runner.get_exit_code(results))
+        self.assertEqual(ExitCode.WARNING, domain_runner.get_exit_code([results[0], results[2]]))
+        summary = domain_runner.create_summary(results)
+        self.assertEqual(2, summary[domain_runner.FAILED_COUNT])
+
+    def test_merge_common_model_files(self):
+        """
+        Verify that common model files are merged without variables, unless a name depends on variables.
+        """
+        base_file = os.path.join(self._manifest_dir, 'common', 'base.yaml')
+        ports_file = os.path.join(self._manifest_dir, 'common', 'ports.yaml')
+        names_file = os.path.join(self._manifest_dir, 'common', 'names.yaml')
+
+        merged_model = domain_runner.merge_common_model_files((base_file, ports_file))
+        self.assertEqual(9001, merged_model['topology']['Server']['m1']['ListenPort'])
+
+        # the variable token is kept, so each domain resolves it with its own variables
+        merged_model = domain_runner.merge_common_model_files((names_file, ports_file))
+        self.assertEqual(None, merged_model)
+        merged_model = domain_runner.merge_common_model_files((names_file,))
+        self.assertEqual(['@@PROP:server@@'], merged_model['topology']['Server'].keys())
+
+        # a domain with a set that is not merged is given the common model files
+        manifest_dict = _create_manifest_dict()
+        manifest_dict[domain_manifest.COMMON_MODEL_FILES] = ['common/base.yaml', 'common/names.yaml']
+        model_context = ModelContext('multiDomainRunner', {CommandLineArgUtil.OUTPUT_DIR_SWITCH: self._output_dir})
+        manifest = DomainManifest(manifest_dict, self._manifest_dir)
+        runner = RecordingRunner(model_context, manifest, self._script_dir, {'dev1': ExitCode.OK, 'dev2': ExitCode.OK,
+                                                                             'dev3': ExitCode.OK})
+        runner.run()
+        command = runner.commands['dev2']
+        self.assertEqual(base_file + ',' + names_file, command[command.index('-model_file') + 1])
+        self.assertFalse(os.path.isdir(os.path.join(self._output_dir, 'common')))
+
+
+class RecordingRunner(MultiDomainRunner):
+    """
+    Records the command for each domain instead of starting a process.
+    """
+    def __init__(self, model_context, manifest, script_dir, exit_codes):
+        """
+        :param exit_codes: the exit code for each domain name, or None if starting the tool fails
+        """
+        MultiDomainRunner.__init__(self, model_context, manifest)
+        self._script_dir = script_dir
+        self._exit_codes = exit_codes
+        self.commands = {}
+
+    def _run_tool(self, command, log_dir, output_file):
+        domain_name = os.path.basename(os.path.dirname(log_dir))
+        self.commands[domain_name] = command
+        exit_code = self._exit_codes[domain_name]
+        if exit_code is None:
+            raise Exception('Unable to start the tool for ' + domain_name)
+        return exit_code
+
+
+def _write_file(parent_dir, path, content):
+    file_path = os.path.join(parent_dir, path)
+    if not os.path.isdir(os.path.dirname(file_path)):
+        os.makedirs(os.path.dirname(file_path))
+    output = open(file_path, 'w')
+    try:
+        output.write(content)
+    finally:
+        output.close()
+
+
+def _create_manifest_dict():
+    return {
+        domain_manifest.MAX_PARALLEL: 2,
+        domain_manifest.COMMON_MODEL_FILES: ['common/base.yaml', 'common/ports.yaml'],
+        domain_manifest.DOMAINS: [
+            {
+                domain_manifest.NAME: 'dev1',
+                domain_manifest.TOOL: domain_manifest.CREATE_DOMAIN_TOOL,
+                domain_manifest.ORACLE_HOME: '/oracleHome',
+                domain_manifest.DOMAIN_HOME: '/domains/dev1',
+                domain_manifest.MODEL_FILES: ['dev1/model.yaml']
+            },
+            {
+                domain_manifest.NAME: 'dev2',
+                domain_manifest.TOOL: domain_manifest.UPDATE_DOMAIN_TOOL,
+                domain_manifest.ORACLE_HOME: '/oracleHome',
+                domain_manifest.DOMAIN_HOME: '/domains/dev2'
+            },
+            {
+                domain_manifest.NAME: 'dev3',
+                domain_manifest.TOOL: domain_manifest.DEPLOY_APPS_TOOL,
+                domain_manifest.ORACLE_HOME: '/oracleHome',
+                domain_manifest.DOMAIN_HOME: '/domains/dev3'
+            },
+            {
+                domain_manifest.NAME: 'test1',
+                domain_manifest.TOOL: domain_manifest.VALIDATE_MODEL_TOOL,
+                domain_manifest.ORACLE_HOME: '/oracleHome',
+                domain_manifest.MODEL_FILES: ['test1/model.yaml']
+            }
+        ]
+    }
@@ -0,0 +1,88 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+from java.lang import IllegalArgumentException
+
+from base_test import BaseTestCase
+from wlsdeploy.tool.util.archive_entry_index import ArchiveEntryIndex
+
+
+class EntryListArchive(object):
+    """
+    Provides the archive methods used by the index, from a fixed list of entries.
+    """
+    def __init__(self, name, entries):
+        self._name = name
+        self._entries = entries
+
+    def getArchiveEntries(self):
+        return self._entries
+
+    def getArchiveFileName(self):
+        return self._name
+
+
+class ArchiveEntryIndexTest(BaseTestCase):
+
+    def setUp(self):
+        BaseTestCase.setUp(self)
+        self._archive_1 = EntryListArchive('archive1.zip', [
+            'wlsdeploy/applications/app1.war',
+            'wlsdeploy/applications/app2.war',
+            'wlsdeploy/applications/exploded/',
+            'wlsdeploy/applications/exploded/WEB-INF/web.xml',
+            'wlsdeploy/domainLibraries/lib1.jar'
+        ])
+        self._archive_2 = EntryListArchive('archive2.zip', [
+            'wlsdeploy/applications/app2.war',
+            'wlsdeploy/sharedLibraries/shared1.war'
+        ])
+        self._index = ArchiveEntryIndex([self._archive_1, self._archive_2])
+
+    def test_contains(self):
+        """
+        Verify file and directory lookups across archives.
+        """
+        self.assertTrue(self._index.contains_file('wlsdeploy/applications/app1.war'))
+        self.assertTrue(self._index.contains_file('wlsdeploy/sharedLibraries/shared1.war'))
+        self.assertFalse(self._index.contains_file('wlsdeploy/applications/app3.war'))
+        self.assertFalse(self._index.contains_file('wlsdeploy/applications'))
+
+        self.assertTrue(self._index.contains_path('wlsdeploy/applications'))
+        self.assertTrue(self._index.contains_path('wlsdeploy/applications/exploded/'))
+        self.assertTrue(self._index.contains_path('wlsdeploy/applications/exploded/WEB-INF'))
+        self.assertFalse(self._index.contains_path('wlsdeploy/applications/app1.war'))
+
+        self.assertTrue(self._index.contains_file_or_path('wlsdeploy/domainLibraries'))
+        self.assertTrue(self._index.contains_file_or_path('wlsdeploy/domainLibraries/lib1.jar'))
+        self.assertFalse(self._index.contains_file_or_path('config/wlsdeploy/missing'))
+        self.assertFalse(self._index.contains_file_or_path('not/into/archive'))
+
+    def test_last_archive_wins(self):
+        """
+        Verify that entries in later archives override the same entries in earlier archives.
+        """
+        self.assertTrue(self._index.find_archive('wlsdeploy/applications/app1.war') is self._archive_1)
+        self.assertTrue(self._index.find_archive('wlsdeploy/applications/app2.war') is self._archive_2)
+        self.assertTrue(self._index.find_archive('wlsdeploy/applications') is self._archive_2)
+        self.assertTrue(self._index.find_archive('wlsdeploy/applications/exploded') is self._archive_1)
+
+        # partial names are matched as a prefix, as WLSDeployArchive.containsFileOrPath does
+        self.assertTrue(self._index.find_archive('wlsdeploy/sharedLibraries/shared') is self._archive_2)
+
+    def test_empty_path(self):
+        """
+        Verify that an empty path is rejected, as WLSDeployArchive does.
+        """
+        self.assertRaises(IllegalArgumentException, self._index.contains_file, '')
+        self.assertRaises(IllegalArgumentException, self._index.contains_path, '')
+        self.assertRaises(IllegalArgumentException, self._index.contains_file_or_path, '')
+
+    def test_shadowed_entries(self):
+        """
+        Verify that entries in more than one archive are reported.
+        """
+        shadowed = self._index.get_shadowed_entries()
+        self.assertEqual(1, len(shadowed))
+        self.assertEqual(['archive1.zip', 'archive2.zip'], shadowed['wlsdeploy/applications/app2.war'])
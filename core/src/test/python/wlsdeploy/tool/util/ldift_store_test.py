@@ -0,0 +1,112 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+import os
+
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+
+from base_test import BaseTestCase
+from wlsdeploy.tool.util.ldif_entry import LDIFEntry
+from wlsdeploy.tool.util.ldift_store import LdiftStore
+
+ROLES_LDIFT = """# roles
+
+dn: cn=r1+xacmlVersion=1.0,ou=Policies,ou=XACMLRole,ou=@realm@,dc=@domain@
+objectclass: top
+cn: r1
+xacmlDocument:: AAAA
+ BBBB
+xacmlRole: Admin
+
+dn: cn=r2+xacmlVersion=1.0,ou=Policies,ou=XACMLRole,ou=@realm@,dc=@domain@
+cn: r2
+xacmlDocument:: CCCC
+xacmlRole: Deployer
+
+dn: cn=r3+xacmlVersion=1.0,ou=Policies,ou=XACMLRole,ou=@realm@,dc=@domain@
+cn: r3
+xacmlRole: Monitor
+"""
+
+
+class LdiftStoreTest(BaseTestCase):
+
+    def setUp(self):
+        BaseTestCase.setUp(self)
+        self._ldift_dir = os.path.join(self.TEST_OUTPUT_DIR, 'ldift-store')
+        if not os.path.isdir(self._ldift_dir):
+            os.makedirs(self._ldift_dir)
+
+    def testIndex(self):
+        store = self._get_store(ROLES_LDIFT)
+        self.assertEqual(['Admin', 'Deployer', 'Monitor'], list(store.get_index().keys()))
+
+        entry = store.read_entry('Admin')
+        self.assertEqual('AAAABBBB', entry.get_single_value('xacmlDocument:'))
+        self.assertEqual('r1', entry.get_single_value('cn'))
+        self.assertEqual(None, store.read_entry('Operator'))
+
+    def testMerge(self):
+        store = self._get_store(ROLES_LDIFT)
+        model_entries = OrderedDict()
+        model_entries['Deployer'] = _get_role_entry('r2', 'Deployer')
+        model_entries['Operator'] = _get_role_entry('r4', 'Operator')
+
+        target_path = os.path.join(self._ldift_dir, 'merged.ldift')
+        result = store.merge(target_path, model_entries)
+        self.assertEqual(['Operator'], result.added)
+        self.assertEqual(['Deployer'], result.replaced)
+        self.assertEqual(2, result.unchanged_count)
+
+        text = _read_file(target_path)
+        self.assertTrue(text.startswith('# roles\n\ndn: cn=r1'))
+        self.assertTrue('xacmlDocument:: AAAA\n BBBB\n' in text)
+        self.assertFalse('CCCC' in text)
+        self.assertTrue(text.endswith('xacmlRole: Monitor\n\n' + _get_role_text('r4', 'Operator')))
+
+        merged = LdiftStore(target_path, _get_role_name, ['cn', 'xacmlRole'])
+        self.assertEqual(['Admin', 'Deployer', 'Monitor', 'Operator'], list(merged.get_index().keys()))
+
+    def testInvalidEntries(self):
+        store = self._get_store('dn: cn=r1\ncn: r1\n\nobjectclass: top\nxacmlRole: Admin\n')
+        self.assertRaises(ValueError, store.get_index)
+
+        store = self._get_store('dn: cn=r1\ncn: r1\nxacmlRole Admin\n')
+        self.assertRaises(ValueError, store.get_index)
+
+        store = self._get_store('dn: cn=r1\ncn: r1\n')
+        self.assertRaises(ValueError, store.get_index)
+
+    def _get_store(self, text):
+        ldift_path = os.path.join(self._ldift_dir, 'source.ldift')
+        ldift_file = open(ldift_path, 'w')
+        try:
+            ldift_file.write(text)
+        finally:
+            ldift_file.close()
+        return LdiftStore(ldift_path, _get_role_name, ['cn', 'xacmlRole'])
+
+
+def _get_role_name(entry):
+    return entry.get_single_value('xacmlRole')
+
+
+def _get_role_entry(cn, role):
+    entry = LDIFEntry()
+    entry.add_assignment_line('dn: cn=%s+xacmlVersion=1.0,ou=Policies,ou=XACMLRole,ou=@realm@,dc=@domain@' % cn)
+    entry.add_assignment('cn', cn)
+    entry.add_assignment('xacmlRole', role)
+    return entry
+
+
+def _get_role_text(cn, role):
+    return '\n'.join(_get_role_entry(cn, role).get_assignment_lines()) + '\n'
+
+
+def _read_file(path):
+    source = open(path, 'r')
+    try:
+        return source.read()
+    finally:
+        source.close()
@@ -0,0 +1,86 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+import unittest
+
+from wlsdeploy.tool.util.targets import file_template_compiler
+
+
+class OutputCollector(object):
+    """
+    Collects the text written by a compiled template.
+    """
+    def __init__(self):
+        self._parts = []
+
+    def write(self, text):
+        self._parts.append(text)
+
+    def get_text(self):
+        return ''.join(self._parts)
+
+
+class FileTemplateCompilerTest(unittest.TestCase):
+
+    def testSubstitution(self):
+        template = file_template_compiler.compile_template([
+            'domain: {{{domainName}}} {{{domainName}}}',
+            'missing: {{{noSuchKey}}}',
+            'plain line'
+        ])
+        self.assertEqual('domain: base base\nmissing: {{{noSuchKey}}}\nplain line\n',
+                         _render(template, {'domainName': 'base'}))
+
+    def testBlocks(self):
+        template = file_template_compiler.compile_template([
+            'clusters:',
+            '{{#clusters}}',
+            '  - name: {{{clusterName}}} in {{{domainName}}}',
+            '{{#servers}}',
+            '    server: {{{serverName}}} of {{{clusterName}}}',
+            '{{/servers}}',
+            '{{/clusters}}',
+            '{{#enabled}}',
+            'enabled: {{{domainName}}}',
+            '{{/enabled}}',
+            '{{#disabled}}',
+            'disabled',
+            '{{/disabled}}',
+            'end'
+        ])
+        template_hash = {
+            'domainName': 'base',
+            'enabled': True,
+            'disabled': False,
+            'clusters': [
+                {'clusterName': 'c1', 'servers': [{'serverName': 's1'}, {'serverName': 's2'}]},
+                {'clusterName': 'c2', 'domainName': 'override', 'servers': []}
+            ]
+        }
+        expected = ('clusters:\n'
+                    '  - name: c1 in base\n'
+                    '    server: s1 of c1\n'
+                    '    server: s2 of c1\n'
+                    '  - name: c2 in override\n'
+                    'enabled: base\n'
+                    'end\n')
+
+        # the compiled template can be rendered more than once
+        self.assertEqual(expected, _render(template, template_hash))
+        self.assertEqual(expected, _render(template, template_hash))
+
+    def testUnclosedBlock(self):
+        # lines in a block without an end tag are not written
+        template = file_template_compiler.compile_template(['first', '{{#items}}', 'item', 'last'])
+        self.assertEqual('first\n', _render(template, {'items': [1, 2]}))
+
+
+def _render(template, template_hash):
+    collector = OutputCollector()
+    template.render(template_hash, collector)
+    return collector.get_text()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+import unittest
+
+from wlsdeploy.tool.util.targets import model_crd_helper
+from wlsdeploy.tool.util.targets import schema_index
+
+
+class SchemaIndexTest(unittest.TestCase):
+
+    def testSchemaIndexIsShared(self):
+        index = schema_index.get_schema_index(model_crd_helper.WKO_4_DOMAIN_SCHEMA_NAME)
+        self.assertTrue(index is schema_index.get_schema_index(model_crd_helper.WKO_4_DOMAIN_SCHEMA_NAME))
+
+        # helpers for the same version use the same compiled schema
+        helper = model_crd_helper.get_product_helper(model_crd_helper.WKO_PRODUCT_KEY,
+                                                     model_crd_helper.WKO_VERSION_4)
+        self.assertTrue(index is helper.get_crd_folder('domain').get_schema_index())
+
+    def testSchemaNodes(self):
+        helper = model_crd_helper.get_product_helper(model_crd_helper.WKO_PRODUCT_KEY,
+                                                     model_crd_helper.WKO_VERSION_4)
+        domain_folder = helper.get_crd_folder('domain')
+        index = domain_folder.get_schema_index()
+        root = domain_folder.get_root_node()
+        self.assertEqual(None, root.get_path())
+
+        # the node from the path index is the same as the node from the folder properties
+        spec = root.get_property('spec')
+        self.assertTrue(spec.is_single_object())
+        self.assertTrue(spec is index.get_node('spec'))
+
+        # object array properties are the properties of the array items
+        managed_servers = index.get_node('spec/managedServers')
+        self.assertTrue(managed_servers.is_object_array())
+        self.assertTrue(managed_servers.get_property('serverName').is_simple_type())
+        self.assertEqual('serverName', managed_servers.get_object_list_key())
+        self.assertEqual('serverName', domain_folder.get_object_list_key('spec/managedServers'))
+        self.assertEqual('name', domain_folder.get_object_list_key('spec/unknown'))
+
+        self.assertTrue(index.get_node('status').is_unsupported())
+        self.assertFalse(spec.is_unsupported())
+        self.assertEqual(None, index.get_node('spec/noSuchFolder'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+import os
+import shutil
+
+from java.lang import IllegalStateException
+from java.util.logging import Handler
+from java.util.logging import Level
+from java.util.logging import Logger as JLogger
+
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+
+from base_test import BaseTestCase
+from wlsdeploy.logging.platform_logger import PlatformLogger
+from wlsdeploy.tool.validate import validation_cache
+from wlsdeploy.tool.validate.validation_cache import ValidationCache
+
+_logger = PlatformLogger('wlsdeploy.validate')
+
+FOLDER_PATH = 'resources:/JDBCSystemResource/ds1'
+
+
+class ValidationCacheTest(BaseTestCase):
+
+    def setUp(self):
+        BaseTestCase.setUp(self)
+        self._cache_dir = os.path.join(self.TEST_OUTPUT_DIR, 'validation-cache')
+        if os.path.isdir(self._cache_dir):
+            shutil.rmtree(self._cache_dir)
+
+        self._handler = _ListHandler()
+        self._test_logger = JLogger.getLogger('wlsdeploy.validate')
+        self._test_logger.addHandler(self._handler)
+        self._validate_count = 0
+
+    def tearDown(self):
+        BaseTestCase.tearDown(self)
+        self._test_logger.removeHandler(self._handler)
+
+    def testKey(self):
+        cache = self._get_cache()
+        key = cache.compute_key(FOLDER_PATH, _get_folder())
+        self.assertEqual(64, len(key))
+        self.assertEqual(key, cache.compute_key(FOLDER_PATH, _get_folder()))
+
+        # the path, values, types, order, and variable values change the key
+        self.assertNotEqual(key, cache.compute_key('resources:/JDBCSystemResource/ds2', _get_folder()))
+        self.assertNotEqual(key, cache.compute_key(FOLDER_PATH, _get_folder(target='cluster2')))
+        self.assertNotEqual(key, cache.compute_key(FOLDER_PATH, _get_folder(timeout='30')))
+        self.assertNotEqual(key, cache.compute_key(FOLDER_PATH, _get_folder(reverse=True)))
+        self.assertNotEqual(key, self._get_cache(url='jdbc:oracle:thin:@other:1521/pdb')
+                            .compute_key(FOLDER_PATH, _get_folder()))
+        self.assertNotEqual(key, self._get_cache(wls_version='14.1.2.0.0').compute_key(FOLDER_PATH, _get_folder()))
+
+        # the key is not computed for folders with environment tokens
+        self.assertEqual(None, cache.compute_key(FOLDER_PATH, _get_folder(target='@@ENV:TARGET@@')))
+
+    def testReuse(self):
+        cache = self._get_cache()
+        cache.validate(FOLDER_PATH, _get_folder(), self._validate)
+        self.assertEqual(1, self._validate_count)
+        self.assertEqual(0, cache.get_reused_count())
+        validated_records = self._handler.get_records()
+        self.assertEqual(2, len(validated_records))
+
+        # the records are logged again without validating
+        self._handler.clear()
+        cache = self._get_cache()
+        cache.validate(FOLDER_PATH, _get_folder(), self._validate)
+        self.assertEqual(1, self._validate_count)
+        self.assertEqual(1, cache.get_reused_count())
+        replayed_records = self._handler.get_records()
+        self.assertEqual(len(validated_records), len(replayed_records))
+        for index in range(len(validated_records)):
+            self.assertEqual(validated_records[index], replayed_records[index])
+
+        # a changed folder is validated
+        cache.validate(FOLDER_PATH, _get_folder(target='cluster2'), self._validate)
+        self.assertEqual(2, self._validate_count)
+
+    def testUncached(self):
+        cache = self._get_cache()
+        cache.validate(FOLDER_PATH, _get_folder(target='@@ENV:TARGET@@'), self._validate)
+        cache.validate(FOLDER_PATH, _get_folder(target='@@ENV:TARGET@@'), self._validate)
+        self.assertEqual(2, self._validate_count)
+
+        # results with exceptions are not stored
+        cache.validate(FOLDER_PATH, _get_folder(), self._validate_with_error)
+        cache.validate(FOLDER_PATH, _get_folder(), self._validate_with_error)
+        self.assertEqual(4, self._validate_count)
+        self.assertEqual(0, cache.get_reused_count())
+
+    def _get_cache(self, wls_version='12.2.1.4.0', url='jdbc:oracle:thin:@db:1521/pdb'):
+        inputs = OrderedDict()
+        inputs[validation_cache.WLS_VERSION] = wls_version
+        return ValidationCache(self._cache_dir, inputs, {'db.url': url})
+
+    def _validate(self):
+        self._validate_count += 1
+        _logger.severe('WLSDPLY-05029', 'Bad', FOLDER_PATH, 'Target', class_name='test', method_name='_validate')
+        _logger.info('WLSDPLY-05031', 'Path', FOLDER_PATH, 'lib/x.jar', class_name='test', method_name='_validate')
+        _logger.fine('key={0}', 'Bad', class_name='test', method_name='_validate')
+
+    def _validate_with_error(self):
+        self._validate_count += 1
+        _logger.warning('WLSDPLY-05029', 'Bad', FOLDER_PATH, 'Target', error=IllegalStateException('test'),
+                        class_name='test', method_name='_validate_with_error')
+
+
+class _ListHandler(Handler):
+    def __init__(self):
+        Handler.__init__(self)
+        self.setLevel(Level.INFO)
+        self._records = []
+
+    def publish(self, log_record):
+        if self.isLoggable(log_record):
+            self._records.append((log_record.getLevel().getName(), log_record.getMessage(),
+                                  list(log_record.getParameters()), log_record.getSourceMethodName()))
+
+    def get_records(self):
+        return list(self._records)
+
+    def clear(self):
+        self._records = []
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def _get_folder(target='cluster1', timeout=15, reverse=False):
+    folder = OrderedDict()
+    folder['Target'] = target
+    folder['JdbcResource'] = OrderedDict()
+    folder['JdbcResource']['JDBCDriverParams'] = OrderedDict()
+    folder['JdbcResource']['JDBCDriverParams']['URL'] = '@@PROP:db.url@@'
+    folder['JdbcResource']['JDBCDriverParams']['LoginDelaySeconds'] = timeout
+    if reverse:
+        reversed_folder = OrderedDict()
+        reversed_folder['JdbcResource'] = folder['JdbcResource']
+        reversed_folder['Target'] = folder['Target']
+        return reversed_folder
+    return folder
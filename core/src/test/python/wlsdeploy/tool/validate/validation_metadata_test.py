@@ -0,0 +1,67 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+from base_test import BaseTestCase
+from wlsdeploy.aliases.aliases import Aliases
+from wlsdeploy.aliases.location_context import LocationContext
+from wlsdeploy.aliases.model_constants import JDBC_DRIVER_PARAMS
+from wlsdeploy.aliases.model_constants import JDBC_RESOURCE
+from wlsdeploy.aliases.model_constants import JDBC_SYSTEM_RESOURCE
+from wlsdeploy.aliases.model_constants import LISTEN_PORT
+from wlsdeploy.aliases.model_constants import SERVER
+from wlsdeploy.aliases.validation_codes import ValidationCodes
+from wlsdeploy.aliases.wlst_modes import WlstModes
+from wlsdeploy.tool.validate.validation_metadata import ValidationMetadataCache
+from wlsdeploy.util.cla_utils import CommandLineArgUtil
+from wlsdeploy.util.model_context import ModelContext
+
+
+class ValidationMetadataTest(BaseTestCase):
+    _wls_version = '12.2.1.3'
+
+    def setUp(self):
+        BaseTestCase.setUp(self)
+        model_context = ModelContext('ValidationMetadataTest', {
+            CommandLineArgUtil.ORACLE_HOME_SWITCH: '/oracleHome',
+            CommandLineArgUtil.DOMAIN_HOME_SWITCH: ''
+        })
+        self._aliases = Aliases(model_context, WlstModes.OFFLINE, self._wls_version)
+        self._cache = ValidationMetadataCache(self._aliases, self._wls_version, WlstModes.OFFLINE)
+
+    def test_instances_share_metadata(self):
+        """
+        Verify that different instances of a folder share one cache entry.
+        """
+        location_1 = LocationContext().append_location(SERVER).add_name_token('SERVER', 'ms1')
+        location_2 = LocationContext().append_location(SERVER).add_name_token('SERVER', 'ms2')
+
+        metadata = self._cache.get_folder_metadata(location_1)
+        self.assertTrue(metadata is self._cache.get_folder_metadata(location_2))
+        self.assertEqual(1, self._cache.size())
+
+        self._cache.get_folder_metadata(LocationContext().append_location(JDBC_SYSTEM_RESOURCE, JDBC_RESOURCE))
+        self.assertEqual(2, self._cache.size())
+
+    def test_metadata_matches_aliases(self):
+        """
+        Verify that the cached values match those returned by the aliases.
+        """
+        location = LocationContext().append_location(SERVER).add_name_token('SERVER', 'ms1')
+        metadata = self._cache.get_folder_metadata(location)
+
+        self.assertEqual(self._aliases.get_model_attribute_names_and_types(location), metadata.get_attribute_infos())
+        self.assertEqual(self._aliases.get_model_subfolder_names(location), metadata.get_subfolder_names())
+        self.assertEqual(self._aliases.get_name_token(location), metadata.get_name_token())
+        self.assertEqual(True, metadata.supports_multiple_mbean_instances())
+
+        code, message = metadata.is_valid_model_attribute_name(location, LISTEN_PORT)
+        self.assertEqual(ValidationCodes.VALID, code)
+
+        # invalid names are not cached with a message, since the message includes the instance path
+        code, message = metadata.is_valid_model_attribute_name(location, 'NoSuchAttribute')
+        self.assertEqual(ValidationCodes.INVALID, code)
+        self.assertTrue(message is not None)
+
+        code, message = metadata.is_valid_model_folder_name(location, JDBC_DRIVER_PARAMS)
+        self.assertEqual(ValidationCodes.INVALID, code)
@@ -0,0 +1,31 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+import os
+
+from base_test import BaseTestCase
+from wlsdeploy.util import hash_utils
+
+# the SHA-256 hash of the text abc
+ABC_HASH = 'ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad'
+
+
+class HashUtilsTest(BaseTestCase):
+
+    def testHashText(self):
+        self.assertEqual(ABC_HASH, hash_utils.hash_text('abc'))
+
+        digest = hash_utils.create_digest()
+        hash_utils.update_digest(digest, 'a')
+        hash_utils.update_digest(digest, 'bc')
+        self.assertEqual(ABC_HASH, hash_utils.to_hex(digest.digest()))
+
+    def testHashFile(self):
+        file_path = os.path.join(self.TEST_OUTPUT_DIR, 'hash-utils.txt')
+        output = open(file_path, 'w')
+        try:
+            output.write('abc')
+        finally:
+            output.close()
+        self.assertEqual(ABC_HASH, hash_utils.hash_file(file_path))
@@ -0,0 +1,62 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+import os
+
+from base_test import BaseTestCase
+from wlsdeploy.util.ldift_helper import LdiftBase
+from wlsdeploy.util.ldift_helper import LdiftLine
+from wlsdeploy.util.model_context import ModelContext
+
+# the first entry is followed by a line with only spaces
+LDIFT_CONTENT = """dn: ou=people,ou=@realm@,dc=@domain@
+objectclass: organizationalUnit
+ou: people
+%s
+dn: uid=user1,ou=people,ou=@realm@,dc=@domain@
+description: a description that is
+  continued on two
+ more lines
+objectclass: wlsUser
+wlsMemberOf: cn=Administrators,ou=groups,ou=@realm@,dc=@
+ domain@
+cn: user1
+
+
+dn: cn=Administrators,ou=groups,ou=@realm@,dc=@domain@
+objectclass: groupOfUniqueNames
+cn: Administrators""" % '   '
+
+
+class LdiftHelperTest(BaseTestCase):
+
+    def setUp(self):
+        BaseTestCase.setUp(self)
+        self._ldift_file = os.path.join(self.TEST_OUTPUT_DIR, 'ldift-helper-test.ldift')
+        writer = open(self._ldift_file, 'w')
+        try:
+            writer.write(LDIFT_CONTENT)
+        finally:
+            writer.close()
+
+        self._ldift = LdiftBase(ModelContext('discoverDomain', {}))
+
+    def testIterateEntries(self):
+        entries = list(self._ldift.iterate_ldift_file(self._ldift_file))
+        self.assertEqual(3, len(entries))
+        self.assertEqual(['dn: ou=people,ou=@realm@,dc=@domain@', 'objectclass: organizationalUnit', 'ou: people'],
+                         entries[0])
+        self.assertEqual('cn: Administrators', entries[2][-1])
+
+        # continuation lines are joined without the leading space
+        user_entry = entries[1]
+        self.assertEqual(5, len(user_entry))
+        self.assertEqual('description: a description that is continued on twomore lines', user_entry[1])
+        member_of = LdiftLine(user_entry[3])
+        self.assertEqual('wlsMemberOf', member_of.get_key())
+        self.assertEqual('cn=Administrators,ou=groups,ou=@realm@,dc=@domain@', member_of.get_value())
+
+    def testReadFile(self):
+        entries = self._ldift.read_ldift_file(self._ldift_file)
+        self.assertEqual(list(self._ldift.iterate_ldift_file(self._ldift_file)), entries)
@@ -0,0 +1,40 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+import unittest
+
+from java.lang import Thread
+
+from wlsdeploy.util import parallel_utils
+
+
+class ParallelUtilsTest(unittest.TestCase):
+
+    def testOrder(self):
+        arguments = range(20)
+        results = parallel_utils.run_parallel(_delayed_square, arguments, 4)
+        expected = []
+        for argument in arguments:
+            expected.append(argument * argument)
+        self.assertEqual(expected, results)
+
+    def testCurrentThread(self):
+        current_thread = Thread.currentThread().getName()
+        results = parallel_utils.run_parallel(_get_thread_name, ['a', 'b'], 1)
+        self.assertEqual([current_thread, current_thread], results)
+        self.assertEqual([], parallel_utils.run_parallel(_get_thread_name, [], 4))
+
+
+def _delayed_square(value):
+    # later arguments finish first
+    Thread.sleep(20 - value)
+    return value * value
+
+
+def _get_thread_name(value):
+    return Thread.currentThread().getName()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,146 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+from base_test import BaseTestCase
+from wlsdeploy.util import parallel_utils
+from wlsdeploy.util import profiler
+from wlsdeploy.util.profiler import Profile
+
+
+class FolderLocation(object):
+    """
+    Provides the location method used for the folder of alias calls.
+    """
+    def __init__(self, folder_path):
+        self._folder_path = folder_path
+
+    def get_folder_path(self):
+        return self._folder_path
+
+
+class ProfiledHelper(object):
+    """
+    A helper class to be instrumented by the tests.
+    """
+    def lookup(self, location, value):
+        return value
+
+    def outer(self, location):
+        # nested calls in the same category are included in the outer call
+        self.lookup(location, 1)
+        return self.lookup(location, 2)
+
+    def fail(self, location):
+        raise ValueError('failed')
+
+
+class ThreadedHelper(object):
+    """
+    A helper class to be instrumented by the threaded call test.
+    """
+    def lookup(self, location, value):
+        return value
+
+
+class ProfilerTest(BaseTestCase):
+
+    def setUp(self):
+        BaseTestCase.setUp(self)
+        self._profile = Profile('testTool')
+
+    def testMBeanFolder(self):
+        self.assertEqual('/Servers/*/Log/*', profiler.get_mbean_folder('/Servers/AdminServer/Log/AdminServer'))
+        self.assertEqual('/Servers/*/SSL', profiler.get_mbean_folder('serverConfig:/Servers/ms1/SSL'))
+        self.assertEqual('/', profiler.get_mbean_folder('/'))
+        self.assertEqual(None, profiler.get_mbean_folder('Log'))
+
+    def testResolveWlstPath(self):
+        self.assertEqual('/Servers/s1/Log', profiler.resolve_wlst_path('/Servers/s1', 'Log'))
+        self.assertEqual('/Servers', profiler.resolve_wlst_path('/Servers/s1', '..'))
+        self.assertEqual('/JDBCSystemResources', profiler.resolve_wlst_path('/Servers/s1', '/JDBCSystemResources'))
+        self.assertEqual('/', profiler.resolve_wlst_path('/Servers', '../..'))
+
+    def testPhases(self):
+        self._profile.start_phase('outer')
+        self._profile.start_phase('inner')
+        self.assertEqual('inner', self._profile.get_current_phase())
+
+        # ending a phase also ends the phases that were started after it
+        self._profile.end_phase('outer')
+        self.assertEqual('testTool', self._profile.get_current_phase())
+
+        phase_names = []
+        for phase, statistics in self._profile.get_phases():
+            phase_names.append(phase)
+            self.assertEqual(1, statistics.count)
+        self.assertEqual(['inner', 'outer'], phase_names)
+
+        # a phase that is not running is ignored
+        self._profile.end_phase('other')
+        self.assertEqual(2, len(self._profile.get_phases()))
+
+    def testInstrumentedCalls(self):
+        profiler.instrument_class(self._profile, ProfiledHelper, profiler.ALIASES, _get_folder)
+        helper = ProfiledHelper()
+        servers = FolderLocation('/Server')
+
+        self._profile.start_phase('phase1')
+        self.assertEqual(5, helper.lookup(servers, 5))
+        self.assertEqual(2, helper.outer(servers))
+        self._profile.end_phase('phase1')
+        helper.lookup(FolderLocation('/JDBCSystemResource'), 3)
+        self.assertRaises(ValueError, helper.fail, servers)
+
+        calls = {}
+        for key, statistics in self._profile.get_calls():
+            calls[key] = statistics.count
+        expected = {
+            ('phase1', 'aliases', 'lookup', '/Server'): 1,
+            ('phase1', 'aliases', 'outer', '/Server'): 1,
+            ('testTool', 'aliases', 'lookup', '/JDBCSystemResource'): 1,
+            ('testTool', 'aliases', 'fail', '/Server'): 1
+        }
+        self.assertEqual(expected, calls)
+
+        folder_totals = {}
+        for key, statistics in self._profile.get_totals(lambda call_key: call_key[3]):
+            folder_totals[key] = statistics.count
+        self.assertEqual({'/Server': 3, '/JDBCSystemResource': 1}, folder_totals)
+
+    def testThreadedCalls(self):
+        profiler.instrument_class(self._profile, ThreadedHelper, profiler.ALIASES, _get_folder)
+        helper = ThreadedHelper()
+        servers = FolderLocation('/Server')
+
+        # each thread has its own running categories, so concurrent calls are all recorded
+        results = parallel_utils.run_parallel(lambda value: helper.lookup(servers, value), range(20), 4)
+        self.assertEqual(range(20), results)
+
+        calls = self._profile.get_calls()
+        self.assertEqual(1, len(calls))
+        self.assertEqual(20, calls[0][1].count)
+
+    def testProfileDictionary(self):
+        self._profile.start_phase('phase1')
+        self._profile.record(profiler.WLST, 'cd', '/Servers/*', 3000000)
+        self._profile.record(profiler.WLST, 'cd', '/Servers/*', 1000000)
+        self._profile.record(profiler.ENCRYPTION, 'decryptString', None, 2000000)
+        self._profile.end_phase('phase1')
+
+        result = self._profile.to_dictionary()
+        self.assertEqual('testTool', result[profiler.PROGRAM])
+        self.assertEqual(['phase1'], result[profiler.PHASES].keys())
+
+        calls = result[profiler.CALLS]
+        self.assertEqual(2, len(calls))
+        self.assertEqual('cd', calls[0][profiler.OPERATION])
+        self.assertEqual('/Servers/*', calls[0][profiler.FOLDER])
+        self.assertEqual(2, calls[0][profiler.COUNT])
+        self.assertEqual(4.0, calls[0][profiler.TOTAL_MILLIS])
+        self.assertEqual(3.0, calls[0][profiler.MAX_MILLIS])
+        self.assertEqual(False, profiler.FOLDER in calls[1])
+
+
+def _get_folder(profile, operation, args):
+    return args[1].get_folder_path()
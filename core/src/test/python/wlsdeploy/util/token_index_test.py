@@ -0,0 +1,111 @@
+"""
+Copyright (c) 2026, Oracle and/or its affiliates.
+Licensed under the Universal Permissive License v1.0 as shown at https://oss.oracle.com/licenses/upl.
+"""
+import copy
+
+from base_test import BaseTestCase
+from wlsdeploy.util import cla_helper
+from wlsdeploy.util import token_index
+from wlsdeploy.util.token_index import TokenIndex
+
+
+class TokenIndexTest(BaseTestCase):
+
+    def testBuildIndex(self):
+        index = TokenIndex(_get_model())
+
+        self.assertEqual(['@@PROP:m1.port@@', '@@PROP:port@@'], index.get_tokens(token_index.PROPERTY))
+        self.assertEqual(['DOMAIN_UID', 'LOG_DIR'], index.get_names(token_index.ENVIRONMENT))
+        self.assertEqual(['@@ENV:DOMAIN_UID@@-ds1:password', 'creds:username'], index.get_names(token_index.SECRET))
+        self.assertEqual(['/tmp/password.txt'], index.get_names(token_index.FILE))
+
+        self.assertEqual(True, index.has_token('@@SECRET:@@ENV:DOMAIN_UID@@-ds1:password@@'))
+        self.assertEqual(True, index.has_name(token_index.PROPERTY, 'port'))
+        self.assertEqual(False, index.has_name(token_index.PROPERTY, 'unused'))
+
+        # a token is located at the attribute that uses it
+        locations = index.get_locations('@@PROP:m1.port@@')
+        self.assertEqual([('topology', 'Server', 'm1', 'ListenPort')], locations)
+
+        # a token used in several places, including a list
+        paths = index.get_usage(token_index.PROPERTY)['@@PROP:port@@']
+        paths.sort()
+        self.assertEqual(['topology:/Server/m2/ListenPort', 'topology:/Server/m2/Notes'], paths)
+
+    def testRemoveLocation(self):
+        index = TokenIndex(_get_model())
+        index.remove_location(('topology', 'Server', 'm2'))
+        self.assertEqual(False, index.has_name(token_index.PROPERTY, 'port'))
+        self.assertEqual(True, index.has_name(token_index.PROPERTY, 'm1.port'))
+        self.assertEqual(True, index.has_name(token_index.ENVIRONMENT, 'LOG_DIR'))
+
+        # a location that was already removed is ignored
+        index.remove_location(('topology', 'Server', 'm2'))
+
+        # a location that is added again can be removed again, with the other locations below its parents
+        index.add_value(('topology', 'Server', 'm2'), 'm2', {'ListenPort': '@@PROP:port@@'})
+        self.assertEqual(True, index.has_name(token_index.PROPERTY, 'port'))
+        index.remove_location(('topology',))
+        index.remove_location(('resources',))
+        self.assertEqual(['@@SECRET:creds:username@@'], index.get_tokens())
+
+    def testMergeModels(self):
+        model = _get_model()
+        new_model = {
+            'topology': {
+                'Server': {
+                    'm1': {
+                        'ListenPort': 7001
+                    },
+                    '!m2': {},
+                    'm3': {
+                        'ListenPort': '@@PROP:m3.port@@'
+                    }
+                }
+            }
+        }
+
+        index = TokenIndex(model)
+        cla_helper.merge_model_dictionaries(model, copy.deepcopy(new_model), None, token_index=index)
+
+        # the updated index matches an index built from the merged model
+        merged_index = TokenIndex(model)
+        self.assertEqual(merged_index.get_usage(), index.get_usage())
+        self.assertEqual(False, index.has_name(token_index.PROPERTY, 'm1.port'))
+        self.assertEqual(False, index.has_name(token_index.PROPERTY, 'port'))
+        self.assertEqual(True, index.has_name(token_index.PROPERTY, 'm3.port'))
+
+
+def _get_model():
+    return {
+        'domainInfo': {
+            'AdminUserName': '@@SECRET:creds:username@@'
+        },
+        'topology': {
+            'Server': {
+                'm1': {
+                    'ListenPort': '@@PROP:m1.port@@',
+                    'Log': {
+                        'FileName': '@@ENV:LOG_DIR@@/m1.log'
+                    }
+                },
+                'm2': {
+                    'ListenPort': '@@PROP:port@@',
+                    'Notes': ['first', 'port @@PROP:port@@']
+                }
+            }
+        },
+        'resources': {
+            'JDBCSystemResource': {
+                'ds1': {
+                    'JdbcResource': {
+                        'JDBCDriverParams': {
+                            'PasswordEncrypted': '@@SECRET:@@ENV:DOMAIN_UID@@-ds1:password@@',
+                            'URL': '@@FILE:/tmp/password.txt@@'
+                        }
+                    }
+                }
+            }
+        }
+    }
@@ -1,10 +1,12 @@
 """
-Copyright (c) 2022, Oracle Corporation and/or its affiliates.  All rights reserved.
+Copyright (c) 2022, 2026, Oracle Corporation and/or its affiliates.  All rights reserved.
 Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 """
 import os
 
 from base_test import BaseTestCase
+from oracle.weblogic.deploy.util import PyOrderedDict as OrderedDict
+from oracle.weblogic.deploy.util import PyRealBoolean
 from oracle.weblogic.deploy.yaml import YamlException
 from wlsdeploy.yaml.yaml_translator import PythonToYaml
 from wlsdeploy.yaml.yaml_translator import YamlToPython
@@ -54,3 +56,59 @@ class YamlTranslatorTest(BaseTestCase):
         except YamlException:
             pass
 
+    def testWritePythonTypes(self):
+        """
+        Test that Python values are written directly, with comments and without anchors for shared values.
+        """
+        shared = OrderedDict()
+        shared['Target'] = 'cluster1'
+
+        server = OrderedDict()
+        server['ListenPort'] = 7001
+        server['MaxMessageSize'] = 12345678901L
+        server['Weight'] = 0.5
+        server['Enabled'] = True
+        server['Secure'] = PyRealBoolean(False)
+        server['Notes'] = None
+        server['Arguments'] = ['-Xmx1g', u'-Dname=\u00e9']
+        server['First'] = shared
+        server['Second'] = shared
+        server.addComment('ListenPort', 'the listen port')
+
+        servers = OrderedDict()
+        servers['server1'] = server
+        model = OrderedDict()
+        model['Server'] = servers
+
+        output_file = os.path.join(self.OUTPUT_DIR, 'python-types.yaml')
+        PythonToYaml(model).write_to_yaml_file(output_file)
+
+        output_text = open(output_file).read()
+        self._match_values("Comment in output", '# the listen port' in output_text, True)
+        self._match_values("Anchor in output", '&' in output_text, False)
+
+        result = YamlToPython(output_file, True).parse()
+        result_server = result['Server']['server1']
+        self._match_values("Server keys", result_server.keys(), server.keys())
+        self._match_values("ListenPort", result_server['ListenPort'], 7001)
+        self._match_values("MaxMessageSize", result_server['MaxMessageSize'], 12345678901L)
+        self._match_values("Weight", result_server['Weight'], 0.5)
+        self._match_values("Enabled", str(result_server['Enabled']), 'true')
+        self._match_values("Secure", str(result_server['Secure']), 'false')
+        self._match_values("Notes", result_server['Notes'], None)
+        self._match_values("Arguments", list(result_server['Arguments']), ['-Xmx1g', u'-Dname=\u00e9'])
+        self._match_values("Second target", result_server['Second']['Target'], 'cluster1')
+
+    def testWriteUnsupportedType(self):
+        """
+        Test that a Python value that has no YAML representation is not written.
+        """
+        model = OrderedDict()
+        model['Value'] = ('one', 'two')
+
+        output_file = os.path.join(self.OUTPUT_DIR, 'unsupported-type.yaml')
+        try:
+            PythonToYaml(model).write_to_yaml_file(output_file)
+            self.fail("Should not write a tuple value")
+        except YamlException:
+            pass
@@ -0,0 +1,107 @@
+@ECHO OFF
+@rem **************************************************************************
+@rem benchmarkTools.cmd
+@rem
+@rem Copyright (c) 2026, Oracle and/or its affiliates.
+@rem Licensed under the Universal Permissive License v1.0 as shown at https://oss.oracle.com/licenses/upl.
+@rem
+@rem     NAME
+@rem       benchmarkTools.cmd - WLS Deploy tool to measure the performance of the other tools.
+@rem
+@rem     DESCRIPTION
+@rem       This script generates a model, variable file, and archive of a configurable
+@rem       size, runs the selected tool phases against them, and writes a JSON report
+@rem       with the elapsed time and memory usage of each phase.  If a baseline report
+@rem       is provided, phases that are slower than the baseline by more than the
+@rem       configured threshold are reported as errors.
+@rem
+@rem This script uses the following variables:
+@rem
+@rem JAVA_HOME             - The location of the JDK to use.  The caller must set
+@rem                         this variable to a valid Java 7 (or later) JDK.
+@rem
+@rem WLSDEPLOY_PROPERTIES  - Extra system properties to pass to WLST.  The caller
+@rem                         can use this environment variable to add additional
+@rem                         system properties to the WLST environment.
+@rem
+
+SETLOCAL
+
+SET WLSDEPLOY_PROGRAM_NAME=benchmarkTools
+
+SET SCRIPT_NAME=%~nx0
+SET SCRIPT_ARGS=%*
+SET SCRIPT_PATH=%~dp0
+FOR %%i IN ("%SCRIPT_PATH%") DO SET SCRIPT_PATH=%%~fsi
+IF %SCRIPT_PATH:~-1%==\ SET SCRIPT_PATH=%SCRIPT_PATH:~0,-1%
+
+call "%SCRIPT_PATH%\shared.cmd" :checkArgs %SCRIPT_ARGS%
+SET RETURN_CODE=%ERRORLEVEL%
+if %RETURN_CODE% NEQ 0 (
+  GOTO done
+)
+
+SET MIN_JDK_VERSION=7
+if "%USE_ENCRYPTION%" == "true" (
+  SET MIN_JDK_VERSION=8
+)
+
+@rem required Java version is dependent on use of encryption
+call "%SCRIPT_PATH%\shared.cmd" :javaSetup %MIN_JDK_VERSION%
+SET RETURN_CODE=%ERRORLEVEL%
+if %RETURN_CODE% NEQ 0 (
+  GOTO done
+)
+
+call "%SCRIPT_PATH%\shared.cmd" :runWlst benchmark_tools.py
+SET RETURN_CODE=%ERRORLEVEL%
+
+:done
+set SHOW_USAGE=false
+if %RETURN_CODE% == 100 set SHOW_USAGE=true
+if %RETURN_CODE% == 99 set SHOW_USAGE=true
+if "%SHOW_USAGE%" == "false" (
+    GOTO exit_script
+)
+
+:usage
+ECHO.
+ECHO Usage: %SCRIPT_NAME% [-help]
+ECHO           [-oracle_home ^<oracle_home^>]
+ECHO           -output_dir ^<output_dir^>
+ECHO           [-benchmark_file ^<benchmark_file^>]
+ECHO           [-baseline_file ^<baseline_file^>]
+ECHO           [-domain_type ^<domain_type^>]
+ECHO           [-wlst_path ^<wlst_path^>]
+ECHO.
+ECHO     where:
+ECHO         oracle_home     - the existing Oracle Home directory to benchmark.
+ECHO                           This argument is required unless the ORACLE_HOME
+ECHO                           environment variable is set.
+ECHO.
+ECHO         output_dir      - the directory where the generated files, the
+ECHO                           benchmark domain, and the report are written.
+ECHO.
+ECHO         benchmark_file  - the JSON file with the model sizes, phases, and
+ECHO                           iterations to run.  If not specified, the default
+ECHO                           benchmark settings are used.
+ECHO.
+ECHO         baseline_file   - a report file from a previous benchmark run.  If
+ECHO                           specified, each phase is compared with the baseline
+ECHO                           and regressions are reported as errors.
+ECHO.
+ECHO         domain_type     - the type of domain (e.g., WLS, JRF).  If not
+ECHO                           specified, the default is WLS.
+ECHO.
+ECHO         wlst_path       - the Oracle Home subdirectory of the wlst.cmd
+ECHO                           script to use (e.g., ^<ORACLE_HOME^>\soa).
+ECHO.
+
+:exit_script
+IF DEFINED USE_CMD_EXIT (
+  EXIT %RETURN_CODE%
+) ELSE (
+  EXIT /B %RETURN_CODE%
+)
+
+ENDLOCAL
@@ -0,0 +1,80 @@
+#!/bin/sh
+# *****************************************************************************
+# benchmarkTools.sh
+#
+# Copyright (c) 2026, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v1.0 as shown at https://oss.oracle.com/licenses/upl.
+#
+#     NAME
+#       benchmarkTools.sh - WLS Deploy tool to measure the performance of the other tools.
+#
+#     DESCRIPTION
+#       This script generates a model, variable file, and archive of a configurable
+#       size, runs the selected tool phases against them, and writes a JSON report
+#       with the elapsed time and memory usage of each phase.  If a baseline report
+#       is provided, phases that are slower than the baseline by more than the
+#       configured threshold are reported as errors.
+#
+# This script uses the following variables:
+#
+# JAVA_HOME             - The path to the Java Home directory used by the ORACLE HOME.
+#
+# WLSDEPLOY_PROPERTIES  - Extra system properties to pass to WLST.  The caller
+#                         can use this environment variable to add additional
+#                         system properties to the WLST environment.
+#
+
+usage() {
+  echo ""
+  echo "Usage: $1 [-help]"
+  echo "          [-oracle_home <oracle_home>]"
+  echo "          -output_dir <output_dir>"
+  echo "          [-benchmark_file <benchmark_file>]"
+  echo "          [-baseline_file <baseline_file>]"
+  echo "          [-domain_type <domain_type>]"
+  echo "          [-wlst_path <wlst_path>]"
+  echo ""
+  echo "    where:"
+  echo "        oracle_home     - the existing Oracle Home directory to benchmark."
+  echo "                          This argument is required unless the ORACLE_HOME"
+  echo "                          environment variable is set."
+  echo ""
+  echo "        output_dir      - the directory where the generated files, the"
+  echo "                          benchmark domain, and the report are written."
+  echo ""
+  echo "        benchmark_file  - the JSON file with the model sizes, phases, and"
+  echo "                          iterations to run.  If not specified, the default"
+  echo "                          benchmark settings are used."
+  echo ""
+  echo "        baseline_file   - a report file from a previous benchmark run.  If"
+  echo "                          specified, each phase is compared with the baseline"
+  echo "                          and regressions are reported as errors."
+  echo ""
+  echo "        domain_type     - the type of domain (e.g., WLS, JRF).  If not"
+  echo "                          specified, the default is WLS."
+  echo ""
+  echo "        wlst_path       - the Oracle Home subdirectory of the wlst.sh"
+  echo "                          script to use (e.g., <ORACLE_HOME>/soa)."
+  echo ""
+}
+
+WLSDEPLOY_PROGRAM_NAME="benchmarkTools"; export WLSDEPLOY_PROGRAM_NAME
+
+scriptName=$(basename "$0")
+scriptPath=$(dirname "$0")
+
+. "$scriptPath/shared.sh"
+
+umask 27
+
+checkArgs "$@"
+
+minJdkVersion=7
+if [ "$USE_ENCRYPTION" == "true" ]; then
+  minJdkVersion=8
+fi
+
+# required Java version is dependent on use of encryption
+javaSetup $minJdkVersion
+
+runWlst benchmark_tools.py "$@"
@@ -0,0 +1,171 @@
+@ECHO OFF
+@rem **************************************************************************
+@rem collectArtifacts.cmd
+@rem
+@rem Copyright (c) 2026, Oracle and/or its affiliates.
+@rem Licensed under the Universal Permissive License v1.0 as shown at https://oss.oracle.com/licenses/upl.
+@rem
+@rem     NAME
+@rem       collectArtifacts.cmd - WLS Deploy tool to collect the archive entries for a remote discovery.
+@rem
+@rem     DESCRIPTION
+@rem       This script adds the files and directories listed in the artifact
+@rem       collection plan, which is written by discoverDomain in remote mode, to
+@rem       an archive file.  The entries are read from the local file system, or
+@rem       downloaded from the domain host using SSH, and are transferred in
+@rem       parallel.  A JSON file with the result of each entry is written to the
+@rem       output directory, or to the directory of the collection plan file.
+@rem
+@rem This script uses the following variables:
+@rem
+@rem JAVA_HOME             - The location of the JDK to use.  The caller must set
+@rem                         this variable to a valid Java 7 (or later) JDK.
+@rem
+@rem WLSDEPLOY_PROPERTIES  - Extra system properties to pass to WLST.  The caller
+@rem                         can use this environment variable to add additional
+@rem                         system properties to the WLST environment.
+@rem
+
+SETLOCAL
+
+SET WLSDEPLOY_PROGRAM_NAME=collectArtifacts
+
+SET SCRIPT_NAME=%~nx0
+SET SCRIPT_ARGS=%*
+SET SCRIPT_PATH=%~dp0
+FOR %%i IN ("%SCRIPT_PATH%") DO SET SCRIPT_PATH=%%~fsi
+IF %SCRIPT_PATH:~-1%==\ SET SCRIPT_PATH=%SCRIPT_PATH:~0,-1%
+
+call "%SCRIPT_PATH%\shared.cmd" :checkArgs %SCRIPT_ARGS%
+SET RETURN_CODE=%ERRORLEVEL%
+if %RETURN_CODE% NEQ 0 (
+  GOTO done
+)
+
+SET MIN_JDK_VERSION=7
+if "%USE_ENCRYPTION%" == "true" (
+  SET MIN_JDK_VERSION=8
+)
+
+@rem required Java version is dependent on use of encryption
+call "%SCRIPT_PATH%\shared.cmd" :javaSetup %MIN_JDK_VERSION%
+SET RETURN_CODE=%ERRORLEVEL%
+if %RETURN_CODE% NEQ 0 (
+  GOTO done
+)
+
+call "%SCRIPT_PATH%\shared.cmd" :runWlst collect_artifacts.py
+SET RETURN_CODE=%ERRORLEVEL%
+
+:done
+set SHOW_USAGE=false
+if %RETURN_CODE% == 100 set SHOW_USAGE=true
+if %RETURN_CODE% == 99 set SHOW_USAGE=true
+if "%SHOW_USAGE%" == "false" (
+    GOTO exit_script
+)
+
+:usage
+ECHO.
+ECHO Usage: %SCRIPT_NAME% [-help]
+ECHO           [-oracle_home ^<oracle_home^>]
+ECHO           -archive_file ^<archive_file^>
+ECHO           -collection_plan_file ^<collection_plan_file^>
+ECHO           [-output_dir ^<output_dir^>]
+ECHO           [-ssh_host ^<ssh_host^> [-ssh_port ^<ssh_port^>]]
+ECHO           [-ssh_user ^<ssh_user^>]
+ECHO           [
+ECHO            -ssh_pass_env ^<ssh_pass_env^> ^|
+ECHO            -ssh_pass_file ^<ssh_pass_file^> ^|
+ECHO            -ssh_pass_prompt
+ECHO           ]
+ECHO           [-ssh_private_key ^<ssh_private_key^>]
+ECHO           [
+ECHO            -ssh_private_key_pass_env ^<ssh_private_key_pass_env^> ^|
+ECHO            -ssh_private_key_pass_file ^<ssh_private_key_pass_file^> ^|
+ECHO            -ssh_private_key_pass_prompt
+ECHO           ]
+ECHO           [-wlst_path ^<wlst_path^>]
+ECHO.
+ECHO     where:
+ECHO         oracle_home     - the existing Oracle Home directory for the domain.
+ECHO                           This argument is required unless the ORACLE_HOME
+ECHO                           environment variable is set.
+ECHO.
+ECHO         archive_file    - the path to the archive file to update.  The archive
+ECHO                           file is created if it does not exist.
+ECHO.
+ECHO         collection_plan_file - the artifact collection plan file written by
+ECHO                           discoverDomain in remote mode.
+ECHO.
+ECHO         output_dir      - the directory where the collection results file is
+ECHO                           written.  This argument is optional and defaults to
+ECHO                           the directory of the collection plan file.
+ECHO.
+ECHO         ssh_host        - the hostname or IP address of the domain host.  If
+ECHO                           this argument is not specified, the entries are read
+ECHO                           from the local file system.
+ECHO.
+ECHO         ssh_port        - the port number to use to connect to the remote machine.
+ECHO                           This argument is optional and defaults to 22, if not
+ECHO                           specified.
+ECHO.
+ECHO         ssh_user        - the SSH user name on the remote machine.  This argument
+ECHO                           is optional and defaults to the current user on the
+ECHO                           local machine, as determined by the user.name Java
+ECHO                           system property.
+ECHO.
+ECHO         ssh_pass_env    - An alternative to entering the SSH user's password
+ECHO                           at a prompt. The value is an ENVIRONMENT VARIABLE
+ECHO                           name that WDT will use to retrieve the password.
+ECHO                           This argument should only be used when using
+ECHO                           username/password-based authentication.
+ECHO.
+ECHO         ssh_pass_file   - An alternative to entering SSH user's password
+ECHO                           at a prompt. The value is the name of a file with a
+ECHO                           string value which WDT will read to retrieve the
+ECHO                           password.  This argument should only be used
+ECHO                           when using username/password-based authentication.
+ECHO.
+ECHO         ssh_private_key - the path to the private key to use for SSH
+ECHO                           authentication.  This argument is optional and defaults
+ECHO                           to the normal default SSH key (e.g., ~/.ssh/id_rsa).
+ECHO                           This argument should only be used when using
+ECHO                           public key-based authentication.
+ECHO.
+ECHO         ssh_private_key_pass_env - An alternative to entering the private key
+ECHO                           passphrase at a prompt. The value is an ENVIRONMENT
+ECHO                           VARIABLE name that WDT will use to retrieve the
+ECHO                           password.  This argument should only be used when
+ECHO                           using public key-based authentication and the
+ECHO                           private key is encrypted with a passphrase.
+ECHO.
+ECHO         ssh_private_key_pass_file - An alternative to entering SSH private key
+ECHO                           passphrase at a prompt. The value is the name of a
+ECHO                           file with a string value which WDT will read to
+ECHO                           retrieve the password.  This argument should only be
+ECHO                           used when using username/password-based
+ECHO                           authentication and the private key is encrypted with
+ECHO                           a passphrase.
+ECHO.
+ECHO         wlst_path       - the Oracle Home subdirectory of the wlst.cmd
+ECHO                           script to use (e.g., ^<ORACLE_HOME^>\soa).
+ECHO.
+ECHO     The -ssh_pass_prompt argument tells WDT to prompt for the SSH user's
+ECHO     password and read it from standard input.  This is also useful for
+ECHO     scripts that want to pipe the value into the tool's standard input.
+ECHO.
+ECHO     The -ssh_private_key_pass_prompt argument tells WDT to prompt for the
+ECHO     private key passphrase and read it from standard input. This is also
+ECHO     useful for scripts that want to pipe the value into the tool's
+ECHO     standard input.
+ECHO.
+
+:exit_script
+IF DEFINED USE_CMD_EXIT (
+  EXIT %RETURN_CODE%
+) ELSE (
+  EXIT /B %RETURN_CODE%
+)
+
+ENDLOCAL
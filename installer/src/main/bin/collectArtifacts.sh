@@ -0,0 +1,144 @@
+#!/bin/sh
+# *****************************************************************************
+# collectArtifacts.sh
+#
+# Copyright (c) 2026, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v1.0 as shown at https://oss.oracle.com/licenses/upl.
+#
+#     NAME
+#       collectArtifacts.sh - WLS Deploy tool to collect the archive entries for a remote discovery.
+#
+#     DESCRIPTION
+#       This script adds the files and directories listed in the artifact
+#       collection plan, which is written by discoverDomain in remote mode, to
+#       an archive file.  The entries are read from the local file system, or
+#       downloaded from the domain host using SSH, and are transferred in
+#       parallel.  A JSON file with the result of each entry is written to the
+#       output directory, or to the directory of the collection plan file.
+#
+# This script uses the following variables:
+#
+# JAVA_HOME             - The path to the Java Home directory used by the ORACLE HOME.
+#
+# WLSDEPLOY_PROPERTIES  - Extra system properties to pass to WLST.  The caller
+#                         can use this environment variable to add additional
+#                         system properties to the WLST environment.
+#
+
+usage() {
+  echo ""
+  echo "Usage: $1 [-help]"
+  echo "          [-oracle_home <oracle_home>]"
+  echo "          -archive_file <archive_file>"
+  echo "          -collection_plan_file <collection_plan_file>"
+  echo "          [-output_dir <output_dir>]"
+  echo "          [-ssh_host <ssh_host> [-ssh_port <ssh_port>]]"
+  echo "          [-ssh_user <ssh_user>]"
+  echo "          ["
+  echo "           -ssh_pass_env <ssh_pass_env> |"
+  echo "           -ssh_pass_file <ssh_pass_file> |"
+  echo "           -ssh_pass_prompt"
+  echo "          ]"
+  echo "          [-ssh_private_key <ssh_private_key>]"
+  echo "          ["
+  echo "           -ssh_private_key_pass_env <ssh_private_key_pass_env> |"
+  echo "           -ssh_private_key_pass_file <ssh_private_key_pass_file> |"
+  echo "           -ssh_private_key_pass_prompt"
+  echo "          ]"
+  echo "          [-wlst_path <wlst_path>]"
+  echo ""
+  echo "    where:"
+  echo "        oracle_home     - the existing Oracle Home directory for the domain."
+  echo "                          This argument is required unless the ORACLE_HOME"
+  echo "                          environment variable is set."
+  echo ""
+  echo "        archive_file    - the path to the archive file to update.  The archive"
+  echo "                          file is created if it does not exist."
+  echo ""
+  echo "        collection_plan_file - the artifact collection plan file written by"
+  echo "                          discoverDomain in remote mode."
+  echo ""
+  echo "        output_dir      - the directory where the collection results file is"
+  echo "                          written.  This argument is optional and defaults to"
+  echo "                          the directory of the collection plan file."
+  echo ""
+  echo "        ssh_host        - the hostname or IP address of the domain host.  If"
+  echo "                          this argument is not specified, the entries are read"
+  echo "                          from the local file system."
+  echo ""
+  echo "        ssh_port        - the port number to use to connect to the remote machine."
+  echo "                          This argument is optional and defaults to 22, if not"
+  echo "                          specified."
+  echo ""
+  echo "        ssh_user        - the SSH user name on the remote machine.  This argument"
+  echo "                          is optional and defaults to the current user on the"
+  echo "                          local machine, as determined by the user.name Java"
+  echo "                          system property."
+  echo ""
+  echo "        ssh_pass_env    - An alternative to entering the SSH user's password"
+  echo "                          at a prompt. The value is an ENVIRONMENT VARIABLE"
+  echo "                          name that WDT will use to retrieve the password."
+  echo "                          This argument should only be used when using"
+  echo "                          username/password-based authentication."
+  echo ""
+  echo "        ssh_pass_file   - An alternative to entering SSH user's password"
+  echo "                          at a prompt. The value is the name of a file with a"
+  echo "                          string value which WDT will read to retrieve the"
+  echo "                          password.  This argument should only be used"
+  echo "                          when using username/password-based authentication."
+  echo ""
+  echo "        ssh_private_key - the path to the private key to use for SSH"
+  echo "                          authentication.  This argument is optional and defaults"
+  echo "                          to the normal default SSH key (e.g., ~/.ssh/id_rsa)."
+  echo "                          This argument should only be used when using"
+  echo "                          public key-based authentication."
+  echo ""
+  echo "        ssh_private_key_pass_env - An alternative to entering the private key"
+  echo "                          passphrase at a prompt. The value is an ENVIRONMENT"
+  echo "                          VARIABLE name that WDT will use to retrieve the"
+  echo "                          password.  This argument should only be used when"
+  echo "                          using public key-based authentication and the"
+  echo "                          private key is encrypted with a passphrase."
+  echo ""
+  echo "        ssh_private_key_pass_file - An alternative to entering SSH private key"
+  echo "                          passphrase at a prompt. The value is the name of a"
+  echo "                          file with a string value which WDT will read to"
+  echo "                          retrieve the password.  This argument should only be"
+  echo "                          used when using username/password-based"
+  echo "                          authentication and the private key is encrypted with"
+  echo "                          a passphrase."
+  echo ""
+  echo "        wlst_path       - the Oracle Home subdirectory of the wlst.sh"
+  echo "                          script to use (e.g., <ORACLE_HOME>/soa)."
+  echo ""
+  echo "    The -ssh_pass_prompt argument tells WDT to prompt for the SSH user's"
+  echo "    password and read it from standard input.  This is also useful for"
+  echo "    scripts that want to pipe the value into the tool's standard input."
+  echo ""
+  echo "    The -ssh_private_key_pass_prompt argument tells WDT to prompt for the"
+  echo "    private key passphrase and read it from standard input. This is also"
+  echo "    useful for scripts that want to pipe the value into the tool's"
+  echo "    standard input."
+  echo ""
+}
+
+WLSDEPLOY_PROGRAM_NAME="collectArtifacts"; export WLSDEPLOY_PROGRAM_NAME
+
+scriptName=$(basename "$0")
+scriptPath=$(dirname "$0")
+
+. "$scriptPath/shared.sh"
+
+umask 27
+
+checkArgs "$@"
+
+minJdkVersion=7
+if [ "$USE_ENCRYPTION" == "true" ]; then
+  minJdkVersion=8
+fi
+
+# required Java version is dependent on use of encryption
+javaSetup $minJdkVersion
+
+runWlst collect_artifacts.py "$@"
@@ -2,7 +2,7 @@
 @rem **************************************************************************
 @rem modelHelp.cmd
 @rem
-@rem Copyright (c) 2020, 2023, Oracle and/or its affiliates.
+@rem Copyright (c) 2020, 2026, Oracle and/or its affiliates.
 @rem Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 @rem
 @rem     NAME
@@ -65,6 +65,7 @@ ECHO         [-help]
 ECHO         [-oracle_home ^<oracle_home^>]
 ECHO         [-target ^<target^>]
 ECHO         [-attributes_only ^| -folders_only ^| -recursive]
+ECHO         [-search ^<search_text^>]
 ECHO         [^<model_path^>]
 ECHO.
 ECHO     where:
@@ -77,6 +78,9 @@ ECHO.
 ECHO         model_path  - the path to the model element to be examined.
 ECHO                       The format is [^<section^>:][/^<folder^>]^*.
 ECHO.
+ECHO         search_text - a folder or attribute name, or words to be found in
+ECHO                       folder and attribute names and descriptions.
+ECHO.
 ECHO     By default, the tool will display the folders and attributes for the
 ECHO     specified model path.
 ECHO.
@@ -90,6 +94,9 @@ ECHO     The -recursive switch will cause the tool to list only the folders
 ECHO     for the specified model path, and recursively include the folders below
 ECHO     that path.
 ECHO.
+ECHO     The -search argument will cause the tool to list the folders and attributes
+ECHO     that match the search text, instead of examining a model path.
+ECHO.
 ECHO     If no model path is specified, the tool will enter an interactive mode.
 ECHO.
 ECHO     model_path examples:
@@ -2,7 +2,7 @@
 # *****************************************************************************
 # modelHelp.sh
 #
-# Copyright (c) 2020, 2023, Oracle and/or its affiliates.
+# Copyright (c) 2020, 2026, Oracle and/or its affiliates.
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl.
 #
 #     NAME
@@ -30,6 +30,7 @@ usage() {
   echo "          [-oracle_home <oracle_home>]"
   echo "          [-target <target>]"
   echo "          [-attributes_only | -folders_only | -recursive]"
+  echo "          [-search <search_text>]"
   echo "          [<model_path>]"
   echo ""
   echo "    where:"
@@ -42,6 +43,9 @@ usage() {
   echo "        model_path  - the path to the model element to be examined."
   echo "                      The format is [<section>:][/<folder>]*"
   echo ""
+  echo "        search_text - a folder or attribute name, or words to be found in"
+  echo "                      folder and attribute names and descriptions."
+  echo ""
   echo "    By default, the tool will display the folders and attributes for the"
   echo "    specified model path."
   echo ""
@@ -55,6 +59,9 @@ usage() {
   echo "    for the specified model path, and recursively include the folders below"
   echo "    that path."
   echo ""
+  echo "    The -search argument will cause the tool to list the folders and attributes"
+  echo "    that match the search text, instead of examining a model path."
+  echo ""
   echo "    If no model path is specified, the tool to enter an interactive mode."
   echo ""
   echo "    model_path examples:"
@@ -0,0 +1,101 @@
+@ECHO OFF
+@rem **************************************************************************
+@rem multiDomainRunner.cmd
+@rem
+@rem Copyright (c) 2026, Oracle and/or its affiliates.
+@rem Licensed under the Universal Permissive License v1.0 as shown at https://oss.oracle.com/licenses/upl.
+@rem
+@rem     NAME
+@rem       multiDomainRunner.cmd - WLS Deploy tool to run a tool for several domains.
+@rem
+@rem     DESCRIPTION
+@rem       This script reads a manifest file that lists domains, with the model,
+@rem       variable, and archive files and the tool to run for each one.  The
+@rem       common model files are merged once, and the tool is run for the
+@rem       domains in parallel, each with its own output file and log directory.
+@rem       A JSON summary with the exit code of each domain is written to the
+@rem       output directory.
+@rem
+@rem This script uses the following variables:
+@rem
+@rem JAVA_HOME             - The location of the JDK to use.  The caller must set
+@rem                         this variable to a valid Java 7 (or later) JDK.
+@rem
+@rem WLSDEPLOY_PROPERTIES  - Extra system properties to pass to WLST.  The caller
+@rem                         can use this environment variable to add additional
+@rem                         system properties to the WLST environment.
+@rem
+
+SETLOCAL
+
+SET WLSDEPLOY_PROGRAM_NAME=multiDomainRunner
+
+SET SCRIPT_NAME=%~nx0
+SET SCRIPT_ARGS=%*
+SET SCRIPT_PATH=%~dp0
+FOR %%i IN ("%SCRIPT_PATH%") DO SET SCRIPT_PATH=%%~fsi
+IF %SCRIPT_PATH:~-1%==\ SET SCRIPT_PATH=%SCRIPT_PATH:~0,-1%
+
+call "%SCRIPT_PATH%\shared.cmd" :checkArgs %SCRIPT_ARGS%
+SET RETURN_CODE=%ERRORLEVEL%
+if %RETURN_CODE% NEQ 0 (
+  GOTO done
+)
+
+SET MIN_JDK_VERSION=7
+if "%USE_ENCRYPTION%" == "true" (
+  SET MIN_JDK_VERSION=8
+)
+
+@rem required Java version is dependent on use of encryption
+call "%SCRIPT_PATH%\shared.cmd" :javaSetup %MIN_JDK_VERSION%
+SET RETURN_CODE=%ERRORLEVEL%
+if %RETURN_CODE% NEQ 0 (
+  GOTO done
+)
+
+call "%SCRIPT_PATH%\shared.cmd" :runWlst multi_domain_runner.py
+SET RETURN_CODE=%ERRORLEVEL%
+
+:done
+set SHOW_USAGE=false
+if %RETURN_CODE% == 100 set SHOW_USAGE=true
+if %RETURN_CODE% == 99 set SHOW_USAGE=true
+if "%SHOW_USAGE%" == "false" (
+    GOTO exit_script
+)
+
+:usage
+ECHO.
+ECHO Usage: %SCRIPT_NAME% [-help]
+ECHO           [-oracle_home ^<oracle_home^>]
+ECHO           -output_dir ^<output_dir^>
+ECHO           -manifest_file ^<manifest_file^>
+ECHO           [-wlst_path ^<wlst_path^>]
+ECHO.
+ECHO     where:
+ECHO         oracle_home     - the existing Oracle Home directory to use for
+ECHO                           domains that do not specify one in the manifest.
+ECHO                           This argument is required unless the ORACLE_HOME
+ECHO                           environment variable is set.
+ECHO.
+ECHO         output_dir      - the directory where the merged common model files,
+ECHO                           the output and logs for each domain, and the
+ECHO                           summary file are written.
+ECHO.
+ECHO         manifest_file   - the JSON file that lists the domains, with the
+ECHO                           tool and the model, variable, and archive files
+ECHO                           for each one.
+ECHO.
+ECHO         wlst_path       - the Oracle Home subdirectory of the wlst.cmd
+ECHO                           script to use (e.g., ^<ORACLE_HOME^>\soa).
+ECHO.
+
+:exit_script
+IF DEFINED USE_CMD_EXIT (
+  EXIT %RETURN_CODE%
+) ELSE (
+  EXIT /B %RETURN_CODE%
+)
+
+ENDLOCAL
@@ -0,0 +1,74 @@
+#!/bin/sh
+# *****************************************************************************
+# multiDomainRunner.sh
+#
+# Copyright (c) 2026, Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v1.0 as shown at https://oss.oracle.com/licenses/upl.
+#
+#     NAME
+#       multiDomainRunner.sh - WLS Deploy tool to run a tool for several domains.
+#
+#     DESCRIPTION
+#       This script reads a manifest file that lists domains, with the model,
+#       variable, and archive files and the tool to run for each one.  The
+#       common model files are merged once, and the tool is run for the
+#       domains in parallel, each with its own output file and log directory.
+#       A JSON summary with the exit code of each domain is written to the
+#       output directory.
+#
+# This script uses the following variables:
+#
+# JAVA_HOME             - The path to the Java Home directory used by the ORACLE HOME.
+#
+# WLSDEPLOY_PROPERTIES  - Extra system properties to pass to WLST.  The caller
+#                         can use this environment variable to add additional
+#                         system properties to the WLST environment.
+#
+
+usage() {
+  echo ""
+  echo "Usage: $1 [-help]"
+  echo "          [-oracle_home <oracle_home>]"
+  echo "          -output_dir <output_dir>"
+  echo "          -manifest_file <manifest_file>"
+  echo "          [-wlst_path <wlst_path>]"
+  echo ""
+  echo "    where:"
+  echo "        oracle_home     - the existing Oracle Home directory to use for"
+  echo "                          domains that do not specify one in the manifest."
+  echo "                          This argument is required unless the ORACLE_HOME"
+  echo "                          environment variable is set."
+  echo ""
+  echo "        output_dir      - the directory where the merged common model files,"
+  echo "                          the output and logs for each domain, and the"
+  echo "                          summary file are written."
+  echo ""
+  echo "        manifest_file   - the JSON file that lists the domains, with the"
+  echo "                          tool and the model, variable, and archive files"
+  echo "                          for each one."
+  echo ""
+  echo "        wlst_path       - the Oracle Home subdirectory of the wlst.sh"
+  echo "                          script to use (e.g., <ORACLE_HOME>/soa)."
+  echo ""
+}
+
+WLSDEPLOY_PROGRAM_NAME="multiDomainRunner"; export WLSDEPLOY_PROGRAM_NAME
+
+scriptName=$(basename "$0")
+scriptPath=$(dirname "$0")
+
+. "$scriptPath/shared.sh"
+
+umask 27
+
+checkArgs "$@"
+
+minJdkVersion=7
+if [ "$USE_ENCRYPTION" == "true" ]; then
+  minJdkVersion=8
+fi
+
+# required Java version is dependent on use of encryption
+javaSetup $minJdkVersion
+
+runWlst multi_domain_runner.py "$@"